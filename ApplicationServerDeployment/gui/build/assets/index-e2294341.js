@@ -181,6 +181,6 @@ to {
   > * {
     pointer-events: auto;
   }
-`,rs=16,K1=({reverseOrder:t,position:e="top-center",toastOptions:n,gutter:i,children:r,containerStyle:s,containerClassName:o})=>{let{toasts:l,handlers:a}=k1(n);return M.exports.createElement("div",{style:{position:"fixed",zIndex:9999,top:rs,left:rs,right:rs,bottom:rs,pointerEvents:"none",...s},className:o,onMouseEnter:a.startPause,onMouseLeave:a.endPause},l.map(u=>{let c=u.position||e,f=a.calculateOffset(u,{reverseOrder:t,gutter:i,defaultPosition:e}),d=Y1(c,f);return M.exports.createElement(U1,{id:u.id,key:u.id,onHeightUpdate:a.updateHeight,className:u.visible?Q1:"",style:d},u.type==="custom"?ao(u.message,u):r?r(u):M.exports.createElement(V1,{toast:u,position:c}))}))},Rp=ze;const X1="/assets/amazon-sidewalk-logo-9b10e5a3.png";const G1=()=>K("header",{children:[T("h2",{children:"Sensor Monitoring App"}),T("img",{src:X1,className:"header-img"})]}),Z1=function t(e){function n(r,s,o){var l,a={};if(Array.isArray(r))return r.concat(s);for(l in r)a[o?l.toLowerCase():l]=r[l];for(l in s){var u=o?l.toLowerCase():l,c=s[l];a[u]=u in a&&typeof c=="object"?n(a[u],c,u=="headers"):c}return a}function i(r,s,o,l,a){var u=typeof r!="string"?(s=r).url:r,c={config:s},f=n(e,s),d={};l=l||f.data,(f.transformRequest||[]).map(function(h){l=h(l,f.headers)||l}),f.auth&&(d.authorization=f.auth),l&&typeof l=="object"&&typeof l.append!="function"&&typeof l.text!="function"&&(l=JSON.stringify(l),d["content-type"]="application/json");try{d[f.xsrfHeaderName]=decodeURIComponent(document.cookie.match(RegExp("(^|; )"+f.xsrfCookieName+"=([^;]*)"))[2])}catch{}return f.baseURL&&(u=u.replace(/^(?!.*\/\/)\/?/,f.baseURL+"/")),f.params&&(u+=(~u.indexOf("?")?"&":"?")+(f.paramsSerializer?f.paramsSerializer(f.params):new URLSearchParams(f.params))),(f.fetch||fetch)(u,{method:(o||f.method||"get").toUpperCase(),body:l,headers:n(f.headers,d,!0),credentials:f.withCredentials?"include":a}).then(function(h){for(var m in h)typeof h[m]!="function"&&(c[m]=h[m]);return f.responseType=="stream"?(c.data=h.body,c):h[f.responseType||"text"]().then(function(y){c.data=y,c.data=JSON.parse(y)}).catch(Object).then(function(){return(f.validateStatus?f.validateStatus(h.status):h.ok)?c:Promise.reject(c)})})}return e=e||{},i.request=i,i.get=function(r,s){return i(r,s,"get")},i.delete=function(r,s){return i(r,s,"delete")},i.head=function(r,s){return i(r,s,"head")},i.options=function(r,s){return i(r,s,"options")},i.post=function(r,s,o){return i(r,o,"post",s)},i.put=function(r,s,o){return i(r,o,"put",s)},i.patch=function(r,s,o){return i(r,o,"patch",s)},i.all=Promise.all.bind(Promise),i.spread=function(r){return r.apply.bind(r,r)},i.CancelToken=typeof AbortController=="function"?AbortController:Object,i.defaults=e,i.create=t,i}(),rf={CELSIUS:`${String.fromCharCode(176)}C`,FAHRENHEIT:`${String.fromCharCode(176)}F`,UNKNOWN:"-"},q1="/api",Fp={gray:"rgb(255, 99, 132)"},yl={ON:"ON",OFF:"OFF"},Bo="access_token",ba="Unauthorize_error";let uo;const J1=()=>{const t=localStorage.getItem(Bo),e={baseURL:q1,...t?{headers:{authorizationtoken:`Basic ${t}`}}:{}};return uo=Z1.create(e),uo},ey=t=>{uo.defaults.headers={authorizationtoken:`Basic ${t}`},localStorage.setItem(Bo,t)},ty=t=>{uo.defaults.headers={Username:`${t}`}},br=J1(),Tu={intervals:{measurement:15*1e3,devices:5*1e3,online:1*1e3}},Cr={devices:"/devices",device:"/devices/:id",measurement:"/measurements/:id",led:"",login:"/auth"},Ap=(t,e)=>{let n=t;return Object.keys(e).forEach(i=>{n=n.replace(`:${i}`,e[i])}),n},Ou=t=>{(t===401||t===403)&&(localStorage.removeItem(Bo),localStorage.setItem(ba,"true"),window.location.reload())},jp={log:(...t)=>{}};function Ar(t){return t+.5|0}const Qt=(t,e,n)=>Math.max(Math.min(t,n),e);function $i(t){return Qt(Ar(t*2.55),0,255)}function on(t){return Qt(Ar(t*255),0,255)}function Pt(t){return Qt(Ar(t/2.55)/100,0,1)}function sf(t){return Qt(Ar(t*100),0,100)}const Xe={0:0,1:1,2:2,3:3,4:4,5:5,6:6,7:7,8:8,9:9,A:10,B:11,C:12,D:13,E:14,F:15,a:10,b:11,c:12,d:13,e:14,f:15},Ca=[..."0123456789ABCDEF"],ny=t=>Ca[t&15],iy=t=>Ca[(t&240)>>4]+Ca[t&15],ss=t=>(t&240)>>4===(t&15),ry=t=>ss(t.r)&&ss(t.g)&&ss(t.b)&&ss(t.a);function sy(t){var e=t.length,n;return t[0]==="#"&&(e===4||e===5?n={r:255&Xe[t[1]]*17,g:255&Xe[t[2]]*17,b:255&Xe[t[3]]*17,a:e===5?Xe[t[4]]*17:255}:(e===7||e===9)&&(n={r:Xe[t[1]]<<4|Xe[t[2]],g:Xe[t[3]]<<4|Xe[t[4]],b:Xe[t[5]]<<4|Xe[t[6]],a:e===9?Xe[t[7]]<<4|Xe[t[8]]:255})),n}const oy=(t,e)=>t<255?e(t):"";function ly(t){var e=ry(t)?ny:iy;return t?"#"+e(t.r)+e(t.g)+e(t.b)+oy(t.a,e):void 0}const ay=/^(hsla?|hwb|hsv)\(\s*([-+.e\d]+)(?:deg)?[\s,]+([-+.e\d]+)%[\s,]+([-+.e\d]+)%(?:[\s,]+([-+.e\d]+)(%)?)?\s*\)$/;function Bp(t,e,n){const i=e*Math.min(n,1-n),r=(s,o=(s+t/30)%12)=>n-i*Math.max(Math.min(o-3,9-o,1),-1);return[r(0),r(8),r(4)]}function uy(t,e,n){const i=(r,s=(r+t/60)%6)=>n-n*e*Math.max(Math.min(s,4-s,1),0);return[i(5),i(3),i(1)]}function cy(t,e,n){const i=Bp(t,1,.5);let r;for(e+n>1&&(r=1/(e+n),e*=r,n*=r),r=0;r<3;r++)i[r]*=1-e-n,i[r]+=e;return i}function fy(t,e,n,i,r){return t===r?(e-n)/i+(e<n?6:0):e===r?(n-t)/i+2:(t-e)/i+4}function Du(t){const n=t.r/255,i=t.g/255,r=t.b/255,s=Math.max(n,i,r),o=Math.min(n,i,r),l=(s+o)/2;let a,u,c;return s!==o&&(c=s-o,u=l>.5?c/(2-s-o):c/(s+o),a=fy(n,i,r,c,s),a=a*60+.5),[a|0,u||0,l]}function zu(t,e,n,i){return(Array.isArray(e)?t(e[0],e[1],e[2]):t(e,n,i)).map(on)}function Nu(t,e,n){return zu(Bp,t,e,n)}function dy(t,e,n){return zu(cy,t,e,n)}function hy(t,e,n){return zu(uy,t,e,n)}function $p(t){return(t%360+360)%360}function py(t){const e=ay.exec(t);let n=255,i;if(!e)return;e[5]!==i&&(n=e[6]?$i(+e[5]):on(+e[5]));const r=$p(+e[2]),s=+e[3]/100,o=+e[4]/100;return e[1]==="hwb"?i=dy(r,s,o):e[1]==="hsv"?i=hy(r,s,o):i=Nu(r,s,o),{r:i[0],g:i[1],b:i[2],a:n}}function gy(t,e){var n=Du(t);n[0]=$p(n[0]+e),n=Nu(n),t.r=n[0],t.g=n[1],t.b=n[2]}function my(t){if(!t)return;const e=Du(t),n=e[0],i=sf(e[1]),r=sf(e[2]);return t.a<255?`hsla(${n}, ${i}%, ${r}%, ${Pt(t.a)})`:`hsl(${n}, ${i}%, ${r}%)`}const of={x:"dark",Z:"light",Y:"re",X:"blu",W:"gr",V:"medium",U:"slate",A:"ee",T:"ol",S:"or",B:"ra",C:"lateg",D:"ights",R:"in",Q:"turquois",E:"hi",P:"ro",O:"al",N:"le",M:"de",L:"yello",F:"en",K:"ch",G:"arks",H:"ea",I:"ightg",J:"wh"},lf={OiceXe:"f0f8ff",antiquewEte:"faebd7",aqua:"ffff",aquamarRe:"7fffd4",azuY:"f0ffff",beige:"f5f5dc",bisque:"ffe4c4",black:"0",blanKedOmond:"ffebcd",Xe:"ff",XeviTet:"8a2be2",bPwn:"a52a2a",burlywood:"deb887",caMtXe:"5f9ea0",KartYuse:"7fff00",KocTate:"d2691e",cSO:"ff7f50",cSnflowerXe:"6495ed",cSnsilk:"fff8dc",crimson:"dc143c",cyan:"ffff",xXe:"8b",xcyan:"8b8b",xgTMnPd:"b8860b",xWay:"a9a9a9",xgYF:"6400",xgYy:"a9a9a9",xkhaki:"bdb76b",xmagFta:"8b008b",xTivegYF:"556b2f",xSange:"ff8c00",xScEd:"9932cc",xYd:"8b0000",xsOmon:"e9967a",xsHgYF:"8fbc8f",xUXe:"483d8b",xUWay:"2f4f4f",xUgYy:"2f4f4f",xQe:"ced1",xviTet:"9400d3",dAppRk:"ff1493",dApskyXe:"bfff",dimWay:"696969",dimgYy:"696969",dodgerXe:"1e90ff",fiYbrick:"b22222",flSOwEte:"fffaf0",foYstWAn:"228b22",fuKsia:"ff00ff",gaRsbSo:"dcdcdc",ghostwEte:"f8f8ff",gTd:"ffd700",gTMnPd:"daa520",Way:"808080",gYF:"8000",gYFLw:"adff2f",gYy:"808080",honeyMw:"f0fff0",hotpRk:"ff69b4",RdianYd:"cd5c5c",Rdigo:"4b0082",ivSy:"fffff0",khaki:"f0e68c",lavFMr:"e6e6fa",lavFMrXsh:"fff0f5",lawngYF:"7cfc00",NmoncEffon:"fffacd",ZXe:"add8e6",ZcSO:"f08080",Zcyan:"e0ffff",ZgTMnPdLw:"fafad2",ZWay:"d3d3d3",ZgYF:"90ee90",ZgYy:"d3d3d3",ZpRk:"ffb6c1",ZsOmon:"ffa07a",ZsHgYF:"20b2aa",ZskyXe:"87cefa",ZUWay:"778899",ZUgYy:"778899",ZstAlXe:"b0c4de",ZLw:"ffffe0",lime:"ff00",limegYF:"32cd32",lRF:"faf0e6",magFta:"ff00ff",maPon:"800000",VaquamarRe:"66cdaa",VXe:"cd",VScEd:"ba55d3",VpurpN:"9370db",VsHgYF:"3cb371",VUXe:"7b68ee",VsprRggYF:"fa9a",VQe:"48d1cc",VviTetYd:"c71585",midnightXe:"191970",mRtcYam:"f5fffa",mistyPse:"ffe4e1",moccasR:"ffe4b5",navajowEte:"ffdead",navy:"80",Tdlace:"fdf5e6",Tive:"808000",TivedBb:"6b8e23",Sange:"ffa500",SangeYd:"ff4500",ScEd:"da70d6",pOegTMnPd:"eee8aa",pOegYF:"98fb98",pOeQe:"afeeee",pOeviTetYd:"db7093",papayawEp:"ffefd5",pHKpuff:"ffdab9",peru:"cd853f",pRk:"ffc0cb",plum:"dda0dd",powMrXe:"b0e0e6",purpN:"800080",YbeccapurpN:"663399",Yd:"ff0000",Psybrown:"bc8f8f",PyOXe:"4169e1",saddNbPwn:"8b4513",sOmon:"fa8072",sandybPwn:"f4a460",sHgYF:"2e8b57",sHshell:"fff5ee",siFna:"a0522d",silver:"c0c0c0",skyXe:"87ceeb",UXe:"6a5acd",UWay:"708090",UgYy:"708090",snow:"fffafa",sprRggYF:"ff7f",stAlXe:"4682b4",tan:"d2b48c",teO:"8080",tEstN:"d8bfd8",tomato:"ff6347",Qe:"40e0d0",viTet:"ee82ee",JHt:"f5deb3",wEte:"ffffff",wEtesmoke:"f5f5f5",Lw:"ffff00",LwgYF:"9acd32"};function yy(){const t={},e=Object.keys(lf),n=Object.keys(of);let i,r,s,o,l;for(i=0;i<e.length;i++){for(o=l=e[i],r=0;r<n.length;r++)s=n[r],l=l.replace(s,of[s]);s=parseInt(lf[o],16),t[l]=[s>>16&255,s>>8&255,s&255]}return t}let os;function vy(t){os||(os=yy(),os.transparent=[0,0,0,0]);const e=os[t.toLowerCase()];return e&&{r:e[0],g:e[1],b:e[2],a:e.length===4?e[3]:255}}const xy=/^rgba?\(\s*([-+.\d]+)(%)?[\s,]+([-+.e\d]+)(%)?[\s,]+([-+.e\d]+)(%)?(?:[\s,/]+([-+.e\d]+)(%)?)?\s*\)$/;function _y(t){const e=xy.exec(t);let n=255,i,r,s;if(e){if(e[7]!==i){const o=+e[7];n=e[8]?$i(o):Qt(o*255,0,255)}return i=+e[1],r=+e[3],s=+e[5],i=255&(e[2]?$i(i):Qt(i,0,255)),r=255&(e[4]?$i(r):Qt(r,0,255)),s=255&(e[6]?$i(s):Qt(s,0,255)),{r:i,g:r,b:s,a:n}}}function wy(t){return t&&(t.a<255?`rgba(${t.r}, ${t.g}, ${t.b}, ${Pt(t.a)})`:`rgb(${t.r}, ${t.g}, ${t.b})`)}const vl=t=>t<=.0031308?t*12.92:Math.pow(t,1/2.4)*1.055-.055,Hn=t=>t<=.04045?t/12.92:Math.pow((t+.055)/1.055,2.4);function ky(t,e,n){const i=Hn(Pt(t.r)),r=Hn(Pt(t.g)),s=Hn(Pt(t.b));return{r:on(vl(i+n*(Hn(Pt(e.r))-i))),g:on(vl(r+n*(Hn(Pt(e.g))-r))),b:on(vl(s+n*(Hn(Pt(e.b))-s))),a:t.a+n*(e.a-t.a)}}function ls(t,e,n){if(t){let i=Du(t);i[e]=Math.max(0,Math.min(i[e]+i[e]*n,e===0?360:1)),i=Nu(i),t.r=i[0],t.g=i[1],t.b=i[2]}}function Hp(t,e){return t&&Object.assign(e||{},t)}function af(t){var e={r:0,g:0,b:0,a:255};return Array.isArray(t)?t.length>=3&&(e={r:t[0],g:t[1],b:t[2],a:255},t.length>3&&(e.a=on(t[3]))):(e=Hp(t,{r:0,g:0,b:0,a:1}),e.a=on(e.a)),e}function Sy(t){return t.charAt(0)==="r"?_y(t):py(t)}class Mr{constructor(e){if(e instanceof Mr)return e;const n=typeof e;let i;n==="object"?i=af(e):n==="string"&&(i=sy(e)||vy(e)||Sy(e)),this._rgb=i,this._valid=!!i}get valid(){return this._valid}get rgb(){var e=Hp(this._rgb);return e&&(e.a=Pt(e.a)),e}set rgb(e){this._rgb=af(e)}rgbString(){return this._valid?wy(this._rgb):void 0}hexString(){return this._valid?ly(this._rgb):void 0}hslString(){return this._valid?my(this._rgb):void 0}mix(e,n){if(e){const i=this.rgb,r=e.rgb;let s;const o=n===s?.5:n,l=2*o-1,a=i.a-r.a,u=((l*a===-1?l:(l+a)/(1+l*a))+1)/2;s=1-u,i.r=255&u*i.r+s*r.r+.5,i.g=255&u*i.g+s*r.g+.5,i.b=255&u*i.b+s*r.b+.5,i.a=o*i.a+(1-o)*r.a,this.rgb=i}return this}interpolate(e,n){return e&&(this._rgb=ky(this._rgb,e._rgb,n)),this}clone(){return new Mr(this.rgb)}alpha(e){return this._rgb.a=on(e),this}clearer(e){const n=this._rgb;return n.a*=1-e,this}greyscale(){const e=this._rgb,n=Ar(e.r*.3+e.g*.59+e.b*.11);return e.r=e.g=e.b=n,this}opaquer(e){const n=this._rgb;return n.a*=1+e,this}negate(){const e=this._rgb;return e.r=255-e.r,e.g=255-e.g,e.b=255-e.b,this}lighten(e){return ls(this._rgb,2,e),this}darken(e){return ls(this._rgb,2,-e),this}saturate(e){return ls(this._rgb,1,e),this}desaturate(e){return ls(this._rgb,1,-e),this}rotate(e){return gy(this._rgb,e),this}}function St(){}const by=(()=>{let t=0;return()=>t++})();function X(t){return t===null||typeof t>"u"}function ie(t){if(Array.isArray&&Array.isArray(t))return!0;const e=Object.prototype.toString.call(t);return e.slice(0,7)==="[object"&&e.slice(-6)==="Array]"}function B(t){return t!==null&&Object.prototype.toString.call(t)==="[object Object]"}function de(t){return(typeof t=="number"||t instanceof Number)&&isFinite(+t)}function He(t,e){return de(t)?t:e}function F(t,e){return typeof t>"u"?e:t}const Cy=(t,e)=>typeof t=="string"&&t.endsWith("%")?parseFloat(t)/100*e:+t;function V(t,e,n){if(t&&typeof t.call=="function")return t.apply(n,e)}function $(t,e,n,i){let r,s,o;if(ie(t))if(s=t.length,i)for(r=s-1;r>=0;r--)e.call(n,t[r],r);else for(r=0;r<s;r++)e.call(n,t[r],r);else if(B(t))for(o=Object.keys(t),s=o.length,r=0;r<s;r++)e.call(n,t[o[r]],o[r])}function co(t,e){let n,i,r,s;if(!t||!e||t.length!==e.length)return!1;for(n=0,i=t.length;n<i;++n)if(r=t[n],s=e[n],r.datasetIndex!==s.datasetIndex||r.index!==s.index)return!1;return!0}function fo(t){if(ie(t))return t.map(fo);if(B(t)){const e=Object.create(null),n=Object.keys(t),i=n.length;let r=0;for(;r<i;++r)e[n[r]]=fo(t[n[r]]);return e}return t}function Wp(t){return["__proto__","prototype","constructor"].indexOf(t)===-1}function My(t,e,n,i){if(!Wp(t))return;const r=e[t],s=n[t];B(r)&&B(s)?Er(r,s,i):e[t]=fo(s)}function Er(t,e,n){const i=ie(e)?e:[e],r=i.length;if(!B(t))return t;n=n||{};const s=n.merger||My;let o;for(let l=0;l<r;++l){if(o=i[l],!B(o))continue;const a=Object.keys(o);for(let u=0,c=a.length;u<c;++u)s(a[u],t,o,n)}return t}function tr(t,e){return Er(t,e,{merger:Ey})}function Ey(t,e,n){if(!Wp(t))return;const i=e[t],r=n[t];B(i)&&B(r)?tr(i,r):Object.prototype.hasOwnProperty.call(e,t)||(e[t]=fo(r))}const uf={"":t=>t,x:t=>t.x,y:t=>t.y};function Py(t){const e=t.split("."),n=[];let i="";for(const r of e)i+=r,i.endsWith("\\")?i=i.slice(0,-1)+".":(n.push(i),i="");return n}function Ly(t){const e=Py(t);return n=>{for(const i of e){if(i==="")break;n=n&&n[i]}return n}}function ho(t,e){return(uf[e]||(uf[e]=Ly(e)))(t)}function Iu(t){return t.charAt(0).toUpperCase()+t.slice(1)}const dt=t=>typeof t<"u",un=t=>typeof t=="function",cf=(t,e)=>{if(t.size!==e.size)return!1;for(const n of t)if(!e.has(n))return!1;return!0};function Ty(t){return t.type==="mouseup"||t.type==="click"||t.type==="contextmenu"}const ve=Math.PI,tt=2*ve,Oy=tt+ve,po=Number.POSITIVE_INFINITY,Dy=ve/180,Ne=ve/2,mn=ve/4,ff=ve*2/3,Kt=Math.log10,mi=Math.sign;function nr(t,e,n){return Math.abs(t-e)<n}function df(t){const e=Math.round(t);t=nr(t,e,t/1e3)?e:t;const n=Math.pow(10,Math.floor(Kt(t))),i=t/n;return(i<=1?1:i<=2?2:i<=5?5:10)*n}function zy(t){const e=[],n=Math.sqrt(t);let i;for(i=1;i<n;i++)t%i===0&&(e.push(i),e.push(t/i));return n===(n|0)&&e.push(n),e.sort((r,s)=>r-s).pop(),e}function Pr(t){return!isNaN(parseFloat(t))&&isFinite(t)}function Ny(t,e){const n=Math.round(t);return n-e<=t&&n+e>=t}function Vp(t,e,n){let i,r,s;for(i=0,r=t.length;i<r;i++)s=t[i][n],isNaN(s)||(e.min=Math.min(e.min,s),e.max=Math.max(e.max,s))}function Xt(t){return t*(ve/180)}function Ru(t){return t*(180/ve)}function hf(t){if(!de(t))return;let e=1,n=0;for(;Math.round(t*e)/e!==t;)e*=10,n++;return n}function Iy(t,e){const n=e.x-t.x,i=e.y-t.y,r=Math.sqrt(n*n+i*i);let s=Math.atan2(i,n);return s<-.5*ve&&(s+=tt),{angle:s,distance:r}}function Ma(t,e){return Math.sqrt(Math.pow(e.x-t.x,2)+Math.pow(e.y-t.y,2))}function Ry(t,e){return(t-e+Oy)%tt-ve}function lt(t){return(t%tt+tt)%tt}function Up(t,e,n,i){const r=lt(t),s=lt(e),o=lt(n),l=lt(s-r),a=lt(o-r),u=lt(r-s),c=lt(r-o);return r===s||r===o||i&&s===o||l>a&&u<c}function Je(t,e,n){return Math.max(e,Math.min(n,t))}function Fy(t){return Je(t,-32768,32767)}function Hi(t,e,n,i=1e-6){return t>=Math.min(e,n)-i&&t<=Math.max(e,n)+i}function Fu(t,e,n){n=n||(o=>t[o]<e);let i=t.length-1,r=0,s;for(;i-r>1;)s=r+i>>1,n(s)?r=s:i=s;return{lo:r,hi:i}}const En=(t,e,n,i)=>Fu(t,n,i?r=>{const s=t[r][e];return s<n||s===n&&t[r+1][e]===n}:r=>t[r][e]<n),Ay=(t,e,n)=>Fu(t,n,i=>t[i][e]>=n);function jy(t,e,n){let i=0,r=t.length;for(;i<r&&t[i]<e;)i++;for(;r>i&&t[r-1]>n;)r--;return i>0||r<t.length?t.slice(i,r):t}const Yp=["push","pop","shift","splice","unshift"];function By(t,e){if(t._chartjs){t._chartjs.listeners.push(e);return}Object.defineProperty(t,"_chartjs",{configurable:!0,enumerable:!1,value:{listeners:[e]}}),Yp.forEach(n=>{const i="_onData"+Iu(n),r=t[n];Object.defineProperty(t,n,{configurable:!0,enumerable:!1,value(...s){const o=r.apply(this,s);return t._chartjs.listeners.forEach(l=>{typeof l[i]=="function"&&l[i](...s)}),o}})})}function pf(t,e){const n=t._chartjs;if(!n)return;const i=n.listeners,r=i.indexOf(e);r!==-1&&i.splice(r,1),!(i.length>0)&&(Yp.forEach(s=>{delete t[s]}),delete t._chartjs)}function $y(t){const e=new Set;let n,i;for(n=0,i=t.length;n<i;++n)e.add(t[n]);return e.size===i?t:Array.from(e)}const Qp=function(){return typeof window>"u"?function(t){return t()}:window.requestAnimationFrame}();function Kp(t,e){let n=[],i=!1;return function(...r){n=r,i||(i=!0,Qp.call(window,()=>{i=!1,t.apply(e,n)}))}}function Hy(t,e){let n;return function(...i){return e?(clearTimeout(n),n=setTimeout(t,e,i)):t.apply(this,i),e}}const Xp=t=>t==="start"?"left":t==="end"?"right":"center",$e=(t,e,n)=>t==="start"?e:t==="end"?n:(e+n)/2,Wy=(t,e,n,i)=>t===(i?"left":"right")?n:t==="center"?(e+n)/2:e;function Vy(t,e,n){const i=e.length;let r=0,s=i;if(t._sorted){const{iScale:o,_parsed:l}=t,a=o.axis,{min:u,max:c,minDefined:f,maxDefined:d}=o.getUserBounds();f&&(r=Je(Math.min(En(l,o.axis,u).lo,n?i:En(e,a,o.getPixelForValue(u)).lo),0,i-1)),d?s=Je(Math.max(En(l,o.axis,c,!0).hi+1,n?0:En(e,a,o.getPixelForValue(c),!0).hi+1),r,i)-r:s=i-r}return{start:r,count:s}}function Uy(t){const{xScale:e,yScale:n,_scaleRanges:i}=t,r={xmin:e.min,xmax:e.max,ymin:n.min,ymax:n.max};if(!i)return t._scaleRanges=r,!0;const s=i.xmin!==e.min||i.xmax!==e.max||i.ymin!==n.min||i.ymax!==n.max;return Object.assign(i,r),s}const as=t=>t===0||t===1,gf=(t,e,n)=>-(Math.pow(2,10*(t-=1))*Math.sin((t-e)*tt/n)),mf=(t,e,n)=>Math.pow(2,-10*t)*Math.sin((t-e)*tt/n)+1,ir={linear:t=>t,easeInQuad:t=>t*t,easeOutQuad:t=>-t*(t-2),easeInOutQuad:t=>(t/=.5)<1?.5*t*t:-.5*(--t*(t-2)-1),easeInCubic:t=>t*t*t,easeOutCubic:t=>(t-=1)*t*t+1,easeInOutCubic:t=>(t/=.5)<1?.5*t*t*t:.5*((t-=2)*t*t+2),easeInQuart:t=>t*t*t*t,easeOutQuart:t=>-((t-=1)*t*t*t-1),easeInOutQuart:t=>(t/=.5)<1?.5*t*t*t*t:-.5*((t-=2)*t*t*t-2),easeInQuint:t=>t*t*t*t*t,easeOutQuint:t=>(t-=1)*t*t*t*t+1,easeInOutQuint:t=>(t/=.5)<1?.5*t*t*t*t*t:.5*((t-=2)*t*t*t*t+2),easeInSine:t=>-Math.cos(t*Ne)+1,easeOutSine:t=>Math.sin(t*Ne),easeInOutSine:t=>-.5*(Math.cos(ve*t)-1),easeInExpo:t=>t===0?0:Math.pow(2,10*(t-1)),easeOutExpo:t=>t===1?1:-Math.pow(2,-10*t)+1,easeInOutExpo:t=>as(t)?t:t<.5?.5*Math.pow(2,10*(t*2-1)):.5*(-Math.pow(2,-10*(t*2-1))+2),easeInCirc:t=>t>=1?t:-(Math.sqrt(1-t*t)-1),easeOutCirc:t=>Math.sqrt(1-(t-=1)*t),easeInOutCirc:t=>(t/=.5)<1?-.5*(Math.sqrt(1-t*t)-1):.5*(Math.sqrt(1-(t-=2)*t)+1),easeInElastic:t=>as(t)?t:gf(t,.075,.3),easeOutElastic:t=>as(t)?t:mf(t,.075,.3),easeInOutElastic(t){return as(t)?t:t<.5?.5*gf(t*2,.1125,.45):.5+.5*mf(t*2-1,.1125,.45)},easeInBack(t){return t*t*((1.70158+1)*t-1.70158)},easeOutBack(t){return(t-=1)*t*((1.70158+1)*t+1.70158)+1},easeInOutBack(t){let e=1.70158;return(t/=.5)<1?.5*(t*t*(((e*=1.525)+1)*t-e)):.5*((t-=2)*t*(((e*=1.525)+1)*t+e)+2)},easeInBounce:t=>1-ir.easeOutBounce(1-t),easeOutBounce(t){return t<1/2.75?7.5625*t*t:t<2/2.75?7.5625*(t-=1.5/2.75)*t+.75:t<2.5/2.75?7.5625*(t-=2.25/2.75)*t+.9375:7.5625*(t-=2.625/2.75)*t+.984375},easeInOutBounce:t=>t<.5?ir.easeInBounce(t*2)*.5:ir.easeOutBounce(t*2-1)*.5+.5};function Gp(t){if(t&&typeof t=="object"){const e=t.toString();return e==="[object CanvasPattern]"||e==="[object CanvasGradient]"}return!1}function yf(t){return Gp(t)?t:new Mr(t)}function xl(t){return Gp(t)?t:new Mr(t).saturate(.5).darken(.1).hexString()}const Yy=["x","y","borderWidth","radius","tension"],Qy=["color","borderColor","backgroundColor"];function Ky(t){t.set("animation",{delay:void 0,duration:1e3,easing:"easeOutQuart",fn:void 0,from:void 0,loop:void 0,to:void 0,type:void 0}),t.describe("animation",{_fallback:!1,_indexable:!1,_scriptable:e=>e!=="onProgress"&&e!=="onComplete"&&e!=="fn"}),t.set("animations",{colors:{type:"color",properties:Qy},numbers:{type:"number",properties:Yy}}),t.describe("animations",{_fallback:"animation"}),t.set("transitions",{active:{animation:{duration:400}},resize:{animation:{duration:0}},show:{animations:{colors:{from:"transparent"},visible:{type:"boolean",duration:0}}},hide:{animations:{colors:{to:"transparent"},visible:{type:"boolean",easing:"linear",fn:e=>e|0}}}})}function Xy(t){t.set("layout",{autoPadding:!0,padding:{top:0,right:0,bottom:0,left:0}})}const vf=new Map;function Gy(t,e){e=e||{};const n=t+JSON.stringify(e);let i=vf.get(n);return i||(i=new Intl.NumberFormat(t,e),vf.set(n,i)),i}function Au(t,e,n){return Gy(e,n).format(t)}const Zp={values(t){return ie(t)?t:""+t},numeric(t,e,n){if(t===0)return"0";const i=this.chart.options.locale;let r,s=t;if(n.length>1){const u=Math.max(Math.abs(n[0].value),Math.abs(n[n.length-1].value));(u<1e-4||u>1e15)&&(r="scientific"),s=Zy(t,n)}const o=Kt(Math.abs(s)),l=Math.max(Math.min(-1*Math.floor(o),20),0),a={notation:r,minimumFractionDigits:l,maximumFractionDigits:l};return Object.assign(a,this.options.ticks.format),Au(t,i,a)},logarithmic(t,e,n){if(t===0)return"0";const i=n[e].significand||t/Math.pow(10,Math.floor(Kt(t)));return[1,2,3,5,10,15].includes(i)||e>.8*n.length?Zp.numeric.call(this,t,e,n):""}};function Zy(t,e){let n=e.length>3?e[2].value-e[1].value:e[1].value-e[0].value;return Math.abs(n)>=1&&t!==Math.floor(t)&&(n=t-Math.floor(t)),n}var $o={formatters:Zp};function qy(t){t.set("scale",{display:!0,offset:!1,reverse:!1,beginAtZero:!1,bounds:"ticks",grace:0,grid:{display:!0,lineWidth:1,drawOnChartArea:!0,drawTicks:!0,tickLength:8,tickWidth:(e,n)=>n.lineWidth,tickColor:(e,n)=>n.color,offset:!1},border:{display:!0,dash:[],dashOffset:0,width:1},title:{display:!1,text:"",padding:{top:4,bottom:4}},ticks:{minRotation:0,maxRotation:50,mirror:!1,textStrokeWidth:0,textStrokeColor:"",padding:3,display:!0,autoSkip:!0,autoSkipPadding:3,labelOffset:0,callback:$o.formatters.values,minor:{},major:{},align:"center",crossAlign:"near",showLabelBackdrop:!1,backdropColor:"rgba(255, 255, 255, 0.75)",backdropPadding:2}}),t.route("scale.ticks","color","","color"),t.route("scale.grid","color","","borderColor"),t.route("scale.border","color","","borderColor"),t.route("scale.title","color","","color"),t.describe("scale",{_fallback:!1,_scriptable:e=>!e.startsWith("before")&&!e.startsWith("after")&&e!=="callback"&&e!=="parser",_indexable:e=>e!=="borderDash"&&e!=="tickBorderDash"&&e!=="dash"}),t.describe("scales",{_fallback:"scale"}),t.describe("scale.ticks",{_scriptable:e=>e!=="backdropPadding"&&e!=="callback",_indexable:e=>e!=="backdropPadding"})}const Rn=Object.create(null),Ea=Object.create(null);function rr(t,e){if(!e)return t;const n=e.split(".");for(let i=0,r=n.length;i<r;++i){const s=n[i];t=t[s]||(t[s]=Object.create(null))}return t}function _l(t,e,n){return typeof e=="string"?Er(rr(t,e),n):Er(rr(t,""),e)}class Jy{constructor(e,n){this.animation=void 0,this.backgroundColor="rgba(0,0,0,0.1)",this.borderColor="rgba(0,0,0,0.1)",this.color="#666",this.datasets={},this.devicePixelRatio=i=>i.chart.platform.getDevicePixelRatio(),this.elements={},this.events=["mousemove","mouseout","click","touchstart","touchmove"],this.font={family:"'Helvetica Neue', 'Helvetica', 'Arial', sans-serif",size:12,style:"normal",lineHeight:1.2,weight:null},this.hover={},this.hoverBackgroundColor=(i,r)=>xl(r.backgroundColor),this.hoverBorderColor=(i,r)=>xl(r.borderColor),this.hoverColor=(i,r)=>xl(r.color),this.indexAxis="x",this.interaction={mode:"nearest",intersect:!0,includeInvisible:!1},this.maintainAspectRatio=!0,this.onHover=null,this.onClick=null,this.parsing=!0,this.plugins={},this.responsive=!0,this.scale=void 0,this.scales={},this.showLine=!0,this.drawActiveElementsOnTop=!0,this.describe(e),this.apply(n)}set(e,n){return _l(this,e,n)}get(e){return rr(this,e)}describe(e,n){return _l(Ea,e,n)}override(e,n){return _l(Rn,e,n)}route(e,n,i,r){const s=rr(this,e),o=rr(this,i),l="_"+n;Object.defineProperties(s,{[l]:{value:s[n],writable:!0},[n]:{enumerable:!0,get(){const a=this[l],u=o[r];return B(a)?Object.assign({},u,a):F(a,u)},set(a){this[l]=a}}})}apply(e){e.forEach(n=>n(this))}}var oe=new Jy({_scriptable:t=>!t.startsWith("on"),_indexable:t=>t!=="events",hover:{_fallback:"interaction"},interaction:{_scriptable:!1,_indexable:!1}},[Ky,Xy,qy]);function ev(t){return!t||X(t.size)||X(t.family)?null:(t.style?t.style+" ":"")+(t.weight?t.weight+" ":"")+t.size+"px "+t.family}function go(t,e,n,i,r){let s=e[r];return s||(s=e[r]=t.measureText(r).width,n.push(r)),s>i&&(i=s),i}function tv(t,e,n,i){i=i||{};let r=i.data=i.data||{},s=i.garbageCollect=i.garbageCollect||[];i.font!==e&&(r=i.data={},s=i.garbageCollect=[],i.font=e),t.save(),t.font=e;let o=0;const l=n.length;let a,u,c,f,d;for(a=0;a<l;a++)if(f=n[a],f!=null&&ie(f)!==!0)o=go(t,r,s,o,f);else if(ie(f))for(u=0,c=f.length;u<c;u++)d=f[u],d!=null&&!ie(d)&&(o=go(t,r,s,o,d));t.restore();const h=s.length/2;if(h>n.length){for(a=0;a<h;a++)delete r[s[a]];s.splice(0,h)}return o}function yn(t,e,n){const i=t.currentDevicePixelRatio,r=n!==0?Math.max(n/2,.5):0;return Math.round((e-r)*i)/i+r}function xf(t,e){e=e||t.getContext("2d"),e.save(),e.resetTransform(),e.clearRect(0,0,t.width,t.height),e.restore()}function Pa(t,e,n,i){qp(t,e,n,i,null)}function qp(t,e,n,i,r){let s,o,l,a,u,c,f,d;const h=e.pointStyle,m=e.rotation,y=e.radius;let x=(m||0)*Dy;if(h&&typeof h=="object"&&(s=h.toString(),s==="[object HTMLImageElement]"||s==="[object HTMLCanvasElement]")){t.save(),t.translate(n,i),t.rotate(x),t.drawImage(h,-h.width/2,-h.height/2,h.width,h.height),t.restore();return}if(!(isNaN(y)||y<=0)){switch(t.beginPath(),h){default:r?t.ellipse(n,i,r/2,y,0,0,tt):t.arc(n,i,y,0,tt),t.closePath();break;case"triangle":c=r?r/2:y,t.moveTo(n+Math.sin(x)*c,i-Math.cos(x)*y),x+=ff,t.lineTo(n+Math.sin(x)*c,i-Math.cos(x)*y),x+=ff,t.lineTo(n+Math.sin(x)*c,i-Math.cos(x)*y),t.closePath();break;case"rectRounded":u=y*.516,a=y-u,o=Math.cos(x+mn)*a,f=Math.cos(x+mn)*(r?r/2-u:a),l=Math.sin(x+mn)*a,d=Math.sin(x+mn)*(r?r/2-u:a),t.arc(n-f,i-l,u,x-ve,x-Ne),t.arc(n+d,i-o,u,x-Ne,x),t.arc(n+f,i+l,u,x,x+Ne),t.arc(n-d,i+o,u,x+Ne,x+ve),t.closePath();break;case"rect":if(!m){a=Math.SQRT1_2*y,c=r?r/2:a,t.rect(n-c,i-a,2*c,2*a);break}x+=mn;case"rectRot":f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+d,i-o),t.lineTo(n+f,i+l),t.lineTo(n-d,i+o),t.closePath();break;case"crossRot":x+=mn;case"cross":f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+f,i+l),t.moveTo(n+d,i-o),t.lineTo(n-d,i+o);break;case"star":f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+f,i+l),t.moveTo(n+d,i-o),t.lineTo(n-d,i+o),x+=mn,f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+f,i+l),t.moveTo(n+d,i-o),t.lineTo(n-d,i+o);break;case"line":o=r?r/2:Math.cos(x)*y,l=Math.sin(x)*y,t.moveTo(n-o,i-l),t.lineTo(n+o,i+l);break;case"dash":t.moveTo(n,i),t.lineTo(n+Math.cos(x)*(r?r/2:y),i+Math.sin(x)*y);break;case!1:t.closePath();break}t.fill(),e.borderWidth>0&&t.stroke()}}function Lr(t,e,n){return n=n||.5,!e||t&&t.x>e.left-n&&t.x<e.right+n&&t.y>e.top-n&&t.y<e.bottom+n}function ju(t,e){t.save(),t.beginPath(),t.rect(e.left,e.top,e.right-e.left,e.bottom-e.top),t.clip()}function Bu(t){t.restore()}function nv(t,e,n,i,r){if(!e)return t.lineTo(n.x,n.y);if(r==="middle"){const s=(e.x+n.x)/2;t.lineTo(s,e.y),t.lineTo(s,n.y)}else r==="after"!=!!i?t.lineTo(e.x,n.y):t.lineTo(n.x,e.y);t.lineTo(n.x,n.y)}function iv(t,e,n,i){if(!e)return t.lineTo(n.x,n.y);t.bezierCurveTo(i?e.cp1x:e.cp2x,i?e.cp1y:e.cp2y,i?n.cp2x:n.cp1x,i?n.cp2y:n.cp1y,n.x,n.y)}function yi(t,e,n,i,r,s={}){const o=ie(e)?e:[e],l=s.strokeWidth>0&&s.strokeColor!=="";let a,u;for(t.save(),t.font=r.string,rv(t,s),a=0;a<o.length;++a)u=o[a],s.backdrop&&ov(t,s.backdrop),l&&(s.strokeColor&&(t.strokeStyle=s.strokeColor),X(s.strokeWidth)||(t.lineWidth=s.strokeWidth),t.strokeText(u,n,i,s.maxWidth)),t.fillText(u,n,i,s.maxWidth),sv(t,n,i,u,s),i+=r.lineHeight;t.restore()}function rv(t,e){e.translation&&t.translate(e.translation[0],e.translation[1]),X(e.rotation)||t.rotate(e.rotation),e.color&&(t.fillStyle=e.color),e.textAlign&&(t.textAlign=e.textAlign),e.textBaseline&&(t.textBaseline=e.textBaseline)}function sv(t,e,n,i,r){if(r.strikethrough||r.underline){const s=t.measureText(i),o=e-s.actualBoundingBoxLeft,l=e+s.actualBoundingBoxRight,a=n-s.actualBoundingBoxAscent,u=n+s.actualBoundingBoxDescent,c=r.strikethrough?(a+u)/2:u;t.strokeStyle=t.fillStyle,t.beginPath(),t.lineWidth=r.decorationWidth||2,t.moveTo(o,c),t.lineTo(l,c),t.stroke()}}function ov(t,e){const n=t.fillStyle;t.fillStyle=e.color,t.fillRect(e.left,e.top,e.width,e.height),t.fillStyle=n}function mo(t,e){const{x:n,y:i,w:r,h:s,radius:o}=e;t.arc(n+o.topLeft,i+o.topLeft,o.topLeft,-Ne,ve,!0),t.lineTo(n,i+s-o.bottomLeft),t.arc(n+o.bottomLeft,i+s-o.bottomLeft,o.bottomLeft,ve,Ne,!0),t.lineTo(n+r-o.bottomRight,i+s),t.arc(n+r-o.bottomRight,i+s-o.bottomRight,o.bottomRight,Ne,0,!0),t.lineTo(n+r,i+o.topRight),t.arc(n+r-o.topRight,i+o.topRight,o.topRight,0,-Ne,!0),t.lineTo(n+o.topLeft,i)}const lv=/^(normal|(\d+(?:\.\d+)?)(px|em|%)?)$/,av=/^(normal|italic|initial|inherit|unset|(oblique( -?[0-9]?[0-9]deg)?))$/;function uv(t,e){const n=(""+t).match(lv);if(!n||n[1]==="normal")return e*1.2;switch(t=+n[2],n[3]){case"px":return t;case"%":t/=100;break}return e*t}const cv=t=>+t||0;function Jp(t,e){const n={},i=B(e),r=i?Object.keys(e):e,s=B(t)?i?o=>F(t[o],t[e[o]]):o=>t[o]:()=>t;for(const o of r)n[o]=cv(s(o));return n}function fv(t){return Jp(t,{top:"y",right:"x",bottom:"y",left:"x"})}function li(t){return Jp(t,["topLeft","topRight","bottomLeft","bottomRight"])}function Me(t){const e=fv(t);return e.width=e.left+e.right,e.height=e.top+e.bottom,e}function ge(t,e){t=t||{},e=e||oe.font;let n=F(t.size,e.size);typeof n=="string"&&(n=parseInt(n,10));let i=F(t.style,e.style);i&&!(""+i).match(av)&&(console.warn('Invalid font style specified: "'+i+'"'),i=void 0);const r={family:F(t.family,e.family),lineHeight:uv(F(t.lineHeight,e.lineHeight),n),size:n,style:i,weight:F(t.weight,e.weight),string:""};return r.string=ev(r),r}function us(t,e,n,i){let r=!0,s,o,l;for(s=0,o=t.length;s<o;++s)if(l=t[s],l!==void 0&&(e!==void 0&&typeof l=="function"&&(l=l(e),r=!1),n!==void 0&&ie(l)&&(l=l[n%l.length],r=!1),l!==void 0))return i&&!r&&(i.cacheable=!1),l}function dv(t,e,n){const{min:i,max:r}=t,s=Cy(e,(r-i)/2),o=(l,a)=>n&&l===0?0:l+a;return{min:o(i,-Math.abs(s)),max:o(r,s)}}function gn(t,e){return Object.assign(Object.create(t),e)}function $u(t,e=[""],n=t,i,r=()=>t[0]){dt(i)||(i=ig("_fallback",t));const s={[Symbol.toStringTag]:"Object",_cacheable:!0,_scopes:t,_rootScopes:n,_fallback:i,_getTarget:r,override:o=>$u([o,...t],e,n,i)};return new Proxy(s,{deleteProperty(o,l){return delete o[l],delete o._keys,delete t[0][l],!0},get(o,l){return tg(o,l,()=>_v(l,e,t,o))},getOwnPropertyDescriptor(o,l){return Reflect.getOwnPropertyDescriptor(o._scopes[0],l)},getPrototypeOf(){return Reflect.getPrototypeOf(t[0])},has(o,l){return wf(o).includes(l)},ownKeys(o){return wf(o)},set(o,l,a){const u=o._storage||(o._storage=r());return o[l]=u[l]=a,delete o._keys,!0}})}function vi(t,e,n,i){const r={_cacheable:!1,_proxy:t,_context:e,_subProxy:n,_stack:new Set,_descriptors:eg(t,i),setContext:s=>vi(t,s,n,i),override:s=>vi(t.override(s),e,n,i)};return new Proxy(r,{deleteProperty(s,o){return delete s[o],delete t[o],!0},get(s,o,l){return tg(s,o,()=>pv(s,o,l))},getOwnPropertyDescriptor(s,o){return s._descriptors.allKeys?Reflect.has(t,o)?{enumerable:!0,configurable:!0}:void 0:Reflect.getOwnPropertyDescriptor(t,o)},getPrototypeOf(){return Reflect.getPrototypeOf(t)},has(s,o){return Reflect.has(t,o)},ownKeys(){return Reflect.ownKeys(t)},set(s,o,l){return t[o]=l,delete s[o],!0}})}function eg(t,e={scriptable:!0,indexable:!0}){const{_scriptable:n=e.scriptable,_indexable:i=e.indexable,_allKeys:r=e.allKeys}=t;return{allKeys:r,scriptable:n,indexable:i,isScriptable:un(n)?n:()=>n,isIndexable:un(i)?i:()=>i}}const hv=(t,e)=>t?t+Iu(e):e,Hu=(t,e)=>B(e)&&t!=="adapters"&&(Object.getPrototypeOf(e)===null||e.constructor===Object);function tg(t,e,n){if(Object.prototype.hasOwnProperty.call(t,e))return t[e];const i=n();return t[e]=i,i}function pv(t,e,n){const{_proxy:i,_context:r,_subProxy:s,_descriptors:o}=t;let l=i[e];return un(l)&&o.isScriptable(e)&&(l=gv(e,l,t,n)),ie(l)&&l.length&&(l=mv(e,l,t,o.isIndexable)),Hu(e,l)&&(l=vi(l,r,s&&s[e],o)),l}function gv(t,e,n,i){const{_proxy:r,_context:s,_subProxy:o,_stack:l}=n;if(l.has(t))throw new Error("Recursion detected: "+Array.from(l).join("->")+"->"+t);return l.add(t),e=e(s,o||i),l.delete(t),Hu(t,e)&&(e=Wu(r._scopes,r,t,e)),e}function mv(t,e,n,i){const{_proxy:r,_context:s,_subProxy:o,_descriptors:l}=n;if(dt(s.index)&&i(t))e=e[s.index%e.length];else if(B(e[0])){const a=e,u=r._scopes.filter(c=>c!==a);e=[];for(const c of a){const f=Wu(u,r,t,c);e.push(vi(f,s,o&&o[t],l))}}return e}function ng(t,e,n){return un(t)?t(e,n):t}const yv=(t,e)=>t===!0?e:typeof t=="string"?ho(e,t):void 0;function vv(t,e,n,i,r){for(const s of e){const o=yv(n,s);if(o){t.add(o);const l=ng(o._fallback,n,r);if(dt(l)&&l!==n&&l!==i)return l}else if(o===!1&&dt(i)&&n!==i)return null}return!1}function Wu(t,e,n,i){const r=e._rootScopes,s=ng(e._fallback,n,i),o=[...t,...r],l=new Set;l.add(i);let a=_f(l,o,n,s||n,i);return a===null||dt(s)&&s!==n&&(a=_f(l,o,s,a,i),a===null)?!1:$u(Array.from(l),[""],r,s,()=>xv(e,n,i))}function _f(t,e,n,i,r){for(;n;)n=vv(t,e,n,i,r);return n}function xv(t,e,n){const i=t._getTarget();e in i||(i[e]={});const r=i[e];return ie(r)&&B(n)?n:r||{}}function _v(t,e,n,i){let r;for(const s of e)if(r=ig(hv(s,t),n),dt(r))return Hu(t,r)?Wu(n,i,t,r):r}function ig(t,e){for(const n of e){if(!n)continue;const i=n[t];if(dt(i))return i}}function wf(t){let e=t._keys;return e||(e=t._keys=wv(t._scopes)),e}function wv(t){const e=new Set;for(const n of t)for(const i of Object.keys(n).filter(r=>!r.startsWith("_")))e.add(i);return Array.from(e)}const kv=Number.EPSILON||1e-14,xi=(t,e)=>e<t.length&&!t[e].skip&&t[e],rg=t=>t==="x"?"y":"x";function Sv(t,e,n,i){const r=t.skip?e:t,s=e,o=n.skip?e:n,l=Ma(s,r),a=Ma(o,s);let u=l/(l+a),c=a/(l+a);u=isNaN(u)?0:u,c=isNaN(c)?0:c;const f=i*u,d=i*c;return{previous:{x:s.x-f*(o.x-r.x),y:s.y-f*(o.y-r.y)},next:{x:s.x+d*(o.x-r.x),y:s.y+d*(o.y-r.y)}}}function bv(t,e,n){const i=t.length;let r,s,o,l,a,u=xi(t,0);for(let c=0;c<i-1;++c)if(a=u,u=xi(t,c+1),!(!a||!u)){if(nr(e[c],0,kv)){n[c]=n[c+1]=0;continue}r=n[c]/e[c],s=n[c+1]/e[c],l=Math.pow(r,2)+Math.pow(s,2),!(l<=9)&&(o=3/Math.sqrt(l),n[c]=r*o*e[c],n[c+1]=s*o*e[c])}}function Cv(t,e,n="x"){const i=rg(n),r=t.length;let s,o,l,a=xi(t,0);for(let u=0;u<r;++u){if(o=l,l=a,a=xi(t,u+1),!l)continue;const c=l[n],f=l[i];o&&(s=(c-o[n])/3,l[`cp1${n}`]=c-s,l[`cp1${i}`]=f-s*e[u]),a&&(s=(a[n]-c)/3,l[`cp2${n}`]=c+s,l[`cp2${i}`]=f+s*e[u])}}function Mv(t,e="x"){const n=rg(e),i=t.length,r=Array(i).fill(0),s=Array(i);let o,l,a,u=xi(t,0);for(o=0;o<i;++o)if(l=a,a=u,u=xi(t,o+1),!!a){if(u){const c=u[e]-a[e];r[o]=c!==0?(u[n]-a[n])/c:0}s[o]=l?u?mi(r[o-1])!==mi(r[o])?0:(r[o-1]+r[o])/2:r[o-1]:r[o]}bv(t,r,s),Cv(t,s,e)}function cs(t,e,n){return Math.max(Math.min(t,n),e)}function Ev(t,e){let n,i,r,s,o,l=Lr(t[0],e);for(n=0,i=t.length;n<i;++n)o=s,s=l,l=n<i-1&&Lr(t[n+1],e),s&&(r=t[n],o&&(r.cp1x=cs(r.cp1x,e.left,e.right),r.cp1y=cs(r.cp1y,e.top,e.bottom)),l&&(r.cp2x=cs(r.cp2x,e.left,e.right),r.cp2y=cs(r.cp2y,e.top,e.bottom)))}function Pv(t,e,n,i,r){let s,o,l,a;if(e.spanGaps&&(t=t.filter(u=>!u.skip)),e.cubicInterpolationMode==="monotone")Mv(t,r);else{let u=i?t[t.length-1]:t[0];for(s=0,o=t.length;s<o;++s)l=t[s],a=Sv(u,l,t[Math.min(s+1,o-(i?0:1))%o],e.tension),l.cp1x=a.previous.x,l.cp1y=a.previous.y,l.cp2x=a.next.x,l.cp2y=a.next.y,u=l}e.capBezierPoints&&Ev(t,n)}function sg(){return typeof window<"u"&&typeof document<"u"}function Vu(t){let e=t.parentNode;return e&&e.toString()==="[object ShadowRoot]"&&(e=e.host),e}function yo(t,e,n){let i;return typeof t=="string"?(i=parseInt(t,10),t.indexOf("%")!==-1&&(i=i/100*e.parentNode[n])):i=t,i}const Ho=t=>t.ownerDocument.defaultView.getComputedStyle(t,null);function Lv(t,e){return Ho(t).getPropertyValue(e)}const Tv=["top","right","bottom","left"];function Tn(t,e,n){const i={};n=n?"-"+n:"";for(let r=0;r<4;r++){const s=Tv[r];i[s]=parseFloat(t[e+"-"+s+n])||0}return i.width=i.left+i.right,i.height=i.top+i.bottom,i}const Ov=(t,e,n)=>(t>0||e>0)&&(!n||!n.shadowRoot);function Dv(t,e){const n=t.touches,i=n&&n.length?n[0]:t,{offsetX:r,offsetY:s}=i;let o=!1,l,a;if(Ov(r,s,t.target))l=r,a=s;else{const u=e.getBoundingClientRect();l=i.clientX-u.left,a=i.clientY-u.top,o=!0}return{x:l,y:a,box:o}}function kn(t,e){if("native"in t)return t;const{canvas:n,currentDevicePixelRatio:i}=e,r=Ho(n),s=r.boxSizing==="border-box",o=Tn(r,"padding"),l=Tn(r,"border","width"),{x:a,y:u,box:c}=Dv(t,n),f=o.left+(c&&l.left),d=o.top+(c&&l.top);let{width:h,height:m}=e;return s&&(h-=o.width+l.width,m-=o.height+l.height),{x:Math.round((a-f)/h*n.width/i),y:Math.round((u-d)/m*n.height/i)}}function zv(t,e,n){let i,r;if(e===void 0||n===void 0){const s=Vu(t);if(!s)e=t.clientWidth,n=t.clientHeight;else{const o=s.getBoundingClientRect(),l=Ho(s),a=Tn(l,"border","width"),u=Tn(l,"padding");e=o.width-u.width-a.width,n=o.height-u.height-a.height,i=yo(l.maxWidth,s,"clientWidth"),r=yo(l.maxHeight,s,"clientHeight")}}return{width:e,height:n,maxWidth:i||po,maxHeight:r||po}}const fs=t=>Math.round(t*10)/10;function Nv(t,e,n,i){const r=Ho(t),s=Tn(r,"margin"),o=yo(r.maxWidth,t,"clientWidth")||po,l=yo(r.maxHeight,t,"clientHeight")||po,a=zv(t,e,n);let{width:u,height:c}=a;if(r.boxSizing==="content-box"){const d=Tn(r,"border","width"),h=Tn(r,"padding");u-=h.width+d.width,c-=h.height+d.height}return u=Math.max(0,u-s.width),c=Math.max(0,i?u/i:c-s.height),u=fs(Math.min(u,o,a.maxWidth)),c=fs(Math.min(c,l,a.maxHeight)),u&&!c&&(c=fs(u/2)),(e!==void 0||n!==void 0)&&i&&a.height&&c>a.height&&(c=a.height,u=fs(Math.floor(c*i))),{width:u,height:c}}function kf(t,e,n){const i=e||1,r=Math.floor(t.height*i),s=Math.floor(t.width*i);t.height=Math.floor(t.height),t.width=Math.floor(t.width);const o=t.canvas;return o.style&&(n||!o.style.height&&!o.style.width)&&(o.style.height=`${t.height}px`,o.style.width=`${t.width}px`),t.currentDevicePixelRatio!==i||o.height!==r||o.width!==s?(t.currentDevicePixelRatio=i,o.height=r,o.width=s,t.ctx.setTransform(i,0,0,i,0,0),!0):!1}const Iv=function(){let t=!1;try{const e={get passive(){return t=!0,!1}};window.addEventListener("test",null,e),window.removeEventListener("test",null,e)}catch{}return t}();function Sf(t,e){const n=Lv(t,e),i=n&&n.match(/^(\d+)(\.\d+)?px$/);return i?+i[1]:void 0}function Sn(t,e,n,i){return{x:t.x+n*(e.x-t.x),y:t.y+n*(e.y-t.y)}}function Rv(t,e,n,i){return{x:t.x+n*(e.x-t.x),y:i==="middle"?n<.5?t.y:e.y:i==="after"?n<1?t.y:e.y:n>0?e.y:t.y}}function Fv(t,e,n,i){const r={x:t.cp2x,y:t.cp2y},s={x:e.cp1x,y:e.cp1y},o=Sn(t,r,n),l=Sn(r,s,n),a=Sn(s,e,n),u=Sn(o,l,n),c=Sn(l,a,n);return Sn(u,c,n)}const Av=function(t,e){return{x(n){return t+t+e-n},setWidth(n){e=n},textAlign(n){return n==="center"?n:n==="right"?"left":"right"},xPlus(n,i){return n-i},leftForLtr(n,i){return n-i}}},jv=function(){return{x(t){return t},setWidth(t){},textAlign(t){return t},xPlus(t,e){return t+e},leftForLtr(t,e){return t}}};function ai(t,e,n){return t?Av(e,n):jv()}function og(t,e){let n,i;(e==="ltr"||e==="rtl")&&(n=t.canvas.style,i=[n.getPropertyValue("direction"),n.getPropertyPriority("direction")],n.setProperty("direction",e,"important"),t.prevTextDirection=i)}function lg(t,e){e!==void 0&&(delete t.prevTextDirection,t.canvas.style.setProperty("direction",e[0],e[1]))}function ag(t){return t==="angle"?{between:Up,compare:Ry,normalize:lt}:{between:Hi,compare:(e,n)=>e-n,normalize:e=>e}}function bf({start:t,end:e,count:n,loop:i,style:r}){return{start:t%n,end:e%n,loop:i&&(e-t+1)%n===0,style:r}}function Bv(t,e,n){const{property:i,start:r,end:s}=n,{between:o,normalize:l}=ag(i),a=e.length;let{start:u,end:c,loop:f}=t,d,h;if(f){for(u+=a,c+=a,d=0,h=a;d<h&&o(l(e[u%a][i]),r,s);++d)u--,c--;u%=a,c%=a}return c<u&&(c+=a),{start:u,end:c,loop:f,style:t.style}}function $v(t,e,n){if(!n)return[t];const{property:i,start:r,end:s}=n,o=e.length,{compare:l,between:a,normalize:u}=ag(i),{start:c,end:f,loop:d,style:h}=Bv(t,e,n),m=[];let y=!1,x=null,p,g,v;const _=()=>a(r,v,p)&&l(r,v)!==0,w=()=>l(s,p)===0||a(s,v,p),k=()=>y||_(),S=()=>!y||w();for(let b=c,O=c;b<=f;++b)g=e[b%o],!g.skip&&(p=u(g[i]),p!==v&&(y=a(p,r,s),x===null&&k()&&(x=l(p,r)===0?b:O),x!==null&&S()&&(m.push(bf({start:x,end:b,loop:d,count:o,style:h})),x=null),O=b,v=p));return x!==null&&m.push(bf({start:x,end:f,loop:d,count:o,style:h})),m}function Hv(t,e){const n=[],i=t.segments;for(let r=0;r<i.length;r++){const s=$v(i[r],t.points,e);s.length&&n.push(...s)}return n}function Wv(t,e,n,i){let r=0,s=e-1;if(n&&!i)for(;r<e&&!t[r].skip;)r++;for(;r<e&&t[r].skip;)r++;for(r%=e,n&&(s+=r);s>r&&t[s%e].skip;)s--;return s%=e,{start:r,end:s}}function Vv(t,e,n,i){const r=t.length,s=[];let o=e,l=t[e],a;for(a=e+1;a<=n;++a){const u=t[a%r];u.skip||u.stop?l.skip||(i=!1,s.push({start:e%r,end:(a-1)%r,loop:i}),e=o=u.stop?a:null):(o=a,l.skip&&(e=a)),l=u}return o!==null&&s.push({start:e%r,end:o%r,loop:i}),s}function Uv(t,e){const n=t.points,i=t.options.spanGaps,r=n.length;if(!r)return[];const s=!!t._loop,{start:o,end:l}=Wv(n,r,s,i);if(i===!0)return Cf(t,[{start:o,end:l,loop:s}],n,e);const a=l<o?l+r:l,u=!!t._fullLoop&&o===0&&l===r-1;return Cf(t,Vv(n,o,a,u),n,e)}function Cf(t,e,n,i){return!i||!i.setContext||!n?e:Yv(t,e,n,i)}function Yv(t,e,n,i){const r=t._chart.getContext(),s=Mf(t.options),{_datasetIndex:o,options:{spanGaps:l}}=t,a=n.length,u=[];let c=s,f=e[0].start,d=f;function h(m,y,x,p){const g=l?-1:1;if(m!==y){for(m+=a;n[m%a].skip;)m-=g;for(;n[y%a].skip;)y+=g;m%a!==y%a&&(u.push({start:m%a,end:y%a,loop:x,style:p}),c=p,f=y%a)}}for(const m of e){f=l?f:m.start;let y=n[f%a],x;for(d=f+1;d<=m.end;d++){const p=n[d%a];x=Mf(i.setContext(gn(r,{type:"segment",p0:y,p1:p,p0DataIndex:(d-1)%a,p1DataIndex:d%a,datasetIndex:o}))),Qv(x,c)&&h(f,d-1,m.loop,c),y=p,c=x}f<d-1&&h(f,d-1,m.loop,c)}return u}function Mf(t){return{backgroundColor:t.backgroundColor,borderCapStyle:t.borderCapStyle,borderDash:t.borderDash,borderDashOffset:t.borderDashOffset,borderJoinStyle:t.borderJoinStyle,borderWidth:t.borderWidth,borderColor:t.borderColor}}function Qv(t,e){return e&&JSON.stringify(t)!==JSON.stringify(e)}class Kv{constructor(){this._request=null,this._charts=new Map,this._running=!1,this._lastDate=void 0}_notify(e,n,i,r){const s=n.listeners[r],o=n.duration;s.forEach(l=>l({chart:e,initial:n.initial,numSteps:o,currentStep:Math.min(i-n.start,o)}))}_refresh(){this._request||(this._running=!0,this._request=Qp.call(window,()=>{this._update(),this._request=null,this._running&&this._refresh()}))}_update(e=Date.now()){let n=0;this._charts.forEach((i,r)=>{if(!i.running||!i.items.length)return;const s=i.items;let o=s.length-1,l=!1,a;for(;o>=0;--o)a=s[o],a._active?(a._total>i.duration&&(i.duration=a._total),a.tick(e),l=!0):(s[o]=s[s.length-1],s.pop());l&&(r.draw(),this._notify(r,i,e,"progress")),s.length||(i.running=!1,this._notify(r,i,e,"complete"),i.initial=!1),n+=s.length}),this._lastDate=e,n===0&&(this._running=!1)}_getAnims(e){const n=this._charts;let i=n.get(e);return i||(i={running:!1,initial:!0,items:[],listeners:{complete:[],progress:[]}},n.set(e,i)),i}listen(e,n,i){this._getAnims(e).listeners[n].push(i)}add(e,n){!n||!n.length||this._getAnims(e).items.push(...n)}has(e){return this._getAnims(e).items.length>0}start(e){const n=this._charts.get(e);n&&(n.running=!0,n.start=Date.now(),n.duration=n.items.reduce((i,r)=>Math.max(i,r._duration),0),this._refresh())}running(e){if(!this._running)return!1;const n=this._charts.get(e);return!(!n||!n.running||!n.items.length)}stop(e){const n=this._charts.get(e);if(!n||!n.items.length)return;const i=n.items;let r=i.length-1;for(;r>=0;--r)i[r].cancel();n.items=[],this._notify(e,n,Date.now(),"complete")}remove(e){return this._charts.delete(e)}}var bt=new Kv;const Ef="transparent",Xv={boolean(t,e,n){return n>.5?e:t},color(t,e,n){const i=yf(t||Ef),r=i.valid&&yf(e||Ef);return r&&r.valid?r.mix(i,n).hexString():e},number(t,e,n){return t+(e-t)*n}};class Gv{constructor(e,n,i,r){const s=n[i];r=us([e.to,r,s,e.from]);const o=us([e.from,s,r]);this._active=!0,this._fn=e.fn||Xv[e.type||typeof o],this._easing=ir[e.easing]||ir.linear,this._start=Math.floor(Date.now()+(e.delay||0)),this._duration=this._total=Math.floor(e.duration),this._loop=!!e.loop,this._target=n,this._prop=i,this._from=o,this._to=r,this._promises=void 0}active(){return this._active}update(e,n,i){if(this._active){this._notify(!1);const r=this._target[this._prop],s=i-this._start,o=this._duration-s;this._start=i,this._duration=Math.floor(Math.max(o,e.duration)),this._total+=s,this._loop=!!e.loop,this._to=us([e.to,n,r,e.from]),this._from=us([e.from,r,n])}}cancel(){this._active&&(this.tick(Date.now()),this._active=!1,this._notify(!1))}tick(e){const n=e-this._start,i=this._duration,r=this._prop,s=this._from,o=this._loop,l=this._to;let a;if(this._active=s!==l&&(o||n<i),!this._active){this._target[r]=l,this._notify(!0);return}if(n<0){this._target[r]=s;return}a=n/i%2,a=o&&a>1?2-a:a,a=this._easing(Math.min(1,Math.max(0,a))),this._target[r]=this._fn(s,l,a)}wait(){const e=this._promises||(this._promises=[]);return new Promise((n,i)=>{e.push({res:n,rej:i})})}_notify(e){const n=e?"res":"rej",i=this._promises||[];for(let r=0;r<i.length;r++)i[r][n]()}}class ug{constructor(e,n){this._chart=e,this._properties=new Map,this.configure(n)}configure(e){if(!B(e))return;const n=Object.keys(oe.animation),i=this._properties;Object.getOwnPropertyNames(e).forEach(r=>{const s=e[r];if(!B(s))return;const o={};for(const l of n)o[l]=s[l];(ie(s.properties)&&s.properties||[r]).forEach(l=>{(l===r||!i.has(l))&&i.set(l,o)})})}_animateOptions(e,n){const i=n.options,r=qv(e,i);if(!r)return[];const s=this._createAnimations(r,i);return i.$shared&&Zv(e.options.$animations,i).then(()=>{e.options=i},()=>{}),s}_createAnimations(e,n){const i=this._properties,r=[],s=e.$animations||(e.$animations={}),o=Object.keys(n),l=Date.now();let a;for(a=o.length-1;a>=0;--a){const u=o[a];if(u.charAt(0)==="$")continue;if(u==="options"){r.push(...this._animateOptions(e,n));continue}const c=n[u];let f=s[u];const d=i.get(u);if(f)if(d&&f.active()){f.update(d,c,l);continue}else f.cancel();if(!d||!d.duration){e[u]=c;continue}s[u]=f=new Gv(d,e,u,c),r.push(f)}return r}update(e,n){if(this._properties.size===0){Object.assign(e,n);return}const i=this._createAnimations(e,n);if(i.length)return bt.add(this._chart,i),!0}}function Zv(t,e){const n=[],i=Object.keys(e);for(let r=0;r<i.length;r++){const s=t[i[r]];s&&s.active()&&n.push(s.wait())}return Promise.all(n)}function qv(t,e){if(!e)return;let n=t.options;if(!n){t.options=e;return}return n.$shared&&(t.options=n=Object.assign({},n,{$shared:!1,$animations:{}})),n}function Pf(t,e){const n=t&&t.options||{},i=n.reverse,r=n.min===void 0?e:0,s=n.max===void 0?e:0;return{start:i?s:r,end:i?r:s}}function Jv(t,e,n){if(n===!1)return!1;const i=Pf(t,n),r=Pf(e,n);return{top:r.end,right:i.end,bottom:r.start,left:i.start}}function ex(t){let e,n,i,r;return B(t)?(e=t.top,n=t.right,i=t.bottom,r=t.left):e=n=i=r=t,{top:e,right:n,bottom:i,left:r,disabled:t===!1}}function cg(t,e){const n=[],i=t._getSortedDatasetMetas(e);let r,s;for(r=0,s=i.length;r<s;++r)n.push(i[r].index);return n}function Lf(t,e,n,i={}){const r=t.keys,s=i.mode==="single";let o,l,a,u;if(e!==null){for(o=0,l=r.length;o<l;++o){if(a=+r[o],a===n){if(i.all)continue;break}u=t.values[a],de(u)&&(s||e===0||mi(e)===mi(u))&&(e+=u)}return e}}function tx(t){const e=Object.keys(t),n=new Array(e.length);let i,r,s;for(i=0,r=e.length;i<r;++i)s=e[i],n[i]={x:s,y:t[s]};return n}function Tf(t,e){const n=t&&t.options.stacked;return n||n===void 0&&e.stack!==void 0}function nx(t,e,n){return`${t.id}.${e.id}.${n.stack||n.type}`}function ix(t){const{min:e,max:n,minDefined:i,maxDefined:r}=t.getUserBounds();return{min:i?e:Number.NEGATIVE_INFINITY,max:r?n:Number.POSITIVE_INFINITY}}function rx(t,e,n){const i=t[e]||(t[e]={});return i[n]||(i[n]={})}function Of(t,e,n,i){for(const r of e.getMatchingVisibleMetas(i).reverse()){const s=t[r.index];if(n&&s>0||!n&&s<0)return r.index}return null}function Df(t,e){const{chart:n,_cachedMeta:i}=t,r=n._stacks||(n._stacks={}),{iScale:s,vScale:o,index:l}=i,a=s.axis,u=o.axis,c=nx(s,o,i),f=e.length;let d;for(let h=0;h<f;++h){const m=e[h],{[a]:y,[u]:x}=m,p=m._stacks||(m._stacks={});d=p[u]=rx(r,c,y),d[l]=x,d._top=Of(d,o,!0,i.type),d._bottom=Of(d,o,!1,i.type);const g=d._visualValues||(d._visualValues={});g[l]=x}}function wl(t,e){const n=t.scales;return Object.keys(n).filter(i=>n[i].axis===e).shift()}function sx(t,e){return gn(t,{active:!1,dataset:void 0,datasetIndex:e,index:e,mode:"default",type:"dataset"})}function ox(t,e,n){return gn(t,{active:!1,dataIndex:e,parsed:void 0,raw:void 0,element:n,index:e,mode:"default",type:"data"})}function Oi(t,e){const n=t.controller.index,i=t.vScale&&t.vScale.axis;if(i){e=e||t._parsed;for(const r of e){const s=r._stacks;if(!s||s[i]===void 0||s[i][n]===void 0)return;delete s[i][n],s[i]._visualValues!==void 0&&s[i]._visualValues[n]!==void 0&&delete s[i]._visualValues[n]}}}const kl=t=>t==="reset"||t==="none",zf=(t,e)=>e?t:Object.assign({},t),lx=(t,e,n)=>t&&!e.hidden&&e._stacked&&{keys:cg(n,!0),values:null};class sr{constructor(e,n){this.chart=e,this._ctx=e.ctx,this.index=n,this._cachedDataOpts={},this._cachedMeta=this.getMeta(),this._type=this._cachedMeta.type,this.options=void 0,this._parsing=!1,this._data=void 0,this._objectData=void 0,this._sharedOptions=void 0,this._drawStart=void 0,this._drawCount=void 0,this.enableOptionSharing=!1,this.supportsDecimation=!1,this.$context=void 0,this._syncList=[],this.datasetElementType=new.target.datasetElementType,this.dataElementType=new.target.dataElementType,this.initialize()}initialize(){const e=this._cachedMeta;this.configure(),this.linkScales(),e._stacked=Tf(e.vScale,e),this.addElements(),this.options.fill&&!this.chart.isPluginEnabled("filler")&&console.warn("Tried to use the 'fill' option without the 'Filler' plugin enabled. Please import and register the 'Filler' plugin and make sure it is not disabled in the options")}updateIndex(e){this.index!==e&&Oi(this._cachedMeta),this.index=e}linkScales(){const e=this.chart,n=this._cachedMeta,i=this.getDataset(),r=(f,d,h,m)=>f==="x"?d:f==="r"?m:h,s=n.xAxisID=F(i.xAxisID,wl(e,"x")),o=n.yAxisID=F(i.yAxisID,wl(e,"y")),l=n.rAxisID=F(i.rAxisID,wl(e,"r")),a=n.indexAxis,u=n.iAxisID=r(a,s,o,l),c=n.vAxisID=r(a,o,s,l);n.xScale=this.getScaleForId(s),n.yScale=this.getScaleForId(o),n.rScale=this.getScaleForId(l),n.iScale=this.getScaleForId(u),n.vScale=this.getScaleForId(c)}getDataset(){return this.chart.data.datasets[this.index]}getMeta(){return this.chart.getDatasetMeta(this.index)}getScaleForId(e){return this.chart.scales[e]}_getOtherScale(e){const n=this._cachedMeta;return e===n.iScale?n.vScale:n.iScale}reset(){this._update("reset")}_destroy(){const e=this._cachedMeta;this._data&&pf(this._data,this),e._stacked&&Oi(e)}_dataCheck(){const e=this.getDataset(),n=e.data||(e.data=[]),i=this._data;if(B(n))this._data=tx(n);else if(i!==n){if(i){pf(i,this);const r=this._cachedMeta;Oi(r),r._parsed=[]}n&&Object.isExtensible(n)&&By(n,this),this._syncList=[],this._data=n}}addElements(){const e=this._cachedMeta;this._dataCheck(),this.datasetElementType&&(e.dataset=new this.datasetElementType)}buildOrUpdateElements(e){const n=this._cachedMeta,i=this.getDataset();let r=!1;this._dataCheck();const s=n._stacked;n._stacked=Tf(n.vScale,n),n.stack!==i.stack&&(r=!0,Oi(n),n.stack=i.stack),this._resyncElements(e),(r||s!==n._stacked)&&Df(this,n._parsed)}configure(){const e=this.chart.config,n=e.datasetScopeKeys(this._type),i=e.getOptionScopes(this.getDataset(),n,!0);this.options=e.createResolver(i,this.getContext()),this._parsing=this.options.parsing,this._cachedDataOpts={}}parse(e,n){const{_cachedMeta:i,_data:r}=this,{iScale:s,_stacked:o}=i,l=s.axis;let a=e===0&&n===r.length?!0:i._sorted,u=e>0&&i._parsed[e-1],c,f,d;if(this._parsing===!1)i._parsed=r,i._sorted=!0,d=r;else{ie(r[e])?d=this.parseArrayData(i,r,e,n):B(r[e])?d=this.parseObjectData(i,r,e,n):d=this.parsePrimitiveData(i,r,e,n);const h=()=>f[l]===null||u&&f[l]<u[l];for(c=0;c<n;++c)i._parsed[c+e]=f=d[c],a&&(h()&&(a=!1),u=f);i._sorted=a}o&&Df(this,d)}parsePrimitiveData(e,n,i,r){const{iScale:s,vScale:o}=e,l=s.axis,a=o.axis,u=s.getLabels(),c=s===o,f=new Array(r);let d,h,m;for(d=0,h=r;d<h;++d)m=d+i,f[d]={[l]:c||s.parse(u[m],m),[a]:o.parse(n[m],m)};return f}parseArrayData(e,n,i,r){const{xScale:s,yScale:o}=e,l=new Array(r);let a,u,c,f;for(a=0,u=r;a<u;++a)c=a+i,f=n[c],l[a]={x:s.parse(f[0],c),y:o.parse(f[1],c)};return l}parseObjectData(e,n,i,r){const{xScale:s,yScale:o}=e,{xAxisKey:l="x",yAxisKey:a="y"}=this._parsing,u=new Array(r);let c,f,d,h;for(c=0,f=r;c<f;++c)d=c+i,h=n[d],u[c]={x:s.parse(ho(h,l),d),y:o.parse(ho(h,a),d)};return u}getParsed(e){return this._cachedMeta._parsed[e]}getDataElement(e){return this._cachedMeta.data[e]}applyStack(e,n,i){const r=this.chart,s=this._cachedMeta,o=n[e.axis],l={keys:cg(r,!0),values:n._stacks[e.axis]._visualValues};return Lf(l,o,s.index,{mode:i})}updateRangeFromParsed(e,n,i,r){const s=i[n.axis];let o=s===null?NaN:s;const l=r&&i._stacks[n.axis];r&&l&&(r.values=l,o=Lf(r,s,this._cachedMeta.index)),e.min=Math.min(e.min,o),e.max=Math.max(e.max,o)}getMinMax(e,n){const i=this._cachedMeta,r=i._parsed,s=i._sorted&&e===i.iScale,o=r.length,l=this._getOtherScale(e),a=lx(n,i,this.chart),u={min:Number.POSITIVE_INFINITY,max:Number.NEGATIVE_INFINITY},{min:c,max:f}=ix(l);let d,h;function m(){h=r[d];const y=h[l.axis];return!de(h[e.axis])||c>y||f<y}for(d=0;d<o&&!(!m()&&(this.updateRangeFromParsed(u,e,h,a),s));++d);if(s){for(d=o-1;d>=0;--d)if(!m()){this.updateRangeFromParsed(u,e,h,a);break}}return u}getAllParsedValues(e){const n=this._cachedMeta._parsed,i=[];let r,s,o;for(r=0,s=n.length;r<s;++r)o=n[r][e.axis],de(o)&&i.push(o);return i}getMaxOverflow(){return!1}getLabelAndValue(e){const n=this._cachedMeta,i=n.iScale,r=n.vScale,s=this.getParsed(e);return{label:i?""+i.getLabelForValue(s[i.axis]):"",value:r?""+r.getLabelForValue(s[r.axis]):""}}_update(e){const n=this._cachedMeta;this.update(e||"default"),n._clip=ex(F(this.options.clip,Jv(n.xScale,n.yScale,this.getMaxOverflow())))}update(e){}draw(){const e=this._ctx,n=this.chart,i=this._cachedMeta,r=i.data||[],s=n.chartArea,o=[],l=this._drawStart||0,a=this._drawCount||r.length-l,u=this.options.drawActiveElementsOnTop;let c;for(i.dataset&&i.dataset.draw(e,s,l,a),c=l;c<l+a;++c){const f=r[c];f.hidden||(f.active&&u?o.push(f):f.draw(e,s))}for(c=0;c<o.length;++c)o[c].draw(e,s)}getStyle(e,n){const i=n?"active":"default";return e===void 0&&this._cachedMeta.dataset?this.resolveDatasetElementOptions(i):this.resolveDataElementOptions(e||0,i)}getContext(e,n,i){const r=this.getDataset();let s;if(e>=0&&e<this._cachedMeta.data.length){const o=this._cachedMeta.data[e];s=o.$context||(o.$context=ox(this.getContext(),e,o)),s.parsed=this.getParsed(e),s.raw=r.data[e],s.index=s.dataIndex=e}else s=this.$context||(this.$context=sx(this.chart.getContext(),this.index)),s.dataset=r,s.index=s.datasetIndex=this.index;return s.active=!!n,s.mode=i,s}resolveDatasetElementOptions(e){return this._resolveElementOptions(this.datasetElementType.id,e)}resolveDataElementOptions(e,n){return this._resolveElementOptions(this.dataElementType.id,n,e)}_resolveElementOptions(e,n="default",i){const r=n==="active",s=this._cachedDataOpts,o=e+"-"+n,l=s[o],a=this.enableOptionSharing&&dt(i);if(l)return zf(l,a);const u=this.chart.config,c=u.datasetElementScopeKeys(this._type,e),f=r?[`${e}Hover`,"hover",e,""]:[e,""],d=u.getOptionScopes(this.getDataset(),c),h=Object.keys(oe.elements[e]),m=()=>this.getContext(i,r,n),y=u.resolveNamedOptions(d,h,m,f);return y.$shared&&(y.$shared=a,s[o]=Object.freeze(zf(y,a))),y}_resolveAnimations(e,n,i){const r=this.chart,s=this._cachedDataOpts,o=`animation-${n}`,l=s[o];if(l)return l;let a;if(r.options.animation!==!1){const c=this.chart.config,f=c.datasetAnimationScopeKeys(this._type,n),d=c.getOptionScopes(this.getDataset(),f);a=c.createResolver(d,this.getContext(e,i,n))}const u=new ug(r,a&&a.animations);return a&&a._cacheable&&(s[o]=Object.freeze(u)),u}getSharedOptions(e){if(e.$shared)return this._sharedOptions||(this._sharedOptions=Object.assign({},e))}includeOptions(e,n){return!n||kl(e)||this.chart._animationsDisabled}_getSharedOptions(e,n){const i=this.resolveDataElementOptions(e,n),r=this._sharedOptions,s=this.getSharedOptions(i),o=this.includeOptions(n,s)||s!==r;return this.updateSharedOptions(s,n,i),{sharedOptions:s,includeOptions:o}}updateElement(e,n,i,r){kl(r)?Object.assign(e,i):this._resolveAnimations(n,r).update(e,i)}updateSharedOptions(e,n,i){e&&!kl(n)&&this._resolveAnimations(void 0,n).update(e,i)}_setStyle(e,n,i,r){e.active=r;const s=this.getStyle(n,r);this._resolveAnimations(n,i,r).update(e,{options:!r&&this.getSharedOptions(s)||s})}removeHoverStyle(e,n,i){this._setStyle(e,i,"active",!1)}setHoverStyle(e,n,i){this._setStyle(e,i,"active",!0)}_removeDatasetHoverStyle(){const e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,"active",!1)}_setDatasetHoverStyle(){const e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,"active",!0)}_resyncElements(e){const n=this._data,i=this._cachedMeta.data;for(const[l,a,u]of this._syncList)this[l](a,u);this._syncList=[];const r=i.length,s=n.length,o=Math.min(s,r);o&&this.parse(0,o),s>r?this._insertElements(r,s-r,e):s<r&&this._removeElements(s,r-s)}_insertElements(e,n,i=!0){const r=this._cachedMeta,s=r.data,o=e+n;let l;const a=u=>{for(u.length+=n,l=u.length-1;l>=o;l--)u[l]=u[l-n]};for(a(s),l=e;l<o;++l)s[l]=new this.dataElementType;this._parsing&&a(r._parsed),this.parse(e,n),i&&this.updateElements(s,e,n,"reset")}updateElements(e,n,i,r){}_removeElements(e,n){const i=this._cachedMeta;if(this._parsing){const r=i._parsed.splice(e,n);i._stacked&&Oi(i,r)}i.data.splice(e,n)}_sync(e){if(this._parsing)this._syncList.push(e);else{const[n,i,r]=e;this[n](i,r)}this.chart._dataChanges.push([this.index,...e])}_onDataPush(){const e=arguments.length;this._sync(["_insertElements",this.getDataset().data.length-e,e])}_onDataPop(){this._sync(["_removeElements",this._cachedMeta.data.length-1,1])}_onDataShift(){this._sync(["_removeElements",0,1])}_onDataSplice(e,n){n&&this._sync(["_removeElements",e,n]);const i=arguments.length-2;i&&this._sync(["_insertElements",e,i])}_onDataUnshift(){this._sync(["_insertElements",0,arguments.length])}}I(sr,"defaults",{}),I(sr,"datasetElementType",null),I(sr,"dataElementType",null);class Ns extends sr{initialize(){this.enableOptionSharing=!0,this.supportsDecimation=!0,super.initialize()}update(e){const n=this._cachedMeta,{dataset:i,data:r=[],_dataset:s}=n,o=this.chart._animationsDisabled;let{start:l,count:a}=Vy(n,r,o);this._drawStart=l,this._drawCount=a,Uy(n)&&(l=0,a=r.length),i._chart=this.chart,i._datasetIndex=this.index,i._decimated=!!s._decimated,i.points=r;const u=this.resolveDatasetElementOptions(e);this.options.showLine||(u.borderWidth=0),u.segment=this.options.segment,this.updateElement(i,void 0,{animated:!o,options:u},e),this.updateElements(r,l,a,e)}updateElements(e,n,i,r){const s=r==="reset",{iScale:o,vScale:l,_stacked:a,_dataset:u}=this._cachedMeta,{sharedOptions:c,includeOptions:f}=this._getSharedOptions(n,r),d=o.axis,h=l.axis,{spanGaps:m,segment:y}=this.options,x=Pr(m)?m:Number.POSITIVE_INFINITY,p=this.chart._animationsDisabled||s||r==="none",g=n+i,v=e.length;let _=n>0&&this.getParsed(n-1);for(let w=0;w<v;++w){const k=e[w],S=p?k:{};if(w<n||w>=g){S.skip=!0;continue}const b=this.getParsed(w),O=X(b[h]),P=S[d]=o.getPixelForValue(b[d],w),D=S[h]=s||O?l.getBasePixel():l.getPixelForValue(a?this.applyStack(l,b,a):b[h],w);S.skip=isNaN(P)||isNaN(D)||O,S.stop=w>0&&Math.abs(b[d]-_[d])>x,y&&(S.parsed=b,S.raw=u.data[w]),f&&(S.options=c||this.resolveDataElementOptions(w,k.active?"active":r)),p||this.updateElement(k,w,S,r),_=b}}getMaxOverflow(){const e=this._cachedMeta,n=e.dataset,i=n.options&&n.options.borderWidth||0,r=e.data||[];if(!r.length)return i;const s=r[0].size(this.resolveDataElementOptions(0)),o=r[r.length-1].size(this.resolveDataElementOptions(r.length-1));return Math.max(i,s,o)/2}draw(){const e=this._cachedMeta;e.dataset.updateControlPoints(this.chart.chartArea,e.iScale.axis),super.draw()}}I(Ns,"id","line"),I(Ns,"defaults",{datasetElementType:"line",dataElementType:"point",showLine:!0,spanGaps:!1}),I(Ns,"overrides",{scales:{_index_:{type:"category"},_value_:{type:"linear"}}});function vn(){throw new Error("This method is not implemented: Check that a complete date adapter is provided.")}class Uu{static override(e){Object.assign(Uu.prototype,e)}constructor(e){this.options=e||{}}init(){}formats(){return vn()}parse(){return vn()}format(){return vn()}add(){return vn()}diff(){return vn()}startOf(){return vn()}endOf(){return vn()}}var ax={_date:Uu};function ux(t,e,n,i){const{controller:r,data:s,_sorted:o}=t,l=r._cachedMeta.iScale;if(l&&e===l.axis&&e!=="r"&&o&&s.length){const a=l._reversePixels?Ay:En;if(i){if(r._sharedOptions){const u=s[0],c=typeof u.getRange=="function"&&u.getRange(e);if(c){const f=a(s,e,n-c),d=a(s,e,n+c);return{lo:f.lo,hi:d.hi}}}}else return a(s,e,n)}return{lo:0,hi:s.length-1}}function jr(t,e,n,i,r){const s=t.getSortedVisibleDatasetMetas(),o=n[e];for(let l=0,a=s.length;l<a;++l){const{index:u,data:c}=s[l],{lo:f,hi:d}=ux(s[l],e,o,r);for(let h=f;h<=d;++h){const m=c[h];m.skip||i(m,u,h)}}}function cx(t){const e=t.indexOf("x")!==-1,n=t.indexOf("y")!==-1;return function(i,r){const s=e?Math.abs(i.x-r.x):0,o=n?Math.abs(i.y-r.y):0;return Math.sqrt(Math.pow(s,2)+Math.pow(o,2))}}function Sl(t,e,n,i,r){const s=[];return!r&&!t.isPointInArea(e)||jr(t,n,e,function(l,a,u){!r&&!Lr(l,t.chartArea,0)||l.inRange(e.x,e.y,i)&&s.push({element:l,datasetIndex:a,index:u})},!0),s}function fx(t,e,n,i){let r=[];function s(o,l,a){const{startAngle:u,endAngle:c}=o.getProps(["startAngle","endAngle"],i),{angle:f}=Iy(o,{x:e.x,y:e.y});Up(f,u,c)&&r.push({element:o,datasetIndex:l,index:a})}return jr(t,n,e,s),r}function dx(t,e,n,i,r,s){let o=[];const l=cx(n);let a=Number.POSITIVE_INFINITY;function u(c,f,d){const h=c.inRange(e.x,e.y,r);if(i&&!h)return;const m=c.getCenterPoint(r);if(!(!!s||t.isPointInArea(m))&&!h)return;const x=l(e,m);x<a?(o=[{element:c,datasetIndex:f,index:d}],a=x):x===a&&o.push({element:c,datasetIndex:f,index:d})}return jr(t,n,e,u),o}function bl(t,e,n,i,r,s){return!s&&!t.isPointInArea(e)?[]:n==="r"&&!i?fx(t,e,n,r):dx(t,e,n,i,r,s)}function Nf(t,e,n,i,r){const s=[],o=n==="x"?"inXRange":"inYRange";let l=!1;return jr(t,n,e,(a,u,c)=>{a[o](e[n],r)&&(s.push({element:a,datasetIndex:u,index:c}),l=l||a.inRange(e.x,e.y,r))}),i&&!l?[]:s}var hx={evaluateInteractionItems:jr,modes:{index(t,e,n,i){const r=kn(e,t),s=n.axis||"x",o=n.includeInvisible||!1,l=n.intersect?Sl(t,r,s,i,o):bl(t,r,s,!1,i,o),a=[];return l.length?(t.getSortedVisibleDatasetMetas().forEach(u=>{const c=l[0].index,f=u.data[c];f&&!f.skip&&a.push({element:f,datasetIndex:u.index,index:c})}),a):[]},dataset(t,e,n,i){const r=kn(e,t),s=n.axis||"xy",o=n.includeInvisible||!1;let l=n.intersect?Sl(t,r,s,i,o):bl(t,r,s,!1,i,o);if(l.length>0){const a=l[0].datasetIndex,u=t.getDatasetMeta(a).data;l=[];for(let c=0;c<u.length;++c)l.push({element:u[c],datasetIndex:a,index:c})}return l},point(t,e,n,i){const r=kn(e,t),s=n.axis||"xy",o=n.includeInvisible||!1;return Sl(t,r,s,i,o)},nearest(t,e,n,i){const r=kn(e,t),s=n.axis||"xy",o=n.includeInvisible||!1;return bl(t,r,s,n.intersect,i,o)},x(t,e,n,i){const r=kn(e,t);return Nf(t,r,"x",n.intersect,i)},y(t,e,n,i){const r=kn(e,t);return Nf(t,r,"y",n.intersect,i)}}};const fg=["left","top","right","bottom"];function Di(t,e){return t.filter(n=>n.pos===e)}function If(t,e){return t.filter(n=>fg.indexOf(n.pos)===-1&&n.box.axis===e)}function zi(t,e){return t.sort((n,i)=>{const r=e?i:n,s=e?n:i;return r.weight===s.weight?r.index-s.index:r.weight-s.weight})}function px(t){const e=[];let n,i,r,s,o,l;for(n=0,i=(t||[]).length;n<i;++n)r=t[n],{position:s,options:{stack:o,stackWeight:l=1}}=r,e.push({index:n,box:r,pos:s,horizontal:r.isHorizontal(),weight:r.weight,stack:o&&s+o,stackWeight:l});return e}function gx(t){const e={};for(const n of t){const{stack:i,pos:r,stackWeight:s}=n;if(!i||!fg.includes(r))continue;const o=e[i]||(e[i]={count:0,placed:0,weight:0,size:0});o.count++,o.weight+=s}return e}function mx(t,e){const n=gx(t),{vBoxMaxWidth:i,hBoxMaxHeight:r}=e;let s,o,l;for(s=0,o=t.length;s<o;++s){l=t[s];const{fullSize:a}=l.box,u=n[l.stack],c=u&&l.stackWeight/u.weight;l.horizontal?(l.width=c?c*i:a&&e.availableWidth,l.height=r):(l.width=i,l.height=c?c*r:a&&e.availableHeight)}return n}function yx(t){const e=px(t),n=zi(e.filter(u=>u.box.fullSize),!0),i=zi(Di(e,"left"),!0),r=zi(Di(e,"right")),s=zi(Di(e,"top"),!0),o=zi(Di(e,"bottom")),l=If(e,"x"),a=If(e,"y");return{fullSize:n,leftAndTop:i.concat(s),rightAndBottom:r.concat(a).concat(o).concat(l),chartArea:Di(e,"chartArea"),vertical:i.concat(r).concat(a),horizontal:s.concat(o).concat(l)}}function Rf(t,e,n,i){return Math.max(t[n],e[n])+Math.max(t[i],e[i])}function dg(t,e){t.top=Math.max(t.top,e.top),t.left=Math.max(t.left,e.left),t.bottom=Math.max(t.bottom,e.bottom),t.right=Math.max(t.right,e.right)}function vx(t,e,n,i){const{pos:r,box:s}=n,o=t.maxPadding;if(!B(r)){n.size&&(t[r]-=n.size);const f=i[n.stack]||{size:0,count:1};f.size=Math.max(f.size,n.horizontal?s.height:s.width),n.size=f.size/f.count,t[r]+=n.size}s.getPadding&&dg(o,s.getPadding());const l=Math.max(0,e.outerWidth-Rf(o,t,"left","right")),a=Math.max(0,e.outerHeight-Rf(o,t,"top","bottom")),u=l!==t.w,c=a!==t.h;return t.w=l,t.h=a,n.horizontal?{same:u,other:c}:{same:c,other:u}}function xx(t){const e=t.maxPadding;function n(i){const r=Math.max(e[i]-t[i],0);return t[i]+=r,r}t.y+=n("top"),t.x+=n("left"),n("right"),n("bottom")}function _x(t,e){const n=e.maxPadding;function i(r){const s={left:0,top:0,right:0,bottom:0};return r.forEach(o=>{s[o]=Math.max(e[o],n[o])}),s}return i(t?["left","right"]:["top","bottom"])}function Wi(t,e,n,i){const r=[];let s,o,l,a,u,c;for(s=0,o=t.length,u=0;s<o;++s){l=t[s],a=l.box,a.update(l.width||e.w,l.height||e.h,_x(l.horizontal,e));const{same:f,other:d}=vx(e,n,l,i);u|=f&&r.length,c=c||d,a.fullSize||r.push(l)}return u&&Wi(r,e,n,i)||c}function ds(t,e,n,i,r){t.top=n,t.left=e,t.right=e+i,t.bottom=n+r,t.width=i,t.height=r}function Ff(t,e,n,i){const r=n.padding;let{x:s,y:o}=e;for(const l of t){const a=l.box,u=i[l.stack]||{count:1,placed:0,weight:1},c=l.stackWeight/u.weight||1;if(l.horizontal){const f=e.w*c,d=u.size||a.height;dt(u.start)&&(o=u.start),a.fullSize?ds(a,r.left,o,n.outerWidth-r.right-r.left,d):ds(a,e.left+u.placed,o,f,d),u.start=o,u.placed+=f,o=a.bottom}else{const f=e.h*c,d=u.size||a.width;dt(u.start)&&(s=u.start),a.fullSize?ds(a,s,r.top,d,n.outerHeight-r.bottom-r.top):ds(a,s,e.top+u.placed,d,f),u.start=s,u.placed+=f,s=a.right}}e.x=s,e.y=o}var Gt={addBox(t,e){t.boxes||(t.boxes=[]),e.fullSize=e.fullSize||!1,e.position=e.position||"top",e.weight=e.weight||0,e._layers=e._layers||function(){return[{z:0,draw(n){e.draw(n)}}]},t.boxes.push(e)},removeBox(t,e){const n=t.boxes?t.boxes.indexOf(e):-1;n!==-1&&t.boxes.splice(n,1)},configure(t,e,n){e.fullSize=n.fullSize,e.position=n.position,e.weight=n.weight},update(t,e,n,i){if(!t)return;const r=Me(t.options.layout.padding),s=Math.max(e-r.width,0),o=Math.max(n-r.height,0),l=yx(t.boxes),a=l.vertical,u=l.horizontal;$(t.boxes,y=>{typeof y.beforeLayout=="function"&&y.beforeLayout()});const c=a.reduce((y,x)=>x.box.options&&x.box.options.display===!1?y:y+1,0)||1,f=Object.freeze({outerWidth:e,outerHeight:n,padding:r,availableWidth:s,availableHeight:o,vBoxMaxWidth:s/2/c,hBoxMaxHeight:o/2}),d=Object.assign({},r);dg(d,Me(i));const h=Object.assign({maxPadding:d,w:s,h:o,x:r.left,y:r.top},r),m=mx(a.concat(u),f);Wi(l.fullSize,h,f,m),Wi(a,h,f,m),Wi(u,h,f,m)&&Wi(a,h,f,m),xx(h),Ff(l.leftAndTop,h,f,m),h.x+=h.w,h.y+=h.h,Ff(l.rightAndBottom,h,f,m),t.chartArea={left:h.left,top:h.top,right:h.left+h.w,bottom:h.top+h.h,height:h.h,width:h.w},$(l.chartArea,y=>{const x=y.box;Object.assign(x,t.chartArea),x.update(h.w,h.h,{left:0,top:0,right:0,bottom:0})})}};class hg{acquireContext(e,n){}releaseContext(e){return!1}addEventListener(e,n,i){}removeEventListener(e,n,i){}getDevicePixelRatio(){return 1}getMaximumSize(e,n,i,r){return n=Math.max(0,n||e.width),i=i||e.height,{width:n,height:Math.max(0,r?Math.floor(n/r):i)}}isAttached(e){return!0}updateConfig(e){}}class wx extends hg{acquireContext(e){return e&&e.getContext&&e.getContext("2d")||null}updateConfig(e){e.options.animation=!1}}const Is="$chartjs",kx={touchstart:"mousedown",touchmove:"mousemove",touchend:"mouseup",pointerenter:"mouseenter",pointerdown:"mousedown",pointermove:"mousemove",pointerup:"mouseup",pointerleave:"mouseout",pointerout:"mouseout"},Af=t=>t===null||t==="";function Sx(t,e){const n=t.style,i=t.getAttribute("height"),r=t.getAttribute("width");if(t[Is]={initial:{height:i,width:r,style:{display:n.display,height:n.height,width:n.width}}},n.display=n.display||"block",n.boxSizing=n.boxSizing||"border-box",Af(r)){const s=Sf(t,"width");s!==void 0&&(t.width=s)}if(Af(i))if(t.style.height==="")t.height=t.width/(e||2);else{const s=Sf(t,"height");s!==void 0&&(t.height=s)}return t}const pg=Iv?{passive:!0}:!1;function bx(t,e,n){t.addEventListener(e,n,pg)}function Cx(t,e,n){t.canvas.removeEventListener(e,n,pg)}function Mx(t,e){const n=kx[t.type]||t.type,{x:i,y:r}=kn(t,e);return{type:n,chart:e,native:t,x:i!==void 0?i:null,y:r!==void 0?r:null}}function vo(t,e){for(const n of t)if(n===e||n.contains(e))return!0}function Ex(t,e,n){const i=t.canvas,r=new MutationObserver(s=>{let o=!1;for(const l of s)o=o||vo(l.addedNodes,i),o=o&&!vo(l.removedNodes,i);o&&n()});return r.observe(document,{childList:!0,subtree:!0}),r}function Px(t,e,n){const i=t.canvas,r=new MutationObserver(s=>{let o=!1;for(const l of s)o=o||vo(l.removedNodes,i),o=o&&!vo(l.addedNodes,i);o&&n()});return r.observe(document,{childList:!0,subtree:!0}),r}const Tr=new Map;let jf=0;function gg(){const t=window.devicePixelRatio;t!==jf&&(jf=t,Tr.forEach((e,n)=>{n.currentDevicePixelRatio!==t&&e()}))}function Lx(t,e){Tr.size||window.addEventListener("resize",gg),Tr.set(t,e)}function Tx(t){Tr.delete(t),Tr.size||window.removeEventListener("resize",gg)}function Ox(t,e,n){const i=t.canvas,r=i&&Vu(i);if(!r)return;const s=Kp((l,a)=>{const u=r.clientWidth;n(l,a),u<r.clientWidth&&n()},window),o=new ResizeObserver(l=>{const a=l[0],u=a.contentRect.width,c=a.contentRect.height;u===0&&c===0||s(u,c)});return o.observe(r),Lx(t,s),o}function Cl(t,e,n){n&&n.disconnect(),e==="resize"&&Tx(t)}function Dx(t,e,n){const i=t.canvas,r=Kp(s=>{t.ctx!==null&&n(Mx(s,t))},t);return bx(i,e,r),r}class zx extends hg{acquireContext(e,n){const i=e&&e.getContext&&e.getContext("2d");return i&&i.canvas===e?(Sx(e,n),i):null}releaseContext(e){const n=e.canvas;if(!n[Is])return!1;const i=n[Is].initial;["height","width"].forEach(s=>{const o=i[s];X(o)?n.removeAttribute(s):n.setAttribute(s,o)});const r=i.style||{};return Object.keys(r).forEach(s=>{n.style[s]=r[s]}),n.width=n.width,delete n[Is],!0}addEventListener(e,n,i){this.removeEventListener(e,n);const r=e.$proxies||(e.$proxies={}),o={attach:Ex,detach:Px,resize:Ox}[n]||Dx;r[n]=o(e,n,i)}removeEventListener(e,n){const i=e.$proxies||(e.$proxies={}),r=i[n];if(!r)return;({attach:Cl,detach:Cl,resize:Cl}[n]||Cx)(e,n,r),i[n]=void 0}getDevicePixelRatio(){return window.devicePixelRatio}getMaximumSize(e,n,i,r){return Nv(e,n,i,r)}isAttached(e){const n=Vu(e);return!!(n&&n.isConnected)}}function Nx(t){return!sg()||typeof OffscreenCanvas<"u"&&t instanceof OffscreenCanvas?wx:zx}class cn{constructor(){I(this,"active",!1)}tooltipPosition(e){const{x:n,y:i}=this.getProps(["x","y"],e);return{x:n,y:i}}hasValue(){return Pr(this.x)&&Pr(this.y)}getProps(e,n){const i=this.$animations;if(!n||!i)return this;const r={};return e.forEach(s=>{r[s]=i[s]&&i[s].active()?i[s]._to:this[s]}),r}}I(cn,"defaults",{}),I(cn,"defaultRoutes");function Ix(t,e){const n=t.options.ticks,i=Rx(t),r=Math.min(n.maxTicksLimit||i,i),s=n.major.enabled?Ax(e):[],o=s.length,l=s[0],a=s[o-1],u=[];if(o>r)return jx(e,u,s,o/r),u;const c=Fx(s,e,r);if(o>0){let f,d;const h=o>1?Math.round((a-l)/(o-1)):null;for(hs(e,u,c,X(h)?0:l-h,l),f=0,d=o-1;f<d;f++)hs(e,u,c,s[f],s[f+1]);return hs(e,u,c,a,X(h)?e.length:a+h),u}return hs(e,u,c),u}function Rx(t){const e=t.options.offset,n=t._tickSize(),i=t._length/n+(e?0:1),r=t._maxLength/n;return Math.floor(Math.min(i,r))}function Fx(t,e,n){const i=Bx(t),r=e.length/n;if(!i)return Math.max(r,1);const s=zy(i);for(let o=0,l=s.length-1;o<l;o++){const a=s[o];if(a>r)return a}return Math.max(r,1)}function Ax(t){const e=[];let n,i;for(n=0,i=t.length;n<i;n++)t[n].major&&e.push(n);return e}function jx(t,e,n,i){let r=0,s=n[0],o;for(i=Math.ceil(i),o=0;o<t.length;o++)o===s&&(e.push(t[o]),r++,s=n[r*i])}function hs(t,e,n,i,r){const s=F(i,0),o=Math.min(F(r,t.length),t.length);let l=0,a,u,c;for(n=Math.ceil(n),r&&(a=r-i,n=a/Math.floor(a/n)),c=s;c<0;)l++,c=Math.round(s+l*n);for(u=Math.max(s,0);u<o;u++)u===c&&(e.push(t[u]),l++,c=Math.round(s+l*n))}function Bx(t){const e=t.length;let n,i;if(e<2)return!1;for(i=t[0],n=1;n<e;++n)if(t[n]-t[n-1]!==i)return!1;return i}const $x=t=>t==="left"?"right":t==="right"?"left":t,Bf=(t,e,n)=>e==="top"||e==="left"?t[e]+n:t[e]-n;function $f(t,e){const n=[],i=t.length/e,r=t.length;let s=0;for(;s<r;s+=i)n.push(t[Math.floor(s)]);return n}function Hx(t,e,n){const i=t.ticks.length,r=Math.min(e,i-1),s=t._startPixel,o=t._endPixel,l=1e-6;let a=t.getPixelForTick(r),u;if(!(n&&(i===1?u=Math.max(a-s,o-a):e===0?u=(t.getPixelForTick(1)-a)/2:u=(a-t.getPixelForTick(r-1))/2,a+=r<e?u:-u,a<s-l||a>o+l)))return a}function Wx(t,e){$(t,n=>{const i=n.gc,r=i.length/2;let s;if(r>e){for(s=0;s<r;++s)delete n.data[i[s]];i.splice(0,r)}})}function Ni(t){return t.drawTicks?t.tickLength:0}function Hf(t,e){if(!t.display)return 0;const n=ge(t.font,e),i=Me(t.padding);return(ie(t.text)?t.text.length:1)*n.lineHeight+i.height}function Vx(t,e){return gn(t,{scale:e,type:"scale"})}function Ux(t,e,n){return gn(t,{tick:n,index:e,type:"tick"})}function Yx(t,e,n){let i=Xp(t);return(n&&e!=="right"||!n&&e==="right")&&(i=$x(i)),i}function Qx(t,e,n,i){const{top:r,left:s,bottom:o,right:l,chart:a}=t,{chartArea:u,scales:c}=a;let f=0,d,h,m;const y=o-r,x=l-s;if(t.isHorizontal()){if(h=$e(i,s,l),B(n)){const p=Object.keys(n)[0],g=n[p];m=c[p].getPixelForValue(g)+y-e}else n==="center"?m=(u.bottom+u.top)/2+y-e:m=Bf(t,n,e);d=l-s}else{if(B(n)){const p=Object.keys(n)[0],g=n[p];h=c[p].getPixelForValue(g)-x+e}else n==="center"?h=(u.left+u.right)/2-x+e:h=Bf(t,n,e);m=$e(i,o,r),f=n==="left"?-Ne:Ne}return{titleX:h,titleY:m,maxWidth:d,rotation:f}}class Bn extends cn{constructor(e){super(),this.id=e.id,this.type=e.type,this.options=void 0,this.ctx=e.ctx,this.chart=e.chart,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this._margins={left:0,right:0,top:0,bottom:0},this.maxWidth=void 0,this.maxHeight=void 0,this.paddingTop=void 0,this.paddingBottom=void 0,this.paddingLeft=void 0,this.paddingRight=void 0,this.axis=void 0,this.labelRotation=void 0,this.min=void 0,this.max=void 0,this._range=void 0,this.ticks=[],this._gridLineItems=null,this._labelItems=null,this._labelSizes=null,this._length=0,this._maxLength=0,this._longestTextCache={},this._startPixel=void 0,this._endPixel=void 0,this._reversePixels=!1,this._userMax=void 0,this._userMin=void 0,this._suggestedMax=void 0,this._suggestedMin=void 0,this._ticksLength=0,this._borderValue=0,this._cache={},this._dataLimitsCached=!1,this.$context=void 0}init(e){this.options=e.setContext(this.getContext()),this.axis=e.axis,this._userMin=this.parse(e.min),this._userMax=this.parse(e.max),this._suggestedMin=this.parse(e.suggestedMin),this._suggestedMax=this.parse(e.suggestedMax)}parse(e,n){return e}getUserBounds(){let{_userMin:e,_userMax:n,_suggestedMin:i,_suggestedMax:r}=this;return e=He(e,Number.POSITIVE_INFINITY),n=He(n,Number.NEGATIVE_INFINITY),i=He(i,Number.POSITIVE_INFINITY),r=He(r,Number.NEGATIVE_INFINITY),{min:He(e,i),max:He(n,r),minDefined:de(e),maxDefined:de(n)}}getMinMax(e){let{min:n,max:i,minDefined:r,maxDefined:s}=this.getUserBounds(),o;if(r&&s)return{min:n,max:i};const l=this.getMatchingVisibleMetas();for(let a=0,u=l.length;a<u;++a)o=l[a].controller.getMinMax(this,e),r||(n=Math.min(n,o.min)),s||(i=Math.max(i,o.max));return n=s&&n>i?i:n,i=r&&n>i?n:i,{min:He(n,He(i,n)),max:He(i,He(n,i))}}getPadding(){return{left:this.paddingLeft||0,top:this.paddingTop||0,right:this.paddingRight||0,bottom:this.paddingBottom||0}}getTicks(){return this.ticks}getLabels(){const e=this.chart.data;return this.options.labels||(this.isHorizontal()?e.xLabels:e.yLabels)||e.labels||[]}getLabelItems(e=this.chart.chartArea){return this._labelItems||(this._labelItems=this._computeLabelItems(e))}beforeLayout(){this._cache={},this._dataLimitsCached=!1}beforeUpdate(){V(this.options.beforeUpdate,[this])}update(e,n,i){const{beginAtZero:r,grace:s,ticks:o}=this.options,l=o.sampleSize;this.beforeUpdate(),this.maxWidth=e,this.maxHeight=n,this._margins=i=Object.assign({left:0,right:0,top:0,bottom:0},i),this.ticks=null,this._labelSizes=null,this._gridLineItems=null,this._labelItems=null,this.beforeSetDimensions(),this.setDimensions(),this.afterSetDimensions(),this._maxLength=this.isHorizontal()?this.width+i.left+i.right:this.height+i.top+i.bottom,this._dataLimitsCached||(this.beforeDataLimits(),this.determineDataLimits(),this.afterDataLimits(),this._range=dv(this,s,r),this._dataLimitsCached=!0),this.beforeBuildTicks(),this.ticks=this.buildTicks()||[],this.afterBuildTicks();const a=l<this.ticks.length;this._convertTicksToLabels(a?$f(this.ticks,l):this.ticks),this.configure(),this.beforeCalculateLabelRotation(),this.calculateLabelRotation(),this.afterCalculateLabelRotation(),o.display&&(o.autoSkip||o.source==="auto")&&(this.ticks=Ix(this,this.ticks),this._labelSizes=null,this.afterAutoSkip()),a&&this._convertTicksToLabels(this.ticks),this.beforeFit(),this.fit(),this.afterFit(),this.afterUpdate()}configure(){let e=this.options.reverse,n,i;this.isHorizontal()?(n=this.left,i=this.right):(n=this.top,i=this.bottom,e=!e),this._startPixel=n,this._endPixel=i,this._reversePixels=e,this._length=i-n,this._alignToPixels=this.options.alignToPixels}afterUpdate(){V(this.options.afterUpdate,[this])}beforeSetDimensions(){V(this.options.beforeSetDimensions,[this])}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=0,this.right=this.width):(this.height=this.maxHeight,this.top=0,this.bottom=this.height),this.paddingLeft=0,this.paddingTop=0,this.paddingRight=0,this.paddingBottom=0}afterSetDimensions(){V(this.options.afterSetDimensions,[this])}_callHooks(e){this.chart.notifyPlugins(e,this.getContext()),V(this.options[e],[this])}beforeDataLimits(){this._callHooks("beforeDataLimits")}determineDataLimits(){}afterDataLimits(){this._callHooks("afterDataLimits")}beforeBuildTicks(){this._callHooks("beforeBuildTicks")}buildTicks(){return[]}afterBuildTicks(){this._callHooks("afterBuildTicks")}beforeTickToLabelConversion(){V(this.options.beforeTickToLabelConversion,[this])}generateTickLabels(e){const n=this.options.ticks;let i,r,s;for(i=0,r=e.length;i<r;i++)s=e[i],s.label=V(n.callback,[s.value,i,e],this)}afterTickToLabelConversion(){V(this.options.afterTickToLabelConversion,[this])}beforeCalculateLabelRotation(){V(this.options.beforeCalculateLabelRotation,[this])}calculateLabelRotation(){const e=this.options,n=e.ticks,i=this.ticks.length,r=n.minRotation||0,s=n.maxRotation;let o=r,l,a,u;if(!this._isVisible()||!n.display||r>=s||i<=1||!this.isHorizontal()){this.labelRotation=r;return}const c=this._getLabelSizes(),f=c.widest.width,d=c.highest.height,h=Je(this.chart.width-f,0,this.maxWidth);l=e.offset?this.maxWidth/i:h/(i-1),f+6>l&&(l=h/(i-(e.offset?.5:1)),a=this.maxHeight-Ni(e.grid)-n.padding-Hf(e.title,this.chart.options.font),u=Math.sqrt(f*f+d*d),o=Ru(Math.min(Math.asin(Je((c.highest.height+6)/l,-1,1)),Math.asin(Je(a/u,-1,1))-Math.asin(Je(d/u,-1,1)))),o=Math.max(r,Math.min(s,o))),this.labelRotation=o}afterCalculateLabelRotation(){V(this.options.afterCalculateLabelRotation,[this])}afterAutoSkip(){}beforeFit(){V(this.options.beforeFit,[this])}fit(){const e={width:0,height:0},{chart:n,options:{ticks:i,title:r,grid:s}}=this,o=this._isVisible(),l=this.isHorizontal();if(o){const a=Hf(r,n.options.font);if(l?(e.width=this.maxWidth,e.height=Ni(s)+a):(e.height=this.maxHeight,e.width=Ni(s)+a),i.display&&this.ticks.length){const{first:u,last:c,widest:f,highest:d}=this._getLabelSizes(),h=i.padding*2,m=Xt(this.labelRotation),y=Math.cos(m),x=Math.sin(m);if(l){const p=i.mirror?0:x*f.width+y*d.height;e.height=Math.min(this.maxHeight,e.height+p+h)}else{const p=i.mirror?0:y*f.width+x*d.height;e.width=Math.min(this.maxWidth,e.width+p+h)}this._calculatePadding(u,c,x,y)}}this._handleMargins(),l?(this.width=this._length=n.width-this._margins.left-this._margins.right,this.height=e.height):(this.width=e.width,this.height=this._length=n.height-this._margins.top-this._margins.bottom)}_calculatePadding(e,n,i,r){const{ticks:{align:s,padding:o},position:l}=this.options,a=this.labelRotation!==0,u=l!=="top"&&this.axis==="x";if(this.isHorizontal()){const c=this.getPixelForTick(0)-this.left,f=this.right-this.getPixelForTick(this.ticks.length-1);let d=0,h=0;a?u?(d=r*e.width,h=i*n.height):(d=i*e.height,h=r*n.width):s==="start"?h=n.width:s==="end"?d=e.width:s!=="inner"&&(d=e.width/2,h=n.width/2),this.paddingLeft=Math.max((d-c+o)*this.width/(this.width-c),0),this.paddingRight=Math.max((h-f+o)*this.width/(this.width-f),0)}else{let c=n.height/2,f=e.height/2;s==="start"?(c=0,f=e.height):s==="end"&&(c=n.height,f=0),this.paddingTop=c+o,this.paddingBottom=f+o}}_handleMargins(){this._margins&&(this._margins.left=Math.max(this.paddingLeft,this._margins.left),this._margins.top=Math.max(this.paddingTop,this._margins.top),this._margins.right=Math.max(this.paddingRight,this._margins.right),this._margins.bottom=Math.max(this.paddingBottom,this._margins.bottom))}afterFit(){V(this.options.afterFit,[this])}isHorizontal(){const{axis:e,position:n}=this.options;return n==="top"||n==="bottom"||e==="x"}isFullSize(){return this.options.fullSize}_convertTicksToLabels(e){this.beforeTickToLabelConversion(),this.generateTickLabels(e);let n,i;for(n=0,i=e.length;n<i;n++)X(e[n].label)&&(e.splice(n,1),i--,n--);this.afterTickToLabelConversion()}_getLabelSizes(){let e=this._labelSizes;if(!e){const n=this.options.ticks.sampleSize;let i=this.ticks;n<i.length&&(i=$f(i,n)),this._labelSizes=e=this._computeLabelSizes(i,i.length)}return e}_computeLabelSizes(e,n){const{ctx:i,_longestTextCache:r}=this,s=[],o=[];let l=0,a=0,u,c,f,d,h,m,y,x,p,g,v;for(u=0;u<n;++u){if(d=e[u].label,h=this._resolveTickFontOptions(u),i.font=m=h.string,y=r[m]=r[m]||{data:{},gc:[]},x=h.lineHeight,p=g=0,!X(d)&&!ie(d))p=go(i,y.data,y.gc,p,d),g=x;else if(ie(d))for(c=0,f=d.length;c<f;++c)v=d[c],!X(v)&&!ie(v)&&(p=go(i,y.data,y.gc,p,v),g+=x);s.push(p),o.push(g),l=Math.max(p,l),a=Math.max(g,a)}Wx(r,n);const _=s.indexOf(l),w=o.indexOf(a),k=S=>({width:s[S]||0,height:o[S]||0});return{first:k(0),last:k(n-1),widest:k(_),highest:k(w),widths:s,heights:o}}getLabelForValue(e){return e}getPixelForValue(e,n){return NaN}getValueForPixel(e){}getPixelForTick(e){const n=this.ticks;return e<0||e>n.length-1?null:this.getPixelForValue(n[e].value)}getPixelForDecimal(e){this._reversePixels&&(e=1-e);const n=this._startPixel+e*this._length;return Fy(this._alignToPixels?yn(this.chart,n,0):n)}getDecimalForPixel(e){const n=(e-this._startPixel)/this._length;return this._reversePixels?1-n:n}getBasePixel(){return this.getPixelForValue(this.getBaseValue())}getBaseValue(){const{min:e,max:n}=this;return e<0&&n<0?n:e>0&&n>0?e:0}getContext(e){const n=this.ticks||[];if(e>=0&&e<n.length){const i=n[e];return i.$context||(i.$context=Ux(this.getContext(),e,i))}return this.$context||(this.$context=Vx(this.chart.getContext(),this))}_tickSize(){const e=this.options.ticks,n=Xt(this.labelRotation),i=Math.abs(Math.cos(n)),r=Math.abs(Math.sin(n)),s=this._getLabelSizes(),o=e.autoSkipPadding||0,l=s?s.widest.width+o:0,a=s?s.highest.height+o:0;return this.isHorizontal()?a*i>l*r?l/i:a/r:a*r<l*i?a/i:l/r}_isVisible(){const e=this.options.display;return e!=="auto"?!!e:this.getMatchingVisibleMetas().length>0}_computeGridLineItems(e){const n=this.axis,i=this.chart,r=this.options,{grid:s,position:o,border:l}=r,a=s.offset,u=this.isHorizontal(),f=this.ticks.length+(a?1:0),d=Ni(s),h=[],m=l.setContext(this.getContext()),y=m.display?m.width:0,x=y/2,p=function(re){return yn(i,re,y)};let g,v,_,w,k,S,b,O,P,D,A,le;if(o==="top")g=p(this.bottom),S=this.bottom-d,O=g-x,D=p(e.top)+x,le=e.bottom;else if(o==="bottom")g=p(this.top),D=e.top,le=p(e.bottom)-x,S=g+x,O=this.top+d;else if(o==="left")g=p(this.right),k=this.right-d,b=g-x,P=p(e.left)+x,A=e.right;else if(o==="right")g=p(this.left),P=e.left,A=p(e.right)-x,k=g+x,b=this.left+d;else if(n==="x"){if(o==="center")g=p((e.top+e.bottom)/2+.5);else if(B(o)){const re=Object.keys(o)[0],xe=o[re];g=p(this.chart.scales[re].getPixelForValue(xe))}D=e.top,le=e.bottom,S=g+x,O=S+d}else if(n==="y"){if(o==="center")g=p((e.left+e.right)/2);else if(B(o)){const re=Object.keys(o)[0],xe=o[re];g=p(this.chart.scales[re].getPixelForValue(xe))}k=g-x,b=k-d,P=e.left,A=e.right}const Ae=F(r.ticks.maxTicksLimit,f),q=Math.max(1,Math.ceil(f/Ae));for(v=0;v<f;v+=q){const re=this.getContext(v),xe=s.setContext(re),E=l.setContext(re),z=xe.lineWidth,N=xe.color,W=E.dash||[],Y=E.dashOffset,ht=xe.tickWidth,je=xe.tickColor,wt=xe.tickBorderDash||[],Be=xe.tickBorderDashOffset;_=Hx(this,v,a),_!==void 0&&(w=yn(i,_,z),u?k=b=P=A=w:S=O=D=le=w,h.push({tx1:k,ty1:S,tx2:b,ty2:O,x1:P,y1:D,x2:A,y2:le,width:z,color:N,borderDash:W,borderDashOffset:Y,tickWidth:ht,tickColor:je,tickBorderDash:wt,tickBorderDashOffset:Be}))}return this._ticksLength=f,this._borderValue=g,h}_computeLabelItems(e){const n=this.axis,i=this.options,{position:r,ticks:s}=i,o=this.isHorizontal(),l=this.ticks,{align:a,crossAlign:u,padding:c,mirror:f}=s,d=Ni(i.grid),h=d+c,m=f?-c:h,y=-Xt(this.labelRotation),x=[];let p,g,v,_,w,k,S,b,O,P,D,A,le="middle";if(r==="top")k=this.bottom-m,S=this._getXAxisLabelAlignment();else if(r==="bottom")k=this.top+m,S=this._getXAxisLabelAlignment();else if(r==="left"){const q=this._getYAxisLabelAlignment(d);S=q.textAlign,w=q.x}else if(r==="right"){const q=this._getYAxisLabelAlignment(d);S=q.textAlign,w=q.x}else if(n==="x"){if(r==="center")k=(e.top+e.bottom)/2+h;else if(B(r)){const q=Object.keys(r)[0],re=r[q];k=this.chart.scales[q].getPixelForValue(re)+h}S=this._getXAxisLabelAlignment()}else if(n==="y"){if(r==="center")w=(e.left+e.right)/2-h;else if(B(r)){const q=Object.keys(r)[0],re=r[q];w=this.chart.scales[q].getPixelForValue(re)}S=this._getYAxisLabelAlignment(d).textAlign}n==="y"&&(a==="start"?le="top":a==="end"&&(le="bottom"));const Ae=this._getLabelSizes();for(p=0,g=l.length;p<g;++p){v=l[p],_=v.label;const q=s.setContext(this.getContext(p));b=this.getPixelForTick(p)+s.labelOffset,O=this._resolveTickFontOptions(p),P=O.lineHeight,D=ie(_)?_.length:1;const re=D/2,xe=q.color,E=q.textStrokeColor,z=q.textStrokeWidth;let N=S;o?(w=b,S==="inner"&&(p===g-1?N=this.options.reverse?"left":"right":p===0?N=this.options.reverse?"right":"left":N="center"),r==="top"?u==="near"||y!==0?A=-D*P+P/2:u==="center"?A=-Ae.highest.height/2-re*P+P:A=-Ae.highest.height+P/2:u==="near"||y!==0?A=P/2:u==="center"?A=Ae.highest.height/2-re*P:A=Ae.highest.height-D*P,f&&(A*=-1),y!==0&&!q.showLabelBackdrop&&(w+=P/2*Math.sin(y))):(k=b,A=(1-D)*P/2);let W;if(q.showLabelBackdrop){const Y=Me(q.backdropPadding),ht=Ae.heights[p],je=Ae.widths[p];let wt=A-Y.top,Be=0-Y.left;switch(le){case"middle":wt-=ht/2;break;case"bottom":wt-=ht;break}switch(S){case"center":Be-=je/2;break;case"right":Be-=je;break}W={left:Be,top:wt,width:je+Y.width,height:ht+Y.height,color:q.backdropColor}}x.push({label:_,font:O,textOffset:A,options:{rotation:y,color:xe,strokeColor:E,strokeWidth:z,textAlign:N,textBaseline:le,translation:[w,k],backdrop:W}})}return x}_getXAxisLabelAlignment(){const{position:e,ticks:n}=this.options;if(-Xt(this.labelRotation))return e==="top"?"left":"right";let r="center";return n.align==="start"?r="left":n.align==="end"?r="right":n.align==="inner"&&(r="inner"),r}_getYAxisLabelAlignment(e){const{position:n,ticks:{crossAlign:i,mirror:r,padding:s}}=this.options,o=this._getLabelSizes(),l=e+s,a=o.widest.width;let u,c;return n==="left"?r?(c=this.right+s,i==="near"?u="left":i==="center"?(u="center",c+=a/2):(u="right",c+=a)):(c=this.right-l,i==="near"?u="right":i==="center"?(u="center",c-=a/2):(u="left",c=this.left)):n==="right"?r?(c=this.left+s,i==="near"?u="right":i==="center"?(u="center",c-=a/2):(u="left",c-=a)):(c=this.left+l,i==="near"?u="left":i==="center"?(u="center",c+=a/2):(u="right",c=this.right)):u="right",{textAlign:u,x:c}}_computeLabelArea(){if(this.options.ticks.mirror)return;const e=this.chart,n=this.options.position;if(n==="left"||n==="right")return{top:0,left:this.left,bottom:e.height,right:this.right};if(n==="top"||n==="bottom")return{top:this.top,left:0,bottom:this.bottom,right:e.width}}drawBackground(){const{ctx:e,options:{backgroundColor:n},left:i,top:r,width:s,height:o}=this;n&&(e.save(),e.fillStyle=n,e.fillRect(i,r,s,o),e.restore())}getLineWidthForValue(e){const n=this.options.grid;if(!this._isVisible()||!n.display)return 0;const r=this.ticks.findIndex(s=>s.value===e);return r>=0?n.setContext(this.getContext(r)).lineWidth:0}drawGrid(e){const n=this.options.grid,i=this.ctx,r=this._gridLineItems||(this._gridLineItems=this._computeGridLineItems(e));let s,o;const l=(a,u,c)=>{!c.width||!c.color||(i.save(),i.lineWidth=c.width,i.strokeStyle=c.color,i.setLineDash(c.borderDash||[]),i.lineDashOffset=c.borderDashOffset,i.beginPath(),i.moveTo(a.x,a.y),i.lineTo(u.x,u.y),i.stroke(),i.restore())};if(n.display)for(s=0,o=r.length;s<o;++s){const a=r[s];n.drawOnChartArea&&l({x:a.x1,y:a.y1},{x:a.x2,y:a.y2},a),n.drawTicks&&l({x:a.tx1,y:a.ty1},{x:a.tx2,y:a.ty2},{color:a.tickColor,width:a.tickWidth,borderDash:a.tickBorderDash,borderDashOffset:a.tickBorderDashOffset})}}drawBorder(){const{chart:e,ctx:n,options:{border:i,grid:r}}=this,s=i.setContext(this.getContext()),o=i.display?s.width:0;if(!o)return;const l=r.setContext(this.getContext(0)).lineWidth,a=this._borderValue;let u,c,f,d;this.isHorizontal()?(u=yn(e,this.left,o)-o/2,c=yn(e,this.right,l)+l/2,f=d=a):(f=yn(e,this.top,o)-o/2,d=yn(e,this.bottom,l)+l/2,u=c=a),n.save(),n.lineWidth=s.width,n.strokeStyle=s.color,n.beginPath(),n.moveTo(u,f),n.lineTo(c,d),n.stroke(),n.restore()}drawLabels(e){if(!this.options.ticks.display)return;const i=this.ctx,r=this._computeLabelArea();r&&ju(i,r);const s=this.getLabelItems(e);for(const o of s){const l=o.options,a=o.font,u=o.label,c=o.textOffset;yi(i,u,0,c,a,l)}r&&Bu(i)}drawTitle(){const{ctx:e,options:{position:n,title:i,reverse:r}}=this;if(!i.display)return;const s=ge(i.font),o=Me(i.padding),l=i.align;let a=s.lineHeight/2;n==="bottom"||n==="center"||B(n)?(a+=o.bottom,ie(i.text)&&(a+=s.lineHeight*(i.text.length-1))):a+=o.top;const{titleX:u,titleY:c,maxWidth:f,rotation:d}=Qx(this,a,n,l);yi(e,i.text,0,0,s,{color:i.color,maxWidth:f,rotation:d,textAlign:Yx(l,n,r),textBaseline:"middle",translation:[u,c]})}draw(e){this._isVisible()&&(this.drawBackground(),this.drawGrid(e),this.drawBorder(),this.drawTitle(),this.drawLabels(e))}_layers(){const e=this.options,n=e.ticks&&e.ticks.z||0,i=F(e.grid&&e.grid.z,-1),r=F(e.border&&e.border.z,0);return!this._isVisible()||this.draw!==Bn.prototype.draw?[{z:n,draw:s=>{this.draw(s)}}]:[{z:i,draw:s=>{this.drawBackground(),this.drawGrid(s),this.drawTitle()}},{z:r,draw:()=>{this.drawBorder()}},{z:n,draw:s=>{this.drawLabels(s)}}]}getMatchingVisibleMetas(e){const n=this.chart.getSortedVisibleDatasetMetas(),i=this.axis+"AxisID",r=[];let s,o;for(s=0,o=n.length;s<o;++s){const l=n[s];l[i]===this.id&&(!e||l.type===e)&&r.push(l)}return r}_resolveTickFontOptions(e){const n=this.options.ticks.setContext(this.getContext(e));return ge(n.font)}_maxDigits(){const e=this._resolveTickFontOptions(0).lineHeight;return(this.isHorizontal()?this.width:this.height)/e}}class ps{constructor(e,n,i){this.type=e,this.scope=n,this.override=i,this.items=Object.create(null)}isForType(e){return Object.prototype.isPrototypeOf.call(this.type.prototype,e.prototype)}register(e){const n=Object.getPrototypeOf(e);let i;Gx(n)&&(i=this.register(n));const r=this.items,s=e.id,o=this.scope+"."+s;if(!s)throw new Error("class does not have id: "+e);return s in r||(r[s]=e,Kx(e,o,i),this.override&&oe.override(e.id,e.overrides)),o}get(e){return this.items[e]}unregister(e){const n=this.items,i=e.id,r=this.scope;i in n&&delete n[i],r&&i in oe[r]&&(delete oe[r][i],this.override&&delete Rn[i])}}function Kx(t,e,n){const i=Er(Object.create(null),[n?oe.get(n):{},oe.get(e),t.defaults]);oe.set(e,i),t.defaultRoutes&&Xx(e,t.defaultRoutes),t.descriptors&&oe.describe(e,t.descriptors)}function Xx(t,e){Object.keys(e).forEach(n=>{const i=n.split("."),r=i.pop(),s=[t].concat(i).join("."),o=e[n].split("."),l=o.pop(),a=o.join(".");oe.route(s,r,a,l)})}function Gx(t){return"id"in t&&"defaults"in t}class Zx{constructor(){this.controllers=new ps(sr,"datasets",!0),this.elements=new ps(cn,"elements"),this.plugins=new ps(Object,"plugins"),this.scales=new ps(Bn,"scales"),this._typedRegistries=[this.controllers,this.scales,this.elements]}add(...e){this._each("register",e)}remove(...e){this._each("unregister",e)}addControllers(...e){this._each("register",e,this.controllers)}addElements(...e){this._each("register",e,this.elements)}addPlugins(...e){this._each("register",e,this.plugins)}addScales(...e){this._each("register",e,this.scales)}getController(e){return this._get(e,this.controllers,"controller")}getElement(e){return this._get(e,this.elements,"element")}getPlugin(e){return this._get(e,this.plugins,"plugin")}getScale(e){return this._get(e,this.scales,"scale")}removeControllers(...e){this._each("unregister",e,this.controllers)}removeElements(...e){this._each("unregister",e,this.elements)}removePlugins(...e){this._each("unregister",e,this.plugins)}removeScales(...e){this._each("unregister",e,this.scales)}_each(e,n,i){[...n].forEach(r=>{const s=i||this._getRegistryForType(r);i||s.isForType(r)||s===this.plugins&&r.id?this._exec(e,s,r):$(r,o=>{const l=i||this._getRegistryForType(o);this._exec(e,l,o)})})}_exec(e,n,i){const r=Iu(e);V(i["before"+r],[],i),n[e](i),V(i["after"+r],[],i)}_getRegistryForType(e){for(let n=0;n<this._typedRegistries.length;n++){const i=this._typedRegistries[n];if(i.isForType(e))return i}return this.plugins}_get(e,n,i){const r=n.get(e);if(r===void 0)throw new Error('"'+e+'" is not a registered '+i+".");return r}}var yt=new Zx;class qx{constructor(){this._init=[]}notify(e,n,i,r){n==="beforeInit"&&(this._init=this._createDescriptors(e,!0),this._notify(this._init,e,"install"));const s=r?this._descriptors(e).filter(r):this._descriptors(e),o=this._notify(s,e,n,i);return n==="afterDestroy"&&(this._notify(s,e,"stop"),this._notify(this._init,e,"uninstall")),o}_notify(e,n,i,r){r=r||{};for(const s of e){const o=s.plugin,l=o[i],a=[n,r,s.options];if(V(l,a,o)===!1&&r.cancelable)return!1}return!0}invalidate(){X(this._cache)||(this._oldCache=this._cache,this._cache=void 0)}_descriptors(e){if(this._cache)return this._cache;const n=this._cache=this._createDescriptors(e);return this._notifyStateChanges(e),n}_createDescriptors(e,n){const i=e&&e.config,r=F(i.options&&i.options.plugins,{}),s=Jx(i);return r===!1&&!n?[]:t2(e,s,r,n)}_notifyStateChanges(e){const n=this._oldCache||[],i=this._cache,r=(s,o)=>s.filter(l=>!o.some(a=>l.plugin.id===a.plugin.id));this._notify(r(n,i),e,"stop"),this._notify(r(i,n),e,"start")}}function Jx(t){const e={},n=[],i=Object.keys(yt.plugins.items);for(let s=0;s<i.length;s++)n.push(yt.getPlugin(i[s]));const r=t.plugins||[];for(let s=0;s<r.length;s++){const o=r[s];n.indexOf(o)===-1&&(n.push(o),e[o.id]=!0)}return{plugins:n,localIds:e}}function e2(t,e){return!e&&t===!1?null:t===!0?{}:t}function t2(t,{plugins:e,localIds:n},i,r){const s=[],o=t.getContext();for(const l of e){const a=l.id,u=e2(i[a],r);u!==null&&s.push({plugin:l,options:n2(t.config,{plugin:l,local:n[a]},u,o)})}return s}function n2(t,{plugin:e,local:n},i,r){const s=t.pluginScopeKeys(e),o=t.getOptionScopes(i,s);return n&&e.defaults&&o.push(e.defaults),t.createResolver(o,r,[""],{scriptable:!1,indexable:!1,allKeys:!0})}function La(t,e){const n=oe.datasets[t]||{};return((e.datasets||{})[t]||{}).indexAxis||e.indexAxis||n.indexAxis||"x"}function i2(t,e){let n=t;return t==="_index_"?n=e:t==="_value_"&&(n=e==="x"?"y":"x"),n}function r2(t,e){return t===e?"_index_":"_value_"}function s2(t){if(t==="top"||t==="bottom")return"x";if(t==="left"||t==="right")return"y"}function xo(t,e){if(t==="x"||t==="y"||t==="r"||(t=e.axis||s2(e.position)||t.length>1&&xo(t[0].toLowerCase(),e),t))return t;throw new Error(`Cannot determine type of '${name}' axis. Please provide 'axis' or 'position' option.`)}function o2(t,e){const n=Rn[t.type]||{scales:{}},i=e.scales||{},r=La(t.type,e),s=Object.create(null);return Object.keys(i).forEach(o=>{const l=i[o];if(!B(l))return console.error(`Invalid scale configuration for scale: ${o}`);if(l._proxy)return console.warn(`Ignoring resolver passed as options for scale: ${o}`);const a=xo(o,l),u=r2(a,r),c=n.scales||{};s[o]=tr(Object.create(null),[{axis:a},l,c[a],c[u]])}),t.data.datasets.forEach(o=>{const l=o.type||t.type,a=o.indexAxis||La(l,e),c=(Rn[l]||{}).scales||{};Object.keys(c).forEach(f=>{const d=i2(f,a),h=o[d+"AxisID"]||d;s[h]=s[h]||Object.create(null),tr(s[h],[{axis:d},i[h],c[f]])})}),Object.keys(s).forEach(o=>{const l=s[o];tr(l,[oe.scales[l.type],oe.scale])}),s}function mg(t){const e=t.options||(t.options={});e.plugins=F(e.plugins,{}),e.scales=o2(t,e)}function yg(t){return t=t||{},t.datasets=t.datasets||[],t.labels=t.labels||[],t}function l2(t){return t=t||{},t.data=yg(t.data),mg(t),t}const Wf=new Map,vg=new Set;function gs(t,e){let n=Wf.get(t);return n||(n=e(),Wf.set(t,n),vg.add(n)),n}const Ii=(t,e,n)=>{const i=ho(e,n);i!==void 0&&t.add(i)};class a2{constructor(e){this._config=l2(e),this._scopeCache=new Map,this._resolverCache=new Map}get platform(){return this._config.platform}get type(){return this._config.type}set type(e){this._config.type=e}get data(){return this._config.data}set data(e){this._config.data=yg(e)}get options(){return this._config.options}set options(e){this._config.options=e}get plugins(){return this._config.plugins}update(){const e=this._config;this.clearCache(),mg(e)}clearCache(){this._scopeCache.clear(),this._resolverCache.clear()}datasetScopeKeys(e){return gs(e,()=>[[`datasets.${e}`,""]])}datasetAnimationScopeKeys(e,n){return gs(`${e}.transition.${n}`,()=>[[`datasets.${e}.transitions.${n}`,`transitions.${n}`],[`datasets.${e}`,""]])}datasetElementScopeKeys(e,n){return gs(`${e}-${n}`,()=>[[`datasets.${e}.elements.${n}`,`datasets.${e}`,`elements.${n}`,""]])}pluginScopeKeys(e){const n=e.id,i=this.type;return gs(`${i}-plugin-${n}`,()=>[[`plugins.${n}`,...e.additionalOptionScopes||[]]])}_cachedScopes(e,n){const i=this._scopeCache;let r=i.get(e);return(!r||n)&&(r=new Map,i.set(e,r)),r}getOptionScopes(e,n,i){const{options:r,type:s}=this,o=this._cachedScopes(e,i),l=o.get(n);if(l)return l;const a=new Set;n.forEach(c=>{e&&(a.add(e),c.forEach(f=>Ii(a,e,f))),c.forEach(f=>Ii(a,r,f)),c.forEach(f=>Ii(a,Rn[s]||{},f)),c.forEach(f=>Ii(a,oe,f)),c.forEach(f=>Ii(a,Ea,f))});const u=Array.from(a);return u.length===0&&u.push(Object.create(null)),vg.has(n)&&o.set(n,u),u}chartOptionScopes(){const{options:e,type:n}=this;return[e,Rn[n]||{},oe.datasets[n]||{},{type:n},oe,Ea]}resolveNamedOptions(e,n,i,r=[""]){const s={$shared:!0},{resolver:o,subPrefixes:l}=Vf(this._resolverCache,e,r);let a=o;if(c2(o,n)){s.$shared=!1,i=un(i)?i():i;const u=this.createResolver(e,i,l);a=vi(o,i,u)}for(const u of n)s[u]=a[u];return s}createResolver(e,n,i=[""],r){const{resolver:s}=Vf(this._resolverCache,e,i);return B(n)?vi(s,n,void 0,r):s}}function Vf(t,e,n){let i=t.get(e);i||(i=new Map,t.set(e,i));const r=n.join();let s=i.get(r);return s||(s={resolver:$u(e,n),subPrefixes:n.filter(l=>!l.toLowerCase().includes("hover"))},i.set(r,s)),s}const u2=t=>B(t)&&Object.getOwnPropertyNames(t).reduce((e,n)=>e||un(t[n]),!1);function c2(t,e){const{isScriptable:n,isIndexable:i}=eg(t);for(const r of e){const s=n(r),o=i(r),l=(o||s)&&t[r];if(s&&(un(l)||u2(l))||o&&ie(l))return!0}return!1}var f2="4.1.1";const d2=["top","bottom","left","right","chartArea"];function Uf(t,e){return t==="top"||t==="bottom"||d2.indexOf(t)===-1&&e==="x"}function Yf(t,e){return function(n,i){return n[t]===i[t]?n[e]-i[e]:n[t]-i[t]}}function Qf(t){const e=t.chart,n=e.options.animation;e.notifyPlugins("afterRender"),V(n&&n.onComplete,[t],e)}function h2(t){const e=t.chart,n=e.options.animation;V(n&&n.onProgress,[t],e)}function xg(t){return sg()&&typeof t=="string"?t=document.getElementById(t):t&&t.length&&(t=t[0]),t&&t.canvas&&(t=t.canvas),t}const Rs={},Kf=t=>{const e=xg(t);return Object.values(Rs).filter(n=>n.canvas===e).pop()};function p2(t,e,n){const i=Object.keys(t);for(const r of i){const s=+r;if(s>=e){const o=t[r];delete t[r],(n>0||s>e)&&(t[s+n]=o)}}}function g2(t,e,n,i){return!n||t.type==="mouseout"?null:i?e:t}function m2(t){const{xScale:e,yScale:n}=t;if(e&&n)return{left:e.left,right:e.right,top:n.top,bottom:n.bottom}}var jt;let Wo=(jt=class{static register(...e){yt.add(...e),Xf()}static unregister(...e){yt.remove(...e),Xf()}constructor(e,n){const i=this.config=new a2(n),r=xg(e),s=Kf(r);if(s)throw new Error("Canvas is already in use. Chart with ID '"+s.id+"' must be destroyed before the canvas with ID '"+s.canvas.id+"' can be reused.");const o=i.createResolver(i.chartOptionScopes(),this.getContext());this.platform=new(i.platform||Nx(r)),this.platform.updateConfig(i);const l=this.platform.acquireContext(r,o.aspectRatio),a=l&&l.canvas,u=a&&a.height,c=a&&a.width;if(this.id=by(),this.ctx=l,this.canvas=a,this.width=c,this.height=u,this._options=o,this._aspectRatio=this.aspectRatio,this._layers=[],this._metasets=[],this._stacks=void 0,this.boxes=[],this.currentDevicePixelRatio=void 0,this.chartArea=void 0,this._active=[],this._lastEvent=void 0,this._listeners={},this._responsiveListeners=void 0,this._sortedMetasets=[],this.scales={},this._plugins=new qx,this.$proxies={},this._hiddenIndices={},this.attached=!1,this._animationsDisabled=void 0,this.$context=void 0,this._doResize=Hy(f=>this.update(f),o.resizeDelay||0),this._dataChanges=[],Rs[this.id]=this,!l||!a){console.error("Failed to create chart: can't acquire context from the given item");return}bt.listen(this,"complete",Qf),bt.listen(this,"progress",h2),this._initialize(),this.attached&&this.update()}get aspectRatio(){const{options:{aspectRatio:e,maintainAspectRatio:n},width:i,height:r,_aspectRatio:s}=this;return X(e)?n&&s?s:r?i/r:null:e}get data(){return this.config.data}set data(e){this.config.data=e}get options(){return this._options}set options(e){this.config.options=e}get registry(){return yt}_initialize(){return this.notifyPlugins("beforeInit"),this.options.responsive?this.resize():kf(this,this.options.devicePixelRatio),this.bindEvents(),this.notifyPlugins("afterInit"),this}clear(){return xf(this.canvas,this.ctx),this}stop(){return bt.stop(this),this}resize(e,n){bt.running(this)?this._resizeBeforeDraw={width:e,height:n}:this._resize(e,n)}_resize(e,n){const i=this.options,r=this.canvas,s=i.maintainAspectRatio&&this.aspectRatio,o=this.platform.getMaximumSize(r,e,n,s),l=i.devicePixelRatio||this.platform.getDevicePixelRatio(),a=this.width?"resize":"attach";this.width=o.width,this.height=o.height,this._aspectRatio=this.aspectRatio,kf(this,l,!0)&&(this.notifyPlugins("resize",{size:o}),V(i.onResize,[this,o],this),this.attached&&this._doResize(a)&&this.render())}ensureScalesHaveIDs(){const n=this.options.scales||{};$(n,(i,r)=>{i.id=r})}buildOrUpdateScales(){const e=this.options,n=e.scales,i=this.scales,r=Object.keys(i).reduce((o,l)=>(o[l]=!1,o),{});let s=[];n&&(s=s.concat(Object.keys(n).map(o=>{const l=n[o],a=xo(o,l),u=a==="r",c=a==="x";return{options:l,dposition:u?"chartArea":c?"bottom":"left",dtype:u?"radialLinear":c?"category":"linear"}}))),$(s,o=>{const l=o.options,a=l.id,u=xo(a,l),c=F(l.type,o.dtype);(l.position===void 0||Uf(l.position,u)!==Uf(o.dposition))&&(l.position=o.dposition),r[a]=!0;let f=null;if(a in i&&i[a].type===c)f=i[a];else{const d=yt.getScale(c);f=new d({id:a,type:c,ctx:this.ctx,chart:this}),i[f.id]=f}f.init(l,e)}),$(r,(o,l)=>{o||delete i[l]}),$(i,o=>{Gt.configure(this,o,o.options),Gt.addBox(this,o)})}_updateMetasets(){const e=this._metasets,n=this.data.datasets.length,i=e.length;if(e.sort((r,s)=>r.index-s.index),i>n){for(let r=n;r<i;++r)this._destroyDatasetMeta(r);e.splice(n,i-n)}this._sortedMetasets=e.slice(0).sort(Yf("order","index"))}_removeUnreferencedMetasets(){const{_metasets:e,data:{datasets:n}}=this;e.length>n.length&&delete this._stacks,e.forEach((i,r)=>{n.filter(s=>s===i._dataset).length===0&&this._destroyDatasetMeta(r)})}buildOrUpdateControllers(){const e=[],n=this.data.datasets;let i,r;for(this._removeUnreferencedMetasets(),i=0,r=n.length;i<r;i++){const s=n[i];let o=this.getDatasetMeta(i);const l=s.type||this.config.type;if(o.type&&o.type!==l&&(this._destroyDatasetMeta(i),o=this.getDatasetMeta(i)),o.type=l,o.indexAxis=s.indexAxis||La(l,this.options),o.order=s.order||0,o.index=i,o.label=""+s.label,o.visible=this.isDatasetVisible(i),o.controller)o.controller.updateIndex(i),o.controller.linkScales();else{const a=yt.getController(l),{datasetElementType:u,dataElementType:c}=oe.datasets[l];Object.assign(a,{dataElementType:yt.getElement(c),datasetElementType:u&&yt.getElement(u)}),o.controller=new a(this,i),e.push(o.controller)}}return this._updateMetasets(),e}_resetElements(){$(this.data.datasets,(e,n)=>{this.getDatasetMeta(n).controller.reset()},this)}reset(){this._resetElements(),this.notifyPlugins("reset")}update(e){const n=this.config;n.update();const i=this._options=n.createResolver(n.chartOptionScopes(),this.getContext()),r=this._animationsDisabled=!i.animation;if(this._updateScales(),this._checkEventBindings(),this._updateHiddenIndices(),this._plugins.invalidate(),this.notifyPlugins("beforeUpdate",{mode:e,cancelable:!0})===!1)return;const s=this.buildOrUpdateControllers();this.notifyPlugins("beforeElementsUpdate");let o=0;for(let u=0,c=this.data.datasets.length;u<c;u++){const{controller:f}=this.getDatasetMeta(u),d=!r&&s.indexOf(f)===-1;f.buildOrUpdateElements(d),o=Math.max(+f.getMaxOverflow(),o)}o=this._minPadding=i.layout.autoPadding?o:0,this._updateLayout(o),r||$(s,u=>{u.reset()}),this._updateDatasets(e),this.notifyPlugins("afterUpdate",{mode:e}),this._layers.sort(Yf("z","_idx"));const{_active:l,_lastEvent:a}=this;a?this._eventHandler(a,!0):l.length&&this._updateHoverStyles(l,l,!0),this.render()}_updateScales(){$(this.scales,e=>{Gt.removeBox(this,e)}),this.ensureScalesHaveIDs(),this.buildOrUpdateScales()}_checkEventBindings(){const e=this.options,n=new Set(Object.keys(this._listeners)),i=new Set(e.events);(!cf(n,i)||!!this._responsiveListeners!==e.responsive)&&(this.unbindEvents(),this.bindEvents())}_updateHiddenIndices(){const{_hiddenIndices:e}=this,n=this._getUniformDataChanges()||[];for(const{method:i,start:r,count:s}of n){const o=i==="_removeElements"?-s:s;p2(e,r,o)}}_getUniformDataChanges(){const e=this._dataChanges;if(!e||!e.length)return;this._dataChanges=[];const n=this.data.datasets.length,i=s=>new Set(e.filter(o=>o[0]===s).map((o,l)=>l+","+o.splice(1).join(","))),r=i(0);for(let s=1;s<n;s++)if(!cf(r,i(s)))return;return Array.from(r).map(s=>s.split(",")).map(s=>({method:s[1],start:+s[2],count:+s[3]}))}_updateLayout(e){if(this.notifyPlugins("beforeLayout",{cancelable:!0})===!1)return;Gt.update(this,this.width,this.height,e);const n=this.chartArea,i=n.width<=0||n.height<=0;this._layers=[],$(this.boxes,r=>{i&&r.position==="chartArea"||(r.configure&&r.configure(),this._layers.push(...r._layers()))},this),this._layers.forEach((r,s)=>{r._idx=s}),this.notifyPlugins("afterLayout")}_updateDatasets(e){if(this.notifyPlugins("beforeDatasetsUpdate",{mode:e,cancelable:!0})!==!1){for(let n=0,i=this.data.datasets.length;n<i;++n)this.getDatasetMeta(n).controller.configure();for(let n=0,i=this.data.datasets.length;n<i;++n)this._updateDataset(n,un(e)?e({datasetIndex:n}):e);this.notifyPlugins("afterDatasetsUpdate",{mode:e})}}_updateDataset(e,n){const i=this.getDatasetMeta(e),r={meta:i,index:e,mode:n,cancelable:!0};this.notifyPlugins("beforeDatasetUpdate",r)!==!1&&(i.controller._update(n),r.cancelable=!1,this.notifyPlugins("afterDatasetUpdate",r))}render(){this.notifyPlugins("beforeRender",{cancelable:!0})!==!1&&(bt.has(this)?this.attached&&!bt.running(this)&&bt.start(this):(this.draw(),Qf({chart:this})))}draw(){let e;if(this._resizeBeforeDraw){const{width:i,height:r}=this._resizeBeforeDraw;this._resize(i,r),this._resizeBeforeDraw=null}if(this.clear(),this.width<=0||this.height<=0||this.notifyPlugins("beforeDraw",{cancelable:!0})===!1)return;const n=this._layers;for(e=0;e<n.length&&n[e].z<=0;++e)n[e].draw(this.chartArea);for(this._drawDatasets();e<n.length;++e)n[e].draw(this.chartArea);this.notifyPlugins("afterDraw")}_getSortedDatasetMetas(e){const n=this._sortedMetasets,i=[];let r,s;for(r=0,s=n.length;r<s;++r){const o=n[r];(!e||o.visible)&&i.push(o)}return i}getSortedVisibleDatasetMetas(){return this._getSortedDatasetMetas(!0)}_drawDatasets(){if(this.notifyPlugins("beforeDatasetsDraw",{cancelable:!0})===!1)return;const e=this.getSortedVisibleDatasetMetas();for(let n=e.length-1;n>=0;--n)this._drawDataset(e[n]);this.notifyPlugins("afterDatasetsDraw")}_drawDataset(e){const n=this.ctx,i=e._clip,r=!i.disabled,s=m2(e)||this.chartArea,o={meta:e,index:e.index,cancelable:!0};this.notifyPlugins("beforeDatasetDraw",o)!==!1&&(r&&ju(n,{left:i.left===!1?0:s.left-i.left,right:i.right===!1?this.width:s.right+i.right,top:i.top===!1?0:s.top-i.top,bottom:i.bottom===!1?this.height:s.bottom+i.bottom}),e.controller.draw(),r&&Bu(n),o.cancelable=!1,this.notifyPlugins("afterDatasetDraw",o))}isPointInArea(e){return Lr(e,this.chartArea,this._minPadding)}getElementsAtEventForMode(e,n,i,r){const s=hx.modes[n];return typeof s=="function"?s(this,e,i,r):[]}getDatasetMeta(e){const n=this.data.datasets[e],i=this._metasets;let r=i.filter(s=>s&&s._dataset===n).pop();return r||(r={type:null,data:[],dataset:null,controller:null,hidden:null,xAxisID:null,yAxisID:null,order:n&&n.order||0,index:e,_dataset:n,_parsed:[],_sorted:!1},i.push(r)),r}getContext(){return this.$context||(this.$context=gn(null,{chart:this,type:"chart"}))}getVisibleDatasetCount(){return this.getSortedVisibleDatasetMetas().length}isDatasetVisible(e){const n=this.data.datasets[e];if(!n)return!1;const i=this.getDatasetMeta(e);return typeof i.hidden=="boolean"?!i.hidden:!n.hidden}setDatasetVisibility(e,n){const i=this.getDatasetMeta(e);i.hidden=!n}toggleDataVisibility(e){this._hiddenIndices[e]=!this._hiddenIndices[e]}getDataVisibility(e){return!this._hiddenIndices[e]}_updateVisibility(e,n,i){const r=i?"show":"hide",s=this.getDatasetMeta(e),o=s.controller._resolveAnimations(void 0,r);dt(n)?(s.data[n].hidden=!i,this.update()):(this.setDatasetVisibility(e,i),o.update(s,{visible:i}),this.update(l=>l.datasetIndex===e?r:void 0))}hide(e,n){this._updateVisibility(e,n,!1)}show(e,n){this._updateVisibility(e,n,!0)}_destroyDatasetMeta(e){const n=this._metasets[e];n&&n.controller&&n.controller._destroy(),delete this._metasets[e]}_stop(){let e,n;for(this.stop(),bt.remove(this),e=0,n=this.data.datasets.length;e<n;++e)this._destroyDatasetMeta(e)}destroy(){this.notifyPlugins("beforeDestroy");const{canvas:e,ctx:n}=this;this._stop(),this.config.clearCache(),e&&(this.unbindEvents(),xf(e,n),this.platform.releaseContext(n),this.canvas=null,this.ctx=null),delete Rs[this.id],this.notifyPlugins("afterDestroy")}toBase64Image(...e){return this.canvas.toDataURL(...e)}bindEvents(){this.bindUserEvents(),this.options.responsive?this.bindResponsiveEvents():this.attached=!0}bindUserEvents(){const e=this._listeners,n=this.platform,i=(s,o)=>{n.addEventListener(this,s,o),e[s]=o},r=(s,o,l)=>{s.offsetX=o,s.offsetY=l,this._eventHandler(s)};$(this.options.events,s=>i(s,r))}bindResponsiveEvents(){this._responsiveListeners||(this._responsiveListeners={});const e=this._responsiveListeners,n=this.platform,i=(a,u)=>{n.addEventListener(this,a,u),e[a]=u},r=(a,u)=>{e[a]&&(n.removeEventListener(this,a,u),delete e[a])},s=(a,u)=>{this.canvas&&this.resize(a,u)};let o;const l=()=>{r("attach",l),this.attached=!0,this.resize(),i("resize",s),i("detach",o)};o=()=>{this.attached=!1,r("resize",s),this._stop(),this._resize(0,0),i("attach",l)},n.isAttached(this.canvas)?l():o()}unbindEvents(){$(this._listeners,(e,n)=>{this.platform.removeEventListener(this,n,e)}),this._listeners={},$(this._responsiveListeners,(e,n)=>{this.platform.removeEventListener(this,n,e)}),this._responsiveListeners=void 0}updateHoverStyle(e,n,i){const r=i?"set":"remove";let s,o,l,a;for(n==="dataset"&&(s=this.getDatasetMeta(e[0].datasetIndex),s.controller["_"+r+"DatasetHoverStyle"]()),l=0,a=e.length;l<a;++l){o=e[l];const u=o&&this.getDatasetMeta(o.datasetIndex).controller;u&&u[r+"HoverStyle"](o.element,o.datasetIndex,o.index)}}getActiveElements(){return this._active||[]}setActiveElements(e){const n=this._active||[],i=e.map(({datasetIndex:s,index:o})=>{const l=this.getDatasetMeta(s);if(!l)throw new Error("No dataset found at index "+s);return{datasetIndex:s,element:l.data[o],index:o}});!co(i,n)&&(this._active=i,this._lastEvent=null,this._updateHoverStyles(i,n))}notifyPlugins(e,n,i){return this._plugins.notify(this,e,n,i)}isPluginEnabled(e){return this._plugins._cache.filter(n=>n.plugin.id===e).length===1}_updateHoverStyles(e,n,i){const r=this.options.hover,s=(a,u)=>a.filter(c=>!u.some(f=>c.datasetIndex===f.datasetIndex&&c.index===f.index)),o=s(n,e),l=i?e:s(e,n);o.length&&this.updateHoverStyle(o,r.mode,!1),l.length&&r.mode&&this.updateHoverStyle(l,r.mode,!0)}_eventHandler(e,n){const i={event:e,replay:n,cancelable:!0,inChartArea:this.isPointInArea(e)},r=o=>(o.options.events||this.options.events).includes(e.native.type);if(this.notifyPlugins("beforeEvent",i,r)===!1)return;const s=this._handleEvent(e,n,i.inChartArea);return i.cancelable=!1,this.notifyPlugins("afterEvent",i,r),(s||i.changed)&&this.render(),this}_handleEvent(e,n,i){const{_active:r=[],options:s}=this,o=n,l=this._getActiveElements(e,r,i,o),a=Ty(e),u=g2(e,this._lastEvent,i,a);i&&(this._lastEvent=null,V(s.onHover,[e,l,this],this),a&&V(s.onClick,[e,l,this],this));const c=!co(l,r);return(c||n)&&(this._active=l,this._updateHoverStyles(l,r,n)),this._lastEvent=u,c}_getActiveElements(e,n,i,r){if(e.type==="mouseout")return[];if(!i)return n;const s=this.options.hover;return this.getElementsAtEventForMode(e,s.mode,s,r)}},I(jt,"defaults",oe),I(jt,"instances",Rs),I(jt,"overrides",Rn),I(jt,"registry",yt),I(jt,"version",f2),I(jt,"getChart",Kf),jt);function Xf(){return $(Wo.instances,t=>t._plugins.invalidate())}function _g(t,e,n=e){t.lineCap=F(n.borderCapStyle,e.borderCapStyle),t.setLineDash(F(n.borderDash,e.borderDash)),t.lineDashOffset=F(n.borderDashOffset,e.borderDashOffset),t.lineJoin=F(n.borderJoinStyle,e.borderJoinStyle),t.lineWidth=F(n.borderWidth,e.borderWidth),t.strokeStyle=F(n.borderColor,e.borderColor)}function y2(t,e,n){t.lineTo(n.x,n.y)}function v2(t){return t.stepped?nv:t.tension||t.cubicInterpolationMode==="monotone"?iv:y2}function wg(t,e,n={}){const i=t.length,{start:r=0,end:s=i-1}=n,{start:o,end:l}=e,a=Math.max(r,o),u=Math.min(s,l),c=r<o&&s<o||r>l&&s>l;return{count:i,start:a,loop:e.loop,ilen:u<a&&!c?i+u-a:u-a}}function x2(t,e,n,i){const{points:r,options:s}=e,{count:o,start:l,loop:a,ilen:u}=wg(r,n,i),c=v2(s);let{move:f=!0,reverse:d}=i||{},h,m,y;for(h=0;h<=u;++h)m=r[(l+(d?u-h:h))%o],!m.skip&&(f?(t.moveTo(m.x,m.y),f=!1):c(t,y,m,d,s.stepped),y=m);return a&&(m=r[(l+(d?u:0))%o],c(t,y,m,d,s.stepped)),!!a}function _2(t,e,n,i){const r=e.points,{count:s,start:o,ilen:l}=wg(r,n,i),{move:a=!0,reverse:u}=i||{};let c=0,f=0,d,h,m,y,x,p;const g=_=>(o+(u?l-_:_))%s,v=()=>{y!==x&&(t.lineTo(c,x),t.lineTo(c,y),t.lineTo(c,p))};for(a&&(h=r[g(0)],t.moveTo(h.x,h.y)),d=0;d<=l;++d){if(h=r[g(d)],h.skip)continue;const _=h.x,w=h.y,k=_|0;k===m?(w<y?y=w:w>x&&(x=w),c=(f*c+_)/++f):(v(),t.lineTo(_,w),m=k,f=0,y=x=w),p=w}v()}function Ta(t){const e=t.options,n=e.borderDash&&e.borderDash.length;return!t._decimated&&!t._loop&&!e.tension&&e.cubicInterpolationMode!=="monotone"&&!e.stepped&&!n?_2:x2}function w2(t){return t.stepped?Rv:t.tension||t.cubicInterpolationMode==="monotone"?Fv:Sn}function k2(t,e,n,i){let r=e._path;r||(r=e._path=new Path2D,e.path(r,n,i)&&r.closePath()),_g(t,e.options),t.stroke(r)}function S2(t,e,n,i){const{segments:r,options:s}=e,o=Ta(e);for(const l of r)_g(t,s,l.style),t.beginPath(),o(t,e,l,{start:n,end:n+i-1})&&t.closePath(),t.stroke()}const b2=typeof Path2D=="function";function C2(t,e,n,i){b2&&!e.options.segment?k2(t,e,n,i):S2(t,e,n,i)}class Vi extends cn{constructor(e){super(),this.animated=!0,this.options=void 0,this._chart=void 0,this._loop=void 0,this._fullLoop=void 0,this._path=void 0,this._points=void 0,this._segments=void 0,this._decimated=!1,this._pointsUpdated=!1,this._datasetIndex=void 0,e&&Object.assign(this,e)}updateControlPoints(e,n){const i=this.options;if((i.tension||i.cubicInterpolationMode==="monotone")&&!i.stepped&&!this._pointsUpdated){const r=i.spanGaps?this._loop:this._fullLoop;Pv(this._points,i,e,r,n),this._pointsUpdated=!0}}set points(e){this._points=e,delete this._segments,delete this._path,this._pointsUpdated=!1}get points(){return this._points}get segments(){return this._segments||(this._segments=Uv(this,this.options.segment))}first(){const e=this.segments,n=this.points;return e.length&&n[e[0].start]}last(){const e=this.segments,n=this.points,i=e.length;return i&&n[e[i-1].end]}interpolate(e,n){const i=this.options,r=e[n],s=this.points,o=Hv(this,{property:n,start:r,end:r});if(!o.length)return;const l=[],a=w2(i);let u,c;for(u=0,c=o.length;u<c;++u){const{start:f,end:d}=o[u],h=s[f],m=s[d];if(h===m){l.push(h);continue}const y=Math.abs((r-h[n])/(m[n]-h[n])),x=a(h,m,y,i.stepped);x[n]=e[n],l.push(x)}return l.length===1?l[0]:l}pathSegment(e,n,i){return Ta(this)(e,this,n,i)}path(e,n,i){const r=this.segments,s=Ta(this);let o=this._loop;n=n||0,i=i||this.points.length-n;for(const l of r)o&=s(e,this,l,{start:n,end:n+i-1});return!!o}draw(e,n,i,r){const s=this.options||{};(this.points||[]).length&&s.borderWidth&&(e.save(),C2(e,this,i,r),e.restore()),this.animated&&(this._pointsUpdated=!1,this._path=void 0)}}I(Vi,"id","line"),I(Vi,"defaults",{borderCapStyle:"butt",borderDash:[],borderDashOffset:0,borderJoinStyle:"miter",borderWidth:3,capBezierPoints:!0,cubicInterpolationMode:"default",fill:!1,spanGaps:!1,stepped:!1,tension:0}),I(Vi,"defaultRoutes",{backgroundColor:"backgroundColor",borderColor:"borderColor"}),I(Vi,"descriptors",{_scriptable:!0,_indexable:e=>e!=="borderDash"&&e!=="fill"});function Gf(t,e,n,i){const r=t.options,{[n]:s}=t.getProps([n],i);return Math.abs(e-s)<r.radius+r.hitRadius}class Fs extends cn{constructor(e){super(),this.options=void 0,this.parsed=void 0,this.skip=void 0,this.stop=void 0,e&&Object.assign(this,e)}inRange(e,n,i){const r=this.options,{x:s,y:o}=this.getProps(["x","y"],i);return Math.pow(e-s,2)+Math.pow(n-o,2)<Math.pow(r.hitRadius+r.radius,2)}inXRange(e,n){return Gf(this,e,"x",n)}inYRange(e,n){return Gf(this,e,"y",n)}getCenterPoint(e){const{x:n,y:i}=this.getProps(["x","y"],e);return{x:n,y:i}}size(e){e=e||this.options||{};let n=e.radius||0;n=Math.max(n,n&&e.hoverRadius||0);const i=n&&e.borderWidth||0;return(n+i)*2}draw(e,n){const i=this.options;this.skip||i.radius<.1||!Lr(this,n,this.size(i)/2)||(e.strokeStyle=i.borderColor,e.lineWidth=i.borderWidth,e.fillStyle=i.backgroundColor,Pa(e,i,this.x,this.y))}getRange(){const e=this.options||{};return e.radius+e.hitRadius}}I(Fs,"id","point"),I(Fs,"defaults",{borderWidth:1,hitRadius:1,hoverBorderWidth:1,hoverRadius:4,pointStyle:"circle",radius:3,rotation:0}),I(Fs,"defaultRoutes",{backgroundColor:"backgroundColor",borderColor:"borderColor"});const Zf=(t,e)=>{let{boxHeight:n=e,boxWidth:i=e}=t;return t.usePointStyle&&(n=Math.min(n,e),i=t.pointStyleWidth||Math.min(i,e)),{boxWidth:i,boxHeight:n,itemHeight:Math.max(e,n)}},M2=(t,e)=>t!==null&&e!==null&&t.datasetIndex===e.datasetIndex&&t.index===e.index;class qf extends cn{constructor(e){super(),this._added=!1,this.legendHitBoxes=[],this._hoveredItem=null,this.doughnutMode=!1,this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this.legendItems=void 0,this.columnSizes=void 0,this.lineWidths=void 0,this.maxHeight=void 0,this.maxWidth=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.height=void 0,this.width=void 0,this._margins=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,n,i){this.maxWidth=e,this.maxHeight=n,this._margins=i,this.setDimensions(),this.buildLabels(),this.fit()}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=this._margins.left,this.right=this.width):(this.height=this.maxHeight,this.top=this._margins.top,this.bottom=this.height)}buildLabels(){const e=this.options.labels||{};let n=V(e.generateLabels,[this.chart],this)||[];e.filter&&(n=n.filter(i=>e.filter(i,this.chart.data))),e.sort&&(n=n.sort((i,r)=>e.sort(i,r,this.chart.data))),this.options.reverse&&n.reverse(),this.legendItems=n}fit(){const{options:e,ctx:n}=this;if(!e.display){this.width=this.height=0;return}const i=e.labels,r=ge(i.font),s=r.size,o=this._computeTitleHeight(),{boxWidth:l,itemHeight:a}=Zf(i,s);let u,c;n.font=r.string,this.isHorizontal()?(u=this.maxWidth,c=this._fitRows(o,s,l,a)+10):(c=this.maxHeight,u=this._fitCols(o,r,l,a)+10),this.width=Math.min(u,e.maxWidth||this.maxWidth),this.height=Math.min(c,e.maxHeight||this.maxHeight)}_fitRows(e,n,i,r){const{ctx:s,maxWidth:o,options:{labels:{padding:l}}}=this,a=this.legendHitBoxes=[],u=this.lineWidths=[0],c=r+l;let f=e;s.textAlign="left",s.textBaseline="middle";let d=-1,h=-c;return this.legendItems.forEach((m,y)=>{const x=i+n/2+s.measureText(m.text).width;(y===0||u[u.length-1]+x+2*l>o)&&(f+=c,u[u.length-(y>0?0:1)]=0,h+=c,d++),a[y]={left:0,top:h,row:d,width:x,height:r},u[u.length-1]+=x+l}),f}_fitCols(e,n,i,r){const{ctx:s,maxHeight:o,options:{labels:{padding:l}}}=this,a=this.legendHitBoxes=[],u=this.columnSizes=[],c=o-e;let f=l,d=0,h=0,m=0,y=0;return this.legendItems.forEach((x,p)=>{const{itemWidth:g,itemHeight:v}=E2(i,n,s,x,r);p>0&&h+v+2*l>c&&(f+=d+l,u.push({width:d,height:h}),m+=d+l,y++,d=h=0),a[p]={left:m,top:h,col:y,width:g,height:v},d=Math.max(d,g),h+=v+l}),f+=d,u.push({width:d,height:h}),f}adjustHitBoxes(){if(!this.options.display)return;const e=this._computeTitleHeight(),{legendHitBoxes:n,options:{align:i,labels:{padding:r},rtl:s}}=this,o=ai(s,this.left,this.width);if(this.isHorizontal()){let l=0,a=$e(i,this.left+r,this.right-this.lineWidths[l]);for(const u of n)l!==u.row&&(l=u.row,a=$e(i,this.left+r,this.right-this.lineWidths[l])),u.top+=this.top+e+r,u.left=o.leftForLtr(o.x(a),u.width),a+=u.width+r}else{let l=0,a=$e(i,this.top+e+r,this.bottom-this.columnSizes[l].height);for(const u of n)u.col!==l&&(l=u.col,a=$e(i,this.top+e+r,this.bottom-this.columnSizes[l].height)),u.top=a,u.left+=this.left+r,u.left=o.leftForLtr(o.x(u.left),u.width),a+=u.height+r}}isHorizontal(){return this.options.position==="top"||this.options.position==="bottom"}draw(){if(this.options.display){const e=this.ctx;ju(e,this),this._draw(),Bu(e)}}_draw(){const{options:e,columnSizes:n,lineWidths:i,ctx:r}=this,{align:s,labels:o}=e,l=oe.color,a=ai(e.rtl,this.left,this.width),u=ge(o.font),{padding:c}=o,f=u.size,d=f/2;let h;this.drawTitle(),r.textAlign=a.textAlign("left"),r.textBaseline="middle",r.lineWidth=.5,r.font=u.string;const{boxWidth:m,boxHeight:y,itemHeight:x}=Zf(o,f),p=function(k,S,b){if(isNaN(m)||m<=0||isNaN(y)||y<0)return;r.save();const O=F(b.lineWidth,1);if(r.fillStyle=F(b.fillStyle,l),r.lineCap=F(b.lineCap,"butt"),r.lineDashOffset=F(b.lineDashOffset,0),r.lineJoin=F(b.lineJoin,"miter"),r.lineWidth=O,r.strokeStyle=F(b.strokeStyle,l),r.setLineDash(F(b.lineDash,[])),o.usePointStyle){const P={radius:y*Math.SQRT2/2,pointStyle:b.pointStyle,rotation:b.rotation,borderWidth:O},D=a.xPlus(k,m/2),A=S+d;qp(r,P,D,A,o.pointStyleWidth&&m)}else{const P=S+Math.max((f-y)/2,0),D=a.leftForLtr(k,m),A=li(b.borderRadius);r.beginPath(),Object.values(A).some(le=>le!==0)?mo(r,{x:D,y:P,w:m,h:y,radius:A}):r.rect(D,P,m,y),r.fill(),O!==0&&r.stroke()}r.restore()},g=function(k,S,b){yi(r,b.text,k,S+x/2,u,{strikethrough:b.hidden,textAlign:a.textAlign(b.textAlign)})},v=this.isHorizontal(),_=this._computeTitleHeight();v?h={x:$e(s,this.left+c,this.right-i[0]),y:this.top+c+_,line:0}:h={x:this.left+c,y:$e(s,this.top+_+c,this.bottom-n[0].height),line:0},og(this.ctx,e.textDirection);const w=x+c;this.legendItems.forEach((k,S)=>{r.strokeStyle=k.fontColor,r.fillStyle=k.fontColor;const b=r.measureText(k.text).width,O=a.textAlign(k.textAlign||(k.textAlign=o.textAlign)),P=m+d+b;let D=h.x,A=h.y;a.setWidth(this.width),v?S>0&&D+P+c>this.right&&(A=h.y+=w,h.line++,D=h.x=$e(s,this.left+c,this.right-i[h.line])):S>0&&A+w>this.bottom&&(D=h.x=D+n[h.line].width+c,h.line++,A=h.y=$e(s,this.top+_+c,this.bottom-n[h.line].height));const le=a.x(D);if(p(le,A,k),D=Wy(O,D+m+d,v?D+P:this.right,e.rtl),g(a.x(D),A,k),v)h.x+=P+c;else if(typeof k.text!="string"){const Ae=u.lineHeight;h.y+=kg(k,Ae)}else h.y+=w}),lg(this.ctx,e.textDirection)}drawTitle(){const e=this.options,n=e.title,i=ge(n.font),r=Me(n.padding);if(!n.display)return;const s=ai(e.rtl,this.left,this.width),o=this.ctx,l=n.position,a=i.size/2,u=r.top+a;let c,f=this.left,d=this.width;if(this.isHorizontal())d=Math.max(...this.lineWidths),c=this.top+u,f=$e(e.align,f,this.right-d);else{const m=this.columnSizes.reduce((y,x)=>Math.max(y,x.height),0);c=u+$e(e.align,this.top,this.bottom-m-e.labels.padding-this._computeTitleHeight())}const h=$e(l,f,f+d);o.textAlign=s.textAlign(Xp(l)),o.textBaseline="middle",o.strokeStyle=n.color,o.fillStyle=n.color,o.font=i.string,yi(o,n.text,h,c,i)}_computeTitleHeight(){const e=this.options.title,n=ge(e.font),i=Me(e.padding);return e.display?n.lineHeight+i.height:0}_getLegendItemAt(e,n){let i,r,s;if(Hi(e,this.left,this.right)&&Hi(n,this.top,this.bottom)){for(s=this.legendHitBoxes,i=0;i<s.length;++i)if(r=s[i],Hi(e,r.left,r.left+r.width)&&Hi(n,r.top,r.top+r.height))return this.legendItems[i]}return null}handleEvent(e){const n=this.options;if(!T2(e.type,n))return;const i=this._getLegendItemAt(e.x,e.y);if(e.type==="mousemove"||e.type==="mouseout"){const r=this._hoveredItem,s=M2(r,i);r&&!s&&V(n.onLeave,[e,r,this],this),this._hoveredItem=i,i&&!s&&V(n.onHover,[e,i,this],this)}else i&&V(n.onClick,[e,i,this],this)}}function E2(t,e,n,i,r){const s=P2(i,t,e,n),o=L2(r,i,e.lineHeight);return{itemWidth:s,itemHeight:o}}function P2(t,e,n,i){let r=t.text;return r&&typeof r!="string"&&(r=r.reduce((s,o)=>s.length>o.length?s:o)),e+n.size/2+i.measureText(r).width}function L2(t,e,n){let i=t;return typeof e.text!="string"&&(i=kg(e,n)),i}function kg(t,e){const n=t.text?t.text.length+.5:0;return e*n}function T2(t,e){return!!((t==="mousemove"||t==="mouseout")&&(e.onHover||e.onLeave)||e.onClick&&(t==="click"||t==="mouseup"))}var O2={id:"legend",_element:qf,start(t,e,n){const i=t.legend=new qf({ctx:t.ctx,options:n,chart:t});Gt.configure(t,i,n),Gt.addBox(t,i)},stop(t){Gt.removeBox(t,t.legend),delete t.legend},beforeUpdate(t,e,n){const i=t.legend;Gt.configure(t,i,n),i.options=n},afterUpdate(t){const e=t.legend;e.buildLabels(),e.adjustHitBoxes()},afterEvent(t,e){e.replay||t.legend.handleEvent(e.event)},defaults:{display:!0,position:"top",align:"center",fullSize:!0,reverse:!1,weight:1e3,onClick(t,e,n){const i=e.datasetIndex,r=n.chart;r.isDatasetVisible(i)?(r.hide(i),e.hidden=!0):(r.show(i),e.hidden=!1)},onHover:null,onLeave:null,labels:{color:t=>t.chart.options.color,boxWidth:40,padding:10,generateLabels(t){const e=t.data.datasets,{labels:{usePointStyle:n,pointStyle:i,textAlign:r,color:s,useBorderRadius:o,borderRadius:l}}=t.legend.options;return t._getSortedDatasetMetas().map(a=>{const u=a.controller.getStyle(n?0:void 0),c=Me(u.borderWidth);return{text:e[a.index].label,fillStyle:u.backgroundColor,fontColor:s,hidden:!a.visible,lineCap:u.borderCapStyle,lineDash:u.borderDash,lineDashOffset:u.borderDashOffset,lineJoin:u.borderJoinStyle,lineWidth:(c.width+c.height)/4,strokeStyle:u.borderColor,pointStyle:i||u.pointStyle,rotation:u.rotation,textAlign:r||u.textAlign,borderRadius:o&&(l||u.borderRadius),datasetIndex:a.index}},this)}},title:{color:t=>t.chart.options.color,display:!1,position:"center",text:""}},descriptors:{_scriptable:t=>!t.startsWith("on"),labels:{_scriptable:t=>!["generateLabels","filter","sort"].includes(t)}}};const Ui={average(t){if(!t.length)return!1;let e,n,i=0,r=0,s=0;for(e=0,n=t.length;e<n;++e){const o=t[e].element;if(o&&o.hasValue()){const l=o.tooltipPosition();i+=l.x,r+=l.y,++s}}return{x:i/s,y:r/s}},nearest(t,e){if(!t.length)return!1;let n=e.x,i=e.y,r=Number.POSITIVE_INFINITY,s,o,l;for(s=0,o=t.length;s<o;++s){const a=t[s].element;if(a&&a.hasValue()){const u=a.getCenterPoint(),c=Ma(e,u);c<r&&(r=c,l=a)}}if(l){const a=l.tooltipPosition();n=a.x,i=a.y}return{x:n,y:i}}};function gt(t,e){return e&&(ie(e)?Array.prototype.push.apply(t,e):t.push(e)),t}function Ct(t){return(typeof t=="string"||t instanceof String)&&t.indexOf(`
+`,rs=16,K1=({reverseOrder:t,position:e="top-center",toastOptions:n,gutter:i,children:r,containerStyle:s,containerClassName:o})=>{let{toasts:l,handlers:a}=k1(n);return M.exports.createElement("div",{style:{position:"fixed",zIndex:9999,top:rs,left:rs,right:rs,bottom:rs,pointerEvents:"none",...s},className:o,onMouseEnter:a.startPause,onMouseLeave:a.endPause},l.map(u=>{let c=u.position||e,f=a.calculateOffset(u,{reverseOrder:t,gutter:i,defaultPosition:e}),d=Y1(c,f);return M.exports.createElement(U1,{id:u.id,key:u.id,onHeightUpdate:a.updateHeight,className:u.visible?Q1:"",style:d},u.type==="custom"?ao(u.message,u):r?r(u):M.exports.createElement(V1,{toast:u,position:c}))}))},Rp=ze;const X1="/assets/amazon-sidewalk-logo-9b10e5a3.png";const G1=()=>K("header",{children:[T("h2",{children:"Sensor Monitoring App"}),T("img",{src:X1,className:"header-img"})]}),Z1=function t(e){function n(r,s,o){var l,a={};if(Array.isArray(r))return r.concat(s);for(l in r)a[o?l.toLowerCase():l]=r[l];for(l in s){var u=o?l.toLowerCase():l,c=s[l];a[u]=u in a&&typeof c=="object"?n(a[u],c,u=="headers"):c}return a}function i(r,s,o,l,a){var u=typeof r!="string"?(s=r).url:r,c={config:s},f=n(e,s),d={};l=l||f.data,(f.transformRequest||[]).map(function(h){l=h(l,f.headers)||l}),f.auth&&(d.authorization=f.auth),l&&typeof l=="object"&&typeof l.append!="function"&&typeof l.text!="function"&&(l=JSON.stringify(l),d["content-type"]="application/json");try{d[f.xsrfHeaderName]=decodeURIComponent(document.cookie.match(RegExp("(^|; )"+f.xsrfCookieName+"=([^;]*)"))[2])}catch{}return f.baseURL&&(u=u.replace(/^(?!.*\/\/)\/?/,f.baseURL+"/")),f.params&&(u+=(~u.indexOf("?")?"&":"?")+(f.paramsSerializer?f.paramsSerializer(f.params):new URLSearchParams(f.params))),(f.fetch||fetch)(u,{method:(o||f.method||"get").toUpperCase(),body:l,headers:n(f.headers,d,!0),credentials:f.withCredentials?"include":a}).then(function(h){for(var m in h)typeof h[m]!="function"&&(c[m]=h[m]);return f.responseType=="stream"?(c.data=h.body,c):h[f.responseType||"text"]().then(function(y){c.data=y,c.data=JSON.parse(y)}).catch(Object).then(function(){return(f.validateStatus?f.validateStatus(h.status):h.ok)?c:Promise.reject(c)})})}return e=e||{},i.request=i,i.get=function(r,s){return i(r,s,"get")},i.delete=function(r,s){return i(r,s,"delete")},i.head=function(r,s){return i(r,s,"head")},i.options=function(r,s){return i(r,s,"options")},i.post=function(r,s,o){return i(r,o,"post",s)},i.put=function(r,s,o){return i(r,o,"put",s)},i.patch=function(r,s,o){return i(r,o,"patch",s)},i.all=Promise.all.bind(Promise),i.spread=function(r){return r.apply.bind(r,r)},i.CancelToken=typeof AbortController=="function"?AbortController:Object,i.defaults=e,i.create=t,i}(),rf={CELSIUS:`${String.fromCharCode(176)}C`,FAHRENHEIT:`${String.fromCharCode(176)}F`,UNKNOWN:"-"},q1="/api",Fp={gray:"rgb(255, 99, 132)"},yl={ON:"ON",OFF:"OFF"},Bo="access_token",ba="Unauthorize_error";let uo;const J1=()=>{const t=localStorage.getItem(Bo),e={baseURL:q1,...t?{headers:{authorizationtoken:`Basic ${t}`}}:{}};return uo=Z1.create(e),uo},ey=t=>{uo.defaults.headers={authorizationtoken:`Basic ${t}`},localStorage.setItem(Bo,t)},ty=t=>{uo.defaults.headers={Username:`${t}`}},br=J1(),Tu={intervals:{measurement:15*1e3,devices:5*1e3,online:1*1e3},sinceOverlap:5*60*1e3,measurements:{window:60*60*1e3,bucket:"60s",agg:"avg"}},Cr={devices:"/devices",device:"/devices/:id",measurement:"/measurements/:id",measurementRange:"/measurements/:id/:start/:end",led:"",login:"/auth"},Ap=(t,e)=>{let n=t;return Object.keys(e).forEach(i=>{n=n.replace(`:${i}`,e[i])}),n},Ou=t=>{(t===401||t===403)&&(localStorage.removeItem(Bo),localStorage.setItem(ba,"true"),window.location.reload())},jp={log:(...t)=>{}};function Ar(t){return t+.5|0}const Qt=(t,e,n)=>Math.max(Math.min(t,n),e);function $i(t){return Qt(Ar(t*2.55),0,255)}function on(t){return Qt(Ar(t*255),0,255)}function Pt(t){return Qt(Ar(t/2.55)/100,0,1)}function sf(t){return Qt(Ar(t*100),0,100)}const Xe={0:0,1:1,2:2,3:3,4:4,5:5,6:6,7:7,8:8,9:9,A:10,B:11,C:12,D:13,E:14,F:15,a:10,b:11,c:12,d:13,e:14,f:15},Ca=[..."0123456789ABCDEF"],ny=t=>Ca[t&15],iy=t=>Ca[(t&240)>>4]+Ca[t&15],ss=t=>(t&240)>>4===(t&15),ry=t=>ss(t.r)&&ss(t.g)&&ss(t.b)&&ss(t.a);function sy(t){var e=t.length,n;return t[0]==="#"&&(e===4||e===5?n={r:255&Xe[t[1]]*17,g:255&Xe[t[2]]*17,b:255&Xe[t[3]]*17,a:e===5?Xe[t[4]]*17:255}:(e===7||e===9)&&(n={r:Xe[t[1]]<<4|Xe[t[2]],g:Xe[t[3]]<<4|Xe[t[4]],b:Xe[t[5]]<<4|Xe[t[6]],a:e===9?Xe[t[7]]<<4|Xe[t[8]]:255})),n}const oy=(t,e)=>t<255?e(t):"";function ly(t){var e=ry(t)?ny:iy;return t?"#"+e(t.r)+e(t.g)+e(t.b)+oy(t.a,e):void 0}const ay=/^(hsla?|hwb|hsv)\(\s*([-+.e\d]+)(?:deg)?[\s,]+([-+.e\d]+)%[\s,]+([-+.e\d]+)%(?:[\s,]+([-+.e\d]+)(%)?)?\s*\)$/;function Bp(t,e,n){const i=e*Math.min(n,1-n),r=(s,o=(s+t/30)%12)=>n-i*Math.max(Math.min(o-3,9-o,1),-1);return[r(0),r(8),r(4)]}function uy(t,e,n){const i=(r,s=(r+t/60)%6)=>n-n*e*Math.max(Math.min(s,4-s,1),0);return[i(5),i(3),i(1)]}function cy(t,e,n){const i=Bp(t,1,.5);let r;for(e+n>1&&(r=1/(e+n),e*=r,n*=r),r=0;r<3;r++)i[r]*=1-e-n,i[r]+=e;return i}function fy(t,e,n,i,r){return t===r?(e-n)/i+(e<n?6:0):e===r?(n-t)/i+2:(t-e)/i+4}function Du(t){const n=t.r/255,i=t.g/255,r=t.b/255,s=Math.max(n,i,r),o=Math.min(n,i,r),l=(s+o)/2;let a,u,c;return s!==o&&(c=s-o,u=l>.5?c/(2-s-o):c/(s+o),a=fy(n,i,r,c,s),a=a*60+.5),[a|0,u||0,l]}function zu(t,e,n,i){return(Array.isArray(e)?t(e[0],e[1],e[2]):t(e,n,i)).map(on)}function Nu(t,e,n){return zu(Bp,t,e,n)}function dy(t,e,n){return zu(cy,t,e,n)}function hy(t,e,n){return zu(uy,t,e,n)}function $p(t){return(t%360+360)%360}function py(t){const e=ay.exec(t);let n=255,i;if(!e)return;e[5]!==i&&(n=e[6]?$i(+e[5]):on(+e[5]));const r=$p(+e[2]),s=+e[3]/100,o=+e[4]/100;return e[1]==="hwb"?i=dy(r,s,o):e[1]==="hsv"?i=hy(r,s,o):i=Nu(r,s,o),{r:i[0],g:i[1],b:i[2],a:n}}function gy(t,e){var n=Du(t);n[0]=$p(n[0]+e),n=Nu(n),t.r=n[0],t.g=n[1],t.b=n[2]}function my(t){if(!t)return;const e=Du(t),n=e[0],i=sf(e[1]),r=sf(e[2]);return t.a<255?`hsla(${n}, ${i}%, ${r}%, ${Pt(t.a)})`:`hsl(${n}, ${i}%, ${r}%)`}const of={x:"dark",Z:"light",Y:"re",X:"blu",W:"gr",V:"medium",U:"slate",A:"ee",T:"ol",S:"or",B:"ra",C:"lateg",D:"ights",R:"in",Q:"turquois",E:"hi",P:"ro",O:"al",N:"le",M:"de",L:"yello",F:"en",K:"ch",G:"arks",H:"ea",I:"ightg",J:"wh"},lf={OiceXe:"f0f8ff",antiquewEte:"faebd7",aqua:"ffff",aquamarRe:"7fffd4",azuY:"f0ffff",beige:"f5f5dc",bisque:"ffe4c4",black:"0",blanKedOmond:"ffebcd",Xe:"ff",XeviTet:"8a2be2",bPwn:"a52a2a",burlywood:"deb887",caMtXe:"5f9ea0",KartYuse:"7fff00",KocTate:"d2691e",cSO:"ff7f50",cSnflowerXe:"6495ed",cSnsilk:"fff8dc",crimson:"dc143c",cyan:"ffff",xXe:"8b",xcyan:"8b8b",xgTMnPd:"b8860b",xWay:"a9a9a9",xgYF:"6400",xgYy:"a9a9a9",xkhaki:"bdb76b",xmagFta:"8b008b",xTivegYF:"556b2f",xSange:"ff8c00",xScEd:"9932cc",xYd:"8b0000",xsOmon:"e9967a",xsHgYF:"8fbc8f",xUXe:"483d8b",xUWay:"2f4f4f",xUgYy:"2f4f4f",xQe:"ced1",xviTet:"9400d3",dAppRk:"ff1493",dApskyXe:"bfff",dimWay:"696969",dimgYy:"696969",dodgerXe:"1e90ff",fiYbrick:"b22222",flSOwEte:"fffaf0",foYstWAn:"228b22",fuKsia:"ff00ff",gaRsbSo:"dcdcdc",ghostwEte:"f8f8ff",gTd:"ffd700",gTMnPd:"daa520",Way:"808080",gYF:"8000",gYFLw:"adff2f",gYy:"808080",honeyMw:"f0fff0",hotpRk:"ff69b4",RdianYd:"cd5c5c",Rdigo:"4b0082",ivSy:"fffff0",khaki:"f0e68c",lavFMr:"e6e6fa",lavFMrXsh:"fff0f5",lawngYF:"7cfc00",NmoncEffon:"fffacd",ZXe:"add8e6",ZcSO:"f08080",Zcyan:"e0ffff",ZgTMnPdLw:"fafad2",ZWay:"d3d3d3",ZgYF:"90ee90",ZgYy:"d3d3d3",ZpRk:"ffb6c1",ZsOmon:"ffa07a",ZsHgYF:"20b2aa",ZskyXe:"87cefa",ZUWay:"778899",ZUgYy:"778899",ZstAlXe:"b0c4de",ZLw:"ffffe0",lime:"ff00",limegYF:"32cd32",lRF:"faf0e6",magFta:"ff00ff",maPon:"800000",VaquamarRe:"66cdaa",VXe:"cd",VScEd:"ba55d3",VpurpN:"9370db",VsHgYF:"3cb371",VUXe:"7b68ee",VsprRggYF:"fa9a",VQe:"48d1cc",VviTetYd:"c71585",midnightXe:"191970",mRtcYam:"f5fffa",mistyPse:"ffe4e1",moccasR:"ffe4b5",navajowEte:"ffdead",navy:"80",Tdlace:"fdf5e6",Tive:"808000",TivedBb:"6b8e23",Sange:"ffa500",SangeYd:"ff4500",ScEd:"da70d6",pOegTMnPd:"eee8aa",pOegYF:"98fb98",pOeQe:"afeeee",pOeviTetYd:"db7093",papayawEp:"ffefd5",pHKpuff:"ffdab9",peru:"cd853f",pRk:"ffc0cb",plum:"dda0dd",powMrXe:"b0e0e6",purpN:"800080",YbeccapurpN:"663399",Yd:"ff0000",Psybrown:"bc8f8f",PyOXe:"4169e1",saddNbPwn:"8b4513",sOmon:"fa8072",sandybPwn:"f4a460",sHgYF:"2e8b57",sHshell:"fff5ee",siFna:"a0522d",silver:"c0c0c0",skyXe:"87ceeb",UXe:"6a5acd",UWay:"708090",UgYy:"708090",snow:"fffafa",sprRggYF:"ff7f",stAlXe:"4682b4",tan:"d2b48c",teO:"8080",tEstN:"d8bfd8",tomato:"ff6347",Qe:"40e0d0",viTet:"ee82ee",JHt:"f5deb3",wEte:"ffffff",wEtesmoke:"f5f5f5",Lw:"ffff00",LwgYF:"9acd32"};function yy(){const t={},e=Object.keys(lf),n=Object.keys(of);let i,r,s,o,l;for(i=0;i<e.length;i++){for(o=l=e[i],r=0;r<n.length;r++)s=n[r],l=l.replace(s,of[s]);s=parseInt(lf[o],16),t[l]=[s>>16&255,s>>8&255,s&255]}return t}let os;function vy(t){os||(os=yy(),os.transparent=[0,0,0,0]);const e=os[t.toLowerCase()];return e&&{r:e[0],g:e[1],b:e[2],a:e.length===4?e[3]:255}}const xy=/^rgba?\(\s*([-+.\d]+)(%)?[\s,]+([-+.e\d]+)(%)?[\s,]+([-+.e\d]+)(%)?(?:[\s,/]+([-+.e\d]+)(%)?)?\s*\)$/;function _y(t){const e=xy.exec(t);let n=255,i,r,s;if(e){if(e[7]!==i){const o=+e[7];n=e[8]?$i(o):Qt(o*255,0,255)}return i=+e[1],r=+e[3],s=+e[5],i=255&(e[2]?$i(i):Qt(i,0,255)),r=255&(e[4]?$i(r):Qt(r,0,255)),s=255&(e[6]?$i(s):Qt(s,0,255)),{r:i,g:r,b:s,a:n}}}function wy(t){return t&&(t.a<255?`rgba(${t.r}, ${t.g}, ${t.b}, ${Pt(t.a)})`:`rgb(${t.r}, ${t.g}, ${t.b})`)}const vl=t=>t<=.0031308?t*12.92:Math.pow(t,1/2.4)*1.055-.055,Hn=t=>t<=.04045?t/12.92:Math.pow((t+.055)/1.055,2.4);function ky(t,e,n){const i=Hn(Pt(t.r)),r=Hn(Pt(t.g)),s=Hn(Pt(t.b));return{r:on(vl(i+n*(Hn(Pt(e.r))-i))),g:on(vl(r+n*(Hn(Pt(e.g))-r))),b:on(vl(s+n*(Hn(Pt(e.b))-s))),a:t.a+n*(e.a-t.a)}}function ls(t,e,n){if(t){let i=Du(t);i[e]=Math.max(0,Math.min(i[e]+i[e]*n,e===0?360:1)),i=Nu(i),t.r=i[0],t.g=i[1],t.b=i[2]}}function Hp(t,e){return t&&Object.assign(e||{},t)}function af(t){var e={r:0,g:0,b:0,a:255};return Array.isArray(t)?t.length>=3&&(e={r:t[0],g:t[1],b:t[2],a:255},t.length>3&&(e.a=on(t[3]))):(e=Hp(t,{r:0,g:0,b:0,a:1}),e.a=on(e.a)),e}function Sy(t){return t.charAt(0)==="r"?_y(t):py(t)}class Mr{constructor(e){if(e instanceof Mr)return e;const n=typeof e;let i;n==="object"?i=af(e):n==="string"&&(i=sy(e)||vy(e)||Sy(e)),this._rgb=i,this._valid=!!i}get valid(){return this._valid}get rgb(){var e=Hp(this._rgb);return e&&(e.a=Pt(e.a)),e}set rgb(e){this._rgb=af(e)}rgbString(){return this._valid?wy(this._rgb):void 0}hexString(){return this._valid?ly(this._rgb):void 0}hslString(){return this._valid?my(this._rgb):void 0}mix(e,n){if(e){const i=this.rgb,r=e.rgb;let s;const o=n===s?.5:n,l=2*o-1,a=i.a-r.a,u=((l*a===-1?l:(l+a)/(1+l*a))+1)/2;s=1-u,i.r=255&u*i.r+s*r.r+.5,i.g=255&u*i.g+s*r.g+.5,i.b=255&u*i.b+s*r.b+.5,i.a=o*i.a+(1-o)*r.a,this.rgb=i}return this}interpolate(e,n){return e&&(this._rgb=ky(this._rgb,e._rgb,n)),this}clone(){return new Mr(this.rgb)}alpha(e){return this._rgb.a=on(e),this}clearer(e){const n=this._rgb;return n.a*=1-e,this}greyscale(){const e=this._rgb,n=Ar(e.r*.3+e.g*.59+e.b*.11);return e.r=e.g=e.b=n,this}opaquer(e){const n=this._rgb;return n.a*=1+e,this}negate(){const e=this._rgb;return e.r=255-e.r,e.g=255-e.g,e.b=255-e.b,this}lighten(e){return ls(this._rgb,2,e),this}darken(e){return ls(this._rgb,2,-e),this}saturate(e){return ls(this._rgb,1,e),this}desaturate(e){return ls(this._rgb,1,-e),this}rotate(e){return gy(this._rgb,e),this}}function St(){}const by=(()=>{let t=0;return()=>t++})();function X(t){return t===null||typeof t>"u"}function ie(t){if(Array.isArray&&Array.isArray(t))return!0;const e=Object.prototype.toString.call(t);return e.slice(0,7)==="[object"&&e.slice(-6)==="Array]"}function B(t){return t!==null&&Object.prototype.toString.call(t)==="[object Object]"}function de(t){return(typeof t=="number"||t instanceof Number)&&isFinite(+t)}function He(t,e){return de(t)?t:e}function F(t,e){return typeof t>"u"?e:t}const Cy=(t,e)=>typeof t=="string"&&t.endsWith("%")?parseFloat(t)/100*e:+t;function V(t,e,n){if(t&&typeof t.call=="function")return t.apply(n,e)}function $(t,e,n,i){let r,s,o;if(ie(t))if(s=t.length,i)for(r=s-1;r>=0;r--)e.call(n,t[r],r);else for(r=0;r<s;r++)e.call(n,t[r],r);else if(B(t))for(o=Object.keys(t),s=o.length,r=0;r<s;r++)e.call(n,t[o[r]],o[r])}function co(t,e){let n,i,r,s;if(!t||!e||t.length!==e.length)return!1;for(n=0,i=t.length;n<i;++n)if(r=t[n],s=e[n],r.datasetIndex!==s.datasetIndex||r.index!==s.index)return!1;return!0}function fo(t){if(ie(t))return t.map(fo);if(B(t)){const e=Object.create(null),n=Object.keys(t),i=n.length;let r=0;for(;r<i;++r)e[n[r]]=fo(t[n[r]]);return e}return t}function Wp(t){return["__proto__","prototype","constructor"].indexOf(t)===-1}function My(t,e,n,i){if(!Wp(t))return;const r=e[t],s=n[t];B(r)&&B(s)?Er(r,s,i):e[t]=fo(s)}function Er(t,e,n){const i=ie(e)?e:[e],r=i.length;if(!B(t))return t;n=n||{};const s=n.merger||My;let o;for(let l=0;l<r;++l){if(o=i[l],!B(o))continue;const a=Object.keys(o);for(let u=0,c=a.length;u<c;++u)s(a[u],t,o,n)}return t}function tr(t,e){return Er(t,e,{merger:Ey})}function Ey(t,e,n){if(!Wp(t))return;const i=e[t],r=n[t];B(i)&&B(r)?tr(i,r):Object.prototype.hasOwnProperty.call(e,t)||(e[t]=fo(r))}const uf={"":t=>t,x:t=>t.x,y:t=>t.y};function Py(t){const e=t.split("."),n=[];let i="";for(const r of e)i+=r,i.endsWith("\\")?i=i.slice(0,-1)+".":(n.push(i),i="");return n}function Ly(t){const e=Py(t);return n=>{for(const i of e){if(i==="")break;n=n&&n[i]}return n}}function ho(t,e){return(uf[e]||(uf[e]=Ly(e)))(t)}function Iu(t){return t.charAt(0).toUpperCase()+t.slice(1)}const dt=t=>typeof t<"u",un=t=>typeof t=="function",cf=(t,e)=>{if(t.size!==e.size)return!1;for(const n of t)if(!e.has(n))return!1;return!0};function Ty(t){return t.type==="mouseup"||t.type==="click"||t.type==="contextmenu"}const ve=Math.PI,tt=2*ve,Oy=tt+ve,po=Number.POSITIVE_INFINITY,Dy=ve/180,Ne=ve/2,mn=ve/4,ff=ve*2/3,Kt=Math.log10,mi=Math.sign;function nr(t,e,n){return Math.abs(t-e)<n}function df(t){const e=Math.round(t);t=nr(t,e,t/1e3)?e:t;const n=Math.pow(10,Math.floor(Kt(t))),i=t/n;return(i<=1?1:i<=2?2:i<=5?5:10)*n}function zy(t){const e=[],n=Math.sqrt(t);let i;for(i=1;i<n;i++)t%i===0&&(e.push(i),e.push(t/i));return n===(n|0)&&e.push(n),e.sort((r,s)=>r-s).pop(),e}function Pr(t){return!isNaN(parseFloat(t))&&isFinite(t)}function Ny(t,e){const n=Math.round(t);return n-e<=t&&n+e>=t}function Vp(t,e,n){let i,r,s;for(i=0,r=t.length;i<r;i++)s=t[i][n],isNaN(s)||(e.min=Math.min(e.min,s),e.max=Math.max(e.max,s))}function Xt(t){return t*(ve/180)}function Ru(t){return t*(180/ve)}function hf(t){if(!de(t))return;let e=1,n=0;for(;Math.round(t*e)/e!==t;)e*=10,n++;return n}function Iy(t,e){const n=e.x-t.x,i=e.y-t.y,r=Math.sqrt(n*n+i*i);let s=Math.atan2(i,n);return s<-.5*ve&&(s+=tt),{angle:s,distance:r}}function Ma(t,e){return Math.sqrt(Math.pow(e.x-t.x,2)+Math.pow(e.y-t.y,2))}function Ry(t,e){return(t-e+Oy)%tt-ve}function lt(t){return(t%tt+tt)%tt}function Up(t,e,n,i){const r=lt(t),s=lt(e),o=lt(n),l=lt(s-r),a=lt(o-r),u=lt(r-s),c=lt(r-o);return r===s||r===o||i&&s===o||l>a&&u<c}function Je(t,e,n){return Math.max(e,Math.min(n,t))}function Fy(t){return Je(t,-32768,32767)}function Hi(t,e,n,i=1e-6){return t>=Math.min(e,n)-i&&t<=Math.max(e,n)+i}function Fu(t,e,n){n=n||(o=>t[o]<e);let i=t.length-1,r=0,s;for(;i-r>1;)s=r+i>>1,n(s)?r=s:i=s;return{lo:r,hi:i}}const En=(t,e,n,i)=>Fu(t,n,i?r=>{const s=t[r][e];return s<n||s===n&&t[r+1][e]===n}:r=>t[r][e]<n),Ay=(t,e,n)=>Fu(t,n,i=>t[i][e]>=n);function jy(t,e,n){let i=0,r=t.length;for(;i<r&&t[i]<e;)i++;for(;r>i&&t[r-1]>n;)r--;return i>0||r<t.length?t.slice(i,r):t}const Yp=["push","pop","shift","splice","unshift"];function By(t,e){if(t._chartjs){t._chartjs.listeners.push(e);return}Object.defineProperty(t,"_chartjs",{configurable:!0,enumerable:!1,value:{listeners:[e]}}),Yp.forEach(n=>{const i="_onData"+Iu(n),r=t[n];Object.defineProperty(t,n,{configurable:!0,enumerable:!1,value(...s){const o=r.apply(this,s);return t._chartjs.listeners.forEach(l=>{typeof l[i]=="function"&&l[i](...s)}),o}})})}function pf(t,e){const n=t._chartjs;if(!n)return;const i=n.listeners,r=i.indexOf(e);r!==-1&&i.splice(r,1),!(i.length>0)&&(Yp.forEach(s=>{delete t[s]}),delete t._chartjs)}function $y(t){const e=new Set;let n,i;for(n=0,i=t.length;n<i;++n)e.add(t[n]);return e.size===i?t:Array.from(e)}const Qp=function(){return typeof window>"u"?function(t){return t()}:window.requestAnimationFrame}();function Kp(t,e){let n=[],i=!1;return function(...r){n=r,i||(i=!0,Qp.call(window,()=>{i=!1,t.apply(e,n)}))}}function Hy(t,e){let n;return function(...i){return e?(clearTimeout(n),n=setTimeout(t,e,i)):t.apply(this,i),e}}const Xp=t=>t==="start"?"left":t==="end"?"right":"center",$e=(t,e,n)=>t==="start"?e:t==="end"?n:(e+n)/2,Wy=(t,e,n,i)=>t===(i?"left":"right")?n:t==="center"?(e+n)/2:e;function Vy(t,e,n){const i=e.length;let r=0,s=i;if(t._sorted){const{iScale:o,_parsed:l}=t,a=o.axis,{min:u,max:c,minDefined:f,maxDefined:d}=o.getUserBounds();f&&(r=Je(Math.min(En(l,o.axis,u).lo,n?i:En(e,a,o.getPixelForValue(u)).lo),0,i-1)),d?s=Je(Math.max(En(l,o.axis,c,!0).hi+1,n?0:En(e,a,o.getPixelForValue(c),!0).hi+1),r,i)-r:s=i-r}return{start:r,count:s}}function Uy(t){const{xScale:e,yScale:n,_scaleRanges:i}=t,r={xmin:e.min,xmax:e.max,ymin:n.min,ymax:n.max};if(!i)return t._scaleRanges=r,!0;const s=i.xmin!==e.min||i.xmax!==e.max||i.ymin!==n.min||i.ymax!==n.max;return Object.assign(i,r),s}const as=t=>t===0||t===1,gf=(t,e,n)=>-(Math.pow(2,10*(t-=1))*Math.sin((t-e)*tt/n)),mf=(t,e,n)=>Math.pow(2,-10*t)*Math.sin((t-e)*tt/n)+1,ir={linear:t=>t,easeInQuad:t=>t*t,easeOutQuad:t=>-t*(t-2),easeInOutQuad:t=>(t/=.5)<1?.5*t*t:-.5*(--t*(t-2)-1),easeInCubic:t=>t*t*t,easeOutCubic:t=>(t-=1)*t*t+1,easeInOutCubic:t=>(t/=.5)<1?.5*t*t*t:.5*((t-=2)*t*t+2),easeInQuart:t=>t*t*t*t,easeOutQuart:t=>-((t-=1)*t*t*t-1),easeInOutQuart:t=>(t/=.5)<1?.5*t*t*t*t:-.5*((t-=2)*t*t*t-2),easeInQuint:t=>t*t*t*t*t,easeOutQuint:t=>(t-=1)*t*t*t*t+1,easeInOutQuint:t=>(t/=.5)<1?.5*t*t*t*t*t:.5*((t-=2)*t*t*t*t+2),easeInSine:t=>-Math.cos(t*Ne)+1,easeOutSine:t=>Math.sin(t*Ne),easeInOutSine:t=>-.5*(Math.cos(ve*t)-1),easeInExpo:t=>t===0?0:Math.pow(2,10*(t-1)),easeOutExpo:t=>t===1?1:-Math.pow(2,-10*t)+1,easeInOutExpo:t=>as(t)?t:t<.5?.5*Math.pow(2,10*(t*2-1)):.5*(-Math.pow(2,-10*(t*2-1))+2),easeInCirc:t=>t>=1?t:-(Math.sqrt(1-t*t)-1),easeOutCirc:t=>Math.sqrt(1-(t-=1)*t),easeInOutCirc:t=>(t/=.5)<1?-.5*(Math.sqrt(1-t*t)-1):.5*(Math.sqrt(1-(t-=2)*t)+1),easeInElastic:t=>as(t)?t:gf(t,.075,.3),easeOutElastic:t=>as(t)?t:mf(t,.075,.3),easeInOutElastic(t){return as(t)?t:t<.5?.5*gf(t*2,.1125,.45):.5+.5*mf(t*2-1,.1125,.45)},easeInBack(t){return t*t*((1.70158+1)*t-1.70158)},easeOutBack(t){return(t-=1)*t*((1.70158+1)*t+1.70158)+1},easeInOutBack(t){let e=1.70158;return(t/=.5)<1?.5*(t*t*(((e*=1.525)+1)*t-e)):.5*((t-=2)*t*(((e*=1.525)+1)*t+e)+2)},easeInBounce:t=>1-ir.easeOutBounce(1-t),easeOutBounce(t){return t<1/2.75?7.5625*t*t:t<2/2.75?7.5625*(t-=1.5/2.75)*t+.75:t<2.5/2.75?7.5625*(t-=2.25/2.75)*t+.9375:7.5625*(t-=2.625/2.75)*t+.984375},easeInOutBounce:t=>t<.5?ir.easeInBounce(t*2)*.5:ir.easeOutBounce(t*2-1)*.5+.5};function Gp(t){if(t&&typeof t=="object"){const e=t.toString();return e==="[object CanvasPattern]"||e==="[object CanvasGradient]"}return!1}function yf(t){return Gp(t)?t:new Mr(t)}function xl(t){return Gp(t)?t:new Mr(t).saturate(.5).darken(.1).hexString()}const Yy=["x","y","borderWidth","radius","tension"],Qy=["color","borderColor","backgroundColor"];function Ky(t){t.set("animation",{delay:void 0,duration:1e3,easing:"easeOutQuart",fn:void 0,from:void 0,loop:void 0,to:void 0,type:void 0}),t.describe("animation",{_fallback:!1,_indexable:!1,_scriptable:e=>e!=="onProgress"&&e!=="onComplete"&&e!=="fn"}),t.set("animations",{colors:{type:"color",properties:Qy},numbers:{type:"number",properties:Yy}}),t.describe("animations",{_fallback:"animation"}),t.set("transitions",{active:{animation:{duration:400}},resize:{animation:{duration:0}},show:{animations:{colors:{from:"transparent"},visible:{type:"boolean",duration:0}}},hide:{animations:{colors:{to:"transparent"},visible:{type:"boolean",easing:"linear",fn:e=>e|0}}}})}function Xy(t){t.set("layout",{autoPadding:!0,padding:{top:0,right:0,bottom:0,left:0}})}const vf=new Map;function Gy(t,e){e=e||{};const n=t+JSON.stringify(e);let i=vf.get(n);return i||(i=new Intl.NumberFormat(t,e),vf.set(n,i)),i}function Au(t,e,n){return Gy(e,n).format(t)}const Zp={values(t){return ie(t)?t:""+t},numeric(t,e,n){if(t===0)return"0";const i=this.chart.options.locale;let r,s=t;if(n.length>1){const u=Math.max(Math.abs(n[0].value),Math.abs(n[n.length-1].value));(u<1e-4||u>1e15)&&(r="scientific"),s=Zy(t,n)}const o=Kt(Math.abs(s)),l=Math.max(Math.min(-1*Math.floor(o),20),0),a={notation:r,minimumFractionDigits:l,maximumFractionDigits:l};return Object.assign(a,this.options.ticks.format),Au(t,i,a)},logarithmic(t,e,n){if(t===0)return"0";const i=n[e].significand||t/Math.pow(10,Math.floor(Kt(t)));return[1,2,3,5,10,15].includes(i)||e>.8*n.length?Zp.numeric.call(this,t,e,n):""}};function Zy(t,e){let n=e.length>3?e[2].value-e[1].value:e[1].value-e[0].value;return Math.abs(n)>=1&&t!==Math.floor(t)&&(n=t-Math.floor(t)),n}var $o={formatters:Zp};function qy(t){t.set("scale",{display:!0,offset:!1,reverse:!1,beginAtZero:!1,bounds:"ticks",grace:0,grid:{display:!0,lineWidth:1,drawOnChartArea:!0,drawTicks:!0,tickLength:8,tickWidth:(e,n)=>n.lineWidth,tickColor:(e,n)=>n.color,offset:!1},border:{display:!0,dash:[],dashOffset:0,width:1},title:{display:!1,text:"",padding:{top:4,bottom:4}},ticks:{minRotation:0,maxRotation:50,mirror:!1,textStrokeWidth:0,textStrokeColor:"",padding:3,display:!0,autoSkip:!0,autoSkipPadding:3,labelOffset:0,callback:$o.formatters.values,minor:{},major:{},align:"center",crossAlign:"near",showLabelBackdrop:!1,backdropColor:"rgba(255, 255, 255, 0.75)",backdropPadding:2}}),t.route("scale.ticks","color","","color"),t.route("scale.grid","color","","borderColor"),t.route("scale.border","color","","borderColor"),t.route("scale.title","color","","color"),t.describe("scale",{_fallback:!1,_scriptable:e=>!e.startsWith("before")&&!e.startsWith("after")&&e!=="callback"&&e!=="parser",_indexable:e=>e!=="borderDash"&&e!=="tickBorderDash"&&e!=="dash"}),t.describe("scales",{_fallback:"scale"}),t.describe("scale.ticks",{_scriptable:e=>e!=="backdropPadding"&&e!=="callback",_indexable:e=>e!=="backdropPadding"})}const Rn=Object.create(null),Ea=Object.create(null);function rr(t,e){if(!e)return t;const n=e.split(".");for(let i=0,r=n.length;i<r;++i){const s=n[i];t=t[s]||(t[s]=Object.create(null))}return t}function _l(t,e,n){return typeof e=="string"?Er(rr(t,e),n):Er(rr(t,""),e)}class Jy{constructor(e,n){this.animation=void 0,this.backgroundColor="rgba(0,0,0,0.1)",this.borderColor="rgba(0,0,0,0.1)",this.color="#666",this.datasets={},this.devicePixelRatio=i=>i.chart.platform.getDevicePixelRatio(),this.elements={},this.events=["mousemove","mouseout","click","touchstart","touchmove"],this.font={family:"'Helvetica Neue', 'Helvetica', 'Arial', sans-serif",size:12,style:"normal",lineHeight:1.2,weight:null},this.hover={},this.hoverBackgroundColor=(i,r)=>xl(r.backgroundColor),this.hoverBorderColor=(i,r)=>xl(r.borderColor),this.hoverColor=(i,r)=>xl(r.color),this.indexAxis="x",this.interaction={mode:"nearest",intersect:!0,includeInvisible:!1},this.maintainAspectRatio=!0,this.onHover=null,this.onClick=null,this.parsing=!0,this.plugins={},this.responsive=!0,this.scale=void 0,this.scales={},this.showLine=!0,this.drawActiveElementsOnTop=!0,this.describe(e),this.apply(n)}set(e,n){return _l(this,e,n)}get(e){return rr(this,e)}describe(e,n){return _l(Ea,e,n)}override(e,n){return _l(Rn,e,n)}route(e,n,i,r){const s=rr(this,e),o=rr(this,i),l="_"+n;Object.defineProperties(s,{[l]:{value:s[n],writable:!0},[n]:{enumerable:!0,get(){const a=this[l],u=o[r];return B(a)?Object.assign({},u,a):F(a,u)},set(a){this[l]=a}}})}apply(e){e.forEach(n=>n(this))}}var oe=new Jy({_scriptable:t=>!t.startsWith("on"),_indexable:t=>t!=="events",hover:{_fallback:"interaction"},interaction:{_scriptable:!1,_indexable:!1}},[Ky,Xy,qy]);function ev(t){return!t||X(t.size)||X(t.family)?null:(t.style?t.style+" ":"")+(t.weight?t.weight+" ":"")+t.size+"px "+t.family}function go(t,e,n,i,r){let s=e[r];return s||(s=e[r]=t.measureText(r).width,n.push(r)),s>i&&(i=s),i}function tv(t,e,n,i){i=i||{};let r=i.data=i.data||{},s=i.garbageCollect=i.garbageCollect||[];i.font!==e&&(r=i.data={},s=i.garbageCollect=[],i.font=e),t.save(),t.font=e;let o=0;const l=n.length;let a,u,c,f,d;for(a=0;a<l;a++)if(f=n[a],f!=null&&ie(f)!==!0)o=go(t,r,s,o,f);else if(ie(f))for(u=0,c=f.length;u<c;u++)d=f[u],d!=null&&!ie(d)&&(o=go(t,r,s,o,d));t.restore();const h=s.length/2;if(h>n.length){for(a=0;a<h;a++)delete r[s[a]];s.splice(0,h)}return o}function yn(t,e,n){const i=t.currentDevicePixelRatio,r=n!==0?Math.max(n/2,.5):0;return Math.round((e-r)*i)/i+r}function xf(t,e){e=e||t.getContext("2d"),e.save(),e.resetTransform(),e.clearRect(0,0,t.width,t.height),e.restore()}function Pa(t,e,n,i){qp(t,e,n,i,null)}function qp(t,e,n,i,r){let s,o,l,a,u,c,f,d;const h=e.pointStyle,m=e.rotation,y=e.radius;let x=(m||0)*Dy;if(h&&typeof h=="object"&&(s=h.toString(),s==="[object HTMLImageElement]"||s==="[object HTMLCanvasElement]")){t.save(),t.translate(n,i),t.rotate(x),t.drawImage(h,-h.width/2,-h.height/2,h.width,h.height),t.restore();return}if(!(isNaN(y)||y<=0)){switch(t.beginPath(),h){default:r?t.ellipse(n,i,r/2,y,0,0,tt):t.arc(n,i,y,0,tt),t.closePath();break;case"triangle":c=r?r/2:y,t.moveTo(n+Math.sin(x)*c,i-Math.cos(x)*y),x+=ff,t.lineTo(n+Math.sin(x)*c,i-Math.cos(x)*y),x+=ff,t.lineTo(n+Math.sin(x)*c,i-Math.cos(x)*y),t.closePath();break;case"rectRounded":u=y*.516,a=y-u,o=Math.cos(x+mn)*a,f=Math.cos(x+mn)*(r?r/2-u:a),l=Math.sin(x+mn)*a,d=Math.sin(x+mn)*(r?r/2-u:a),t.arc(n-f,i-l,u,x-ve,x-Ne),t.arc(n+d,i-o,u,x-Ne,x),t.arc(n+f,i+l,u,x,x+Ne),t.arc(n-d,i+o,u,x+Ne,x+ve),t.closePath();break;case"rect":if(!m){a=Math.SQRT1_2*y,c=r?r/2:a,t.rect(n-c,i-a,2*c,2*a);break}x+=mn;case"rectRot":f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+d,i-o),t.lineTo(n+f,i+l),t.lineTo(n-d,i+o),t.closePath();break;case"crossRot":x+=mn;case"cross":f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+f,i+l),t.moveTo(n+d,i-o),t.lineTo(n-d,i+o);break;case"star":f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+f,i+l),t.moveTo(n+d,i-o),t.lineTo(n-d,i+o),x+=mn,f=Math.cos(x)*(r?r/2:y),o=Math.cos(x)*y,l=Math.sin(x)*y,d=Math.sin(x)*(r?r/2:y),t.moveTo(n-f,i-l),t.lineTo(n+f,i+l),t.moveTo(n+d,i-o),t.lineTo(n-d,i+o);break;case"line":o=r?r/2:Math.cos(x)*y,l=Math.sin(x)*y,t.moveTo(n-o,i-l),t.lineTo(n+o,i+l);break;case"dash":t.moveTo(n,i),t.lineTo(n+Math.cos(x)*(r?r/2:y),i+Math.sin(x)*y);break;case!1:t.closePath();break}t.fill(),e.borderWidth>0&&t.stroke()}}function Lr(t,e,n){return n=n||.5,!e||t&&t.x>e.left-n&&t.x<e.right+n&&t.y>e.top-n&&t.y<e.bottom+n}function ju(t,e){t.save(),t.beginPath(),t.rect(e.left,e.top,e.right-e.left,e.bottom-e.top),t.clip()}function Bu(t){t.restore()}function nv(t,e,n,i,r){if(!e)return t.lineTo(n.x,n.y);if(r==="middle"){const s=(e.x+n.x)/2;t.lineTo(s,e.y),t.lineTo(s,n.y)}else r==="after"!=!!i?t.lineTo(e.x,n.y):t.lineTo(n.x,e.y);t.lineTo(n.x,n.y)}function iv(t,e,n,i){if(!e)return t.lineTo(n.x,n.y);t.bezierCurveTo(i?e.cp1x:e.cp2x,i?e.cp1y:e.cp2y,i?n.cp2x:n.cp1x,i?n.cp2y:n.cp1y,n.x,n.y)}function yi(t,e,n,i,r,s={}){const o=ie(e)?e:[e],l=s.strokeWidth>0&&s.strokeColor!=="";let a,u;for(t.save(),t.font=r.string,rv(t,s),a=0;a<o.length;++a)u=o[a],s.backdrop&&ov(t,s.backdrop),l&&(s.strokeColor&&(t.strokeStyle=s.strokeColor),X(s.strokeWidth)||(t.lineWidth=s.strokeWidth),t.strokeText(u,n,i,s.maxWidth)),t.fillText(u,n,i,s.maxWidth),sv(t,n,i,u,s),i+=r.lineHeight;t.restore()}function rv(t,e){e.translation&&t.translate(e.translation[0],e.translation[1]),X(e.rotation)||t.rotate(e.rotation),e.color&&(t.fillStyle=e.color),e.textAlign&&(t.textAlign=e.textAlign),e.textBaseline&&(t.textBaseline=e.textBaseline)}function sv(t,e,n,i,r){if(r.strikethrough||r.underline){const s=t.measureText(i),o=e-s.actualBoundingBoxLeft,l=e+s.actualBoundingBoxRight,a=n-s.actualBoundingBoxAscent,u=n+s.actualBoundingBoxDescent,c=r.strikethrough?(a+u)/2:u;t.strokeStyle=t.fillStyle,t.beginPath(),t.lineWidth=r.decorationWidth||2,t.moveTo(o,c),t.lineTo(l,c),t.stroke()}}function ov(t,e){const n=t.fillStyle;t.fillStyle=e.color,t.fillRect(e.left,e.top,e.width,e.height),t.fillStyle=n}function mo(t,e){const{x:n,y:i,w:r,h:s,radius:o}=e;t.arc(n+o.topLeft,i+o.topLeft,o.topLeft,-Ne,ve,!0),t.lineTo(n,i+s-o.bottomLeft),t.arc(n+o.bottomLeft,i+s-o.bottomLeft,o.bottomLeft,ve,Ne,!0),t.lineTo(n+r-o.bottomRight,i+s),t.arc(n+r-o.bottomRight,i+s-o.bottomRight,o.bottomRight,Ne,0,!0),t.lineTo(n+r,i+o.topRight),t.arc(n+r-o.topRight,i+o.topRight,o.topRight,0,-Ne,!0),t.lineTo(n+o.topLeft,i)}const lv=/^(normal|(\d+(?:\.\d+)?)(px|em|%)?)$/,av=/^(normal|italic|initial|inherit|unset|(oblique( -?[0-9]?[0-9]deg)?))$/;function uv(t,e){const n=(""+t).match(lv);if(!n||n[1]==="normal")return e*1.2;switch(t=+n[2],n[3]){case"px":return t;case"%":t/=100;break}return e*t}const cv=t=>+t||0;function Jp(t,e){const n={},i=B(e),r=i?Object.keys(e):e,s=B(t)?i?o=>F(t[o],t[e[o]]):o=>t[o]:()=>t;for(const o of r)n[o]=cv(s(o));return n}function fv(t){return Jp(t,{top:"y",right:"x",bottom:"y",left:"x"})}function li(t){return Jp(t,["topLeft","topRight","bottomLeft","bottomRight"])}function Me(t){const e=fv(t);return e.width=e.left+e.right,e.height=e.top+e.bottom,e}function ge(t,e){t=t||{},e=e||oe.font;let n=F(t.size,e.size);typeof n=="string"&&(n=parseInt(n,10));let i=F(t.style,e.style);i&&!(""+i).match(av)&&(console.warn('Invalid font style specified: "'+i+'"'),i=void 0);const r={family:F(t.family,e.family),lineHeight:uv(F(t.lineHeight,e.lineHeight),n),size:n,style:i,weight:F(t.weight,e.weight),string:""};return r.string=ev(r),r}function us(t,e,n,i){let r=!0,s,o,l;for(s=0,o=t.length;s<o;++s)if(l=t[s],l!==void 0&&(e!==void 0&&typeof l=="function"&&(l=l(e),r=!1),n!==void 0&&ie(l)&&(l=l[n%l.length],r=!1),l!==void 0))return i&&!r&&(i.cacheable=!1),l}function dv(t,e,n){const{min:i,max:r}=t,s=Cy(e,(r-i)/2),o=(l,a)=>n&&l===0?0:l+a;return{min:o(i,-Math.abs(s)),max:o(r,s)}}function gn(t,e){return Object.assign(Object.create(t),e)}function $u(t,e=[""],n=t,i,r=()=>t[0]){dt(i)||(i=ig("_fallback",t));const s={[Symbol.toStringTag]:"Object",_cacheable:!0,_scopes:t,_rootScopes:n,_fallback:i,_getTarget:r,override:o=>$u([o,...t],e,n,i)};return new Proxy(s,{deleteProperty(o,l){return delete o[l],delete o._keys,delete t[0][l],!0},get(o,l){return tg(o,l,()=>_v(l,e,t,o))},getOwnPropertyDescriptor(o,l){return Reflect.getOwnPropertyDescriptor(o._scopes[0],l)},getPrototypeOf(){return Reflect.getPrototypeOf(t[0])},has(o,l){return wf(o).includes(l)},ownKeys(o){return wf(o)},set(o,l,a){const u=o._storage||(o._storage=r());return o[l]=u[l]=a,delete o._keys,!0}})}function vi(t,e,n,i){const r={_cacheable:!1,_proxy:t,_context:e,_subProxy:n,_stack:new Set,_descriptors:eg(t,i),setContext:s=>vi(t,s,n,i),override:s=>vi(t.override(s),e,n,i)};return new Proxy(r,{deleteProperty(s,o){return delete s[o],delete t[o],!0},get(s,o,l){return tg(s,o,()=>pv(s,o,l))},getOwnPropertyDescriptor(s,o){return s._descriptors.allKeys?Reflect.has(t,o)?{enumerable:!0,configurable:!0}:void 0:Reflect.getOwnPropertyDescriptor(t,o)},getPrototypeOf(){return Reflect.getPrototypeOf(t)},has(s,o){return Reflect.has(t,o)},ownKeys(){return Reflect.ownKeys(t)},set(s,o,l){return t[o]=l,delete s[o],!0}})}function eg(t,e={scriptable:!0,indexable:!0}){const{_scriptable:n=e.scriptable,_indexable:i=e.indexable,_allKeys:r=e.allKeys}=t;return{allKeys:r,scriptable:n,indexable:i,isScriptable:un(n)?n:()=>n,isIndexable:un(i)?i:()=>i}}const hv=(t,e)=>t?t+Iu(e):e,Hu=(t,e)=>B(e)&&t!=="adapters"&&(Object.getPrototypeOf(e)===null||e.constructor===Object);function tg(t,e,n){if(Object.prototype.hasOwnProperty.call(t,e))return t[e];const i=n();return t[e]=i,i}function pv(t,e,n){const{_proxy:i,_context:r,_subProxy:s,_descriptors:o}=t;let l=i[e];return un(l)&&o.isScriptable(e)&&(l=gv(e,l,t,n)),ie(l)&&l.length&&(l=mv(e,l,t,o.isIndexable)),Hu(e,l)&&(l=vi(l,r,s&&s[e],o)),l}function gv(t,e,n,i){const{_proxy:r,_context:s,_subProxy:o,_stack:l}=n;if(l.has(t))throw new Error("Recursion detected: "+Array.from(l).join("->")+"->"+t);return l.add(t),e=e(s,o||i),l.delete(t),Hu(t,e)&&(e=Wu(r._scopes,r,t,e)),e}function mv(t,e,n,i){const{_proxy:r,_context:s,_subProxy:o,_descriptors:l}=n;if(dt(s.index)&&i(t))e=e[s.index%e.length];else if(B(e[0])){const a=e,u=r._scopes.filter(c=>c!==a);e=[];for(const c of a){const f=Wu(u,r,t,c);e.push(vi(f,s,o&&o[t],l))}}return e}function ng(t,e,n){return un(t)?t(e,n):t}const yv=(t,e)=>t===!0?e:typeof t=="string"?ho(e,t):void 0;function vv(t,e,n,i,r){for(const s of e){const o=yv(n,s);if(o){t.add(o);const l=ng(o._fallback,n,r);if(dt(l)&&l!==n&&l!==i)return l}else if(o===!1&&dt(i)&&n!==i)return null}return!1}function Wu(t,e,n,i){const r=e._rootScopes,s=ng(e._fallback,n,i),o=[...t,...r],l=new Set;l.add(i);let a=_f(l,o,n,s||n,i);return a===null||dt(s)&&s!==n&&(a=_f(l,o,s,a,i),a===null)?!1:$u(Array.from(l),[""],r,s,()=>xv(e,n,i))}function _f(t,e,n,i,r){for(;n;)n=vv(t,e,n,i,r);return n}function xv(t,e,n){const i=t._getTarget();e in i||(i[e]={});const r=i[e];return ie(r)&&B(n)?n:r||{}}function _v(t,e,n,i){let r;for(const s of e)if(r=ig(hv(s,t),n),dt(r))return Hu(t,r)?Wu(n,i,t,r):r}function ig(t,e){for(const n of e){if(!n)continue;const i=n[t];if(dt(i))return i}}function wf(t){let e=t._keys;return e||(e=t._keys=wv(t._scopes)),e}function wv(t){const e=new Set;for(const n of t)for(const i of Object.keys(n).filter(r=>!r.startsWith("_")))e.add(i);return Array.from(e)}const kv=Number.EPSILON||1e-14,xi=(t,e)=>e<t.length&&!t[e].skip&&t[e],rg=t=>t==="x"?"y":"x";function Sv(t,e,n,i){const r=t.skip?e:t,s=e,o=n.skip?e:n,l=Ma(s,r),a=Ma(o,s);let u=l/(l+a),c=a/(l+a);u=isNaN(u)?0:u,c=isNaN(c)?0:c;const f=i*u,d=i*c;return{previous:{x:s.x-f*(o.x-r.x),y:s.y-f*(o.y-r.y)},next:{x:s.x+d*(o.x-r.x),y:s.y+d*(o.y-r.y)}}}function bv(t,e,n){const i=t.length;let r,s,o,l,a,u=xi(t,0);for(let c=0;c<i-1;++c)if(a=u,u=xi(t,c+1),!(!a||!u)){if(nr(e[c],0,kv)){n[c]=n[c+1]=0;continue}r=n[c]/e[c],s=n[c+1]/e[c],l=Math.pow(r,2)+Math.pow(s,2),!(l<=9)&&(o=3/Math.sqrt(l),n[c]=r*o*e[c],n[c+1]=s*o*e[c])}}function Cv(t,e,n="x"){const i=rg(n),r=t.length;let s,o,l,a=xi(t,0);for(let u=0;u<r;++u){if(o=l,l=a,a=xi(t,u+1),!l)continue;const c=l[n],f=l[i];o&&(s=(c-o[n])/3,l[`cp1${n}`]=c-s,l[`cp1${i}`]=f-s*e[u]),a&&(s=(a[n]-c)/3,l[`cp2${n}`]=c+s,l[`cp2${i}`]=f+s*e[u])}}function Mv(t,e="x"){const n=rg(e),i=t.length,r=Array(i).fill(0),s=Array(i);let o,l,a,u=xi(t,0);for(o=0;o<i;++o)if(l=a,a=u,u=xi(t,o+1),!!a){if(u){const c=u[e]-a[e];r[o]=c!==0?(u[n]-a[n])/c:0}s[o]=l?u?mi(r[o-1])!==mi(r[o])?0:(r[o-1]+r[o])/2:r[o-1]:r[o]}bv(t,r,s),Cv(t,s,e)}function cs(t,e,n){return Math.max(Math.min(t,n),e)}function Ev(t,e){let n,i,r,s,o,l=Lr(t[0],e);for(n=0,i=t.length;n<i;++n)o=s,s=l,l=n<i-1&&Lr(t[n+1],e),s&&(r=t[n],o&&(r.cp1x=cs(r.cp1x,e.left,e.right),r.cp1y=cs(r.cp1y,e.top,e.bottom)),l&&(r.cp2x=cs(r.cp2x,e.left,e.right),r.cp2y=cs(r.cp2y,e.top,e.bottom)))}function Pv(t,e,n,i,r){let s,o,l,a;if(e.spanGaps&&(t=t.filter(u=>!u.skip)),e.cubicInterpolationMode==="monotone")Mv(t,r);else{let u=i?t[t.length-1]:t[0];for(s=0,o=t.length;s<o;++s)l=t[s],a=Sv(u,l,t[Math.min(s+1,o-(i?0:1))%o],e.tension),l.cp1x=a.previous.x,l.cp1y=a.previous.y,l.cp2x=a.next.x,l.cp2y=a.next.y,u=l}e.capBezierPoints&&Ev(t,n)}function sg(){return typeof window<"u"&&typeof document<"u"}function Vu(t){let e=t.parentNode;return e&&e.toString()==="[object ShadowRoot]"&&(e=e.host),e}function yo(t,e,n){let i;return typeof t=="string"?(i=parseInt(t,10),t.indexOf("%")!==-1&&(i=i/100*e.parentNode[n])):i=t,i}const Ho=t=>t.ownerDocument.defaultView.getComputedStyle(t,null);function Lv(t,e){return Ho(t).getPropertyValue(e)}const Tv=["top","right","bottom","left"];function Tn(t,e,n){const i={};n=n?"-"+n:"";for(let r=0;r<4;r++){const s=Tv[r];i[s]=parseFloat(t[e+"-"+s+n])||0}return i.width=i.left+i.right,i.height=i.top+i.bottom,i}const Ov=(t,e,n)=>(t>0||e>0)&&(!n||!n.shadowRoot);function Dv(t,e){const n=t.touches,i=n&&n.length?n[0]:t,{offsetX:r,offsetY:s}=i;let o=!1,l,a;if(Ov(r,s,t.target))l=r,a=s;else{const u=e.getBoundingClientRect();l=i.clientX-u.left,a=i.clientY-u.top,o=!0}return{x:l,y:a,box:o}}function kn(t,e){if("native"in t)return t;const{canvas:n,currentDevicePixelRatio:i}=e,r=Ho(n),s=r.boxSizing==="border-box",o=Tn(r,"padding"),l=Tn(r,"border","width"),{x:a,y:u,box:c}=Dv(t,n),f=o.left+(c&&l.left),d=o.top+(c&&l.top);let{width:h,height:m}=e;return s&&(h-=o.width+l.width,m-=o.height+l.height),{x:Math.round((a-f)/h*n.width/i),y:Math.round((u-d)/m*n.height/i)}}function zv(t,e,n){let i,r;if(e===void 0||n===void 0){const s=Vu(t);if(!s)e=t.clientWidth,n=t.clientHeight;else{const o=s.getBoundingClientRect(),l=Ho(s),a=Tn(l,"border","width"),u=Tn(l,"padding");e=o.width-u.width-a.width,n=o.height-u.height-a.height,i=yo(l.maxWidth,s,"clientWidth"),r=yo(l.maxHeight,s,"clientHeight")}}return{width:e,height:n,maxWidth:i||po,maxHeight:r||po}}const fs=t=>Math.round(t*10)/10;function Nv(t,e,n,i){const r=Ho(t),s=Tn(r,"margin"),o=yo(r.maxWidth,t,"clientWidth")||po,l=yo(r.maxHeight,t,"clientHeight")||po,a=zv(t,e,n);let{width:u,height:c}=a;if(r.boxSizing==="content-box"){const d=Tn(r,"border","width"),h=Tn(r,"padding");u-=h.width+d.width,c-=h.height+d.height}return u=Math.max(0,u-s.width),c=Math.max(0,i?u/i:c-s.height),u=fs(Math.min(u,o,a.maxWidth)),c=fs(Math.min(c,l,a.maxHeight)),u&&!c&&(c=fs(u/2)),(e!==void 0||n!==void 0)&&i&&a.height&&c>a.height&&(c=a.height,u=fs(Math.floor(c*i))),{width:u,height:c}}function kf(t,e,n){const i=e||1,r=Math.floor(t.height*i),s=Math.floor(t.width*i);t.height=Math.floor(t.height),t.width=Math.floor(t.width);const o=t.canvas;return o.style&&(n||!o.style.height&&!o.style.width)&&(o.style.height=`${t.height}px`,o.style.width=`${t.width}px`),t.currentDevicePixelRatio!==i||o.height!==r||o.width!==s?(t.currentDevicePixelRatio=i,o.height=r,o.width=s,t.ctx.setTransform(i,0,0,i,0,0),!0):!1}const Iv=function(){let t=!1;try{const e={get passive(){return t=!0,!1}};window.addEventListener("test",null,e),window.removeEventListener("test",null,e)}catch{}return t}();function Sf(t,e){const n=Lv(t,e),i=n&&n.match(/^(\d+)(\.\d+)?px$/);return i?+i[1]:void 0}function Sn(t,e,n,i){return{x:t.x+n*(e.x-t.x),y:t.y+n*(e.y-t.y)}}function Rv(t,e,n,i){return{x:t.x+n*(e.x-t.x),y:i==="middle"?n<.5?t.y:e.y:i==="after"?n<1?t.y:e.y:n>0?e.y:t.y}}function Fv(t,e,n,i){const r={x:t.cp2x,y:t.cp2y},s={x:e.cp1x,y:e.cp1y},o=Sn(t,r,n),l=Sn(r,s,n),a=Sn(s,e,n),u=Sn(o,l,n),c=Sn(l,a,n);return Sn(u,c,n)}const Av=function(t,e){return{x(n){return t+t+e-n},setWidth(n){e=n},textAlign(n){return n==="center"?n:n==="right"?"left":"right"},xPlus(n,i){return n-i},leftForLtr(n,i){return n-i}}},jv=function(){return{x(t){return t},setWidth(t){},textAlign(t){return t},xPlus(t,e){return t+e},leftForLtr(t,e){return t}}};function ai(t,e,n){return t?Av(e,n):jv()}function og(t,e){let n,i;(e==="ltr"||e==="rtl")&&(n=t.canvas.style,i=[n.getPropertyValue("direction"),n.getPropertyPriority("direction")],n.setProperty("direction",e,"important"),t.prevTextDirection=i)}function lg(t,e){e!==void 0&&(delete t.prevTextDirection,t.canvas.style.setProperty("direction",e[0],e[1]))}function ag(t){return t==="angle"?{between:Up,compare:Ry,normalize:lt}:{between:Hi,compare:(e,n)=>e-n,normalize:e=>e}}function bf({start:t,end:e,count:n,loop:i,style:r}){return{start:t%n,end:e%n,loop:i&&(e-t+1)%n===0,style:r}}function Bv(t,e,n){const{property:i,start:r,end:s}=n,{between:o,normalize:l}=ag(i),a=e.length;let{start:u,end:c,loop:f}=t,d,h;if(f){for(u+=a,c+=a,d=0,h=a;d<h&&o(l(e[u%a][i]),r,s);++d)u--,c--;u%=a,c%=a}return c<u&&(c+=a),{start:u,end:c,loop:f,style:t.style}}function $v(t,e,n){if(!n)return[t];const{property:i,start:r,end:s}=n,o=e.length,{compare:l,between:a,normalize:u}=ag(i),{start:c,end:f,loop:d,style:h}=Bv(t,e,n),m=[];let y=!1,x=null,p,g,v;const _=()=>a(r,v,p)&&l(r,v)!==0,w=()=>l(s,p)===0||a(s,v,p),k=()=>y||_(),S=()=>!y||w();for(let b=c,O=c;b<=f;++b)g=e[b%o],!g.skip&&(p=u(g[i]),p!==v&&(y=a(p,r,s),x===null&&k()&&(x=l(p,r)===0?b:O),x!==null&&S()&&(m.push(bf({start:x,end:b,loop:d,count:o,style:h})),x=null),O=b,v=p));return x!==null&&m.push(bf({start:x,end:f,loop:d,count:o,style:h})),m}function Hv(t,e){const n=[],i=t.segments;for(let r=0;r<i.length;r++){const s=$v(i[r],t.points,e);s.length&&n.push(...s)}return n}function Wv(t,e,n,i){let r=0,s=e-1;if(n&&!i)for(;r<e&&!t[r].skip;)r++;for(;r<e&&t[r].skip;)r++;for(r%=e,n&&(s+=r);s>r&&t[s%e].skip;)s--;return s%=e,{start:r,end:s}}function Vv(t,e,n,i){const r=t.length,s=[];let o=e,l=t[e],a;for(a=e+1;a<=n;++a){const u=t[a%r];u.skip||u.stop?l.skip||(i=!1,s.push({start:e%r,end:(a-1)%r,loop:i}),e=o=u.stop?a:null):(o=a,l.skip&&(e=a)),l=u}return o!==null&&s.push({start:e%r,end:o%r,loop:i}),s}function Uv(t,e){const n=t.points,i=t.options.spanGaps,r=n.length;if(!r)return[];const s=!!t._loop,{start:o,end:l}=Wv(n,r,s,i);if(i===!0)return Cf(t,[{start:o,end:l,loop:s}],n,e);const a=l<o?l+r:l,u=!!t._fullLoop&&o===0&&l===r-1;return Cf(t,Vv(n,o,a,u),n,e)}function Cf(t,e,n,i){return!i||!i.setContext||!n?e:Yv(t,e,n,i)}function Yv(t,e,n,i){const r=t._chart.getContext(),s=Mf(t.options),{_datasetIndex:o,options:{spanGaps:l}}=t,a=n.length,u=[];let c=s,f=e[0].start,d=f;function h(m,y,x,p){const g=l?-1:1;if(m!==y){for(m+=a;n[m%a].skip;)m-=g;for(;n[y%a].skip;)y+=g;m%a!==y%a&&(u.push({start:m%a,end:y%a,loop:x,style:p}),c=p,f=y%a)}}for(const m of e){f=l?f:m.start;let y=n[f%a],x;for(d=f+1;d<=m.end;d++){const p=n[d%a];x=Mf(i.setContext(gn(r,{type:"segment",p0:y,p1:p,p0DataIndex:(d-1)%a,p1DataIndex:d%a,datasetIndex:o}))),Qv(x,c)&&h(f,d-1,m.loop,c),y=p,c=x}f<d-1&&h(f,d-1,m.loop,c)}return u}function Mf(t){return{backgroundColor:t.backgroundColor,borderCapStyle:t.borderCapStyle,borderDash:t.borderDash,borderDashOffset:t.borderDashOffset,borderJoinStyle:t.borderJoinStyle,borderWidth:t.borderWidth,borderColor:t.borderColor}}function Qv(t,e){return e&&JSON.stringify(t)!==JSON.stringify(e)}class Kv{constructor(){this._request=null,this._charts=new Map,this._running=!1,this._lastDate=void 0}_notify(e,n,i,r){const s=n.listeners[r],o=n.duration;s.forEach(l=>l({chart:e,initial:n.initial,numSteps:o,currentStep:Math.min(i-n.start,o)}))}_refresh(){this._request||(this._running=!0,this._request=Qp.call(window,()=>{this._update(),this._request=null,this._running&&this._refresh()}))}_update(e=Date.now()){let n=0;this._charts.forEach((i,r)=>{if(!i.running||!i.items.length)return;const s=i.items;let o=s.length-1,l=!1,a;for(;o>=0;--o)a=s[o],a._active?(a._total>i.duration&&(i.duration=a._total),a.tick(e),l=!0):(s[o]=s[s.length-1],s.pop());l&&(r.draw(),this._notify(r,i,e,"progress")),s.length||(i.running=!1,this._notify(r,i,e,"complete"),i.initial=!1),n+=s.length}),this._lastDate=e,n===0&&(this._running=!1)}_getAnims(e){const n=this._charts;let i=n.get(e);return i||(i={running:!1,initial:!0,items:[],listeners:{complete:[],progress:[]}},n.set(e,i)),i}listen(e,n,i){this._getAnims(e).listeners[n].push(i)}add(e,n){!n||!n.length||this._getAnims(e).items.push(...n)}has(e){return this._getAnims(e).items.length>0}start(e){const n=this._charts.get(e);n&&(n.running=!0,n.start=Date.now(),n.duration=n.items.reduce((i,r)=>Math.max(i,r._duration),0),this._refresh())}running(e){if(!this._running)return!1;const n=this._charts.get(e);return!(!n||!n.running||!n.items.length)}stop(e){const n=this._charts.get(e);if(!n||!n.items.length)return;const i=n.items;let r=i.length-1;for(;r>=0;--r)i[r].cancel();n.items=[],this._notify(e,n,Date.now(),"complete")}remove(e){return this._charts.delete(e)}}var bt=new Kv;const Ef="transparent",Xv={boolean(t,e,n){return n>.5?e:t},color(t,e,n){const i=yf(t||Ef),r=i.valid&&yf(e||Ef);return r&&r.valid?r.mix(i,n).hexString():e},number(t,e,n){return t+(e-t)*n}};class Gv{constructor(e,n,i,r){const s=n[i];r=us([e.to,r,s,e.from]);const o=us([e.from,s,r]);this._active=!0,this._fn=e.fn||Xv[e.type||typeof o],this._easing=ir[e.easing]||ir.linear,this._start=Math.floor(Date.now()+(e.delay||0)),this._duration=this._total=Math.floor(e.duration),this._loop=!!e.loop,this._target=n,this._prop=i,this._from=o,this._to=r,this._promises=void 0}active(){return this._active}update(e,n,i){if(this._active){this._notify(!1);const r=this._target[this._prop],s=i-this._start,o=this._duration-s;this._start=i,this._duration=Math.floor(Math.max(o,e.duration)),this._total+=s,this._loop=!!e.loop,this._to=us([e.to,n,r,e.from]),this._from=us([e.from,r,n])}}cancel(){this._active&&(this.tick(Date.now()),this._active=!1,this._notify(!1))}tick(e){const n=e-this._start,i=this._duration,r=this._prop,s=this._from,o=this._loop,l=this._to;let a;if(this._active=s!==l&&(o||n<i),!this._active){this._target[r]=l,this._notify(!0);return}if(n<0){this._target[r]=s;return}a=n/i%2,a=o&&a>1?2-a:a,a=this._easing(Math.min(1,Math.max(0,a))),this._target[r]=this._fn(s,l,a)}wait(){const e=this._promises||(this._promises=[]);return new Promise((n,i)=>{e.push({res:n,rej:i})})}_notify(e){const n=e?"res":"rej",i=this._promises||[];for(let r=0;r<i.length;r++)i[r][n]()}}class ug{constructor(e,n){this._chart=e,this._properties=new Map,this.configure(n)}configure(e){if(!B(e))return;const n=Object.keys(oe.animation),i=this._properties;Object.getOwnPropertyNames(e).forEach(r=>{const s=e[r];if(!B(s))return;const o={};for(const l of n)o[l]=s[l];(ie(s.properties)&&s.properties||[r]).forEach(l=>{(l===r||!i.has(l))&&i.set(l,o)})})}_animateOptions(e,n){const i=n.options,r=qv(e,i);if(!r)return[];const s=this._createAnimations(r,i);return i.$shared&&Zv(e.options.$animations,i).then(()=>{e.options=i},()=>{}),s}_createAnimations(e,n){const i=this._properties,r=[],s=e.$animations||(e.$animations={}),o=Object.keys(n),l=Date.now();let a;for(a=o.length-1;a>=0;--a){const u=o[a];if(u.charAt(0)==="$")continue;if(u==="options"){r.push(...this._animateOptions(e,n));continue}const c=n[u];let f=s[u];const d=i.get(u);if(f)if(d&&f.active()){f.update(d,c,l);continue}else f.cancel();if(!d||!d.duration){e[u]=c;continue}s[u]=f=new Gv(d,e,u,c),r.push(f)}return r}update(e,n){if(this._properties.size===0){Object.assign(e,n);return}const i=this._createAnimations(e,n);if(i.length)return bt.add(this._chart,i),!0}}function Zv(t,e){const n=[],i=Object.keys(e);for(let r=0;r<i.length;r++){const s=t[i[r]];s&&s.active()&&n.push(s.wait())}return Promise.all(n)}function qv(t,e){if(!e)return;let n=t.options;if(!n){t.options=e;return}return n.$shared&&(t.options=n=Object.assign({},n,{$shared:!1,$animations:{}})),n}function Pf(t,e){const n=t&&t.options||{},i=n.reverse,r=n.min===void 0?e:0,s=n.max===void 0?e:0;return{start:i?s:r,end:i?r:s}}function Jv(t,e,n){if(n===!1)return!1;const i=Pf(t,n),r=Pf(e,n);return{top:r.end,right:i.end,bottom:r.start,left:i.start}}function ex(t){let e,n,i,r;return B(t)?(e=t.top,n=t.right,i=t.bottom,r=t.left):e=n=i=r=t,{top:e,right:n,bottom:i,left:r,disabled:t===!1}}function cg(t,e){const n=[],i=t._getSortedDatasetMetas(e);let r,s;for(r=0,s=i.length;r<s;++r)n.push(i[r].index);return n}function Lf(t,e,n,i={}){const r=t.keys,s=i.mode==="single";let o,l,a,u;if(e!==null){for(o=0,l=r.length;o<l;++o){if(a=+r[o],a===n){if(i.all)continue;break}u=t.values[a],de(u)&&(s||e===0||mi(e)===mi(u))&&(e+=u)}return e}}function tx(t){const e=Object.keys(t),n=new Array(e.length);let i,r,s;for(i=0,r=e.length;i<r;++i)s=e[i],n[i]={x:s,y:t[s]};return n}function Tf(t,e){const n=t&&t.options.stacked;return n||n===void 0&&e.stack!==void 0}function nx(t,e,n){return`${t.id}.${e.id}.${n.stack||n.type}`}function ix(t){const{min:e,max:n,minDefined:i,maxDefined:r}=t.getUserBounds();return{min:i?e:Number.NEGATIVE_INFINITY,max:r?n:Number.POSITIVE_INFINITY}}function rx(t,e,n){const i=t[e]||(t[e]={});return i[n]||(i[n]={})}function Of(t,e,n,i){for(const r of e.getMatchingVisibleMetas(i).reverse()){const s=t[r.index];if(n&&s>0||!n&&s<0)return r.index}return null}function Df(t,e){const{chart:n,_cachedMeta:i}=t,r=n._stacks||(n._stacks={}),{iScale:s,vScale:o,index:l}=i,a=s.axis,u=o.axis,c=nx(s,o,i),f=e.length;let d;for(let h=0;h<f;++h){const m=e[h],{[a]:y,[u]:x}=m,p=m._stacks||(m._stacks={});d=p[u]=rx(r,c,y),d[l]=x,d._top=Of(d,o,!0,i.type),d._bottom=Of(d,o,!1,i.type);const g=d._visualValues||(d._visualValues={});g[l]=x}}function wl(t,e){const n=t.scales;return Object.keys(n).filter(i=>n[i].axis===e).shift()}function sx(t,e){return gn(t,{active:!1,dataset:void 0,datasetIndex:e,index:e,mode:"default",type:"dataset"})}function ox(t,e,n){return gn(t,{active:!1,dataIndex:e,parsed:void 0,raw:void 0,element:n,index:e,mode:"default",type:"data"})}function Oi(t,e){const n=t.controller.index,i=t.vScale&&t.vScale.axis;if(i){e=e||t._parsed;for(const r of e){const s=r._stacks;if(!s||s[i]===void 0||s[i][n]===void 0)return;delete s[i][n],s[i]._visualValues!==void 0&&s[i]._visualValues[n]!==void 0&&delete s[i]._visualValues[n]}}}const kl=t=>t==="reset"||t==="none",zf=(t,e)=>e?t:Object.assign({},t),lx=(t,e,n)=>t&&!e.hidden&&e._stacked&&{keys:cg(n,!0),values:null};class sr{constructor(e,n){this.chart=e,this._ctx=e.ctx,this.index=n,this._cachedDataOpts={},this._cachedMeta=this.getMeta(),this._type=this._cachedMeta.type,this.options=void 0,this._parsing=!1,this._data=void 0,this._objectData=void 0,this._sharedOptions=void 0,this._drawStart=void 0,this._drawCount=void 0,this.enableOptionSharing=!1,this.supportsDecimation=!1,this.$context=void 0,this._syncList=[],this.datasetElementType=new.target.datasetElementType,this.dataElementType=new.target.dataElementType,this.initialize()}initialize(){const e=this._cachedMeta;this.configure(),this.linkScales(),e._stacked=Tf(e.vScale,e),this.addElements(),this.options.fill&&!this.chart.isPluginEnabled("filler")&&console.warn("Tried to use the 'fill' option without the 'Filler' plugin enabled. Please import and register the 'Filler' plugin and make sure it is not disabled in the options")}updateIndex(e){this.index!==e&&Oi(this._cachedMeta),this.index=e}linkScales(){const e=this.chart,n=this._cachedMeta,i=this.getDataset(),r=(f,d,h,m)=>f==="x"?d:f==="r"?m:h,s=n.xAxisID=F(i.xAxisID,wl(e,"x")),o=n.yAxisID=F(i.yAxisID,wl(e,"y")),l=n.rAxisID=F(i.rAxisID,wl(e,"r")),a=n.indexAxis,u=n.iAxisID=r(a,s,o,l),c=n.vAxisID=r(a,o,s,l);n.xScale=this.getScaleForId(s),n.yScale=this.getScaleForId(o),n.rScale=this.getScaleForId(l),n.iScale=this.getScaleForId(u),n.vScale=this.getScaleForId(c)}getDataset(){return this.chart.data.datasets[this.index]}getMeta(){return this.chart.getDatasetMeta(this.index)}getScaleForId(e){return this.chart.scales[e]}_getOtherScale(e){const n=this._cachedMeta;return e===n.iScale?n.vScale:n.iScale}reset(){this._update("reset")}_destroy(){const e=this._cachedMeta;this._data&&pf(this._data,this),e._stacked&&Oi(e)}_dataCheck(){const e=this.getDataset(),n=e.data||(e.data=[]),i=this._data;if(B(n))this._data=tx(n);else if(i!==n){if(i){pf(i,this);const r=this._cachedMeta;Oi(r),r._parsed=[]}n&&Object.isExtensible(n)&&By(n,this),this._syncList=[],this._data=n}}addElements(){const e=this._cachedMeta;this._dataCheck(),this.datasetElementType&&(e.dataset=new this.datasetElementType)}buildOrUpdateElements(e){const n=this._cachedMeta,i=this.getDataset();let r=!1;this._dataCheck();const s=n._stacked;n._stacked=Tf(n.vScale,n),n.stack!==i.stack&&(r=!0,Oi(n),n.stack=i.stack),this._resyncElements(e),(r||s!==n._stacked)&&Df(this,n._parsed)}configure(){const e=this.chart.config,n=e.datasetScopeKeys(this._type),i=e.getOptionScopes(this.getDataset(),n,!0);this.options=e.createResolver(i,this.getContext()),this._parsing=this.options.parsing,this._cachedDataOpts={}}parse(e,n){const{_cachedMeta:i,_data:r}=this,{iScale:s,_stacked:o}=i,l=s.axis;let a=e===0&&n===r.length?!0:i._sorted,u=e>0&&i._parsed[e-1],c,f,d;if(this._parsing===!1)i._parsed=r,i._sorted=!0,d=r;else{ie(r[e])?d=this.parseArrayData(i,r,e,n):B(r[e])?d=this.parseObjectData(i,r,e,n):d=this.parsePrimitiveData(i,r,e,n);const h=()=>f[l]===null||u&&f[l]<u[l];for(c=0;c<n;++c)i._parsed[c+e]=f=d[c],a&&(h()&&(a=!1),u=f);i._sorted=a}o&&Df(this,d)}parsePrimitiveData(e,n,i,r){const{iScale:s,vScale:o}=e,l=s.axis,a=o.axis,u=s.getLabels(),c=s===o,f=new Array(r);let d,h,m;for(d=0,h=r;d<h;++d)m=d+i,f[d]={[l]:c||s.parse(u[m],m),[a]:o.parse(n[m],m)};return f}parseArrayData(e,n,i,r){const{xScale:s,yScale:o}=e,l=new Array(r);let a,u,c,f;for(a=0,u=r;a<u;++a)c=a+i,f=n[c],l[a]={x:s.parse(f[0],c),y:o.parse(f[1],c)};return l}parseObjectData(e,n,i,r){const{xScale:s,yScale:o}=e,{xAxisKey:l="x",yAxisKey:a="y"}=this._parsing,u=new Array(r);let c,f,d,h;for(c=0,f=r;c<f;++c)d=c+i,h=n[d],u[c]={x:s.parse(ho(h,l),d),y:o.parse(ho(h,a),d)};return u}getParsed(e){return this._cachedMeta._parsed[e]}getDataElement(e){return this._cachedMeta.data[e]}applyStack(e,n,i){const r=this.chart,s=this._cachedMeta,o=n[e.axis],l={keys:cg(r,!0),values:n._stacks[e.axis]._visualValues};return Lf(l,o,s.index,{mode:i})}updateRangeFromParsed(e,n,i,r){const s=i[n.axis];let o=s===null?NaN:s;const l=r&&i._stacks[n.axis];r&&l&&(r.values=l,o=Lf(r,s,this._cachedMeta.index)),e.min=Math.min(e.min,o),e.max=Math.max(e.max,o)}getMinMax(e,n){const i=this._cachedMeta,r=i._parsed,s=i._sorted&&e===i.iScale,o=r.length,l=this._getOtherScale(e),a=lx(n,i,this.chart),u={min:Number.POSITIVE_INFINITY,max:Number.NEGATIVE_INFINITY},{min:c,max:f}=ix(l);let d,h;function m(){h=r[d];const y=h[l.axis];return!de(h[e.axis])||c>y||f<y}for(d=0;d<o&&!(!m()&&(this.updateRangeFromParsed(u,e,h,a),s));++d);if(s){for(d=o-1;d>=0;--d)if(!m()){this.updateRangeFromParsed(u,e,h,a);break}}return u}getAllParsedValues(e){const n=this._cachedMeta._parsed,i=[];let r,s,o;for(r=0,s=n.length;r<s;++r)o=n[r][e.axis],de(o)&&i.push(o);return i}getMaxOverflow(){return!1}getLabelAndValue(e){const n=this._cachedMeta,i=n.iScale,r=n.vScale,s=this.getParsed(e);return{label:i?""+i.getLabelForValue(s[i.axis]):"",value:r?""+r.getLabelForValue(s[r.axis]):""}}_update(e){const n=this._cachedMeta;this.update(e||"default"),n._clip=ex(F(this.options.clip,Jv(n.xScale,n.yScale,this.getMaxOverflow())))}update(e){}draw(){const e=this._ctx,n=this.chart,i=this._cachedMeta,r=i.data||[],s=n.chartArea,o=[],l=this._drawStart||0,a=this._drawCount||r.length-l,u=this.options.drawActiveElementsOnTop;let c;for(i.dataset&&i.dataset.draw(e,s,l,a),c=l;c<l+a;++c){const f=r[c];f.hidden||(f.active&&u?o.push(f):f.draw(e,s))}for(c=0;c<o.length;++c)o[c].draw(e,s)}getStyle(e,n){const i=n?"active":"default";return e===void 0&&this._cachedMeta.dataset?this.resolveDatasetElementOptions(i):this.resolveDataElementOptions(e||0,i)}getContext(e,n,i){const r=this.getDataset();let s;if(e>=0&&e<this._cachedMeta.data.length){const o=this._cachedMeta.data[e];s=o.$context||(o.$context=ox(this.getContext(),e,o)),s.parsed=this.getParsed(e),s.raw=r.data[e],s.index=s.dataIndex=e}else s=this.$context||(this.$context=sx(this.chart.getContext(),this.index)),s.dataset=r,s.index=s.datasetIndex=this.index;return s.active=!!n,s.mode=i,s}resolveDatasetElementOptions(e){return this._resolveElementOptions(this.datasetElementType.id,e)}resolveDataElementOptions(e,n){return this._resolveElementOptions(this.dataElementType.id,n,e)}_resolveElementOptions(e,n="default",i){const r=n==="active",s=this._cachedDataOpts,o=e+"-"+n,l=s[o],a=this.enableOptionSharing&&dt(i);if(l)return zf(l,a);const u=this.chart.config,c=u.datasetElementScopeKeys(this._type,e),f=r?[`${e}Hover`,"hover",e,""]:[e,""],d=u.getOptionScopes(this.getDataset(),c),h=Object.keys(oe.elements[e]),m=()=>this.getContext(i,r,n),y=u.resolveNamedOptions(d,h,m,f);return y.$shared&&(y.$shared=a,s[o]=Object.freeze(zf(y,a))),y}_resolveAnimations(e,n,i){const r=this.chart,s=this._cachedDataOpts,o=`animation-${n}`,l=s[o];if(l)return l;let a;if(r.options.animation!==!1){const c=this.chart.config,f=c.datasetAnimationScopeKeys(this._type,n),d=c.getOptionScopes(this.getDataset(),f);a=c.createResolver(d,this.getContext(e,i,n))}const u=new ug(r,a&&a.animations);return a&&a._cacheable&&(s[o]=Object.freeze(u)),u}getSharedOptions(e){if(e.$shared)return this._sharedOptions||(this._sharedOptions=Object.assign({},e))}includeOptions(e,n){return!n||kl(e)||this.chart._animationsDisabled}_getSharedOptions(e,n){const i=this.resolveDataElementOptions(e,n),r=this._sharedOptions,s=this.getSharedOptions(i),o=this.includeOptions(n,s)||s!==r;return this.updateSharedOptions(s,n,i),{sharedOptions:s,includeOptions:o}}updateElement(e,n,i,r){kl(r)?Object.assign(e,i):this._resolveAnimations(n,r).update(e,i)}updateSharedOptions(e,n,i){e&&!kl(n)&&this._resolveAnimations(void 0,n).update(e,i)}_setStyle(e,n,i,r){e.active=r;const s=this.getStyle(n,r);this._resolveAnimations(n,i,r).update(e,{options:!r&&this.getSharedOptions(s)||s})}removeHoverStyle(e,n,i){this._setStyle(e,i,"active",!1)}setHoverStyle(e,n,i){this._setStyle(e,i,"active",!0)}_removeDatasetHoverStyle(){const e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,"active",!1)}_setDatasetHoverStyle(){const e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,"active",!0)}_resyncElements(e){const n=this._data,i=this._cachedMeta.data;for(const[l,a,u]of this._syncList)this[l](a,u);this._syncList=[];const r=i.length,s=n.length,o=Math.min(s,r);o&&this.parse(0,o),s>r?this._insertElements(r,s-r,e):s<r&&this._removeElements(s,r-s)}_insertElements(e,n,i=!0){const r=this._cachedMeta,s=r.data,o=e+n;let l;const a=u=>{for(u.length+=n,l=u.length-1;l>=o;l--)u[l]=u[l-n]};for(a(s),l=e;l<o;++l)s[l]=new this.dataElementType;this._parsing&&a(r._parsed),this.parse(e,n),i&&this.updateElements(s,e,n,"reset")}updateElements(e,n,i,r){}_removeElements(e,n){const i=this._cachedMeta;if(this._parsing){const r=i._parsed.splice(e,n);i._stacked&&Oi(i,r)}i.data.splice(e,n)}_sync(e){if(this._parsing)this._syncList.push(e);else{const[n,i,r]=e;this[n](i,r)}this.chart._dataChanges.push([this.index,...e])}_onDataPush(){const e=arguments.length;this._sync(["_insertElements",this.getDataset().data.length-e,e])}_onDataPop(){this._sync(["_removeElements",this._cachedMeta.data.length-1,1])}_onDataShift(){this._sync(["_removeElements",0,1])}_onDataSplice(e,n){n&&this._sync(["_removeElements",e,n]);const i=arguments.length-2;i&&this._sync(["_insertElements",e,i])}_onDataUnshift(){this._sync(["_insertElements",0,arguments.length])}}I(sr,"defaults",{}),I(sr,"datasetElementType",null),I(sr,"dataElementType",null);class Ns extends sr{initialize(){this.enableOptionSharing=!0,this.supportsDecimation=!0,super.initialize()}update(e){const n=this._cachedMeta,{dataset:i,data:r=[],_dataset:s}=n,o=this.chart._animationsDisabled;let{start:l,count:a}=Vy(n,r,o);this._drawStart=l,this._drawCount=a,Uy(n)&&(l=0,a=r.length),i._chart=this.chart,i._datasetIndex=this.index,i._decimated=!!s._decimated,i.points=r;const u=this.resolveDatasetElementOptions(e);this.options.showLine||(u.borderWidth=0),u.segment=this.options.segment,this.updateElement(i,void 0,{animated:!o,options:u},e),this.updateElements(r,l,a,e)}updateElements(e,n,i,r){const s=r==="reset",{iScale:o,vScale:l,_stacked:a,_dataset:u}=this._cachedMeta,{sharedOptions:c,includeOptions:f}=this._getSharedOptions(n,r),d=o.axis,h=l.axis,{spanGaps:m,segment:y}=this.options,x=Pr(m)?m:Number.POSITIVE_INFINITY,p=this.chart._animationsDisabled||s||r==="none",g=n+i,v=e.length;let _=n>0&&this.getParsed(n-1);for(let w=0;w<v;++w){const k=e[w],S=p?k:{};if(w<n||w>=g){S.skip=!0;continue}const b=this.getParsed(w),O=X(b[h]),P=S[d]=o.getPixelForValue(b[d],w),D=S[h]=s||O?l.getBasePixel():l.getPixelForValue(a?this.applyStack(l,b,a):b[h],w);S.skip=isNaN(P)||isNaN(D)||O,S.stop=w>0&&Math.abs(b[d]-_[d])>x,y&&(S.parsed=b,S.raw=u.data[w]),f&&(S.options=c||this.resolveDataElementOptions(w,k.active?"active":r)),p||this.updateElement(k,w,S,r),_=b}}getMaxOverflow(){const e=this._cachedMeta,n=e.dataset,i=n.options&&n.options.borderWidth||0,r=e.data||[];if(!r.length)return i;const s=r[0].size(this.resolveDataElementOptions(0)),o=r[r.length-1].size(this.resolveDataElementOptions(r.length-1));return Math.max(i,s,o)/2}draw(){const e=this._cachedMeta;e.dataset.updateControlPoints(this.chart.chartArea,e.iScale.axis),super.draw()}}I(Ns,"id","line"),I(Ns,"defaults",{datasetElementType:"line",dataElementType:"point",showLine:!0,spanGaps:!1}),I(Ns,"overrides",{scales:{_index_:{type:"category"},_value_:{type:"linear"}}});function vn(){throw new Error("This method is not implemented: Check that a complete date adapter is provided.")}class Uu{static override(e){Object.assign(Uu.prototype,e)}constructor(e){this.options=e||{}}init(){}formats(){return vn()}parse(){return vn()}format(){return vn()}add(){return vn()}diff(){return vn()}startOf(){return vn()}endOf(){return vn()}}var ax={_date:Uu};function ux(t,e,n,i){const{controller:r,data:s,_sorted:o}=t,l=r._cachedMeta.iScale;if(l&&e===l.axis&&e!=="r"&&o&&s.length){const a=l._reversePixels?Ay:En;if(i){if(r._sharedOptions){const u=s[0],c=typeof u.getRange=="function"&&u.getRange(e);if(c){const f=a(s,e,n-c),d=a(s,e,n+c);return{lo:f.lo,hi:d.hi}}}}else return a(s,e,n)}return{lo:0,hi:s.length-1}}function jr(t,e,n,i,r){const s=t.getSortedVisibleDatasetMetas(),o=n[e];for(let l=0,a=s.length;l<a;++l){const{index:u,data:c}=s[l],{lo:f,hi:d}=ux(s[l],e,o,r);for(let h=f;h<=d;++h){const m=c[h];m.skip||i(m,u,h)}}}function cx(t){const e=t.indexOf("x")!==-1,n=t.indexOf("y")!==-1;return function(i,r){const s=e?Math.abs(i.x-r.x):0,o=n?Math.abs(i.y-r.y):0;return Math.sqrt(Math.pow(s,2)+Math.pow(o,2))}}function Sl(t,e,n,i,r){const s=[];return!r&&!t.isPointInArea(e)||jr(t,n,e,function(l,a,u){!r&&!Lr(l,t.chartArea,0)||l.inRange(e.x,e.y,i)&&s.push({element:l,datasetIndex:a,index:u})},!0),s}function fx(t,e,n,i){let r=[];function s(o,l,a){const{startAngle:u,endAngle:c}=o.getProps(["startAngle","endAngle"],i),{angle:f}=Iy(o,{x:e.x,y:e.y});Up(f,u,c)&&r.push({element:o,datasetIndex:l,index:a})}return jr(t,n,e,s),r}function dx(t,e,n,i,r,s){let o=[];const l=cx(n);let a=Number.POSITIVE_INFINITY;function u(c,f,d){const h=c.inRange(e.x,e.y,r);if(i&&!h)return;const m=c.getCenterPoint(r);if(!(!!s||t.isPointInArea(m))&&!h)return;const x=l(e,m);x<a?(o=[{element:c,datasetIndex:f,index:d}],a=x):x===a&&o.push({element:c,datasetIndex:f,index:d})}return jr(t,n,e,u),o}function bl(t,e,n,i,r,s){return!s&&!t.isPointInArea(e)?[]:n==="r"&&!i?fx(t,e,n,r):dx(t,e,n,i,r,s)}function Nf(t,e,n,i,r){const s=[],o=n==="x"?"inXRange":"inYRange";let l=!1;return jr(t,n,e,(a,u,c)=>{a[o](e[n],r)&&(s.push({element:a,datasetIndex:u,index:c}),l=l||a.inRange(e.x,e.y,r))}),i&&!l?[]:s}var hx={evaluateInteractionItems:jr,modes:{index(t,e,n,i){const r=kn(e,t),s=n.axis||"x",o=n.includeInvisible||!1,l=n.intersect?Sl(t,r,s,i,o):bl(t,r,s,!1,i,o),a=[];return l.length?(t.getSortedVisibleDatasetMetas().forEach(u=>{const c=l[0].index,f=u.data[c];f&&!f.skip&&a.push({element:f,datasetIndex:u.index,index:c})}),a):[]},dataset(t,e,n,i){const r=kn(e,t),s=n.axis||"xy",o=n.includeInvisible||!1;let l=n.intersect?Sl(t,r,s,i,o):bl(t,r,s,!1,i,o);if(l.length>0){const a=l[0].datasetIndex,u=t.getDatasetMeta(a).data;l=[];for(let c=0;c<u.length;++c)l.push({element:u[c],datasetIndex:a,index:c})}return l},point(t,e,n,i){const r=kn(e,t),s=n.axis||"xy",o=n.includeInvisible||!1;return Sl(t,r,s,i,o)},nearest(t,e,n,i){const r=kn(e,t),s=n.axis||"xy",o=n.includeInvisible||!1;return bl(t,r,s,n.intersect,i,o)},x(t,e,n,i){const r=kn(e,t);return Nf(t,r,"x",n.intersect,i)},y(t,e,n,i){const r=kn(e,t);return Nf(t,r,"y",n.intersect,i)}}};const fg=["left","top","right","bottom"];function Di(t,e){return t.filter(n=>n.pos===e)}function If(t,e){return t.filter(n=>fg.indexOf(n.pos)===-1&&n.box.axis===e)}function zi(t,e){return t.sort((n,i)=>{const r=e?i:n,s=e?n:i;return r.weight===s.weight?r.index-s.index:r.weight-s.weight})}function px(t){const e=[];let n,i,r,s,o,l;for(n=0,i=(t||[]).length;n<i;++n)r=t[n],{position:s,options:{stack:o,stackWeight:l=1}}=r,e.push({index:n,box:r,pos:s,horizontal:r.isHorizontal(),weight:r.weight,stack:o&&s+o,stackWeight:l});return e}function gx(t){const e={};for(const n of t){const{stack:i,pos:r,stackWeight:s}=n;if(!i||!fg.includes(r))continue;const o=e[i]||(e[i]={count:0,placed:0,weight:0,size:0});o.count++,o.weight+=s}return e}function mx(t,e){const n=gx(t),{vBoxMaxWidth:i,hBoxMaxHeight:r}=e;let s,o,l;for(s=0,o=t.length;s<o;++s){l=t[s];const{fullSize:a}=l.box,u=n[l.stack],c=u&&l.stackWeight/u.weight;l.horizontal?(l.width=c?c*i:a&&e.availableWidth,l.height=r):(l.width=i,l.height=c?c*r:a&&e.availableHeight)}return n}function yx(t){const e=px(t),n=zi(e.filter(u=>u.box.fullSize),!0),i=zi(Di(e,"left"),!0),r=zi(Di(e,"right")),s=zi(Di(e,"top"),!0),o=zi(Di(e,"bottom")),l=If(e,"x"),a=If(e,"y");return{fullSize:n,leftAndTop:i.concat(s),rightAndBottom:r.concat(a).concat(o).concat(l),chartArea:Di(e,"chartArea"),vertical:i.concat(r).concat(a),horizontal:s.concat(o).concat(l)}}function Rf(t,e,n,i){return Math.max(t[n],e[n])+Math.max(t[i],e[i])}function dg(t,e){t.top=Math.max(t.top,e.top),t.left=Math.max(t.left,e.left),t.bottom=Math.max(t.bottom,e.bottom),t.right=Math.max(t.right,e.right)}function vx(t,e,n,i){const{pos:r,box:s}=n,o=t.maxPadding;if(!B(r)){n.size&&(t[r]-=n.size);const f=i[n.stack]||{size:0,count:1};f.size=Math.max(f.size,n.horizontal?s.height:s.width),n.size=f.size/f.count,t[r]+=n.size}s.getPadding&&dg(o,s.getPadding());const l=Math.max(0,e.outerWidth-Rf(o,t,"left","right")),a=Math.max(0,e.outerHeight-Rf(o,t,"top","bottom")),u=l!==t.w,c=a!==t.h;return t.w=l,t.h=a,n.horizontal?{same:u,other:c}:{same:c,other:u}}function xx(t){const e=t.maxPadding;function n(i){const r=Math.max(e[i]-t[i],0);return t[i]+=r,r}t.y+=n("top"),t.x+=n("left"),n("right"),n("bottom")}function _x(t,e){const n=e.maxPadding;function i(r){const s={left:0,top:0,right:0,bottom:0};return r.forEach(o=>{s[o]=Math.max(e[o],n[o])}),s}return i(t?["left","right"]:["top","bottom"])}function Wi(t,e,n,i){const r=[];let s,o,l,a,u,c;for(s=0,o=t.length,u=0;s<o;++s){l=t[s],a=l.box,a.update(l.width||e.w,l.height||e.h,_x(l.horizontal,e));const{same:f,other:d}=vx(e,n,l,i);u|=f&&r.length,c=c||d,a.fullSize||r.push(l)}return u&&Wi(r,e,n,i)||c}function ds(t,e,n,i,r){t.top=n,t.left=e,t.right=e+i,t.bottom=n+r,t.width=i,t.height=r}function Ff(t,e,n,i){const r=n.padding;let{x:s,y:o}=e;for(const l of t){const a=l.box,u=i[l.stack]||{count:1,placed:0,weight:1},c=l.stackWeight/u.weight||1;if(l.horizontal){const f=e.w*c,d=u.size||a.height;dt(u.start)&&(o=u.start),a.fullSize?ds(a,r.left,o,n.outerWidth-r.right-r.left,d):ds(a,e.left+u.placed,o,f,d),u.start=o,u.placed+=f,o=a.bottom}else{const f=e.h*c,d=u.size||a.width;dt(u.start)&&(s=u.start),a.fullSize?ds(a,s,r.top,d,n.outerHeight-r.bottom-r.top):ds(a,s,e.top+u.placed,d,f),u.start=s,u.placed+=f,s=a.right}}e.x=s,e.y=o}var Gt={addBox(t,e){t.boxes||(t.boxes=[]),e.fullSize=e.fullSize||!1,e.position=e.position||"top",e.weight=e.weight||0,e._layers=e._layers||function(){return[{z:0,draw(n){e.draw(n)}}]},t.boxes.push(e)},removeBox(t,e){const n=t.boxes?t.boxes.indexOf(e):-1;n!==-1&&t.boxes.splice(n,1)},configure(t,e,n){e.fullSize=n.fullSize,e.position=n.position,e.weight=n.weight},update(t,e,n,i){if(!t)return;const r=Me(t.options.layout.padding),s=Math.max(e-r.width,0),o=Math.max(n-r.height,0),l=yx(t.boxes),a=l.vertical,u=l.horizontal;$(t.boxes,y=>{typeof y.beforeLayout=="function"&&y.beforeLayout()});const c=a.reduce((y,x)=>x.box.options&&x.box.options.display===!1?y:y+1,0)||1,f=Object.freeze({outerWidth:e,outerHeight:n,padding:r,availableWidth:s,availableHeight:o,vBoxMaxWidth:s/2/c,hBoxMaxHeight:o/2}),d=Object.assign({},r);dg(d,Me(i));const h=Object.assign({maxPadding:d,w:s,h:o,x:r.left,y:r.top},r),m=mx(a.concat(u),f);Wi(l.fullSize,h,f,m),Wi(a,h,f,m),Wi(u,h,f,m)&&Wi(a,h,f,m),xx(h),Ff(l.leftAndTop,h,f,m),h.x+=h.w,h.y+=h.h,Ff(l.rightAndBottom,h,f,m),t.chartArea={left:h.left,top:h.top,right:h.left+h.w,bottom:h.top+h.h,height:h.h,width:h.w},$(l.chartArea,y=>{const x=y.box;Object.assign(x,t.chartArea),x.update(h.w,h.h,{left:0,top:0,right:0,bottom:0})})}};class hg{acquireContext(e,n){}releaseContext(e){return!1}addEventListener(e,n,i){}removeEventListener(e,n,i){}getDevicePixelRatio(){return 1}getMaximumSize(e,n,i,r){return n=Math.max(0,n||e.width),i=i||e.height,{width:n,height:Math.max(0,r?Math.floor(n/r):i)}}isAttached(e){return!0}updateConfig(e){}}class wx extends hg{acquireContext(e){return e&&e.getContext&&e.getContext("2d")||null}updateConfig(e){e.options.animation=!1}}const Is="$chartjs",kx={touchstart:"mousedown",touchmove:"mousemove",touchend:"mouseup",pointerenter:"mouseenter",pointerdown:"mousedown",pointermove:"mousemove",pointerup:"mouseup",pointerleave:"mouseout",pointerout:"mouseout"},Af=t=>t===null||t==="";function Sx(t,e){const n=t.style,i=t.getAttribute("height"),r=t.getAttribute("width");if(t[Is]={initial:{height:i,width:r,style:{display:n.display,height:n.height,width:n.width}}},n.display=n.display||"block",n.boxSizing=n.boxSizing||"border-box",Af(r)){const s=Sf(t,"width");s!==void 0&&(t.width=s)}if(Af(i))if(t.style.height==="")t.height=t.width/(e||2);else{const s=Sf(t,"height");s!==void 0&&(t.height=s)}return t}const pg=Iv?{passive:!0}:!1;function bx(t,e,n){t.addEventListener(e,n,pg)}function Cx(t,e,n){t.canvas.removeEventListener(e,n,pg)}function Mx(t,e){const n=kx[t.type]||t.type,{x:i,y:r}=kn(t,e);return{type:n,chart:e,native:t,x:i!==void 0?i:null,y:r!==void 0?r:null}}function vo(t,e){for(const n of t)if(n===e||n.contains(e))return!0}function Ex(t,e,n){const i=t.canvas,r=new MutationObserver(s=>{let o=!1;for(const l of s)o=o||vo(l.addedNodes,i),o=o&&!vo(l.removedNodes,i);o&&n()});return r.observe(document,{childList:!0,subtree:!0}),r}function Px(t,e,n){const i=t.canvas,r=new MutationObserver(s=>{let o=!1;for(const l of s)o=o||vo(l.removedNodes,i),o=o&&!vo(l.addedNodes,i);o&&n()});return r.observe(document,{childList:!0,subtree:!0}),r}const Tr=new Map;let jf=0;function gg(){const t=window.devicePixelRatio;t!==jf&&(jf=t,Tr.forEach((e,n)=>{n.currentDevicePixelRatio!==t&&e()}))}function Lx(t,e){Tr.size||window.addEventListener("resize",gg),Tr.set(t,e)}function Tx(t){Tr.delete(t),Tr.size||window.removeEventListener("resize",gg)}function Ox(t,e,n){const i=t.canvas,r=i&&Vu(i);if(!r)return;const s=Kp((l,a)=>{const u=r.clientWidth;n(l,a),u<r.clientWidth&&n()},window),o=new ResizeObserver(l=>{const a=l[0],u=a.contentRect.width,c=a.contentRect.height;u===0&&c===0||s(u,c)});return o.observe(r),Lx(t,s),o}function Cl(t,e,n){n&&n.disconnect(),e==="resize"&&Tx(t)}function Dx(t,e,n){const i=t.canvas,r=Kp(s=>{t.ctx!==null&&n(Mx(s,t))},t);return bx(i,e,r),r}class zx extends hg{acquireContext(e,n){const i=e&&e.getContext&&e.getContext("2d");return i&&i.canvas===e?(Sx(e,n),i):null}releaseContext(e){const n=e.canvas;if(!n[Is])return!1;const i=n[Is].initial;["height","width"].forEach(s=>{const o=i[s];X(o)?n.removeAttribute(s):n.setAttribute(s,o)});const r=i.style||{};return Object.keys(r).forEach(s=>{n.style[s]=r[s]}),n.width=n.width,delete n[Is],!0}addEventListener(e,n,i){this.removeEventListener(e,n);const r=e.$proxies||(e.$proxies={}),o={attach:Ex,detach:Px,resize:Ox}[n]||Dx;r[n]=o(e,n,i)}removeEventListener(e,n){const i=e.$proxies||(e.$proxies={}),r=i[n];if(!r)return;({attach:Cl,detach:Cl,resize:Cl}[n]||Cx)(e,n,r),i[n]=void 0}getDevicePixelRatio(){return window.devicePixelRatio}getMaximumSize(e,n,i,r){return Nv(e,n,i,r)}isAttached(e){const n=Vu(e);return!!(n&&n.isConnected)}}function Nx(t){return!sg()||typeof OffscreenCanvas<"u"&&t instanceof OffscreenCanvas?wx:zx}class cn{constructor(){I(this,"active",!1)}tooltipPosition(e){const{x:n,y:i}=this.getProps(["x","y"],e);return{x:n,y:i}}hasValue(){return Pr(this.x)&&Pr(this.y)}getProps(e,n){const i=this.$animations;if(!n||!i)return this;const r={};return e.forEach(s=>{r[s]=i[s]&&i[s].active()?i[s]._to:this[s]}),r}}I(cn,"defaults",{}),I(cn,"defaultRoutes");function Ix(t,e){const n=t.options.ticks,i=Rx(t),r=Math.min(n.maxTicksLimit||i,i),s=n.major.enabled?Ax(e):[],o=s.length,l=s[0],a=s[o-1],u=[];if(o>r)return jx(e,u,s,o/r),u;const c=Fx(s,e,r);if(o>0){let f,d;const h=o>1?Math.round((a-l)/(o-1)):null;for(hs(e,u,c,X(h)?0:l-h,l),f=0,d=o-1;f<d;f++)hs(e,u,c,s[f],s[f+1]);return hs(e,u,c,a,X(h)?e.length:a+h),u}return hs(e,u,c),u}function Rx(t){const e=t.options.offset,n=t._tickSize(),i=t._length/n+(e?0:1),r=t._maxLength/n;return Math.floor(Math.min(i,r))}function Fx(t,e,n){const i=Bx(t),r=e.length/n;if(!i)return Math.max(r,1);const s=zy(i);for(let o=0,l=s.length-1;o<l;o++){const a=s[o];if(a>r)return a}return Math.max(r,1)}function Ax(t){const e=[];let n,i;for(n=0,i=t.length;n<i;n++)t[n].major&&e.push(n);return e}function jx(t,e,n,i){let r=0,s=n[0],o;for(i=Math.ceil(i),o=0;o<t.length;o++)o===s&&(e.push(t[o]),r++,s=n[r*i])}function hs(t,e,n,i,r){const s=F(i,0),o=Math.min(F(r,t.length),t.length);let l=0,a,u,c;for(n=Math.ceil(n),r&&(a=r-i,n=a/Math.floor(a/n)),c=s;c<0;)l++,c=Math.round(s+l*n);for(u=Math.max(s,0);u<o;u++)u===c&&(e.push(t[u]),l++,c=Math.round(s+l*n))}function Bx(t){const e=t.length;let n,i;if(e<2)return!1;for(i=t[0],n=1;n<e;++n)if(t[n]-t[n-1]!==i)return!1;return i}const $x=t=>t==="left"?"right":t==="right"?"left":t,Bf=(t,e,n)=>e==="top"||e==="left"?t[e]+n:t[e]-n;function $f(t,e){const n=[],i=t.length/e,r=t.length;let s=0;for(;s<r;s+=i)n.push(t[Math.floor(s)]);return n}function Hx(t,e,n){const i=t.ticks.length,r=Math.min(e,i-1),s=t._startPixel,o=t._endPixel,l=1e-6;let a=t.getPixelForTick(r),u;if(!(n&&(i===1?u=Math.max(a-s,o-a):e===0?u=(t.getPixelForTick(1)-a)/2:u=(a-t.getPixelForTick(r-1))/2,a+=r<e?u:-u,a<s-l||a>o+l)))return a}function Wx(t,e){$(t,n=>{const i=n.gc,r=i.length/2;let s;if(r>e){for(s=0;s<r;++s)delete n.data[i[s]];i.splice(0,r)}})}function Ni(t){return t.drawTicks?t.tickLength:0}function Hf(t,e){if(!t.display)return 0;const n=ge(t.font,e),i=Me(t.padding);return(ie(t.text)?t.text.length:1)*n.lineHeight+i.height}function Vx(t,e){return gn(t,{scale:e,type:"scale"})}function Ux(t,e,n){return gn(t,{tick:n,index:e,type:"tick"})}function Yx(t,e,n){let i=Xp(t);return(n&&e!=="right"||!n&&e==="right")&&(i=$x(i)),i}function Qx(t,e,n,i){const{top:r,left:s,bottom:o,right:l,chart:a}=t,{chartArea:u,scales:c}=a;let f=0,d,h,m;const y=o-r,x=l-s;if(t.isHorizontal()){if(h=$e(i,s,l),B(n)){const p=Object.keys(n)[0],g=n[p];m=c[p].getPixelForValue(g)+y-e}else n==="center"?m=(u.bottom+u.top)/2+y-e:m=Bf(t,n,e);d=l-s}else{if(B(n)){const p=Object.keys(n)[0],g=n[p];h=c[p].getPixelForValue(g)-x+e}else n==="center"?h=(u.left+u.right)/2-x+e:h=Bf(t,n,e);m=$e(i,o,r),f=n==="left"?-Ne:Ne}return{titleX:h,titleY:m,maxWidth:d,rotation:f}}class Bn extends cn{constructor(e){super(),this.id=e.id,this.type=e.type,this.options=void 0,this.ctx=e.ctx,this.chart=e.chart,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this._margins={left:0,right:0,top:0,bottom:0},this.maxWidth=void 0,this.maxHeight=void 0,this.paddingTop=void 0,this.paddingBottom=void 0,this.paddingLeft=void 0,this.paddingRight=void 0,this.axis=void 0,this.labelRotation=void 0,this.min=void 0,this.max=void 0,this._range=void 0,this.ticks=[],this._gridLineItems=null,this._labelItems=null,this._labelSizes=null,this._length=0,this._maxLength=0,this._longestTextCache={},this._startPixel=void 0,this._endPixel=void 0,this._reversePixels=!1,this._userMax=void 0,this._userMin=void 0,this._suggestedMax=void 0,this._suggestedMin=void 0,this._ticksLength=0,this._borderValue=0,this._cache={},this._dataLimitsCached=!1,this.$context=void 0}init(e){this.options=e.setContext(this.getContext()),this.axis=e.axis,this._userMin=this.parse(e.min),this._userMax=this.parse(e.max),this._suggestedMin=this.parse(e.suggestedMin),this._suggestedMax=this.parse(e.suggestedMax)}parse(e,n){return e}getUserBounds(){let{_userMin:e,_userMax:n,_suggestedMin:i,_suggestedMax:r}=this;return e=He(e,Number.POSITIVE_INFINITY),n=He(n,Number.NEGATIVE_INFINITY),i=He(i,Number.POSITIVE_INFINITY),r=He(r,Number.NEGATIVE_INFINITY),{min:He(e,i),max:He(n,r),minDefined:de(e),maxDefined:de(n)}}getMinMax(e){let{min:n,max:i,minDefined:r,maxDefined:s}=this.getUserBounds(),o;if(r&&s)return{min:n,max:i};const l=this.getMatchingVisibleMetas();for(let a=0,u=l.length;a<u;++a)o=l[a].controller.getMinMax(this,e),r||(n=Math.min(n,o.min)),s||(i=Math.max(i,o.max));return n=s&&n>i?i:n,i=r&&n>i?n:i,{min:He(n,He(i,n)),max:He(i,He(n,i))}}getPadding(){return{left:this.paddingLeft||0,top:this.paddingTop||0,right:this.paddingRight||0,bottom:this.paddingBottom||0}}getTicks(){return this.ticks}getLabels(){const e=this.chart.data;return this.options.labels||(this.isHorizontal()?e.xLabels:e.yLabels)||e.labels||[]}getLabelItems(e=this.chart.chartArea){return this._labelItems||(this._labelItems=this._computeLabelItems(e))}beforeLayout(){this._cache={},this._dataLimitsCached=!1}beforeUpdate(){V(this.options.beforeUpdate,[this])}update(e,n,i){const{beginAtZero:r,grace:s,ticks:o}=this.options,l=o.sampleSize;this.beforeUpdate(),this.maxWidth=e,this.maxHeight=n,this._margins=i=Object.assign({left:0,right:0,top:0,bottom:0},i),this.ticks=null,this._labelSizes=null,this._gridLineItems=null,this._labelItems=null,this.beforeSetDimensions(),this.setDimensions(),this.afterSetDimensions(),this._maxLength=this.isHorizontal()?this.width+i.left+i.right:this.height+i.top+i.bottom,this._dataLimitsCached||(this.beforeDataLimits(),this.determineDataLimits(),this.afterDataLimits(),this._range=dv(this,s,r),this._dataLimitsCached=!0),this.beforeBuildTicks(),this.ticks=this.buildTicks()||[],this.afterBuildTicks();const a=l<this.ticks.length;this._convertTicksToLabels(a?$f(this.ticks,l):this.ticks),this.configure(),this.beforeCalculateLabelRotation(),this.calculateLabelRotation(),this.afterCalculateLabelRotation(),o.display&&(o.autoSkip||o.source==="auto")&&(this.ticks=Ix(this,this.ticks),this._labelSizes=null,this.afterAutoSkip()),a&&this._convertTicksToLabels(this.ticks),this.beforeFit(),this.fit(),this.afterFit(),this.afterUpdate()}configure(){let e=this.options.reverse,n,i;this.isHorizontal()?(n=this.left,i=this.right):(n=this.top,i=this.bottom,e=!e),this._startPixel=n,this._endPixel=i,this._reversePixels=e,this._length=i-n,this._alignToPixels=this.options.alignToPixels}afterUpdate(){V(this.options.afterUpdate,[this])}beforeSetDimensions(){V(this.options.beforeSetDimensions,[this])}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=0,this.right=this.width):(this.height=this.maxHeight,this.top=0,this.bottom=this.height),this.paddingLeft=0,this.paddingTop=0,this.paddingRight=0,this.paddingBottom=0}afterSetDimensions(){V(this.options.afterSetDimensions,[this])}_callHooks(e){this.chart.notifyPlugins(e,this.getContext()),V(this.options[e],[this])}beforeDataLimits(){this._callHooks("beforeDataLimits")}determineDataLimits(){}afterDataLimits(){this._callHooks("afterDataLimits")}beforeBuildTicks(){this._callHooks("beforeBuildTicks")}buildTicks(){return[]}afterBuildTicks(){this._callHooks("afterBuildTicks")}beforeTickToLabelConversion(){V(this.options.beforeTickToLabelConversion,[this])}generateTickLabels(e){const n=this.options.ticks;let i,r,s;for(i=0,r=e.length;i<r;i++)s=e[i],s.label=V(n.callback,[s.value,i,e],this)}afterTickToLabelConversion(){V(this.options.afterTickToLabelConversion,[this])}beforeCalculateLabelRotation(){V(this.options.beforeCalculateLabelRotation,[this])}calculateLabelRotation(){const e=this.options,n=e.ticks,i=this.ticks.length,r=n.minRotation||0,s=n.maxRotation;let o=r,l,a,u;if(!this._isVisible()||!n.display||r>=s||i<=1||!this.isHorizontal()){this.labelRotation=r;return}const c=this._getLabelSizes(),f=c.widest.width,d=c.highest.height,h=Je(this.chart.width-f,0,this.maxWidth);l=e.offset?this.maxWidth/i:h/(i-1),f+6>l&&(l=h/(i-(e.offset?.5:1)),a=this.maxHeight-Ni(e.grid)-n.padding-Hf(e.title,this.chart.options.font),u=Math.sqrt(f*f+d*d),o=Ru(Math.min(Math.asin(Je((c.highest.height+6)/l,-1,1)),Math.asin(Je(a/u,-1,1))-Math.asin(Je(d/u,-1,1)))),o=Math.max(r,Math.min(s,o))),this.labelRotation=o}afterCalculateLabelRotation(){V(this.options.afterCalculateLabelRotation,[this])}afterAutoSkip(){}beforeFit(){V(this.options.beforeFit,[this])}fit(){const e={width:0,height:0},{chart:n,options:{ticks:i,title:r,grid:s}}=this,o=this._isVisible(),l=this.isHorizontal();if(o){const a=Hf(r,n.options.font);if(l?(e.width=this.maxWidth,e.height=Ni(s)+a):(e.height=this.maxHeight,e.width=Ni(s)+a),i.display&&this.ticks.length){const{first:u,last:c,widest:f,highest:d}=this._getLabelSizes(),h=i.padding*2,m=Xt(this.labelRotation),y=Math.cos(m),x=Math.sin(m);if(l){const p=i.mirror?0:x*f.width+y*d.height;e.height=Math.min(this.maxHeight,e.height+p+h)}else{const p=i.mirror?0:y*f.width+x*d.height;e.width=Math.min(this.maxWidth,e.width+p+h)}this._calculatePadding(u,c,x,y)}}this._handleMargins(),l?(this.width=this._length=n.width-this._margins.left-this._margins.right,this.height=e.height):(this.width=e.width,this.height=this._length=n.height-this._margins.top-this._margins.bottom)}_calculatePadding(e,n,i,r){const{ticks:{align:s,padding:o},position:l}=this.options,a=this.labelRotation!==0,u=l!=="top"&&this.axis==="x";if(this.isHorizontal()){const c=this.getPixelForTick(0)-this.left,f=this.right-this.getPixelForTick(this.ticks.length-1);let d=0,h=0;a?u?(d=r*e.width,h=i*n.height):(d=i*e.height,h=r*n.width):s==="start"?h=n.width:s==="end"?d=e.width:s!=="inner"&&(d=e.width/2,h=n.width/2),this.paddingLeft=Math.max((d-c+o)*this.width/(this.width-c),0),this.paddingRight=Math.max((h-f+o)*this.width/(this.width-f),0)}else{let c=n.height/2,f=e.height/2;s==="start"?(c=0,f=e.height):s==="end"&&(c=n.height,f=0),this.paddingTop=c+o,this.paddingBottom=f+o}}_handleMargins(){this._margins&&(this._margins.left=Math.max(this.paddingLeft,this._margins.left),this._margins.top=Math.max(this.paddingTop,this._margins.top),this._margins.right=Math.max(this.paddingRight,this._margins.right),this._margins.bottom=Math.max(this.paddingBottom,this._margins.bottom))}afterFit(){V(this.options.afterFit,[this])}isHorizontal(){const{axis:e,position:n}=this.options;return n==="top"||n==="bottom"||e==="x"}isFullSize(){return this.options.fullSize}_convertTicksToLabels(e){this.beforeTickToLabelConversion(),this.generateTickLabels(e);let n,i;for(n=0,i=e.length;n<i;n++)X(e[n].label)&&(e.splice(n,1),i--,n--);this.afterTickToLabelConversion()}_getLabelSizes(){let e=this._labelSizes;if(!e){const n=this.options.ticks.sampleSize;let i=this.ticks;n<i.length&&(i=$f(i,n)),this._labelSizes=e=this._computeLabelSizes(i,i.length)}return e}_computeLabelSizes(e,n){const{ctx:i,_longestTextCache:r}=this,s=[],o=[];let l=0,a=0,u,c,f,d,h,m,y,x,p,g,v;for(u=0;u<n;++u){if(d=e[u].label,h=this._resolveTickFontOptions(u),i.font=m=h.string,y=r[m]=r[m]||{data:{},gc:[]},x=h.lineHeight,p=g=0,!X(d)&&!ie(d))p=go(i,y.data,y.gc,p,d),g=x;else if(ie(d))for(c=0,f=d.length;c<f;++c)v=d[c],!X(v)&&!ie(v)&&(p=go(i,y.data,y.gc,p,v),g+=x);s.push(p),o.push(g),l=Math.max(p,l),a=Math.max(g,a)}Wx(r,n);const _=s.indexOf(l),w=o.indexOf(a),k=S=>({width:s[S]||0,height:o[S]||0});return{first:k(0),last:k(n-1),widest:k(_),highest:k(w),widths:s,heights:o}}getLabelForValue(e){return e}getPixelForValue(e,n){return NaN}getValueForPixel(e){}getPixelForTick(e){const n=this.ticks;return e<0||e>n.length-1?null:this.getPixelForValue(n[e].value)}getPixelForDecimal(e){this._reversePixels&&(e=1-e);const n=this._startPixel+e*this._length;return Fy(this._alignToPixels?yn(this.chart,n,0):n)}getDecimalForPixel(e){const n=(e-this._startPixel)/this._length;return this._reversePixels?1-n:n}getBasePixel(){return this.getPixelForValue(this.getBaseValue())}getBaseValue(){const{min:e,max:n}=this;return e<0&&n<0?n:e>0&&n>0?e:0}getContext(e){const n=this.ticks||[];if(e>=0&&e<n.length){const i=n[e];return i.$context||(i.$context=Ux(this.getContext(),e,i))}return this.$context||(this.$context=Vx(this.chart.getContext(),this))}_tickSize(){const e=this.options.ticks,n=Xt(this.labelRotation),i=Math.abs(Math.cos(n)),r=Math.abs(Math.sin(n)),s=this._getLabelSizes(),o=e.autoSkipPadding||0,l=s?s.widest.width+o:0,a=s?s.highest.height+o:0;return this.isHorizontal()?a*i>l*r?l/i:a/r:a*r<l*i?a/i:l/r}_isVisible(){const e=this.options.display;return e!=="auto"?!!e:this.getMatchingVisibleMetas().length>0}_computeGridLineItems(e){const n=this.axis,i=this.chart,r=this.options,{grid:s,position:o,border:l}=r,a=s.offset,u=this.isHorizontal(),f=this.ticks.length+(a?1:0),d=Ni(s),h=[],m=l.setContext(this.getContext()),y=m.display?m.width:0,x=y/2,p=function(re){return yn(i,re,y)};let g,v,_,w,k,S,b,O,P,D,A,le;if(o==="top")g=p(this.bottom),S=this.bottom-d,O=g-x,D=p(e.top)+x,le=e.bottom;else if(o==="bottom")g=p(this.top),D=e.top,le=p(e.bottom)-x,S=g+x,O=this.top+d;else if(o==="left")g=p(this.right),k=this.right-d,b=g-x,P=p(e.left)+x,A=e.right;else if(o==="right")g=p(this.left),P=e.left,A=p(e.right)-x,k=g+x,b=this.left+d;else if(n==="x"){if(o==="center")g=p((e.top+e.bottom)/2+.5);else if(B(o)){const re=Object.keys(o)[0],xe=o[re];g=p(this.chart.scales[re].getPixelForValue(xe))}D=e.top,le=e.bottom,S=g+x,O=S+d}else if(n==="y"){if(o==="center")g=p((e.left+e.right)/2);else if(B(o)){const re=Object.keys(o)[0],xe=o[re];g=p(this.chart.scales[re].getPixelForValue(xe))}k=g-x,b=k-d,P=e.left,A=e.right}const Ae=F(r.ticks.maxTicksLimit,f),q=Math.max(1,Math.ceil(f/Ae));for(v=0;v<f;v+=q){const re=this.getContext(v),xe=s.setContext(re),E=l.setContext(re),z=xe.lineWidth,N=xe.color,W=E.dash||[],Y=E.dashOffset,ht=xe.tickWidth,je=xe.tickColor,wt=xe.tickBorderDash||[],Be=xe.tickBorderDashOffset;_=Hx(this,v,a),_!==void 0&&(w=yn(i,_,z),u?k=b=P=A=w:S=O=D=le=w,h.push({tx1:k,ty1:S,tx2:b,ty2:O,x1:P,y1:D,x2:A,y2:le,width:z,color:N,borderDash:W,borderDashOffset:Y,tickWidth:ht,tickColor:je,tickBorderDash:wt,tickBorderDashOffset:Be}))}return this._ticksLength=f,this._borderValue=g,h}_computeLabelItems(e){const n=this.axis,i=this.options,{position:r,ticks:s}=i,o=this.isHorizontal(),l=this.ticks,{align:a,crossAlign:u,padding:c,mirror:f}=s,d=Ni(i.grid),h=d+c,m=f?-c:h,y=-Xt(this.labelRotation),x=[];let p,g,v,_,w,k,S,b,O,P,D,A,le="middle";if(r==="top")k=this.bottom-m,S=this._getXAxisLabelAlignment();else if(r==="bottom")k=this.top+m,S=this._getXAxisLabelAlignment();else if(r==="left"){const q=this._getYAxisLabelAlignment(d);S=q.textAlign,w=q.x}else if(r==="right"){const q=this._getYAxisLabelAlignment(d);S=q.textAlign,w=q.x}else if(n==="x"){if(r==="center")k=(e.top+e.bottom)/2+h;else if(B(r)){const q=Object.keys(r)[0],re=r[q];k=this.chart.scales[q].getPixelForValue(re)+h}S=this._getXAxisLabelAlignment()}else if(n==="y"){if(r==="center")w=(e.left+e.right)/2-h;else if(B(r)){const q=Object.keys(r)[0],re=r[q];w=this.chart.scales[q].getPixelForValue(re)}S=this._getYAxisLabelAlignment(d).textAlign}n==="y"&&(a==="start"?le="top":a==="end"&&(le="bottom"));const Ae=this._getLabelSizes();for(p=0,g=l.length;p<g;++p){v=l[p],_=v.label;const q=s.setContext(this.getContext(p));b=this.getPixelForTick(p)+s.labelOffset,O=this._resolveTickFontOptions(p),P=O.lineHeight,D=ie(_)?_.length:1;const re=D/2,xe=q.color,E=q.textStrokeColor,z=q.textStrokeWidth;let N=S;o?(w=b,S==="inner"&&(p===g-1?N=this.options.reverse?"left":"right":p===0?N=this.options.reverse?"right":"left":N="center"),r==="top"?u==="near"||y!==0?A=-D*P+P/2:u==="center"?A=-Ae.highest.height/2-re*P+P:A=-Ae.highest.height+P/2:u==="near"||y!==0?A=P/2:u==="center"?A=Ae.highest.height/2-re*P:A=Ae.highest.height-D*P,f&&(A*=-1),y!==0&&!q.showLabelBackdrop&&(w+=P/2*Math.sin(y))):(k=b,A=(1-D)*P/2);let W;if(q.showLabelBackdrop){const Y=Me(q.backdropPadding),ht=Ae.heights[p],je=Ae.widths[p];let wt=A-Y.top,Be=0-Y.left;switch(le){case"middle":wt-=ht/2;break;case"bottom":wt-=ht;break}switch(S){case"center":Be-=je/2;break;case"right":Be-=je;break}W={left:Be,top:wt,width:je+Y.width,height:ht+Y.height,color:q.backdropColor}}x.push({label:_,font:O,textOffset:A,options:{rotation:y,color:xe,strokeColor:E,strokeWidth:z,textAlign:N,textBaseline:le,translation:[w,k],backdrop:W}})}return x}_getXAxisLabelAlignment(){const{position:e,ticks:n}=this.options;if(-Xt(this.labelRotation))return e==="top"?"left":"right";let r="center";return n.align==="start"?r="left":n.align==="end"?r="right":n.align==="inner"&&(r="inner"),r}_getYAxisLabelAlignment(e){const{position:n,ticks:{crossAlign:i,mirror:r,padding:s}}=this.options,o=this._getLabelSizes(),l=e+s,a=o.widest.width;let u,c;return n==="left"?r?(c=this.right+s,i==="near"?u="left":i==="center"?(u="center",c+=a/2):(u="right",c+=a)):(c=this.right-l,i==="near"?u="right":i==="center"?(u="center",c-=a/2):(u="left",c=this.left)):n==="right"?r?(c=this.left+s,i==="near"?u="right":i==="center"?(u="center",c-=a/2):(u="left",c-=a)):(c=this.left+l,i==="near"?u="left":i==="center"?(u="center",c+=a/2):(u="right",c=this.right)):u="right",{textAlign:u,x:c}}_computeLabelArea(){if(this.options.ticks.mirror)return;const e=this.chart,n=this.options.position;if(n==="left"||n==="right")return{top:0,left:this.left,bottom:e.height,right:this.right};if(n==="top"||n==="bottom")return{top:this.top,left:0,bottom:this.bottom,right:e.width}}drawBackground(){const{ctx:e,options:{backgroundColor:n},left:i,top:r,width:s,height:o}=this;n&&(e.save(),e.fillStyle=n,e.fillRect(i,r,s,o),e.restore())}getLineWidthForValue(e){const n=this.options.grid;if(!this._isVisible()||!n.display)return 0;const r=this.ticks.findIndex(s=>s.value===e);return r>=0?n.setContext(this.getContext(r)).lineWidth:0}drawGrid(e){const n=this.options.grid,i=this.ctx,r=this._gridLineItems||(this._gridLineItems=this._computeGridLineItems(e));let s,o;const l=(a,u,c)=>{!c.width||!c.color||(i.save(),i.lineWidth=c.width,i.strokeStyle=c.color,i.setLineDash(c.borderDash||[]),i.lineDashOffset=c.borderDashOffset,i.beginPath(),i.moveTo(a.x,a.y),i.lineTo(u.x,u.y),i.stroke(),i.restore())};if(n.display)for(s=0,o=r.length;s<o;++s){const a=r[s];n.drawOnChartArea&&l({x:a.x1,y:a.y1},{x:a.x2,y:a.y2},a),n.drawTicks&&l({x:a.tx1,y:a.ty1},{x:a.tx2,y:a.ty2},{color:a.tickColor,width:a.tickWidth,borderDash:a.tickBorderDash,borderDashOffset:a.tickBorderDashOffset})}}drawBorder(){const{chart:e,ctx:n,options:{border:i,grid:r}}=this,s=i.setContext(this.getContext()),o=i.display?s.width:0;if(!o)return;const l=r.setContext(this.getContext(0)).lineWidth,a=this._borderValue;let u,c,f,d;this.isHorizontal()?(u=yn(e,this.left,o)-o/2,c=yn(e,this.right,l)+l/2,f=d=a):(f=yn(e,this.top,o)-o/2,d=yn(e,this.bottom,l)+l/2,u=c=a),n.save(),n.lineWidth=s.width,n.strokeStyle=s.color,n.beginPath(),n.moveTo(u,f),n.lineTo(c,d),n.stroke(),n.restore()}drawLabels(e){if(!this.options.ticks.display)return;const i=this.ctx,r=this._computeLabelArea();r&&ju(i,r);const s=this.getLabelItems(e);for(const o of s){const l=o.options,a=o.font,u=o.label,c=o.textOffset;yi(i,u,0,c,a,l)}r&&Bu(i)}drawTitle(){const{ctx:e,options:{position:n,title:i,reverse:r}}=this;if(!i.display)return;const s=ge(i.font),o=Me(i.padding),l=i.align;let a=s.lineHeight/2;n==="bottom"||n==="center"||B(n)?(a+=o.bottom,ie(i.text)&&(a+=s.lineHeight*(i.text.length-1))):a+=o.top;const{titleX:u,titleY:c,maxWidth:f,rotation:d}=Qx(this,a,n,l);yi(e,i.text,0,0,s,{color:i.color,maxWidth:f,rotation:d,textAlign:Yx(l,n,r),textBaseline:"middle",translation:[u,c]})}draw(e){this._isVisible()&&(this.drawBackground(),this.drawGrid(e),this.drawBorder(),this.drawTitle(),this.drawLabels(e))}_layers(){const e=this.options,n=e.ticks&&e.ticks.z||0,i=F(e.grid&&e.grid.z,-1),r=F(e.border&&e.border.z,0);return!this._isVisible()||this.draw!==Bn.prototype.draw?[{z:n,draw:s=>{this.draw(s)}}]:[{z:i,draw:s=>{this.drawBackground(),this.drawGrid(s),this.drawTitle()}},{z:r,draw:()=>{this.drawBorder()}},{z:n,draw:s=>{this.drawLabels(s)}}]}getMatchingVisibleMetas(e){const n=this.chart.getSortedVisibleDatasetMetas(),i=this.axis+"AxisID",r=[];let s,o;for(s=0,o=n.length;s<o;++s){const l=n[s];l[i]===this.id&&(!e||l.type===e)&&r.push(l)}return r}_resolveTickFontOptions(e){const n=this.options.ticks.setContext(this.getContext(e));return ge(n.font)}_maxDigits(){const e=this._resolveTickFontOptions(0).lineHeight;return(this.isHorizontal()?this.width:this.height)/e}}class ps{constructor(e,n,i){this.type=e,this.scope=n,this.override=i,this.items=Object.create(null)}isForType(e){return Object.prototype.isPrototypeOf.call(this.type.prototype,e.prototype)}register(e){const n=Object.getPrototypeOf(e);let i;Gx(n)&&(i=this.register(n));const r=this.items,s=e.id,o=this.scope+"."+s;if(!s)throw new Error("class does not have id: "+e);return s in r||(r[s]=e,Kx(e,o,i),this.override&&oe.override(e.id,e.overrides)),o}get(e){return this.items[e]}unregister(e){const n=this.items,i=e.id,r=this.scope;i in n&&delete n[i],r&&i in oe[r]&&(delete oe[r][i],this.override&&delete Rn[i])}}function Kx(t,e,n){const i=Er(Object.create(null),[n?oe.get(n):{},oe.get(e),t.defaults]);oe.set(e,i),t.defaultRoutes&&Xx(e,t.defaultRoutes),t.descriptors&&oe.describe(e,t.descriptors)}function Xx(t,e){Object.keys(e).forEach(n=>{const i=n.split("."),r=i.pop(),s=[t].concat(i).join("."),o=e[n].split("."),l=o.pop(),a=o.join(".");oe.route(s,r,a,l)})}function Gx(t){return"id"in t&&"defaults"in t}class Zx{constructor(){this.controllers=new ps(sr,"datasets",!0),this.elements=new ps(cn,"elements"),this.plugins=new ps(Object,"plugins"),this.scales=new ps(Bn,"scales"),this._typedRegistries=[this.controllers,this.scales,this.elements]}add(...e){this._each("register",e)}remove(...e){this._each("unregister",e)}addControllers(...e){this._each("register",e,this.controllers)}addElements(...e){this._each("register",e,this.elements)}addPlugins(...e){this._each("register",e,this.plugins)}addScales(...e){this._each("register",e,this.scales)}getController(e){return this._get(e,this.controllers,"controller")}getElement(e){return this._get(e,this.elements,"element")}getPlugin(e){return this._get(e,this.plugins,"plugin")}getScale(e){return this._get(e,this.scales,"scale")}removeControllers(...e){this._each("unregister",e,this.controllers)}removeElements(...e){this._each("unregister",e,this.elements)}removePlugins(...e){this._each("unregister",e,this.plugins)}removeScales(...e){this._each("unregister",e,this.scales)}_each(e,n,i){[...n].forEach(r=>{const s=i||this._getRegistryForType(r);i||s.isForType(r)||s===this.plugins&&r.id?this._exec(e,s,r):$(r,o=>{const l=i||this._getRegistryForType(o);this._exec(e,l,o)})})}_exec(e,n,i){const r=Iu(e);V(i["before"+r],[],i),n[e](i),V(i["after"+r],[],i)}_getRegistryForType(e){for(let n=0;n<this._typedRegistries.length;n++){const i=this._typedRegistries[n];if(i.isForType(e))return i}return this.plugins}_get(e,n,i){const r=n.get(e);if(r===void 0)throw new Error('"'+e+'" is not a registered '+i+".");return r}}var yt=new Zx;class qx{constructor(){this._init=[]}notify(e,n,i,r){n==="beforeInit"&&(this._init=this._createDescriptors(e,!0),this._notify(this._init,e,"install"));const s=r?this._descriptors(e).filter(r):this._descriptors(e),o=this._notify(s,e,n,i);return n==="afterDestroy"&&(this._notify(s,e,"stop"),this._notify(this._init,e,"uninstall")),o}_notify(e,n,i,r){r=r||{};for(const s of e){const o=s.plugin,l=o[i],a=[n,r,s.options];if(V(l,a,o)===!1&&r.cancelable)return!1}return!0}invalidate(){X(this._cache)||(this._oldCache=this._cache,this._cache=void 0)}_descriptors(e){if(this._cache)return this._cache;const n=this._cache=this._createDescriptors(e);return this._notifyStateChanges(e),n}_createDescriptors(e,n){const i=e&&e.config,r=F(i.options&&i.options.plugins,{}),s=Jx(i);return r===!1&&!n?[]:t2(e,s,r,n)}_notifyStateChanges(e){const n=this._oldCache||[],i=this._cache,r=(s,o)=>s.filter(l=>!o.some(a=>l.plugin.id===a.plugin.id));this._notify(r(n,i),e,"stop"),this._notify(r(i,n),e,"start")}}function Jx(t){const e={},n=[],i=Object.keys(yt.plugins.items);for(let s=0;s<i.length;s++)n.push(yt.getPlugin(i[s]));const r=t.plugins||[];for(let s=0;s<r.length;s++){const o=r[s];n.indexOf(o)===-1&&(n.push(o),e[o.id]=!0)}return{plugins:n,localIds:e}}function e2(t,e){return!e&&t===!1?null:t===!0?{}:t}function t2(t,{plugins:e,localIds:n},i,r){const s=[],o=t.getContext();for(const l of e){const a=l.id,u=e2(i[a],r);u!==null&&s.push({plugin:l,options:n2(t.config,{plugin:l,local:n[a]},u,o)})}return s}function n2(t,{plugin:e,local:n},i,r){const s=t.pluginScopeKeys(e),o=t.getOptionScopes(i,s);return n&&e.defaults&&o.push(e.defaults),t.createResolver(o,r,[""],{scriptable:!1,indexable:!1,allKeys:!0})}function La(t,e){const n=oe.datasets[t]||{};return((e.datasets||{})[t]||{}).indexAxis||e.indexAxis||n.indexAxis||"x"}function i2(t,e){let n=t;return t==="_index_"?n=e:t==="_value_"&&(n=e==="x"?"y":"x"),n}function r2(t,e){return t===e?"_index_":"_value_"}function s2(t){if(t==="top"||t==="bottom")return"x";if(t==="left"||t==="right")return"y"}function xo(t,e){if(t==="x"||t==="y"||t==="r"||(t=e.axis||s2(e.position)||t.length>1&&xo(t[0].toLowerCase(),e),t))return t;throw new Error(`Cannot determine type of '${name}' axis. Please provide 'axis' or 'position' option.`)}function o2(t,e){const n=Rn[t.type]||{scales:{}},i=e.scales||{},r=La(t.type,e),s=Object.create(null);return Object.keys(i).forEach(o=>{const l=i[o];if(!B(l))return console.error(`Invalid scale configuration for scale: ${o}`);if(l._proxy)return console.warn(`Ignoring resolver passed as options for scale: ${o}`);const a=xo(o,l),u=r2(a,r),c=n.scales||{};s[o]=tr(Object.create(null),[{axis:a},l,c[a],c[u]])}),t.data.datasets.forEach(o=>{const l=o.type||t.type,a=o.indexAxis||La(l,e),c=(Rn[l]||{}).scales||{};Object.keys(c).forEach(f=>{const d=i2(f,a),h=o[d+"AxisID"]||d;s[h]=s[h]||Object.create(null),tr(s[h],[{axis:d},i[h],c[f]])})}),Object.keys(s).forEach(o=>{const l=s[o];tr(l,[oe.scales[l.type],oe.scale])}),s}function mg(t){const e=t.options||(t.options={});e.plugins=F(e.plugins,{}),e.scales=o2(t,e)}function yg(t){return t=t||{},t.datasets=t.datasets||[],t.labels=t.labels||[],t}function l2(t){return t=t||{},t.data=yg(t.data),mg(t),t}const Wf=new Map,vg=new Set;function gs(t,e){let n=Wf.get(t);return n||(n=e(),Wf.set(t,n),vg.add(n)),n}const Ii=(t,e,n)=>{const i=ho(e,n);i!==void 0&&t.add(i)};class a2{constructor(e){this._config=l2(e),this._scopeCache=new Map,this._resolverCache=new Map}get platform(){return this._config.platform}get type(){return this._config.type}set type(e){this._config.type=e}get data(){return this._config.data}set data(e){this._config.data=yg(e)}get options(){return this._config.options}set options(e){this._config.options=e}get plugins(){return this._config.plugins}update(){const e=this._config;this.clearCache(),mg(e)}clearCache(){this._scopeCache.clear(),this._resolverCache.clear()}datasetScopeKeys(e){return gs(e,()=>[[`datasets.${e}`,""]])}datasetAnimationScopeKeys(e,n){return gs(`${e}.transition.${n}`,()=>[[`datasets.${e}.transitions.${n}`,`transitions.${n}`],[`datasets.${e}`,""]])}datasetElementScopeKeys(e,n){return gs(`${e}-${n}`,()=>[[`datasets.${e}.elements.${n}`,`datasets.${e}`,`elements.${n}`,""]])}pluginScopeKeys(e){const n=e.id,i=this.type;return gs(`${i}-plugin-${n}`,()=>[[`plugins.${n}`,...e.additionalOptionScopes||[]]])}_cachedScopes(e,n){const i=this._scopeCache;let r=i.get(e);return(!r||n)&&(r=new Map,i.set(e,r)),r}getOptionScopes(e,n,i){const{options:r,type:s}=this,o=this._cachedScopes(e,i),l=o.get(n);if(l)return l;const a=new Set;n.forEach(c=>{e&&(a.add(e),c.forEach(f=>Ii(a,e,f))),c.forEach(f=>Ii(a,r,f)),c.forEach(f=>Ii(a,Rn[s]||{},f)),c.forEach(f=>Ii(a,oe,f)),c.forEach(f=>Ii(a,Ea,f))});const u=Array.from(a);return u.length===0&&u.push(Object.create(null)),vg.has(n)&&o.set(n,u),u}chartOptionScopes(){const{options:e,type:n}=this;return[e,Rn[n]||{},oe.datasets[n]||{},{type:n},oe,Ea]}resolveNamedOptions(e,n,i,r=[""]){const s={$shared:!0},{resolver:o,subPrefixes:l}=Vf(this._resolverCache,e,r);let a=o;if(c2(o,n)){s.$shared=!1,i=un(i)?i():i;const u=this.createResolver(e,i,l);a=vi(o,i,u)}for(const u of n)s[u]=a[u];return s}createResolver(e,n,i=[""],r){const{resolver:s}=Vf(this._resolverCache,e,i);return B(n)?vi(s,n,void 0,r):s}}function Vf(t,e,n){let i=t.get(e);i||(i=new Map,t.set(e,i));const r=n.join();let s=i.get(r);return s||(s={resolver:$u(e,n),subPrefixes:n.filter(l=>!l.toLowerCase().includes("hover"))},i.set(r,s)),s}const u2=t=>B(t)&&Object.getOwnPropertyNames(t).reduce((e,n)=>e||un(t[n]),!1);function c2(t,e){const{isScriptable:n,isIndexable:i}=eg(t);for(const r of e){const s=n(r),o=i(r),l=(o||s)&&t[r];if(s&&(un(l)||u2(l))||o&&ie(l))return!0}return!1}var f2="4.1.1";const d2=["top","bottom","left","right","chartArea"];function Uf(t,e){return t==="top"||t==="bottom"||d2.indexOf(t)===-1&&e==="x"}function Yf(t,e){return function(n,i){return n[t]===i[t]?n[e]-i[e]:n[t]-i[t]}}function Qf(t){const e=t.chart,n=e.options.animation;e.notifyPlugins("afterRender"),V(n&&n.onComplete,[t],e)}function h2(t){const e=t.chart,n=e.options.animation;V(n&&n.onProgress,[t],e)}function xg(t){return sg()&&typeof t=="string"?t=document.getElementById(t):t&&t.length&&(t=t[0]),t&&t.canvas&&(t=t.canvas),t}const Rs={},Kf=t=>{const e=xg(t);return Object.values(Rs).filter(n=>n.canvas===e).pop()};function p2(t,e,n){const i=Object.keys(t);for(const r of i){const s=+r;if(s>=e){const o=t[r];delete t[r],(n>0||s>e)&&(t[s+n]=o)}}}function g2(t,e,n,i){return!n||t.type==="mouseout"?null:i?e:t}function m2(t){const{xScale:e,yScale:n}=t;if(e&&n)return{left:e.left,right:e.right,top:n.top,bottom:n.bottom}}var jt;let Wo=(jt=class{static register(...e){yt.add(...e),Xf()}static unregister(...e){yt.remove(...e),Xf()}constructor(e,n){const i=this.config=new a2(n),r=xg(e),s=Kf(r);if(s)throw new Error("Canvas is already in use. Chart with ID '"+s.id+"' must be destroyed before the canvas with ID '"+s.canvas.id+"' can be reused.");const o=i.createResolver(i.chartOptionScopes(),this.getContext());this.platform=new(i.platform||Nx(r)),this.platform.updateConfig(i);const l=this.platform.acquireContext(r,o.aspectRatio),a=l&&l.canvas,u=a&&a.height,c=a&&a.width;if(this.id=by(),this.ctx=l,this.canvas=a,this.width=c,this.height=u,this._options=o,this._aspectRatio=this.aspectRatio,this._layers=[],this._metasets=[],this._stacks=void 0,this.boxes=[],this.currentDevicePixelRatio=void 0,this.chartArea=void 0,this._active=[],this._lastEvent=void 0,this._listeners={},this._responsiveListeners=void 0,this._sortedMetasets=[],this.scales={},this._plugins=new qx,this.$proxies={},this._hiddenIndices={},this.attached=!1,this._animationsDisabled=void 0,this.$context=void 0,this._doResize=Hy(f=>this.update(f),o.resizeDelay||0),this._dataChanges=[],Rs[this.id]=this,!l||!a){console.error("Failed to create chart: can't acquire context from the given item");return}bt.listen(this,"complete",Qf),bt.listen(this,"progress",h2),this._initialize(),this.attached&&this.update()}get aspectRatio(){const{options:{aspectRatio:e,maintainAspectRatio:n},width:i,height:r,_aspectRatio:s}=this;return X(e)?n&&s?s:r?i/r:null:e}get data(){return this.config.data}set data(e){this.config.data=e}get options(){return this._options}set options(e){this.config.options=e}get registry(){return yt}_initialize(){return this.notifyPlugins("beforeInit"),this.options.responsive?this.resize():kf(this,this.options.devicePixelRatio),this.bindEvents(),this.notifyPlugins("afterInit"),this}clear(){return xf(this.canvas,this.ctx),this}stop(){return bt.stop(this),this}resize(e,n){bt.running(this)?this._resizeBeforeDraw={width:e,height:n}:this._resize(e,n)}_resize(e,n){const i=this.options,r=this.canvas,s=i.maintainAspectRatio&&this.aspectRatio,o=this.platform.getMaximumSize(r,e,n,s),l=i.devicePixelRatio||this.platform.getDevicePixelRatio(),a=this.width?"resize":"attach";this.width=o.width,this.height=o.height,this._aspectRatio=this.aspectRatio,kf(this,l,!0)&&(this.notifyPlugins("resize",{size:o}),V(i.onResize,[this,o],this),this.attached&&this._doResize(a)&&this.render())}ensureScalesHaveIDs(){const n=this.options.scales||{};$(n,(i,r)=>{i.id=r})}buildOrUpdateScales(){const e=this.options,n=e.scales,i=this.scales,r=Object.keys(i).reduce((o,l)=>(o[l]=!1,o),{});let s=[];n&&(s=s.concat(Object.keys(n).map(o=>{const l=n[o],a=xo(o,l),u=a==="r",c=a==="x";return{options:l,dposition:u?"chartArea":c?"bottom":"left",dtype:u?"radialLinear":c?"category":"linear"}}))),$(s,o=>{const l=o.options,a=l.id,u=xo(a,l),c=F(l.type,o.dtype);(l.position===void 0||Uf(l.position,u)!==Uf(o.dposition))&&(l.position=o.dposition),r[a]=!0;let f=null;if(a in i&&i[a].type===c)f=i[a];else{const d=yt.getScale(c);f=new d({id:a,type:c,ctx:this.ctx,chart:this}),i[f.id]=f}f.init(l,e)}),$(r,(o,l)=>{o||delete i[l]}),$(i,o=>{Gt.configure(this,o,o.options),Gt.addBox(this,o)})}_updateMetasets(){const e=this._metasets,n=this.data.datasets.length,i=e.length;if(e.sort((r,s)=>r.index-s.index),i>n){for(let r=n;r<i;++r)this._destroyDatasetMeta(r);e.splice(n,i-n)}this._sortedMetasets=e.slice(0).sort(Yf("order","index"))}_removeUnreferencedMetasets(){const{_metasets:e,data:{datasets:n}}=this;e.length>n.length&&delete this._stacks,e.forEach((i,r)=>{n.filter(s=>s===i._dataset).length===0&&this._destroyDatasetMeta(r)})}buildOrUpdateControllers(){const e=[],n=this.data.datasets;let i,r;for(this._removeUnreferencedMetasets(),i=0,r=n.length;i<r;i++){const s=n[i];let o=this.getDatasetMeta(i);const l=s.type||this.config.type;if(o.type&&o.type!==l&&(this._destroyDatasetMeta(i),o=this.getDatasetMeta(i)),o.type=l,o.indexAxis=s.indexAxis||La(l,this.options),o.order=s.order||0,o.index=i,o.label=""+s.label,o.visible=this.isDatasetVisible(i),o.controller)o.controller.updateIndex(i),o.controller.linkScales();else{const a=yt.getController(l),{datasetElementType:u,dataElementType:c}=oe.datasets[l];Object.assign(a,{dataElementType:yt.getElement(c),datasetElementType:u&&yt.getElement(u)}),o.controller=new a(this,i),e.push(o.controller)}}return this._updateMetasets(),e}_resetElements(){$(this.data.datasets,(e,n)=>{this.getDatasetMeta(n).controller.reset()},this)}reset(){this._resetElements(),this.notifyPlugins("reset")}update(e){const n=this.config;n.update();const i=this._options=n.createResolver(n.chartOptionScopes(),this.getContext()),r=this._animationsDisabled=!i.animation;if(this._updateScales(),this._checkEventBindings(),this._updateHiddenIndices(),this._plugins.invalidate(),this.notifyPlugins("beforeUpdate",{mode:e,cancelable:!0})===!1)return;const s=this.buildOrUpdateControllers();this.notifyPlugins("beforeElementsUpdate");let o=0;for(let u=0,c=this.data.datasets.length;u<c;u++){const{controller:f}=this.getDatasetMeta(u),d=!r&&s.indexOf(f)===-1;f.buildOrUpdateElements(d),o=Math.max(+f.getMaxOverflow(),o)}o=this._minPadding=i.layout.autoPadding?o:0,this._updateLayout(o),r||$(s,u=>{u.reset()}),this._updateDatasets(e),this.notifyPlugins("afterUpdate",{mode:e}),this._layers.sort(Yf("z","_idx"));const{_active:l,_lastEvent:a}=this;a?this._eventHandler(a,!0):l.length&&this._updateHoverStyles(l,l,!0),this.render()}_updateScales(){$(this.scales,e=>{Gt.removeBox(this,e)}),this.ensureScalesHaveIDs(),this.buildOrUpdateScales()}_checkEventBindings(){const e=this.options,n=new Set(Object.keys(this._listeners)),i=new Set(e.events);(!cf(n,i)||!!this._responsiveListeners!==e.responsive)&&(this.unbindEvents(),this.bindEvents())}_updateHiddenIndices(){const{_hiddenIndices:e}=this,n=this._getUniformDataChanges()||[];for(const{method:i,start:r,count:s}of n){const o=i==="_removeElements"?-s:s;p2(e,r,o)}}_getUniformDataChanges(){const e=this._dataChanges;if(!e||!e.length)return;this._dataChanges=[];const n=this.data.datasets.length,i=s=>new Set(e.filter(o=>o[0]===s).map((o,l)=>l+","+o.splice(1).join(","))),r=i(0);for(let s=1;s<n;s++)if(!cf(r,i(s)))return;return Array.from(r).map(s=>s.split(",")).map(s=>({method:s[1],start:+s[2],count:+s[3]}))}_updateLayout(e){if(this.notifyPlugins("beforeLayout",{cancelable:!0})===!1)return;Gt.update(this,this.width,this.height,e);const n=this.chartArea,i=n.width<=0||n.height<=0;this._layers=[],$(this.boxes,r=>{i&&r.position==="chartArea"||(r.configure&&r.configure(),this._layers.push(...r._layers()))},this),this._layers.forEach((r,s)=>{r._idx=s}),this.notifyPlugins("afterLayout")}_updateDatasets(e){if(this.notifyPlugins("beforeDatasetsUpdate",{mode:e,cancelable:!0})!==!1){for(let n=0,i=this.data.datasets.length;n<i;++n)this.getDatasetMeta(n).controller.configure();for(let n=0,i=this.data.datasets.length;n<i;++n)this._updateDataset(n,un(e)?e({datasetIndex:n}):e);this.notifyPlugins("afterDatasetsUpdate",{mode:e})}}_updateDataset(e,n){const i=this.getDatasetMeta(e),r={meta:i,index:e,mode:n,cancelable:!0};this.notifyPlugins("beforeDatasetUpdate",r)!==!1&&(i.controller._update(n),r.cancelable=!1,this.notifyPlugins("afterDatasetUpdate",r))}render(){this.notifyPlugins("beforeRender",{cancelable:!0})!==!1&&(bt.has(this)?this.attached&&!bt.running(this)&&bt.start(this):(this.draw(),Qf({chart:this})))}draw(){let e;if(this._resizeBeforeDraw){const{width:i,height:r}=this._resizeBeforeDraw;this._resize(i,r),this._resizeBeforeDraw=null}if(this.clear(),this.width<=0||this.height<=0||this.notifyPlugins("beforeDraw",{cancelable:!0})===!1)return;const n=this._layers;for(e=0;e<n.length&&n[e].z<=0;++e)n[e].draw(this.chartArea);for(this._drawDatasets();e<n.length;++e)n[e].draw(this.chartArea);this.notifyPlugins("afterDraw")}_getSortedDatasetMetas(e){const n=this._sortedMetasets,i=[];let r,s;for(r=0,s=n.length;r<s;++r){const o=n[r];(!e||o.visible)&&i.push(o)}return i}getSortedVisibleDatasetMetas(){return this._getSortedDatasetMetas(!0)}_drawDatasets(){if(this.notifyPlugins("beforeDatasetsDraw",{cancelable:!0})===!1)return;const e=this.getSortedVisibleDatasetMetas();for(let n=e.length-1;n>=0;--n)this._drawDataset(e[n]);this.notifyPlugins("afterDatasetsDraw")}_drawDataset(e){const n=this.ctx,i=e._clip,r=!i.disabled,s=m2(e)||this.chartArea,o={meta:e,index:e.index,cancelable:!0};this.notifyPlugins("beforeDatasetDraw",o)!==!1&&(r&&ju(n,{left:i.left===!1?0:s.left-i.left,right:i.right===!1?this.width:s.right+i.right,top:i.top===!1?0:s.top-i.top,bottom:i.bottom===!1?this.height:s.bottom+i.bottom}),e.controller.draw(),r&&Bu(n),o.cancelable=!1,this.notifyPlugins("afterDatasetDraw",o))}isPointInArea(e){return Lr(e,this.chartArea,this._minPadding)}getElementsAtEventForMode(e,n,i,r){const s=hx.modes[n];return typeof s=="function"?s(this,e,i,r):[]}getDatasetMeta(e){const n=this.data.datasets[e],i=this._metasets;let r=i.filter(s=>s&&s._dataset===n).pop();return r||(r={type:null,data:[],dataset:null,controller:null,hidden:null,xAxisID:null,yAxisID:null,order:n&&n.order||0,index:e,_dataset:n,_parsed:[],_sorted:!1},i.push(r)),r}getContext(){return this.$context||(this.$context=gn(null,{chart:this,type:"chart"}))}getVisibleDatasetCount(){return this.getSortedVisibleDatasetMetas().length}isDatasetVisible(e){const n=this.data.datasets[e];if(!n)return!1;const i=this.getDatasetMeta(e);return typeof i.hidden=="boolean"?!i.hidden:!n.hidden}setDatasetVisibility(e,n){const i=this.getDatasetMeta(e);i.hidden=!n}toggleDataVisibility(e){this._hiddenIndices[e]=!this._hiddenIndices[e]}getDataVisibility(e){return!this._hiddenIndices[e]}_updateVisibility(e,n,i){const r=i?"show":"hide",s=this.getDatasetMeta(e),o=s.controller._resolveAnimations(void 0,r);dt(n)?(s.data[n].hidden=!i,this.update()):(this.setDatasetVisibility(e,i),o.update(s,{visible:i}),this.update(l=>l.datasetIndex===e?r:void 0))}hide(e,n){this._updateVisibility(e,n,!1)}show(e,n){this._updateVisibility(e,n,!0)}_destroyDatasetMeta(e){const n=this._metasets[e];n&&n.controller&&n.controller._destroy(),delete this._metasets[e]}_stop(){let e,n;for(this.stop(),bt.remove(this),e=0,n=this.data.datasets.length;e<n;++e)this._destroyDatasetMeta(e)}destroy(){this.notifyPlugins("beforeDestroy");const{canvas:e,ctx:n}=this;this._stop(),this.config.clearCache(),e&&(this.unbindEvents(),xf(e,n),this.platform.releaseContext(n),this.canvas=null,this.ctx=null),delete Rs[this.id],this.notifyPlugins("afterDestroy")}toBase64Image(...e){return this.canvas.toDataURL(...e)}bindEvents(){this.bindUserEvents(),this.options.responsive?this.bindResponsiveEvents():this.attached=!0}bindUserEvents(){const e=this._listeners,n=this.platform,i=(s,o)=>{n.addEventListener(this,s,o),e[s]=o},r=(s,o,l)=>{s.offsetX=o,s.offsetY=l,this._eventHandler(s)};$(this.options.events,s=>i(s,r))}bindResponsiveEvents(){this._responsiveListeners||(this._responsiveListeners={});const e=this._responsiveListeners,n=this.platform,i=(a,u)=>{n.addEventListener(this,a,u),e[a]=u},r=(a,u)=>{e[a]&&(n.removeEventListener(this,a,u),delete e[a])},s=(a,u)=>{this.canvas&&this.resize(a,u)};let o;const l=()=>{r("attach",l),this.attached=!0,this.resize(),i("resize",s),i("detach",o)};o=()=>{this.attached=!1,r("resize",s),this._stop(),this._resize(0,0),i("attach",l)},n.isAttached(this.canvas)?l():o()}unbindEvents(){$(this._listeners,(e,n)=>{this.platform.removeEventListener(this,n,e)}),this._listeners={},$(this._responsiveListeners,(e,n)=>{this.platform.removeEventListener(this,n,e)}),this._responsiveListeners=void 0}updateHoverStyle(e,n,i){const r=i?"set":"remove";let s,o,l,a;for(n==="dataset"&&(s=this.getDatasetMeta(e[0].datasetIndex),s.controller["_"+r+"DatasetHoverStyle"]()),l=0,a=e.length;l<a;++l){o=e[l];const u=o&&this.getDatasetMeta(o.datasetIndex).controller;u&&u[r+"HoverStyle"](o.element,o.datasetIndex,o.index)}}getActiveElements(){return this._active||[]}setActiveElements(e){const n=this._active||[],i=e.map(({datasetIndex:s,index:o})=>{const l=this.getDatasetMeta(s);if(!l)throw new Error("No dataset found at index "+s);return{datasetIndex:s,element:l.data[o],index:o}});!co(i,n)&&(this._active=i,this._lastEvent=null,this._updateHoverStyles(i,n))}notifyPlugins(e,n,i){return this._plugins.notify(this,e,n,i)}isPluginEnabled(e){return this._plugins._cache.filter(n=>n.plugin.id===e).length===1}_updateHoverStyles(e,n,i){const r=this.options.hover,s=(a,u)=>a.filter(c=>!u.some(f=>c.datasetIndex===f.datasetIndex&&c.index===f.index)),o=s(n,e),l=i?e:s(e,n);o.length&&this.updateHoverStyle(o,r.mode,!1),l.length&&r.mode&&this.updateHoverStyle(l,r.mode,!0)}_eventHandler(e,n){const i={event:e,replay:n,cancelable:!0,inChartArea:this.isPointInArea(e)},r=o=>(o.options.events||this.options.events).includes(e.native.type);if(this.notifyPlugins("beforeEvent",i,r)===!1)return;const s=this._handleEvent(e,n,i.inChartArea);return i.cancelable=!1,this.notifyPlugins("afterEvent",i,r),(s||i.changed)&&this.render(),this}_handleEvent(e,n,i){const{_active:r=[],options:s}=this,o=n,l=this._getActiveElements(e,r,i,o),a=Ty(e),u=g2(e,this._lastEvent,i,a);i&&(this._lastEvent=null,V(s.onHover,[e,l,this],this),a&&V(s.onClick,[e,l,this],this));const c=!co(l,r);return(c||n)&&(this._active=l,this._updateHoverStyles(l,r,n)),this._lastEvent=u,c}_getActiveElements(e,n,i,r){if(e.type==="mouseout")return[];if(!i)return n;const s=this.options.hover;return this.getElementsAtEventForMode(e,s.mode,s,r)}},I(jt,"defaults",oe),I(jt,"instances",Rs),I(jt,"overrides",Rn),I(jt,"registry",yt),I(jt,"version",f2),I(jt,"getChart",Kf),jt);function Xf(){return $(Wo.instances,t=>t._plugins.invalidate())}function _g(t,e,n=e){t.lineCap=F(n.borderCapStyle,e.borderCapStyle),t.setLineDash(F(n.borderDash,e.borderDash)),t.lineDashOffset=F(n.borderDashOffset,e.borderDashOffset),t.lineJoin=F(n.borderJoinStyle,e.borderJoinStyle),t.lineWidth=F(n.borderWidth,e.borderWidth),t.strokeStyle=F(n.borderColor,e.borderColor)}function y2(t,e,n){t.lineTo(n.x,n.y)}function v2(t){return t.stepped?nv:t.tension||t.cubicInterpolationMode==="monotone"?iv:y2}function wg(t,e,n={}){const i=t.length,{start:r=0,end:s=i-1}=n,{start:o,end:l}=e,a=Math.max(r,o),u=Math.min(s,l),c=r<o&&s<o||r>l&&s>l;return{count:i,start:a,loop:e.loop,ilen:u<a&&!c?i+u-a:u-a}}function x2(t,e,n,i){const{points:r,options:s}=e,{count:o,start:l,loop:a,ilen:u}=wg(r,n,i),c=v2(s);let{move:f=!0,reverse:d}=i||{},h,m,y;for(h=0;h<=u;++h)m=r[(l+(d?u-h:h))%o],!m.skip&&(f?(t.moveTo(m.x,m.y),f=!1):c(t,y,m,d,s.stepped),y=m);return a&&(m=r[(l+(d?u:0))%o],c(t,y,m,d,s.stepped)),!!a}function _2(t,e,n,i){const r=e.points,{count:s,start:o,ilen:l}=wg(r,n,i),{move:a=!0,reverse:u}=i||{};let c=0,f=0,d,h,m,y,x,p;const g=_=>(o+(u?l-_:_))%s,v=()=>{y!==x&&(t.lineTo(c,x),t.lineTo(c,y),t.lineTo(c,p))};for(a&&(h=r[g(0)],t.moveTo(h.x,h.y)),d=0;d<=l;++d){if(h=r[g(d)],h.skip)continue;const _=h.x,w=h.y,k=_|0;k===m?(w<y?y=w:w>x&&(x=w),c=(f*c+_)/++f):(v(),t.lineTo(_,w),m=k,f=0,y=x=w),p=w}v()}function Ta(t){const e=t.options,n=e.borderDash&&e.borderDash.length;return!t._decimated&&!t._loop&&!e.tension&&e.cubicInterpolationMode!=="monotone"&&!e.stepped&&!n?_2:x2}function w2(t){return t.stepped?Rv:t.tension||t.cubicInterpolationMode==="monotone"?Fv:Sn}function k2(t,e,n,i){let r=e._path;r||(r=e._path=new Path2D,e.path(r,n,i)&&r.closePath()),_g(t,e.options),t.stroke(r)}function S2(t,e,n,i){const{segments:r,options:s}=e,o=Ta(e);for(const l of r)_g(t,s,l.style),t.beginPath(),o(t,e,l,{start:n,end:n+i-1})&&t.closePath(),t.stroke()}const b2=typeof Path2D=="function";function C2(t,e,n,i){b2&&!e.options.segment?k2(t,e,n,i):S2(t,e,n,i)}class Vi extends cn{constructor(e){super(),this.animated=!0,this.options=void 0,this._chart=void 0,this._loop=void 0,this._fullLoop=void 0,this._path=void 0,this._points=void 0,this._segments=void 0,this._decimated=!1,this._pointsUpdated=!1,this._datasetIndex=void 0,e&&Object.assign(this,e)}updateControlPoints(e,n){const i=this.options;if((i.tension||i.cubicInterpolationMode==="monotone")&&!i.stepped&&!this._pointsUpdated){const r=i.spanGaps?this._loop:this._fullLoop;Pv(this._points,i,e,r,n),this._pointsUpdated=!0}}set points(e){this._points=e,delete this._segments,delete this._path,this._pointsUpdated=!1}get points(){return this._points}get segments(){return this._segments||(this._segments=Uv(this,this.options.segment))}first(){const e=this.segments,n=this.points;return e.length&&n[e[0].start]}last(){const e=this.segments,n=this.points,i=e.length;return i&&n[e[i-1].end]}interpolate(e,n){const i=this.options,r=e[n],s=this.points,o=Hv(this,{property:n,start:r,end:r});if(!o.length)return;const l=[],a=w2(i);let u,c;for(u=0,c=o.length;u<c;++u){const{start:f,end:d}=o[u],h=s[f],m=s[d];if(h===m){l.push(h);continue}const y=Math.abs((r-h[n])/(m[n]-h[n])),x=a(h,m,y,i.stepped);x[n]=e[n],l.push(x)}return l.length===1?l[0]:l}pathSegment(e,n,i){return Ta(this)(e,this,n,i)}path(e,n,i){const r=this.segments,s=Ta(this);let o=this._loop;n=n||0,i=i||this.points.length-n;for(const l of r)o&=s(e,this,l,{start:n,end:n+i-1});return!!o}draw(e,n,i,r){const s=this.options||{};(this.points||[]).length&&s.borderWidth&&(e.save(),C2(e,this,i,r),e.restore()),this.animated&&(this._pointsUpdated=!1,this._path=void 0)}}I(Vi,"id","line"),I(Vi,"defaults",{borderCapStyle:"butt",borderDash:[],borderDashOffset:0,borderJoinStyle:"miter",borderWidth:3,capBezierPoints:!0,cubicInterpolationMode:"default",fill:!1,spanGaps:!1,stepped:!1,tension:0}),I(Vi,"defaultRoutes",{backgroundColor:"backgroundColor",borderColor:"borderColor"}),I(Vi,"descriptors",{_scriptable:!0,_indexable:e=>e!=="borderDash"&&e!=="fill"});function Gf(t,e,n,i){const r=t.options,{[n]:s}=t.getProps([n],i);return Math.abs(e-s)<r.radius+r.hitRadius}class Fs extends cn{constructor(e){super(),this.options=void 0,this.parsed=void 0,this.skip=void 0,this.stop=void 0,e&&Object.assign(this,e)}inRange(e,n,i){const r=this.options,{x:s,y:o}=this.getProps(["x","y"],i);return Math.pow(e-s,2)+Math.pow(n-o,2)<Math.pow(r.hitRadius+r.radius,2)}inXRange(e,n){return Gf(this,e,"x",n)}inYRange(e,n){return Gf(this,e,"y",n)}getCenterPoint(e){const{x:n,y:i}=this.getProps(["x","y"],e);return{x:n,y:i}}size(e){e=e||this.options||{};let n=e.radius||0;n=Math.max(n,n&&e.hoverRadius||0);const i=n&&e.borderWidth||0;return(n+i)*2}draw(e,n){const i=this.options;this.skip||i.radius<.1||!Lr(this,n,this.size(i)/2)||(e.strokeStyle=i.borderColor,e.lineWidth=i.borderWidth,e.fillStyle=i.backgroundColor,Pa(e,i,this.x,this.y))}getRange(){const e=this.options||{};return e.radius+e.hitRadius}}I(Fs,"id","point"),I(Fs,"defaults",{borderWidth:1,hitRadius:1,hoverBorderWidth:1,hoverRadius:4,pointStyle:"circle",radius:3,rotation:0}),I(Fs,"defaultRoutes",{backgroundColor:"backgroundColor",borderColor:"borderColor"});const Zf=(t,e)=>{let{boxHeight:n=e,boxWidth:i=e}=t;return t.usePointStyle&&(n=Math.min(n,e),i=t.pointStyleWidth||Math.min(i,e)),{boxWidth:i,boxHeight:n,itemHeight:Math.max(e,n)}},M2=(t,e)=>t!==null&&e!==null&&t.datasetIndex===e.datasetIndex&&t.index===e.index;class qf extends cn{constructor(e){super(),this._added=!1,this.legendHitBoxes=[],this._hoveredItem=null,this.doughnutMode=!1,this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this.legendItems=void 0,this.columnSizes=void 0,this.lineWidths=void 0,this.maxHeight=void 0,this.maxWidth=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.height=void 0,this.width=void 0,this._margins=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,n,i){this.maxWidth=e,this.maxHeight=n,this._margins=i,this.setDimensions(),this.buildLabels(),this.fit()}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=this._margins.left,this.right=this.width):(this.height=this.maxHeight,this.top=this._margins.top,this.bottom=this.height)}buildLabels(){const e=this.options.labels||{};let n=V(e.generateLabels,[this.chart],this)||[];e.filter&&(n=n.filter(i=>e.filter(i,this.chart.data))),e.sort&&(n=n.sort((i,r)=>e.sort(i,r,this.chart.data))),this.options.reverse&&n.reverse(),this.legendItems=n}fit(){const{options:e,ctx:n}=this;if(!e.display){this.width=this.height=0;return}const i=e.labels,r=ge(i.font),s=r.size,o=this._computeTitleHeight(),{boxWidth:l,itemHeight:a}=Zf(i,s);let u,c;n.font=r.string,this.isHorizontal()?(u=this.maxWidth,c=this._fitRows(o,s,l,a)+10):(c=this.maxHeight,u=this._fitCols(o,r,l,a)+10),this.width=Math.min(u,e.maxWidth||this.maxWidth),this.height=Math.min(c,e.maxHeight||this.maxHeight)}_fitRows(e,n,i,r){const{ctx:s,maxWidth:o,options:{labels:{padding:l}}}=this,a=this.legendHitBoxes=[],u=this.lineWidths=[0],c=r+l;let f=e;s.textAlign="left",s.textBaseline="middle";let d=-1,h=-c;return this.legendItems.forEach((m,y)=>{const x=i+n/2+s.measureText(m.text).width;(y===0||u[u.length-1]+x+2*l>o)&&(f+=c,u[u.length-(y>0?0:1)]=0,h+=c,d++),a[y]={left:0,top:h,row:d,width:x,height:r},u[u.length-1]+=x+l}),f}_fitCols(e,n,i,r){const{ctx:s,maxHeight:o,options:{labels:{padding:l}}}=this,a=this.legendHitBoxes=[],u=this.columnSizes=[],c=o-e;let f=l,d=0,h=0,m=0,y=0;return this.legendItems.forEach((x,p)=>{const{itemWidth:g,itemHeight:v}=E2(i,n,s,x,r);p>0&&h+v+2*l>c&&(f+=d+l,u.push({width:d,height:h}),m+=d+l,y++,d=h=0),a[p]={left:m,top:h,col:y,width:g,height:v},d=Math.max(d,g),h+=v+l}),f+=d,u.push({width:d,height:h}),f}adjustHitBoxes(){if(!this.options.display)return;const e=this._computeTitleHeight(),{legendHitBoxes:n,options:{align:i,labels:{padding:r},rtl:s}}=this,o=ai(s,this.left,this.width);if(this.isHorizontal()){let l=0,a=$e(i,this.left+r,this.right-this.lineWidths[l]);for(const u of n)l!==u.row&&(l=u.row,a=$e(i,this.left+r,this.right-this.lineWidths[l])),u.top+=this.top+e+r,u.left=o.leftForLtr(o.x(a),u.width),a+=u.width+r}else{let l=0,a=$e(i,this.top+e+r,this.bottom-this.columnSizes[l].height);for(const u of n)u.col!==l&&(l=u.col,a=$e(i,this.top+e+r,this.bottom-this.columnSizes[l].height)),u.top=a,u.left+=this.left+r,u.left=o.leftForLtr(o.x(u.left),u.width),a+=u.height+r}}isHorizontal(){return this.options.position==="top"||this.options.position==="bottom"}draw(){if(this.options.display){const e=this.ctx;ju(e,this),this._draw(),Bu(e)}}_draw(){const{options:e,columnSizes:n,lineWidths:i,ctx:r}=this,{align:s,labels:o}=e,l=oe.color,a=ai(e.rtl,this.left,this.width),u=ge(o.font),{padding:c}=o,f=u.size,d=f/2;let h;this.drawTitle(),r.textAlign=a.textAlign("left"),r.textBaseline="middle",r.lineWidth=.5,r.font=u.string;const{boxWidth:m,boxHeight:y,itemHeight:x}=Zf(o,f),p=function(k,S,b){if(isNaN(m)||m<=0||isNaN(y)||y<0)return;r.save();const O=F(b.lineWidth,1);if(r.fillStyle=F(b.fillStyle,l),r.lineCap=F(b.lineCap,"butt"),r.lineDashOffset=F(b.lineDashOffset,0),r.lineJoin=F(b.lineJoin,"miter"),r.lineWidth=O,r.strokeStyle=F(b.strokeStyle,l),r.setLineDash(F(b.lineDash,[])),o.usePointStyle){const P={radius:y*Math.SQRT2/2,pointStyle:b.pointStyle,rotation:b.rotation,borderWidth:O},D=a.xPlus(k,m/2),A=S+d;qp(r,P,D,A,o.pointStyleWidth&&m)}else{const P=S+Math.max((f-y)/2,0),D=a.leftForLtr(k,m),A=li(b.borderRadius);r.beginPath(),Object.values(A).some(le=>le!==0)?mo(r,{x:D,y:P,w:m,h:y,radius:A}):r.rect(D,P,m,y),r.fill(),O!==0&&r.stroke()}r.restore()},g=function(k,S,b){yi(r,b.text,k,S+x/2,u,{strikethrough:b.hidden,textAlign:a.textAlign(b.textAlign)})},v=this.isHorizontal(),_=this._computeTitleHeight();v?h={x:$e(s,this.left+c,this.right-i[0]),y:this.top+c+_,line:0}:h={x:this.left+c,y:$e(s,this.top+_+c,this.bottom-n[0].height),line:0},og(this.ctx,e.textDirection);const w=x+c;this.legendItems.forEach((k,S)=>{r.strokeStyle=k.fontColor,r.fillStyle=k.fontColor;const b=r.measureText(k.text).width,O=a.textAlign(k.textAlign||(k.textAlign=o.textAlign)),P=m+d+b;let D=h.x,A=h.y;a.setWidth(this.width),v?S>0&&D+P+c>this.right&&(A=h.y+=w,h.line++,D=h.x=$e(s,this.left+c,this.right-i[h.line])):S>0&&A+w>this.bottom&&(D=h.x=D+n[h.line].width+c,h.line++,A=h.y=$e(s,this.top+_+c,this.bottom-n[h.line].height));const le=a.x(D);if(p(le,A,k),D=Wy(O,D+m+d,v?D+P:this.right,e.rtl),g(a.x(D),A,k),v)h.x+=P+c;else if(typeof k.text!="string"){const Ae=u.lineHeight;h.y+=kg(k,Ae)}else h.y+=w}),lg(this.ctx,e.textDirection)}drawTitle(){const e=this.options,n=e.title,i=ge(n.font),r=Me(n.padding);if(!n.display)return;const s=ai(e.rtl,this.left,this.width),o=this.ctx,l=n.position,a=i.size/2,u=r.top+a;let c,f=this.left,d=this.width;if(this.isHorizontal())d=Math.max(...this.lineWidths),c=this.top+u,f=$e(e.align,f,this.right-d);else{const m=this.columnSizes.reduce((y,x)=>Math.max(y,x.height),0);c=u+$e(e.align,this.top,this.bottom-m-e.labels.padding-this._computeTitleHeight())}const h=$e(l,f,f+d);o.textAlign=s.textAlign(Xp(l)),o.textBaseline="middle",o.strokeStyle=n.color,o.fillStyle=n.color,o.font=i.string,yi(o,n.text,h,c,i)}_computeTitleHeight(){const e=this.options.title,n=ge(e.font),i=Me(e.padding);return e.display?n.lineHeight+i.height:0}_getLegendItemAt(e,n){let i,r,s;if(Hi(e,this.left,this.right)&&Hi(n,this.top,this.bottom)){for(s=this.legendHitBoxes,i=0;i<s.length;++i)if(r=s[i],Hi(e,r.left,r.left+r.width)&&Hi(n,r.top,r.top+r.height))return this.legendItems[i]}return null}handleEvent(e){const n=this.options;if(!T2(e.type,n))return;const i=this._getLegendItemAt(e.x,e.y);if(e.type==="mousemove"||e.type==="mouseout"){const r=this._hoveredItem,s=M2(r,i);r&&!s&&V(n.onLeave,[e,r,this],this),this._hoveredItem=i,i&&!s&&V(n.onHover,[e,i,this],this)}else i&&V(n.onClick,[e,i,this],this)}}function E2(t,e,n,i,r){const s=P2(i,t,e,n),o=L2(r,i,e.lineHeight);return{itemWidth:s,itemHeight:o}}function P2(t,e,n,i){let r=t.text;return r&&typeof r!="string"&&(r=r.reduce((s,o)=>s.length>o.length?s:o)),e+n.size/2+i.measureText(r).width}function L2(t,e,n){let i=t;return typeof e.text!="string"&&(i=kg(e,n)),i}function kg(t,e){const n=t.text?t.text.length+.5:0;return e*n}function T2(t,e){return!!((t==="mousemove"||t==="mouseout")&&(e.onHover||e.onLeave)||e.onClick&&(t==="click"||t==="mouseup"))}var O2={id:"legend",_element:qf,start(t,e,n){const i=t.legend=new qf({ctx:t.ctx,options:n,chart:t});Gt.configure(t,i,n),Gt.addBox(t,i)},stop(t){Gt.removeBox(t,t.legend),delete t.legend},beforeUpdate(t,e,n){const i=t.legend;Gt.configure(t,i,n),i.options=n},afterUpdate(t){const e=t.legend;e.buildLabels(),e.adjustHitBoxes()},afterEvent(t,e){e.replay||t.legend.handleEvent(e.event)},defaults:{display:!0,position:"top",align:"center",fullSize:!0,reverse:!1,weight:1e3,onClick(t,e,n){const i=e.datasetIndex,r=n.chart;r.isDatasetVisible(i)?(r.hide(i),e.hidden=!0):(r.show(i),e.hidden=!1)},onHover:null,onLeave:null,labels:{color:t=>t.chart.options.color,boxWidth:40,padding:10,generateLabels(t){const e=t.data.datasets,{labels:{usePointStyle:n,pointStyle:i,textAlign:r,color:s,useBorderRadius:o,borderRadius:l}}=t.legend.options;return t._getSortedDatasetMetas().map(a=>{const u=a.controller.getStyle(n?0:void 0),c=Me(u.borderWidth);return{text:e[a.index].label,fillStyle:u.backgroundColor,fontColor:s,hidden:!a.visible,lineCap:u.borderCapStyle,lineDash:u.borderDash,lineDashOffset:u.borderDashOffset,lineJoin:u.borderJoinStyle,lineWidth:(c.width+c.height)/4,strokeStyle:u.borderColor,pointStyle:i||u.pointStyle,rotation:u.rotation,textAlign:r||u.textAlign,borderRadius:o&&(l||u.borderRadius),datasetIndex:a.index}},this)}},title:{color:t=>t.chart.options.color,display:!1,position:"center",text:""}},descriptors:{_scriptable:t=>!t.startsWith("on"),labels:{_scriptable:t=>!["generateLabels","filter","sort"].includes(t)}}};const Ui={average(t){if(!t.length)return!1;let e,n,i=0,r=0,s=0;for(e=0,n=t.length;e<n;++e){const o=t[e].element;if(o&&o.hasValue()){const l=o.tooltipPosition();i+=l.x,r+=l.y,++s}}return{x:i/s,y:r/s}},nearest(t,e){if(!t.length)return!1;let n=e.x,i=e.y,r=Number.POSITIVE_INFINITY,s,o,l;for(s=0,o=t.length;s<o;++s){const a=t[s].element;if(a&&a.hasValue()){const u=a.getCenterPoint(),c=Ma(e,u);c<r&&(r=c,l=a)}}if(l){const a=l.tooltipPosition();n=a.x,i=a.y}return{x:n,y:i}}};function gt(t,e){return e&&(ie(e)?Array.prototype.push.apply(t,e):t.push(e)),t}function Ct(t){return(typeof t=="string"||t instanceof String)&&t.indexOf(`
 `)>-1?t.split(`
-`):t}function D2(t,e){const{element:n,datasetIndex:i,index:r}=e,s=t.getDatasetMeta(i).controller,{label:o,value:l}=s.getLabelAndValue(r);return{chart:t,label:o,parsed:s.getParsed(r),raw:t.data.datasets[i].data[r],formattedValue:l,dataset:s.getDataset(),dataIndex:r,datasetIndex:i,element:n}}function Jf(t,e){const n=t.chart.ctx,{body:i,footer:r,title:s}=t,{boxWidth:o,boxHeight:l}=e,a=ge(e.bodyFont),u=ge(e.titleFont),c=ge(e.footerFont),f=s.length,d=r.length,h=i.length,m=Me(e.padding);let y=m.height,x=0,p=i.reduce((_,w)=>_+w.before.length+w.lines.length+w.after.length,0);if(p+=t.beforeBody.length+t.afterBody.length,f&&(y+=f*u.lineHeight+(f-1)*e.titleSpacing+e.titleMarginBottom),p){const _=e.displayColors?Math.max(l,a.lineHeight):a.lineHeight;y+=h*_+(p-h)*a.lineHeight+(p-1)*e.bodySpacing}d&&(y+=e.footerMarginTop+d*c.lineHeight+(d-1)*e.footerSpacing);let g=0;const v=function(_){x=Math.max(x,n.measureText(_).width+g)};return n.save(),n.font=u.string,$(t.title,v),n.font=a.string,$(t.beforeBody.concat(t.afterBody),v),g=e.displayColors?o+2+e.boxPadding:0,$(i,_=>{$(_.before,v),$(_.lines,v),$(_.after,v)}),g=0,n.font=c.string,$(t.footer,v),n.restore(),x+=m.width,{width:x,height:y}}function z2(t,e){const{y:n,height:i}=e;return n<i/2?"top":n>t.height-i/2?"bottom":"center"}function N2(t,e,n,i){const{x:r,width:s}=i,o=n.caretSize+n.caretPadding;if(t==="left"&&r+s+o>e.width||t==="right"&&r-s-o<0)return!0}function I2(t,e,n,i){const{x:r,width:s}=n,{width:o,chartArea:{left:l,right:a}}=t;let u="center";return i==="center"?u=r<=(l+a)/2?"left":"right":r<=s/2?u="left":r>=o-s/2&&(u="right"),N2(u,t,e,n)&&(u="center"),u}function ed(t,e,n){const i=n.yAlign||e.yAlign||z2(t,n);return{xAlign:n.xAlign||e.xAlign||I2(t,e,n,i),yAlign:i}}function R2(t,e){let{x:n,width:i}=t;return e==="right"?n-=i:e==="center"&&(n-=i/2),n}function F2(t,e,n){let{y:i,height:r}=t;return e==="top"?i+=n:e==="bottom"?i-=r+n:i-=r/2,i}function td(t,e,n,i){const{caretSize:r,caretPadding:s,cornerRadius:o}=t,{xAlign:l,yAlign:a}=n,u=r+s,{topLeft:c,topRight:f,bottomLeft:d,bottomRight:h}=li(o);let m=R2(e,l);const y=F2(e,a,u);return a==="center"?l==="left"?m+=u:l==="right"&&(m-=u):l==="left"?m-=Math.max(c,d)+r:l==="right"&&(m+=Math.max(f,h)+r),{x:Je(m,0,i.width-e.width),y:Je(y,0,i.height-e.height)}}function ms(t,e,n){const i=Me(n.padding);return e==="center"?t.x+t.width/2:e==="right"?t.x+t.width-i.right:t.x+i.left}function nd(t){return gt([],Ct(t))}function A2(t,e,n){return gn(t,{tooltip:e,tooltipItems:n,type:"tooltip"})}function id(t,e){const n=e&&e.dataset&&e.dataset.tooltip&&e.dataset.tooltip.callbacks;return n?t.override(n):t}const Sg={beforeTitle:St,title(t){if(t.length>0){const e=t[0],n=e.chart.data.labels,i=n?n.length:0;if(this&&this.options&&this.options.mode==="dataset")return e.dataset.label||"";if(e.label)return e.label;if(i>0&&e.dataIndex<i)return n[e.dataIndex]}return""},afterTitle:St,beforeBody:St,beforeLabel:St,label(t){if(this&&this.options&&this.options.mode==="dataset")return t.label+": "+t.formattedValue||t.formattedValue;let e=t.dataset.label||"";e&&(e+=": ");const n=t.formattedValue;return X(n)||(e+=n),e},labelColor(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{borderColor:n.borderColor,backgroundColor:n.backgroundColor,borderWidth:n.borderWidth,borderDash:n.borderDash,borderDashOffset:n.borderDashOffset,borderRadius:0}},labelTextColor(){return this.options.bodyColor},labelPointStyle(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{pointStyle:n.pointStyle,rotation:n.rotation}},afterLabel:St,afterBody:St,beforeFooter:St,footer:St,afterFooter:St};function Le(t,e,n,i){const r=t[e].call(n,i);return typeof r>"u"?Sg[e].call(n,i):r}class Oa extends cn{constructor(e){super(),this.opacity=0,this._active=[],this._eventPosition=void 0,this._size=void 0,this._cachedAnimations=void 0,this._tooltipItems=[],this.$animations=void 0,this.$context=void 0,this.chart=e.chart,this.options=e.options,this.dataPoints=void 0,this.title=void 0,this.beforeBody=void 0,this.body=void 0,this.afterBody=void 0,this.footer=void 0,this.xAlign=void 0,this.yAlign=void 0,this.x=void 0,this.y=void 0,this.height=void 0,this.width=void 0,this.caretX=void 0,this.caretY=void 0,this.labelColors=void 0,this.labelPointStyles=void 0,this.labelTextColors=void 0}initialize(e){this.options=e,this._cachedAnimations=void 0,this.$context=void 0}_resolveAnimations(){const e=this._cachedAnimations;if(e)return e;const n=this.chart,i=this.options.setContext(this.getContext()),r=i.enabled&&n.options.animation&&i.animations,s=new ug(this.chart,r);return r._cacheable&&(this._cachedAnimations=Object.freeze(s)),s}getContext(){return this.$context||(this.$context=A2(this.chart.getContext(),this,this._tooltipItems))}getTitle(e,n){const{callbacks:i}=n,r=Le(i,"beforeTitle",this,e),s=Le(i,"title",this,e),o=Le(i,"afterTitle",this,e);let l=[];return l=gt(l,Ct(r)),l=gt(l,Ct(s)),l=gt(l,Ct(o)),l}getBeforeBody(e,n){return nd(Le(n.callbacks,"beforeBody",this,e))}getBody(e,n){const{callbacks:i}=n,r=[];return $(e,s=>{const o={before:[],lines:[],after:[]},l=id(i,s);gt(o.before,Ct(Le(l,"beforeLabel",this,s))),gt(o.lines,Le(l,"label",this,s)),gt(o.after,Ct(Le(l,"afterLabel",this,s))),r.push(o)}),r}getAfterBody(e,n){return nd(Le(n.callbacks,"afterBody",this,e))}getFooter(e,n){const{callbacks:i}=n,r=Le(i,"beforeFooter",this,e),s=Le(i,"footer",this,e),o=Le(i,"afterFooter",this,e);let l=[];return l=gt(l,Ct(r)),l=gt(l,Ct(s)),l=gt(l,Ct(o)),l}_createItems(e){const n=this._active,i=this.chart.data,r=[],s=[],o=[];let l=[],a,u;for(a=0,u=n.length;a<u;++a)l.push(D2(this.chart,n[a]));return e.filter&&(l=l.filter((c,f,d)=>e.filter(c,f,d,i))),e.itemSort&&(l=l.sort((c,f)=>e.itemSort(c,f,i))),$(l,c=>{const f=id(e.callbacks,c);r.push(Le(f,"labelColor",this,c)),s.push(Le(f,"labelPointStyle",this,c)),o.push(Le(f,"labelTextColor",this,c))}),this.labelColors=r,this.labelPointStyles=s,this.labelTextColors=o,this.dataPoints=l,l}update(e,n){const i=this.options.setContext(this.getContext()),r=this._active;let s,o=[];if(!r.length)this.opacity!==0&&(s={opacity:0});else{const l=Ui[i.position].call(this,r,this._eventPosition);o=this._createItems(i),this.title=this.getTitle(o,i),this.beforeBody=this.getBeforeBody(o,i),this.body=this.getBody(o,i),this.afterBody=this.getAfterBody(o,i),this.footer=this.getFooter(o,i);const a=this._size=Jf(this,i),u=Object.assign({},l,a),c=ed(this.chart,i,u),f=td(i,u,c,this.chart);this.xAlign=c.xAlign,this.yAlign=c.yAlign,s={opacity:1,x:f.x,y:f.y,width:a.width,height:a.height,caretX:l.x,caretY:l.y}}this._tooltipItems=o,this.$context=void 0,s&&this._resolveAnimations().update(this,s),e&&i.external&&i.external.call(this,{chart:this.chart,tooltip:this,replay:n})}drawCaret(e,n,i,r){const s=this.getCaretPosition(e,i,r);n.lineTo(s.x1,s.y1),n.lineTo(s.x2,s.y2),n.lineTo(s.x3,s.y3)}getCaretPosition(e,n,i){const{xAlign:r,yAlign:s}=this,{caretSize:o,cornerRadius:l}=i,{topLeft:a,topRight:u,bottomLeft:c,bottomRight:f}=li(l),{x:d,y:h}=e,{width:m,height:y}=n;let x,p,g,v,_,w;return s==="center"?(_=h+y/2,r==="left"?(x=d,p=x-o,v=_+o,w=_-o):(x=d+m,p=x+o,v=_-o,w=_+o),g=x):(r==="left"?p=d+Math.max(a,c)+o:r==="right"?p=d+m-Math.max(u,f)-o:p=this.caretX,s==="top"?(v=h,_=v-o,x=p-o,g=p+o):(v=h+y,_=v+o,x=p+o,g=p-o),w=v),{x1:x,x2:p,x3:g,y1:v,y2:_,y3:w}}drawTitle(e,n,i){const r=this.title,s=r.length;let o,l,a;if(s){const u=ai(i.rtl,this.x,this.width);for(e.x=ms(this,i.titleAlign,i),n.textAlign=u.textAlign(i.titleAlign),n.textBaseline="middle",o=ge(i.titleFont),l=i.titleSpacing,n.fillStyle=i.titleColor,n.font=o.string,a=0;a<s;++a)n.fillText(r[a],u.x(e.x),e.y+o.lineHeight/2),e.y+=o.lineHeight+l,a+1===s&&(e.y+=i.titleMarginBottom-l)}}_drawColorBox(e,n,i,r,s){const o=this.labelColors[i],l=this.labelPointStyles[i],{boxHeight:a,boxWidth:u,boxPadding:c}=s,f=ge(s.bodyFont),d=ms(this,"left",s),h=r.x(d),m=a<f.lineHeight?(f.lineHeight-a)/2:0,y=n.y+m;if(s.usePointStyle){const x={radius:Math.min(u,a)/2,pointStyle:l.pointStyle,rotation:l.rotation,borderWidth:1},p=r.leftForLtr(h,u)+u/2,g=y+a/2;e.strokeStyle=s.multiKeyBackground,e.fillStyle=s.multiKeyBackground,Pa(e,x,p,g),e.strokeStyle=o.borderColor,e.fillStyle=o.backgroundColor,Pa(e,x,p,g)}else{e.lineWidth=B(o.borderWidth)?Math.max(...Object.values(o.borderWidth)):o.borderWidth||1,e.strokeStyle=o.borderColor,e.setLineDash(o.borderDash||[]),e.lineDashOffset=o.borderDashOffset||0;const x=r.leftForLtr(h,u-c),p=r.leftForLtr(r.xPlus(h,1),u-c-2),g=li(o.borderRadius);Object.values(g).some(v=>v!==0)?(e.beginPath(),e.fillStyle=s.multiKeyBackground,mo(e,{x,y,w:u,h:a,radius:g}),e.fill(),e.stroke(),e.fillStyle=o.backgroundColor,e.beginPath(),mo(e,{x:p,y:y+1,w:u-2,h:a-2,radius:g}),e.fill()):(e.fillStyle=s.multiKeyBackground,e.fillRect(x,y,u,a),e.strokeRect(x,y,u,a),e.fillStyle=o.backgroundColor,e.fillRect(p,y+1,u-2,a-2))}e.fillStyle=this.labelTextColors[i]}drawBody(e,n,i){const{body:r}=this,{bodySpacing:s,bodyAlign:o,displayColors:l,boxHeight:a,boxWidth:u,boxPadding:c}=i,f=ge(i.bodyFont);let d=f.lineHeight,h=0;const m=ai(i.rtl,this.x,this.width),y=function(b){n.fillText(b,m.x(e.x+h),e.y+d/2),e.y+=d+s},x=m.textAlign(o);let p,g,v,_,w,k,S;for(n.textAlign=o,n.textBaseline="middle",n.font=f.string,e.x=ms(this,x,i),n.fillStyle=i.bodyColor,$(this.beforeBody,y),h=l&&x!=="right"?o==="center"?u/2+c:u+2+c:0,_=0,k=r.length;_<k;++_){for(p=r[_],g=this.labelTextColors[_],n.fillStyle=g,$(p.before,y),v=p.lines,l&&v.length&&(this._drawColorBox(n,e,_,m,i),d=Math.max(f.lineHeight,a)),w=0,S=v.length;w<S;++w)y(v[w]),d=f.lineHeight;$(p.after,y)}h=0,d=f.lineHeight,$(this.afterBody,y),e.y-=s}drawFooter(e,n,i){const r=this.footer,s=r.length;let o,l;if(s){const a=ai(i.rtl,this.x,this.width);for(e.x=ms(this,i.footerAlign,i),e.y+=i.footerMarginTop,n.textAlign=a.textAlign(i.footerAlign),n.textBaseline="middle",o=ge(i.footerFont),n.fillStyle=i.footerColor,n.font=o.string,l=0;l<s;++l)n.fillText(r[l],a.x(e.x),e.y+o.lineHeight/2),e.y+=o.lineHeight+i.footerSpacing}}drawBackground(e,n,i,r){const{xAlign:s,yAlign:o}=this,{x:l,y:a}=e,{width:u,height:c}=i,{topLeft:f,topRight:d,bottomLeft:h,bottomRight:m}=li(r.cornerRadius);n.fillStyle=r.backgroundColor,n.strokeStyle=r.borderColor,n.lineWidth=r.borderWidth,n.beginPath(),n.moveTo(l+f,a),o==="top"&&this.drawCaret(e,n,i,r),n.lineTo(l+u-d,a),n.quadraticCurveTo(l+u,a,l+u,a+d),o==="center"&&s==="right"&&this.drawCaret(e,n,i,r),n.lineTo(l+u,a+c-m),n.quadraticCurveTo(l+u,a+c,l+u-m,a+c),o==="bottom"&&this.drawCaret(e,n,i,r),n.lineTo(l+h,a+c),n.quadraticCurveTo(l,a+c,l,a+c-h),o==="center"&&s==="left"&&this.drawCaret(e,n,i,r),n.lineTo(l,a+f),n.quadraticCurveTo(l,a,l+f,a),n.closePath(),n.fill(),r.borderWidth>0&&n.stroke()}_updateAnimationTarget(e){const n=this.chart,i=this.$animations,r=i&&i.x,s=i&&i.y;if(r||s){const o=Ui[e.position].call(this,this._active,this._eventPosition);if(!o)return;const l=this._size=Jf(this,e),a=Object.assign({},o,this._size),u=ed(n,e,a),c=td(e,a,u,n);(r._to!==c.x||s._to!==c.y)&&(this.xAlign=u.xAlign,this.yAlign=u.yAlign,this.width=l.width,this.height=l.height,this.caretX=o.x,this.caretY=o.y,this._resolveAnimations().update(this,c))}}_willRender(){return!!this.opacity}draw(e){const n=this.options.setContext(this.getContext());let i=this.opacity;if(!i)return;this._updateAnimationTarget(n);const r={width:this.width,height:this.height},s={x:this.x,y:this.y};i=Math.abs(i)<.001?0:i;const o=Me(n.padding),l=this.title.length||this.beforeBody.length||this.body.length||this.afterBody.length||this.footer.length;n.enabled&&l&&(e.save(),e.globalAlpha=i,this.drawBackground(s,e,r,n),og(e,n.textDirection),s.y+=o.top,this.drawTitle(s,e,n),this.drawBody(s,e,n),this.drawFooter(s,e,n),lg(e,n.textDirection),e.restore())}getActiveElements(){return this._active||[]}setActiveElements(e,n){const i=this._active,r=e.map(({datasetIndex:l,index:a})=>{const u=this.chart.getDatasetMeta(l);if(!u)throw new Error("Cannot find a dataset at index "+l);return{datasetIndex:l,element:u.data[a],index:a}}),s=!co(i,r),o=this._positionChanged(r,n);(s||o)&&(this._active=r,this._eventPosition=n,this._ignoreReplayEvents=!0,this.update(!0))}handleEvent(e,n,i=!0){if(n&&this._ignoreReplayEvents)return!1;this._ignoreReplayEvents=!1;const r=this.options,s=this._active||[],o=this._getActiveElements(e,s,n,i),l=this._positionChanged(o,e),a=n||!co(o,s)||l;return a&&(this._active=o,(r.enabled||r.external)&&(this._eventPosition={x:e.x,y:e.y},this.update(!0,n))),a}_getActiveElements(e,n,i,r){const s=this.options;if(e.type==="mouseout")return[];if(!r)return n;const o=this.chart.getElementsAtEventForMode(e,s.mode,s,i);return s.reverse&&o.reverse(),o}_positionChanged(e,n){const{caretX:i,caretY:r,options:s}=this,o=Ui[s.position].call(this,e,n);return o!==!1&&(i!==o.x||r!==o.y)}}I(Oa,"positioners",Ui);var j2={id:"tooltip",_element:Oa,positioners:Ui,afterInit(t,e,n){n&&(t.tooltip=new Oa({chart:t,options:n}))},beforeUpdate(t,e,n){t.tooltip&&t.tooltip.initialize(n)},reset(t,e,n){t.tooltip&&t.tooltip.initialize(n)},afterDraw(t){const e=t.tooltip;if(e&&e._willRender()){const n={tooltip:e};if(t.notifyPlugins("beforeTooltipDraw",{...n,cancelable:!0})===!1)return;e.draw(t.ctx),t.notifyPlugins("afterTooltipDraw",n)}},afterEvent(t,e){if(t.tooltip){const n=e.replay;t.tooltip.handleEvent(e.event,n,e.inChartArea)&&(e.changed=!0)}},defaults:{enabled:!0,external:null,position:"average",backgroundColor:"rgba(0,0,0,0.8)",titleColor:"#fff",titleFont:{weight:"bold"},titleSpacing:2,titleMarginBottom:6,titleAlign:"left",bodyColor:"#fff",bodySpacing:2,bodyFont:{},bodyAlign:"left",footerColor:"#fff",footerSpacing:2,footerMarginTop:6,footerFont:{weight:"bold"},footerAlign:"left",padding:6,caretPadding:2,caretSize:5,cornerRadius:6,boxHeight:(t,e)=>e.bodyFont.size,boxWidth:(t,e)=>e.bodyFont.size,multiKeyBackground:"#fff",displayColors:!0,boxPadding:0,borderColor:"rgba(0,0,0,0)",borderWidth:0,animation:{duration:400,easing:"easeOutQuart"},animations:{numbers:{type:"number",properties:["x","y","width","height","caretX","caretY"]},opacity:{easing:"linear",duration:200}},callbacks:Sg},defaultRoutes:{bodyFont:"font",footerFont:"font",titleFont:"font"},descriptors:{_scriptable:t=>t!=="filter"&&t!=="itemSort"&&t!=="external",_indexable:!1,callbacks:{_scriptable:!1,_indexable:!1},animation:{_fallback:!1},animations:{_fallback:"animation"}},additionalOptionScopes:["interaction"]};const B2=(t,e,n,i)=>(typeof e=="string"?(n=t.push(e)-1,i.unshift({index:n,label:e})):isNaN(e)&&(n=null),n);function $2(t,e,n,i){const r=t.indexOf(e);if(r===-1)return B2(t,e,n,i);const s=t.lastIndexOf(e);return r!==s?n:r}const H2=(t,e)=>t===null?null:Je(Math.round(t),0,e);function rd(t){const e=this.getLabels();return t>=0&&t<e.length?e[t]:t}class Da extends Bn{constructor(e){super(e),this._startValue=void 0,this._valueRange=0,this._addedLabels=[]}init(e){const n=this._addedLabels;if(n.length){const i=this.getLabels();for(const{index:r,label:s}of n)i[r]===s&&i.splice(r,1);this._addedLabels=[]}super.init(e)}parse(e,n){if(X(e))return null;const i=this.getLabels();return n=isFinite(n)&&i[n]===e?n:$2(i,e,F(n,e),this._addedLabels),H2(n,i.length-1)}determineDataLimits(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let{min:i,max:r}=this.getMinMax(!0);this.options.bounds==="ticks"&&(e||(i=0),n||(r=this.getLabels().length-1)),this.min=i,this.max=r}buildTicks(){const e=this.min,n=this.max,i=this.options.offset,r=[];let s=this.getLabels();s=e===0&&n===s.length-1?s:s.slice(e,n+1),this._valueRange=Math.max(s.length-(i?0:1),1),this._startValue=this.min-(i?.5:0);for(let o=e;o<=n;o++)r.push({value:o});return r}getLabelForValue(e){return rd.call(this,e)}configure(){super.configure(),this.isHorizontal()||(this._reversePixels=!this._reversePixels)}getPixelForValue(e){return typeof e!="number"&&(e=this.parse(e)),e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getPixelForTick(e){const n=this.ticks;return e<0||e>n.length-1?null:this.getPixelForValue(n[e].value)}getValueForPixel(e){return Math.round(this._startValue+this.getDecimalForPixel(e)*this._valueRange)}getBasePixel(){return this.bottom}}I(Da,"id","category"),I(Da,"defaults",{ticks:{callback:rd}});function W2(t,e){const n=[],{bounds:r,step:s,min:o,max:l,precision:a,count:u,maxTicks:c,maxDigits:f,includeBounds:d}=t,h=s||1,m=c-1,{min:y,max:x}=e,p=!X(o),g=!X(l),v=!X(u),_=(x-y)/(f+1);let w=df((x-y)/m/h)*h,k,S,b,O;if(w<1e-14&&!p&&!g)return[{value:y},{value:x}];O=Math.ceil(x/w)-Math.floor(y/w),O>m&&(w=df(O*w/m/h)*h),X(a)||(k=Math.pow(10,a),w=Math.ceil(w*k)/k),r==="ticks"?(S=Math.floor(y/w)*w,b=Math.ceil(x/w)*w):(S=y,b=x),p&&g&&s&&Ny((l-o)/s,w/1e3)?(O=Math.round(Math.min((l-o)/w,c)),w=(l-o)/O,S=o,b=l):v?(S=p?o:S,b=g?l:b,O=u-1,w=(b-S)/O):(O=(b-S)/w,nr(O,Math.round(O),w/1e3)?O=Math.round(O):O=Math.ceil(O));const P=Math.max(hf(w),hf(S));k=Math.pow(10,X(a)?P:a),S=Math.round(S*k)/k,b=Math.round(b*k)/k;let D=0;for(p&&(d&&S!==o?(n.push({value:o}),S<o&&D++,nr(Math.round((S+D*w)*k)/k,o,sd(o,_,t))&&D++):S<o&&D++);D<O;++D)n.push({value:Math.round((S+D*w)*k)/k});return g&&d&&b!==l?n.length&&nr(n[n.length-1].value,l,sd(l,_,t))?n[n.length-1].value=l:n.push({value:l}):(!g||b===l)&&n.push({value:b}),n}function sd(t,e,{horizontal:n,minRotation:i}){const r=Xt(i),s=(n?Math.sin(r):Math.cos(r))||.001,o=.75*e*(""+t).length;return Math.min(e/s,o)}class _o extends Bn{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._endValue=void 0,this._valueRange=0}parse(e,n){return X(e)||(typeof e=="number"||e instanceof Number)&&!isFinite(+e)?null:+e}handleTickRangeOptions(){const{beginAtZero:e}=this.options,{minDefined:n,maxDefined:i}=this.getUserBounds();let{min:r,max:s}=this;const o=a=>r=n?r:a,l=a=>s=i?s:a;if(e){const a=mi(r),u=mi(s);a<0&&u<0?l(0):a>0&&u>0&&o(0)}if(r===s){let a=s===0?1:Math.abs(s*.05);l(s+a),e||o(r-a)}this.min=r,this.max=s}getTickLimit(){const e=this.options.ticks;let{maxTicksLimit:n,stepSize:i}=e,r;return i?(r=Math.ceil(this.max/i)-Math.floor(this.min/i)+1,r>1e3&&(console.warn(`scales.${this.id}.ticks.stepSize: ${i} would result generating up to ${r} ticks. Limiting to 1000.`),r=1e3)):(r=this.computeTickLimit(),n=n||11),n&&(r=Math.min(n,r)),r}computeTickLimit(){return Number.POSITIVE_INFINITY}buildTicks(){const e=this.options,n=e.ticks;let i=this.getTickLimit();i=Math.max(2,i);const r={maxTicks:i,bounds:e.bounds,min:e.min,max:e.max,precision:n.precision,step:n.stepSize,count:n.count,maxDigits:this._maxDigits(),horizontal:this.isHorizontal(),minRotation:n.minRotation||0,includeBounds:n.includeBounds!==!1},s=this._range||this,o=W2(r,s);return e.bounds==="ticks"&&Vp(o,this,"value"),e.reverse?(o.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),o}configure(){const e=this.ticks;let n=this.min,i=this.max;if(super.configure(),this.options.offset&&e.length){const r=(i-n)/Math.max(e.length-1,1)/2;n-=r,i+=r}this._startValue=n,this._endValue=i,this._valueRange=i-n}getLabelForValue(e){return Au(e,this.chart.options.locale,this.options.ticks.format)}}class za extends _o{determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=de(e)?e:0,this.max=de(n)?n:1,this.handleTickRangeOptions()}computeTickLimit(){const e=this.isHorizontal(),n=e?this.width:this.height,i=Xt(this.options.ticks.minRotation),r=(e?Math.sin(i):Math.cos(i))||.001,s=this._resolveTickFontOptions(0);return Math.ceil(n/Math.min(40,s.lineHeight/r))}getPixelForValue(e){return e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getValueForPixel(e){return this._startValue+this.getDecimalForPixel(e)*this._valueRange}}I(za,"id","linear"),I(za,"defaults",{ticks:{callback:$o.formatters.numeric}});const Or=t=>Math.floor(Kt(t)),xn=(t,e)=>Math.pow(10,Or(t)+e);function od(t){return t/Math.pow(10,Or(t))===1}function ld(t,e,n){const i=Math.pow(10,n),r=Math.floor(t/i);return Math.ceil(e/i)-r}function V2(t,e){const n=e-t;let i=Or(n);for(;ld(t,e,i)>10;)i++;for(;ld(t,e,i)<10;)i--;return Math.min(i,Or(t))}function U2(t,{min:e,max:n}){e=He(t.min,e);const i=[],r=Or(e);let s=V2(e,n),o=s<0?Math.pow(10,Math.abs(s)):1;const l=Math.pow(10,s),a=r>s?Math.pow(10,r):0,u=Math.round((e-a)*o)/o,c=Math.floor((e-a)/l/10)*l*10;let f=Math.floor((u-c)/Math.pow(10,s)),d=He(t.min,Math.round((a+c+f*Math.pow(10,s))*o)/o);for(;d<n;)i.push({value:d,major:od(d),significand:f}),f>=10?f=f<15?15:20:f++,f>=20&&(s++,f=2,o=s>=0?1:o),d=Math.round((a+c+f*Math.pow(10,s))*o)/o;const h=He(t.max,d);return i.push({value:h,major:od(h),significand:f}),i}class ad extends Bn{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._valueRange=0}parse(e,n){const i=_o.prototype.parse.apply(this,[e,n]);if(i===0){this._zero=!0;return}return de(i)&&i>0?i:null}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=de(e)?Math.max(0,e):null,this.max=de(n)?Math.max(0,n):null,this.options.beginAtZero&&(this._zero=!0),this._zero&&this.min!==this._suggestedMin&&!de(this._userMin)&&(this.min=e===xn(this.min,0)?xn(this.min,-1):xn(this.min,0)),this.handleTickRangeOptions()}handleTickRangeOptions(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let i=this.min,r=this.max;const s=l=>i=e?i:l,o=l=>r=n?r:l;i===r&&(i<=0?(s(1),o(10)):(s(xn(i,-1)),o(xn(r,1)))),i<=0&&s(xn(r,-1)),r<=0&&o(xn(i,1)),this.min=i,this.max=r}buildTicks(){const e=this.options,n={min:this._userMin,max:this._userMax},i=U2(n,this);return e.bounds==="ticks"&&Vp(i,this,"value"),e.reverse?(i.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),i}getLabelForValue(e){return e===void 0?"0":Au(e,this.chart.options.locale,this.options.ticks.format)}configure(){const e=this.min;super.configure(),this._startValue=Kt(e),this._valueRange=Kt(this.max)-Kt(e)}getPixelForValue(e){return(e===void 0||e===0)&&(e=this.min),e===null||isNaN(e)?NaN:this.getPixelForDecimal(e===this.min?0:(Kt(e)-this._startValue)/this._valueRange)}getValueForPixel(e){const n=this.getDecimalForPixel(e);return Math.pow(10,this._startValue+n*this._valueRange)}}I(ad,"id","logarithmic"),I(ad,"defaults",{ticks:{callback:$o.formatters.logarithmic,major:{enabled:!0}}});function Na(t){const e=t.ticks;if(e.display&&t.display){const n=Me(e.backdropPadding);return F(e.font&&e.font.size,oe.font.size)+n.height}return 0}function Y2(t,e,n){return n=ie(n)?n:[n],{w:tv(t,e.string,n),h:n.length*e.lineHeight}}function ud(t,e,n,i,r){return t===i||t===r?{start:e-n/2,end:e+n/2}:t<i||t>r?{start:e-n,end:e}:{start:e,end:e+n}}function Q2(t){const e={l:t.left+t._padding.left,r:t.right-t._padding.right,t:t.top+t._padding.top,b:t.bottom-t._padding.bottom},n=Object.assign({},e),i=[],r=[],s=t._pointLabels.length,o=t.options.pointLabels,l=o.centerPointLabels?ve/s:0;for(let a=0;a<s;a++){const u=o.setContext(t.getPointLabelContext(a));r[a]=u.padding;const c=t.getPointPosition(a,t.drawingArea+r[a],l),f=ge(u.font),d=Y2(t.ctx,f,t._pointLabels[a]);i[a]=d;const h=lt(t.getIndexAngle(a)+l),m=Math.round(Ru(h)),y=ud(m,c.x,d.w,0,180),x=ud(m,c.y,d.h,90,270);K2(n,e,h,y,x)}t.setCenterPoint(e.l-n.l,n.r-e.r,e.t-n.t,n.b-e.b),t._pointLabelItems=X2(t,i,r)}function K2(t,e,n,i,r){const s=Math.abs(Math.sin(n)),o=Math.abs(Math.cos(n));let l=0,a=0;i.start<e.l?(l=(e.l-i.start)/s,t.l=Math.min(t.l,e.l-l)):i.end>e.r&&(l=(i.end-e.r)/s,t.r=Math.max(t.r,e.r+l)),r.start<e.t?(a=(e.t-r.start)/o,t.t=Math.min(t.t,e.t-a)):r.end>e.b&&(a=(r.end-e.b)/o,t.b=Math.max(t.b,e.b+a))}function X2(t,e,n){const i=[],r=t._pointLabels.length,s=t.options,o=Na(s)/2,l=t.drawingArea,a=s.pointLabels.centerPointLabels?ve/r:0;for(let u=0;u<r;u++){const c=t.getPointPosition(u,l+o+n[u],a),f=Math.round(Ru(lt(c.angle+Ne))),d=e[u],h=q2(c.y,d.h,f),m=G2(f),y=Z2(c.x,d.w,m);i.push({x:c.x,y:h,textAlign:m,left:y,top:h,right:y+d.w,bottom:h+d.h})}return i}function G2(t){return t===0||t===180?"center":t<180?"left":"right"}function Z2(t,e,n){return n==="right"?t-=e:n==="center"&&(t-=e/2),t}function q2(t,e,n){return n===90||n===270?t-=e/2:(n>270||n<90)&&(t-=e),t}function J2(t,e){const{ctx:n,options:{pointLabels:i}}=t;for(let r=e-1;r>=0;r--){const s=i.setContext(t.getPointLabelContext(r)),o=ge(s.font),{x:l,y:a,textAlign:u,left:c,top:f,right:d,bottom:h}=t._pointLabelItems[r],{backdropColor:m}=s;if(!X(m)){const y=li(s.borderRadius),x=Me(s.backdropPadding);n.fillStyle=m;const p=c-x.left,g=f-x.top,v=d-c+x.width,_=h-f+x.height;Object.values(y).some(w=>w!==0)?(n.beginPath(),mo(n,{x:p,y:g,w:v,h:_,radius:y}),n.fill()):n.fillRect(p,g,v,_)}yi(n,t._pointLabels[r],l,a+o.lineHeight/2,o,{color:s.color,textAlign:u,textBaseline:"middle"})}}function bg(t,e,n,i){const{ctx:r}=t;if(n)r.arc(t.xCenter,t.yCenter,e,0,tt);else{let s=t.getPointPosition(0,e);r.moveTo(s.x,s.y);for(let o=1;o<i;o++)s=t.getPointPosition(o,e),r.lineTo(s.x,s.y)}}function e_(t,e,n,i,r){const s=t.ctx,o=e.circular,{color:l,lineWidth:a}=e;!o&&!i||!l||!a||n<0||(s.save(),s.strokeStyle=l,s.lineWidth=a,s.setLineDash(r.dash),s.lineDashOffset=r.dashOffset,s.beginPath(),bg(t,n,o,i),s.closePath(),s.stroke(),s.restore())}function t_(t,e,n){return gn(t,{label:n,index:e,type:"pointLabel"})}class ys extends _o{constructor(e){super(e),this.xCenter=void 0,this.yCenter=void 0,this.drawingArea=void 0,this._pointLabels=[],this._pointLabelItems=[]}setDimensions(){const e=this._padding=Me(Na(this.options)/2),n=this.width=this.maxWidth-e.width,i=this.height=this.maxHeight-e.height;this.xCenter=Math.floor(this.left+n/2+e.left),this.yCenter=Math.floor(this.top+i/2+e.top),this.drawingArea=Math.floor(Math.min(n,i)/2)}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!1);this.min=de(e)&&!isNaN(e)?e:0,this.max=de(n)&&!isNaN(n)?n:0,this.handleTickRangeOptions()}computeTickLimit(){return Math.ceil(this.drawingArea/Na(this.options))}generateTickLabels(e){_o.prototype.generateTickLabels.call(this,e),this._pointLabels=this.getLabels().map((n,i)=>{const r=V(this.options.pointLabels.callback,[n,i],this);return r||r===0?r:""}).filter((n,i)=>this.chart.getDataVisibility(i))}fit(){const e=this.options;e.display&&e.pointLabels.display?Q2(this):this.setCenterPoint(0,0,0,0)}setCenterPoint(e,n,i,r){this.xCenter+=Math.floor((e-n)/2),this.yCenter+=Math.floor((i-r)/2),this.drawingArea-=Math.min(this.drawingArea/2,Math.max(e,n,i,r))}getIndexAngle(e){const n=tt/(this._pointLabels.length||1),i=this.options.startAngle||0;return lt(e*n+Xt(i))}getDistanceFromCenterForValue(e){if(X(e))return NaN;const n=this.drawingArea/(this.max-this.min);return this.options.reverse?(this.max-e)*n:(e-this.min)*n}getValueForDistanceFromCenter(e){if(X(e))return NaN;const n=e/(this.drawingArea/(this.max-this.min));return this.options.reverse?this.max-n:this.min+n}getPointLabelContext(e){const n=this._pointLabels||[];if(e>=0&&e<n.length){const i=n[e];return t_(this.getContext(),e,i)}}getPointPosition(e,n,i=0){const r=this.getIndexAngle(e)-Ne+i;return{x:Math.cos(r)*n+this.xCenter,y:Math.sin(r)*n+this.yCenter,angle:r}}getPointPositionForValue(e,n){return this.getPointPosition(e,this.getDistanceFromCenterForValue(n))}getBasePosition(e){return this.getPointPositionForValue(e||0,this.getBaseValue())}getPointLabelPosition(e){const{left:n,top:i,right:r,bottom:s}=this._pointLabelItems[e];return{left:n,top:i,right:r,bottom:s}}drawBackground(){const{backgroundColor:e,grid:{circular:n}}=this.options;if(e){const i=this.ctx;i.save(),i.beginPath(),bg(this,this.getDistanceFromCenterForValue(this._endValue),n,this._pointLabels.length),i.closePath(),i.fillStyle=e,i.fill(),i.restore()}}drawGrid(){const e=this.ctx,n=this.options,{angleLines:i,grid:r,border:s}=n,o=this._pointLabels.length;let l,a,u;if(n.pointLabels.display&&J2(this,o),r.display&&this.ticks.forEach((c,f)=>{if(f!==0){a=this.getDistanceFromCenterForValue(c.value);const d=this.getContext(f),h=r.setContext(d),m=s.setContext(d);e_(this,h,a,o,m)}}),i.display){for(e.save(),l=o-1;l>=0;l--){const c=i.setContext(this.getPointLabelContext(l)),{color:f,lineWidth:d}=c;!d||!f||(e.lineWidth=d,e.strokeStyle=f,e.setLineDash(c.borderDash),e.lineDashOffset=c.borderDashOffset,a=this.getDistanceFromCenterForValue(n.ticks.reverse?this.min:this.max),u=this.getPointPosition(l,a),e.beginPath(),e.moveTo(this.xCenter,this.yCenter),e.lineTo(u.x,u.y),e.stroke())}e.restore()}}drawBorder(){}drawLabels(){const e=this.ctx,n=this.options,i=n.ticks;if(!i.display)return;const r=this.getIndexAngle(0);let s,o;e.save(),e.translate(this.xCenter,this.yCenter),e.rotate(r),e.textAlign="center",e.textBaseline="middle",this.ticks.forEach((l,a)=>{if(a===0&&!n.reverse)return;const u=i.setContext(this.getContext(a)),c=ge(u.font);if(s=this.getDistanceFromCenterForValue(this.ticks[a].value),u.showLabelBackdrop){e.font=c.string,o=e.measureText(l.label).width,e.fillStyle=u.backdropColor;const f=Me(u.backdropPadding);e.fillRect(-o/2-f.left,-s-c.size/2-f.top,o+f.width,c.size+f.height)}yi(e,l.label,0,-s,c,{color:u.color})}),e.restore()}drawTitle(){}}I(ys,"id","radialLinear"),I(ys,"defaults",{display:!0,animate:!0,position:"chartArea",angleLines:{display:!0,lineWidth:1,borderDash:[],borderDashOffset:0},grid:{circular:!1},startAngle:0,ticks:{showLabelBackdrop:!0,callback:$o.formatters.numeric},pointLabels:{backdropColor:void 0,backdropPadding:2,display:!0,font:{size:10},callback(e){return e},padding:5,centerPointLabels:!1}}),I(ys,"defaultRoutes",{"angleLines.color":"borderColor","pointLabels.color":"color","ticks.color":"color"}),I(ys,"descriptors",{angleLines:{_fallback:"grid"}});const Vo={millisecond:{common:!0,size:1,steps:1e3},second:{common:!0,size:1e3,steps:60},minute:{common:!0,size:6e4,steps:60},hour:{common:!0,size:36e5,steps:24},day:{common:!0,size:864e5,steps:30},week:{common:!1,size:6048e5,steps:4},month:{common:!0,size:2628e6,steps:12},quarter:{common:!1,size:7884e6,steps:4},year:{common:!0,size:3154e7}},Oe=Object.keys(Vo);function n_(t,e){return t-e}function cd(t,e){if(X(e))return null;const n=t._adapter,{parser:i,round:r,isoWeekday:s}=t._parseOpts;let o=e;return typeof i=="function"&&(o=i(o)),de(o)||(o=typeof i=="string"?n.parse(o,i):n.parse(o)),o===null?null:(r&&(o=r==="week"&&(Pr(s)||s===!0)?n.startOf(o,"isoWeek",s):n.startOf(o,r)),+o)}function fd(t,e,n,i){const r=Oe.length;for(let s=Oe.indexOf(t);s<r-1;++s){const o=Vo[Oe[s]],l=o.steps?o.steps:Number.MAX_SAFE_INTEGER;if(o.common&&Math.ceil((n-e)/(l*o.size))<=i)return Oe[s]}return Oe[r-1]}function i_(t,e,n,i,r){for(let s=Oe.length-1;s>=Oe.indexOf(n);s--){const o=Oe[s];if(Vo[o].common&&t._adapter.diff(r,i,o)>=e-1)return o}return Oe[n?Oe.indexOf(n):0]}function r_(t){for(let e=Oe.indexOf(t)+1,n=Oe.length;e<n;++e)if(Vo[Oe[e]].common)return Oe[e]}function dd(t,e,n){if(!n)t[e]=!0;else if(n.length){const{lo:i,hi:r}=Fu(n,e),s=n[i]>=e?n[i]:n[r];t[s]=!0}}function s_(t,e,n,i){const r=t._adapter,s=+r.startOf(e[0].value,i),o=e[e.length-1].value;let l,a;for(l=s;l<=o;l=+r.add(l,1,i))a=n[l],a>=0&&(e[a].major=!0);return e}function hd(t,e,n){const i=[],r={},s=e.length;let o,l;for(o=0;o<s;++o)l=e[o],r[l]=o,i.push({value:l,major:!1});return s===0||!n?i:s_(t,i,r,n)}class wo extends Bn{constructor(e){super(e),this._cache={data:[],labels:[],all:[]},this._unit="day",this._majorUnit=void 0,this._offsets={},this._normalized=!1,this._parseOpts=void 0}init(e,n={}){const i=e.time||(e.time={}),r=this._adapter=new ax._date(e.adapters.date);r.init(n),tr(i.displayFormats,r.formats()),this._parseOpts={parser:i.parser,round:i.round,isoWeekday:i.isoWeekday},super.init(e),this._normalized=n.normalized}parse(e,n){return e===void 0?null:cd(this,e)}beforeLayout(){super.beforeLayout(),this._cache={data:[],labels:[],all:[]}}determineDataLimits(){const e=this.options,n=this._adapter,i=e.time.unit||"day";let{min:r,max:s,minDefined:o,maxDefined:l}=this.getUserBounds();function a(u){!o&&!isNaN(u.min)&&(r=Math.min(r,u.min)),!l&&!isNaN(u.max)&&(s=Math.max(s,u.max))}(!o||!l)&&(a(this._getLabelBounds()),(e.bounds!=="ticks"||e.ticks.source!=="labels")&&a(this.getMinMax(!1))),r=de(r)&&!isNaN(r)?r:+n.startOf(Date.now(),i),s=de(s)&&!isNaN(s)?s:+n.endOf(Date.now(),i)+1,this.min=Math.min(r,s-1),this.max=Math.max(r+1,s)}_getLabelBounds(){const e=this.getLabelTimestamps();let n=Number.POSITIVE_INFINITY,i=Number.NEGATIVE_INFINITY;return e.length&&(n=e[0],i=e[e.length-1]),{min:n,max:i}}buildTicks(){const e=this.options,n=e.time,i=e.ticks,r=i.source==="labels"?this.getLabelTimestamps():this._generate();e.bounds==="ticks"&&r.length&&(this.min=this._userMin||r[0],this.max=this._userMax||r[r.length-1]);const s=this.min,o=this.max,l=jy(r,s,o);return this._unit=n.unit||(i.autoSkip?fd(n.minUnit,this.min,this.max,this._getLabelCapacity(s)):i_(this,l.length,n.minUnit,this.min,this.max)),this._majorUnit=!i.major.enabled||this._unit==="year"?void 0:r_(this._unit),this.initOffsets(r),e.reverse&&l.reverse(),hd(this,l,this._majorUnit)}afterAutoSkip(){this.options.offsetAfterAutoskip&&this.initOffsets(this.ticks.map(e=>+e.value))}initOffsets(e=[]){let n=0,i=0,r,s;this.options.offset&&e.length&&(r=this.getDecimalForValue(e[0]),e.length===1?n=1-r:n=(this.getDecimalForValue(e[1])-r)/2,s=this.getDecimalForValue(e[e.length-1]),e.length===1?i=s:i=(s-this.getDecimalForValue(e[e.length-2]))/2);const o=e.length<3?.5:.25;n=Je(n,0,o),i=Je(i,0,o),this._offsets={start:n,end:i,factor:1/(n+1+i)}}_generate(){const e=this._adapter,n=this.min,i=this.max,r=this.options,s=r.time,o=s.unit||fd(s.minUnit,n,i,this._getLabelCapacity(n)),l=F(r.ticks.stepSize,1),a=o==="week"?s.isoWeekday:!1,u=Pr(a)||a===!0,c={};let f=n,d,h;if(u&&(f=+e.startOf(f,"isoWeek",a)),f=+e.startOf(f,u?"day":o),e.diff(i,n,o)>1e5*l)throw new Error(n+" and "+i+" are too far apart with stepSize of "+l+" "+o);const m=r.ticks.source==="data"&&this.getDataTimestamps();for(d=f,h=0;d<i;d=+e.add(d,l,o),h++)dd(c,d,m);return(d===i||r.bounds==="ticks"||h===1)&&dd(c,d,m),Object.keys(c).sort((y,x)=>y-x).map(y=>+y)}getLabelForValue(e){const n=this._adapter,i=this.options.time;return i.tooltipFormat?n.format(e,i.tooltipFormat):n.format(e,i.displayFormats.datetime)}_tickFormatFunction(e,n,i,r){const s=this.options,o=s.ticks.callback;if(o)return V(o,[e,n,i],this);const l=s.time.displayFormats,a=this._unit,u=this._majorUnit,c=a&&l[a],f=u&&l[u],d=i[n],h=u&&f&&d&&d.major;return this._adapter.format(e,r||(h?f:c))}generateTickLabels(e){let n,i,r;for(n=0,i=e.length;n<i;++n)r=e[n],r.label=this._tickFormatFunction(r.value,n,e)}getDecimalForValue(e){return e===null?NaN:(e-this.min)/(this.max-this.min)}getPixelForValue(e){const n=this._offsets,i=this.getDecimalForValue(e);return this.getPixelForDecimal((n.start+i)*n.factor)}getValueForPixel(e){const n=this._offsets,i=this.getDecimalForPixel(e)/n.factor-n.end;return this.min+i*(this.max-this.min)}_getLabelSize(e){const n=this.options.ticks,i=this.ctx.measureText(e).width,r=Xt(this.isHorizontal()?n.maxRotation:n.minRotation),s=Math.cos(r),o=Math.sin(r),l=this._resolveTickFontOptions(0).size;return{w:i*s+l*o,h:i*o+l*s}}_getLabelCapacity(e){const n=this.options.time,i=n.displayFormats,r=i[n.unit]||i.millisecond,s=this._tickFormatFunction(e,0,hd(this,[e],this._majorUnit),r),o=this._getLabelSize(s),l=Math.floor(this.isHorizontal()?this.width/o.w:this.height/o.h)-1;return l>0?l:1}getDataTimestamps(){let e=this._cache.data||[],n,i;if(e.length)return e;const r=this.getMatchingVisibleMetas();if(this._normalized&&r.length)return this._cache.data=r[0].controller.getAllParsedValues(this);for(n=0,i=r.length;n<i;++n)e=e.concat(r[n].controller.getAllParsedValues(this));return this._cache.data=this.normalize(e)}getLabelTimestamps(){const e=this._cache.labels||[];let n,i;if(e.length)return e;const r=this.getLabels();for(n=0,i=r.length;n<i;++n)e.push(cd(this,r[n]));return this._cache.labels=this._normalized?e:this.normalize(e)}normalize(e){return $y(e.sort(n_))}}I(wo,"id","time"),I(wo,"defaults",{bounds:"data",adapters:{},time:{parser:!1,unit:!1,round:!1,isoWeekday:!1,minUnit:"millisecond",displayFormats:{}},ticks:{source:"auto",callback:!1,major:{enabled:!1}}});function vs(t,e,n){let i=0,r=t.length-1,s,o,l,a;n?(e>=t[i].pos&&e<=t[r].pos&&({lo:i,hi:r}=En(t,"pos",e)),{pos:s,time:l}=t[i],{pos:o,time:a}=t[r]):(e>=t[i].time&&e<=t[r].time&&({lo:i,hi:r}=En(t,"time",e)),{time:s,pos:l}=t[i],{time:o,pos:a}=t[r]);const u=o-s;return u?l+(a-l)*(e-s)/u:l}class pd extends wo{constructor(e){super(e),this._table=[],this._minPos=void 0,this._tableRange=void 0}initOffsets(){const e=this._getTimestampsForTable(),n=this._table=this.buildLookupTable(e);this._minPos=vs(n,this.min),this._tableRange=vs(n,this.max)-this._minPos,super.initOffsets(e)}buildLookupTable(e){const{min:n,max:i}=this,r=[],s=[];let o,l,a,u,c;for(o=0,l=e.length;o<l;++o)u=e[o],u>=n&&u<=i&&r.push(u);if(r.length<2)return[{time:n,pos:0},{time:i,pos:1}];for(o=0,l=r.length;o<l;++o)c=r[o+1],a=r[o-1],u=r[o],Math.round((c+a)/2)!==u&&s.push({time:u,pos:o/(l-1)});return s}_getTimestampsForTable(){let e=this._cache.all||[];if(e.length)return e;const n=this.getDataTimestamps(),i=this.getLabelTimestamps();return n.length&&i.length?e=this.normalize(n.concat(i)):e=n.length?n:i,e=this._cache.all=e,e}getDecimalForValue(e){return(vs(this._table,e)-this._minPos)/this._tableRange}getValueForPixel(e){const n=this._offsets,i=this.getDecimalForPixel(e)/n.factor-n.end;return vs(this._table,i*this._tableRange+this._minPos,!0)}}I(pd,"id","timeseries"),I(pd,"defaults",wo.defaults);const Cg="label";function gd(t,e){typeof t=="function"?t(e):t&&(t.current=e)}function o_(t,e){const n=t.options;n&&e&&Object.assign(n,e)}function Mg(t,e){t.labels=e}function Eg(t,e){let n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:Cg;const i=[];t.datasets=e.map(r=>{const s=t.datasets.find(o=>o[n]===r[n]);return!s||!r.data||i.includes(s)?{...r}:(i.push(s),Object.assign(s,r),s)})}function l_(t){let e=arguments.length>1&&arguments[1]!==void 0?arguments[1]:Cg;const n={labels:[],datasets:[]};return Mg(n,t.labels),Eg(n,t.datasets,e),n}function a_(t,e){const{height:n=150,width:i=300,redraw:r=!1,datasetIdKey:s,type:o,data:l,options:a,plugins:u=[],fallbackContent:c,updateMode:f,...d}=t,h=M.exports.useRef(null),m=M.exports.useRef(),y=()=>{h.current&&(m.current=new Wo(h.current,{type:o,data:l_(l,s),options:a&&{...a},plugins:u}),gd(e,m.current))},x=()=>{gd(e,null),m.current&&(m.current.destroy(),m.current=null)};return M.exports.useEffect(()=>{!r&&m.current&&a&&o_(m.current,a)},[r,a]),M.exports.useEffect(()=>{!r&&m.current&&Mg(m.current.config.data,l.labels)},[r,l.labels]),M.exports.useEffect(()=>{!r&&m.current&&l.datasets&&Eg(m.current.config.data,l.datasets,s)},[r,l.datasets]),M.exports.useEffect(()=>{m.current&&(r?(x(),setTimeout(y)):m.current.update(f))},[r,a,l.labels,l.datasets,f]),M.exports.useEffect(()=>{m.current&&(x(),setTimeout(y))},[o]),M.exports.useEffect(()=>(y(),()=>x()),[]),ja.createElement("canvas",Object.assign({ref:h,role:"img",height:n,width:i},d),c)}const u_=M.exports.forwardRef(a_);function c_(t,e){return Wo.register(e),M.exports.forwardRef((n,i)=>ja.createElement(u_,Object.assign({},n,{ref:i,type:t})))}const f_=c_("line",Ns);function d_(t){var e=typeof t;return t!=null&&(e=="object"||e=="function")}var Pg=d_,h_=typeof{}=="object"&&{}&&{}.Object===Object&&{},p_=h_,g_=p_,m_=typeof self=="object"&&self&&self.Object===Object&&self,y_=g_||m_||Function("return this")(),Lg=y_,v_=Lg,x_=function(){return v_.Date.now()},__=x_,w_=/\s/;function k_(t){for(var e=t.length;e--&&w_.test(t.charAt(e)););return e}var S_=k_,b_=S_,C_=/^\s+/;function M_(t){return t&&t.slice(0,b_(t)+1).replace(C_,"")}var E_=M_,P_=Lg,L_=P_.Symbol,Tg=L_,md=Tg,Og=Object.prototype,T_=Og.hasOwnProperty,O_=Og.toString,Ri=md?md.toStringTag:void 0;function D_(t){var e=T_.call(t,Ri),n=t[Ri];try{t[Ri]=void 0;var i=!0}catch{}var r=O_.call(t);return i&&(e?t[Ri]=n:delete t[Ri]),r}var z_=D_,N_=Object.prototype,I_=N_.toString;function R_(t){return I_.call(t)}var F_=R_,yd=Tg,A_=z_,j_=F_,B_="[object Null]",$_="[object Undefined]",vd=yd?yd.toStringTag:void 0;function H_(t){return t==null?t===void 0?$_:B_:vd&&vd in Object(t)?A_(t):j_(t)}var W_=H_;function V_(t){return t!=null&&typeof t=="object"}var U_=V_,Y_=W_,Q_=U_,K_="[object Symbol]";function X_(t){return typeof t=="symbol"||Q_(t)&&Y_(t)==K_}var G_=X_,Z_=E_,xd=Pg,q_=G_,_d=0/0,J_=/^[-+]0x[0-9a-f]+$/i,ew=/^0b[01]+$/i,tw=/^0o[0-7]+$/i,nw=parseInt;function iw(t){if(typeof t=="number")return t;if(q_(t))return _d;if(xd(t)){var e=typeof t.valueOf=="function"?t.valueOf():t;t=xd(e)?e+"":e}if(typeof t!="string")return t===0?t:+t;t=Z_(t);var n=ew.test(t);return n||tw.test(t)?nw(t.slice(2),n?2:8):J_.test(t)?_d:+t}var rw=iw,sw=Pg,Ml=__,wd=rw,ow="Expected a function",lw=Math.max,aw=Math.min;function uw(t,e,n){var i,r,s,o,l,a,u=0,c=!1,f=!1,d=!0;if(typeof t!="function")throw new TypeError(ow);e=wd(e)||0,sw(n)&&(c=!!n.leading,f="maxWait"in n,s=f?lw(wd(n.maxWait)||0,e):s,d="trailing"in n?!!n.trailing:d);function h(k){var S=i,b=r;return i=r=void 0,u=k,o=t.apply(b,S),o}function m(k){return u=k,l=setTimeout(p,e),c?h(k):o}function y(k){var S=k-a,b=k-u,O=e-S;return f?aw(O,s-b):O}function x(k){var S=k-a,b=k-u;return a===void 0||S>=e||S<0||f&&b>=s}function p(){var k=Ml();if(x(k))return g(k);l=setTimeout(p,y(k))}function g(k){return l=void 0,d&&i?h(k):(i=r=void 0,o)}function v(){l!==void 0&&clearTimeout(l),u=0,i=a=r=l=void 0}function _(){return l===void 0?o:g(Ml())}function w(){var k=Ml(),S=x(k);if(i=arguments,r=this,a=k,S){if(l===void 0)return m(a);if(f)return clearTimeout(l),l=setTimeout(p,e),h(a)}return l===void 0&&(l=setTimeout(p,e)),o}return w.cancel=v,w.flush=_,w}var cw=uw;const fw=()=>{const[t,e]=M.exports.useState(!1);return M.exports.useLayoutEffect(()=>{const n=()=>{e(window.innerWidth<768)};return window.addEventListener("resize",cw(n,250)),n(),()=>window.removeEventListener("resize",n)},[]),t},dw=t=>({labels:t.map(e=>new Date(e.time).toLocaleTimeString()),datasets:[{data:t.map(e=>e.value),backgroundColor:Fp.gray,type:"line",tension:.1}]});Wo.register(za,Da,Vi,Fs,j2,O2);const hw=({deviceId:t,sensorUnit:e,isSensorOn:n})=>{const[i,r]=M.exports.useState({datasets:[{data:[],backgroundColor:Fp.gray}]}),[s,o]=M.exports.useState(!1),[l,a]=M.exports.useState(!0),[u,c]=M.exports.useState(!1),f=!fw(),d=.5,h=M.exports.useRef(0),m=async()=>{try{const p=await br.get(Ap(Cr.measurement,{id:t}));c(!1),jp.log("Measurement",t,{response:p.data}),r(dw(p.data))}catch(p){Ou(p.status),c(!0)}},y=async()=>{o(!0),await m(),o(!1)};M.exports.useEffect(()=>{n&&l&&!s&&y()},[n]),M.exports.useEffect(()=>{if(!l)return h.current=window.setInterval(m,Tu.intervals.measurement),()=>clearInterval(h.current)},[l,n]),M.exports.useEffect(()=>{a(u),u&&clearInterval(h.current)},[u]);const x={plugins:{legend:{display:!1},tooltip:{callbacks:{label:p=>`${Number(p.raw).toFixed(1)}${rf[e]}`}}},scales:{y:{ticks:{callback:function(p){return`${Number(p).toFixed(1)}${rf[e]}`}},min:f?Math.min(...i.datasets[0].data)-d:void 0,max:f?Math.max(...i.datasets[0].data)+d:void 0}}};return u?K("div",{className:"flex-abs-center chart-section",children:["Error loading measurements,"," ",T("div",{role:"button",className:"chart-wrapper-link",onClick:y,children:"try again"})]}):s?T("div",{className:"flex-abs-center chart-section",children:"Loading measurements..."}):n?i.datasets[0].data.length===0?T("div",{className:"flex-abs-center chart-section",children:"No data to display"}):T("div",{className:"flex-abs-center chart-section",children:T(f_,{datasetIdKey:"line-chart",options:x,data:i})}):T("div",{className:"flex-abs-center chart-section",children:"Sensor unavailable"})};var Dg={exports:{}};(function(t){(function(){var e={}.hasOwnProperty;function n(){for(var i=[],r=0;r<arguments.length;r++){var s=arguments[r];if(s){var o=typeof s;if(o==="string"||o==="number")i.push(s);else if(Array.isArray(s)){if(s.length){var l=n.apply(null,s);l&&i.push(l)}}else if(o==="object"){if(s.toString!==Object.prototype.toString&&!s.toString.toString().includes("[native code]")){i.push(s.toString());continue}for(var a in s)e.call(s,a)&&s[a]&&i.push(a)}}}return i.join(" ")}t.exports?(n.default=n,t.exports=n):window.classNames=n})()})(Dg);const or=Dg.exports,pw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M192 128c70.7 0 128 57.3 128 128s-57.3 128-128 128s-128-57.3-128-128s57.3-128 128-128zm0 320H384c106 0 192-86 192-192s-86-192-192-192H192C86 64 0 150 0 256S86 448 192 448zm143.1-64c30.4-34 48.9-78.8 48.9-128s-18.5-94-48.9-128H384c70.7 0 128 57.3 128 128s-57.3 128-128 128H335.1z"})),gw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M384 64C490 64 576 149.1 576 256C576 362 490 448 384 448H192C85.96 448 0 362 0 256C0 149.1 85.96 64 192 64H384zM384 400C463.5 400 528 335.5 528 256C528 176.5 463.5 112 384 112C304.5 112 240 176.5 240 256C240 335.5 304.5 400 384 400z"}));const mw=({serialNumber:t,initialState:e,ledId:n,deviceId:i,isOffline:r})=>{const[s,o]=M.exports.useState(!1),[l,a]=M.exports.useState(!1),u=async(f,d,h)=>{let m=!1,y=!1;const p=setTimeout(()=>{y=!0},5e3);for(;m===!1&&y===!1;){const g=await br.get(Ap(Cr.device,{id:f}));m=h===yl.ON?g.data.led_on.includes(d):!g.data.led_on.includes(d)}return clearTimeout(p),m},c=async()=>{a(!0);const f=s?yl.OFF:yl.ON;try{const d=await br.post(Cr.led,{command:"DEMO_APP_ACTION_REQ",deviceId:i,ledId:n,action:f});await u(i,n,f)&&o(m=>!m)}catch(d){Ou(d.status),Rp("Error notifying led, try again later")}finally{a(!1)}};return M.exports.useEffect(()=>{l||o(e)},[e]),K("div",{className:"flex-abs-center led-section",children:[s?T("span",{className:or("led-section-indicator-on"),children:"On"}):T("span",{className:or("led-section-indicator-off"),children:"Off"}),T("button",{className:"flex-abs-center led-section-toggle-button",onClick:c,disabled:r||l,children:s?T(gw,{fill:"green",width:25,height:25}):T(pw,{width:25,height:25})}),K("span",{className:"mt-1 no-selection",children:["LED ",t]})]})};const yw=t=>M.exports.createElement("svg",{width:"100%",height:"100%",viewBox:"0 0 640 448",xmlns:"http://www.w3.org/2000/svg",xmlnsXlink:"http://www.w3.org/1999/xlink",...t},M.exports.createElement("title",null,"Combined Shape"),M.exports.createElement("g",{id:"Page-1",stroke:"none",strokeWidth:1,fill:"none",fillRule:"evenodd",fillOpacity:.54},M.exports.createElement("path",{d:"M272,0 C331.5,0 384.1,29.55 416,74.8 C430.5,67.87 446.8,64 464,64 C525.9,64 576,114.1 576,176 C576,186.7 574.5,196.1 571.7,206.8 C612.3,228.2 640,270.9 640,320 C640,390.7 582.7,448 512,448 L144,448 C64.47,448 0,383.5 0,304 C0,241.2 40.15,187.9 96.17,168.1 C100.3,74.6 177.4,0 272,0 Z M272,32 C194.6,32 131.5,93 128.1,169.5 C127.6,182.6 119.1,193.1 106.8,198.3 C63.18,213.7 32,255.2 32,304 C32,365.9 82.14,416 144,416 L512,416 C565,416 608,373 608,320 C608,283.2 587.3,251.2 556.8,235.1 C543.4,227.1 536.8,212.5 540.9,197.1 C542.9,191 544,183.7 544,176 C544,131.8 508.2,96 464,96 C451.7,96 440.1,98.8 429.7,103.7 C415.7,110.4 398.8,105.9 389.8,93.2 C363.7,56.12 320.7,32 272,32 Z M360.125,92 C365.453125,92 369.8125,96.3327344 369.8125,101.6875 L369.8125,101.6875 L369.8125,130.75 L379.5,130.75 C400.90332,130.75 418.25,148.09668 418.25,169.5 L418.25,169.5 L418.25,179.1875 L447.3125,179.1875 C452.667266,179.1875 457,183.546875 457,188.875 C457,194.203125 452.640625,198.5625 447.3125,198.5625 L447.3125,198.5625 L418.25,198.5625 L418.25,237.3125 L447.3125,237.3125 C452.667266,237.3125 457,241.671875 457,247 C457,252.328125 452.640625,256.6875 447.3125,256.6875 L447.3125,256.6875 L418.25,256.6875 L418.25,295.4375 L447.3125,295.4375 C452.667266,295.4375 457,299.770234 457,305.125 C457,310.479766 452.667266,314.8125 447.3125,314.8125 L447.3125,314.8125 L418.25,314.8125 L418.25,324.5 C418.25,345.90332 400.90332,363.25 379.5,363.25 L379.5,363.25 L369.8125,363.25 L369.8125,392.3125 C369.8125,397.667266 365.479766,402 360.125,402 C354.770234,402 350.4375,397.667266 350.4375,392.3125 L350.4375,392.3125 L350.4375,363.25 L311.6875,363.25 L311.6875,392.3125 C311.6875,397.667266 307.354766,402 302,402 C296.645234,402 292.3125,397.667266 292.3125,392.3125 L292.3125,392.3125 L292.3125,363.25 L253.5625,363.25 L253.5625,392.3125 C253.5625,397.667266 249.203125,402 243.875,402 C238.546875,402 234.1875,397.640625 234.1875,392.3125 L234.1875,392.3125 L234.1875,363.25 L224.5,363.25 C203.09668,363.25 185.75,345.90332 185.75,324.5 L185.75,324.5 L185.75,314.8125 L156.6875,314.8125 C151.332734,314.8125 147,310.453125 147,305.125 C147,299.796875 151.332734,295.4375 156.6875,295.4375 L156.6875,295.4375 L185.75,295.4375 L185.75,256.6875 L156.6875,256.6875 C151.332734,256.6875 147,252.328125 147,247 C147,241.671875 151.332734,237.3125 156.6875,237.3125 L156.6875,237.3125 L185.75,237.3125 L185.75,198.5625 L156.6875,198.5625 C151.332734,198.5625 147,194.203125 147,188.875 C147,183.546875 151.332734,179.1875 156.6875,179.1875 L156.6875,179.1875 L185.75,179.1875 L185.75,169.5 C185.75,148.09668 203.09668,130.75 224.5,130.75 L224.5,130.75 L234.1875,130.75 L234.1875,101.6875 C234.1875,96.3327344 238.546875,92 243.875,92 C249.203125,92 253.5625,96.3327344 253.5625,101.6875 L253.5625,101.6875 L253.5625,130.75 L292.3125,130.75 L292.3125,101.6875 C292.3125,96.3327344 296.671875,92 302,92 C307.328125,92 311.6875,96.3327344 311.6875,101.6875 L311.6875,101.6875 L311.6875,130.75 L350.4375,130.75 L350.4375,101.6875 C350.4375,96.3327344 354.796875,92 360.125,92 Z M379.5,150.125 L224.5,150.125 C213.819531,150.125 205.125,158.819531 205.125,169.5 L205.125,169.5 L205.125,324.5 C205.125,335.180469 213.819531,343.875 224.5,343.875 L224.5,343.875 L379.5,343.875 C390.180469,343.875 398.875,335.180469 398.875,324.5 L398.875,324.5 L398.875,169.5 C398.875,158.819531 390.180469,150.125 379.5,150.125 L379.5,150.125 Z M360.125,169.5 C370.841797,169.5 379.5,178.158203 379.5,188.875 L379.5,188.875 L379.5,305.125 C379.5,315.823633 370.823633,324.5 360.125,324.5 L360.125,324.5 L243.875,324.5 C233.176367,324.5 224.5,315.823633 224.5,305.125 L224.5,305.125 L224.5,188.875 C224.5,178.158203 233.158203,169.5 243.875,169.5 L243.875,169.5 Z M360.125,188.875 L243.875,188.875 L243.875,305.125 L360.125,305.125 L360.125,188.875 Z",id:"Combined-Shape",fill:"#000000",fillRule:"nonzero"}))),vw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512",...t},M.exports.createElement("path",{d:"M256 512c141.4 0 256-114.6 256-256S397.4 0 256 0S0 114.6 0 256S114.6 512 256 512z"})),xw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M160 256C160 185.3 217.3 128 288 128C358.7 128 416 185.3 416 256C416 326.7 358.7 384 288 384C217.3 384 160 326.7 160 256zM288 336C332.2 336 368 300.2 368 256C368 211.8 332.2 176 288 176C287.3 176 286.7 176 285.1 176C287.3 181.1 288 186.5 288 192C288 227.3 259.3 256 224 256C218.5 256 213.1 255.3 208 253.1C208 254.7 208 255.3 208 255.1C208 300.2 243.8 336 288 336L288 336zM95.42 112.6C142.5 68.84 207.2 32 288 32C368.8 32 433.5 68.84 480.6 112.6C527.4 156 558.7 207.1 573.5 243.7C576.8 251.6 576.8 260.4 573.5 268.3C558.7 304 527.4 355.1 480.6 399.4C433.5 443.2 368.8 480 288 480C207.2 480 142.5 443.2 95.42 399.4C48.62 355.1 17.34 304 2.461 268.3C-.8205 260.4-.8205 251.6 2.461 243.7C17.34 207.1 48.62 156 95.42 112.6V112.6zM288 80C222.8 80 169.2 109.6 128.1 147.7C89.6 183.5 63.02 225.1 49.44 256C63.02 286 89.6 328.5 128.1 364.3C169.2 402.4 222.8 432 288 432C353.2 432 406.8 402.4 447.9 364.3C486.4 328.5 512.1 286 526.6 256C512.1 225.1 486.4 183.5 447.9 147.7C406.8 109.6 353.2 80 288 80V80z"})),_w=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M108.2 71c13.8 11.1 16 31.2 5 45C82.4 154.4 64 203 64 256s18.4 101.6 49.1 140c11.1 13.8 8.8 33.9-5 45s-33.9 8.8-45-5C23.7 386.7 0 324.1 0 256S23.7 125.3 63.2 76c11.1-13.8 31.2-16 45-5zm359.7 0c13.8-11.1 33.9-8.8 45 5C552.3 125.3 576 187.9 576 256s-23.7 130.7-63.2 180c-11.1 13.8-31.2 16-45 5s-16-31.2-5-45c30.7-38.4 49.1-87 49.1-140s-18.4-101.6-49.1-140c-11.1-13.8-8.8-33.9 5-45zM344 256c0 30.9-25.1 56-56 56s-56-25.1-56-56s25.1-56 56-56s56 25.1 56 56zM204.5 181.3c-17.8 19.8-28.5 46-28.5 74.7s10.8 54.8 28.5 74.7c11.8 13.2 10.7 33.4-2.5 45.2s-33.4 10.7-45.2-2.5C129 342.2 112 301.1 112 256s17-86.2 44.8-117.3c11.8-13.2 32-14.3 45.2-2.5s14.3 32 2.5 45.2zm214.7-42.7C447 169.8 464 210.9 464 256s-17 86.2-44.8 117.3c-11.8 13.2-32 14.3-45.2 2.5s-14.3-32-2.5-45.2c17.8-19.8 28.5-46 28.5-74.7s-10.8-54.8-28.5-74.7c-11.8-13.2-10.7-33.4 2.5-45.2s33.4-10.7 45.2 2.5z"})),ww={day:86400,hour:3600,minute:60,second:1},kw=t=>(Date.now()-t)/1e3,Sw=t=>{for(const[e,n]of Object.entries(ww))if(t>=n||e==="second")return{value:Math.floor(t/n)*-1,unit:e}},bw={second:"s",minute:"m",hour:"h",day:"d",week:"w"},Cw=t=>{const e=kw(t),{value:n,unit:i}=Sw(e);return`${Math.abs(n)}${bw[i]} ago`},Mw=({date:t})=>{const[e,n]=M.exports.useState("");return M.exports.useEffect(()=>{const i=setInterval(()=>{n(Cw(t))},1e3);return()=>clearInterval(i)},[t]),T("div",{children:e})};const kd=({name:t,lastUplink:e,isOffline:n,linkType:i})=>K("div",{className:"status-section",children:[T("div",{className:"status-section-icon-wrapper",children:T(yw,{width:75,height:60})}),K("div",{className:"status-section-right-column-wrapper",children:[T("h2",{className:"title-h2",children:t}),K("div",{className:"status-section-device-info",children:[K("div",{className:"flex-abs-center status-section-status",children:[T(vw,{width:10,height:18,fill:n?"black":"green"}),T("span",{className:"status-section-info-text",children:n?"Offline":"Online"})]}),K("div",{className:"flex-abs-center status-section-last-beat",children:[T(xw,{width:15,height:18}),T("span",{className:"status-section-info-text",children:T(Mw,{date:e})})]}),!n&&K("div",{className:"flex-abs-center status-section-signal",children:[T(_w,{width:15,height:18}),T("span",{className:"status-section-info-text",children:i})]})]})]})]}),Ew=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512",...t},M.exports.createElement("path",{d:"M288 32V0H224V32 256v32h64V256 32zM80 256c0-54.4 24.7-103.1 63.5-135.4L102.6 71.4C49.7 115.4 16 181.8 16 256c0 132.5 107.5 240 240 240s240-107.5 240-240c0-74.2-33.8-140.6-86.6-184.6l-40.9 49.2c38.9 32.3 63.5 81 63.5 135.4c0 97.2-78.8 176-176 176s-176-78.8-176-176z"}));const Pw=({serialNumber:t,initialState:e})=>{const[n,i]=M.exports.useState(!1);return M.exports.useEffect(()=>{i(e)},[e]),T("div",{className:"engage-button-section",children:K("button",{className:or("stats-power-button","flex-abs-center",n&&"on"),children:[T("span",{className:or("no-selection","mr-2",n?"green":"black"),children:t}),K("div",{className:"flex-abs-center",children:[T(Ew,{width:25,height:25,fill:n?"green":"black"}),T("span",{className:or("no-selection","engaged-text",n?"green":"black"),children:n?"Engaged":"Disengaged"})]})]})})},Lw=({data:t})=>{const[e,n]=M.exports.useState(!1);return M.exports.useEffect(()=>{const r=setInterval(()=>{const l=Date.now()-t.last_uplink*1e3>6e4;n(l)},Tu.intervals.online);return()=>clearInterval(r)},[t.last_uplink]),t.led.length===0&&t.button.length===0&&!t.sensor?K("div",{className:"full-height-with-header container-offline",children:[T("section",{className:"title",children:T(kd,{name:t.wireless_device_id,lastUplink:t.last_uplink*1e3,linkType:t.link_type,isOffline:e})}),T("section",{className:"offline offline-text flex-abs-center",children:K("p",{children:["No device capabilities info. ",T("br",{}),"Please restart your device."]})})]}):K("div",{className:"container",children:[T("section",{className:"title",children:T(kd,{name:t.wireless_device_id,lastUplink:t.last_uplink*1e3,linkType:t.link_type,isOffline:e})}),K(El,{children:[T("section",{className:"led",children:t.led.length>0&&T("div",{className:"led-wrapper",children:t.led.map(r=>{const s=t.led.length===1,o=t.led_on.includes(r);return T(mw,{initialState:o,serialNumber:s?void 0:r+1,deviceId:t.wireless_device_id,ledId:r,isOffline:e},r)})})}),T("section",{className:"chart",children:T(hw,{deviceId:t.wireless_device_id,sensorUnit:t.sensor_unit,isSensorOn:t.sensor})}),T("section",{className:"ebuttons",children:t.button.length>0&&K(El,{children:[T("div",{className:"ebuttons-section-title flex-abs-center",children:"Push button on device"}),T("div",{className:"ebuttons-wrapper",children:t.button.map(r=>{const s=t.button.length===1,o=t.button_pressed.includes(r);return T(Pw,{initialState:o,serialNumber:s?void 0:r+1},r)})})]})})]})]})};const Tw=()=>T("div",{className:"loadingio-spinner-cube-43if4zhoecl",children:K("div",{className:"ldio-3ubwwbm9rn2",children:[T("div",{}),T("div",{}),T("div",{}),T("div",{})]})});const Ow=()=>{const[t,e]=M.exports.useState(!0),[n,i]=M.exports.useState(!1),[r,s]=M.exports.useState([]),[o,l]=M.exports.useState(!1),a=M.exports.useRef(0),u=async()=>{try{const f=await br.get(Cr.devices);l(!1),s(f.data),jp.log("Devices",{response:f.data})}catch(f){Ou(f.status),l(!0)}},c=async()=>{i(!0),await u(),i(!1)};return M.exports.useEffect(()=>{t&&!n&&c()},[]),M.exports.useEffect(()=>{if(!t)return a.current=window.setInterval(u,Tu.intervals.devices),()=>clearInterval(a.current)},[t]),M.exports.useEffect(()=>{e(o),o&&clearInterval(a.current)},[o]),o?K("div",{className:"full-height-with-header flex-abs-center",children:["Error loading devices information,"," ",T("div",{role:"button",className:"device-wrapper-link",onClick:c,children:"try again"})]}):n?K("div",{className:"full-height-with-header flex-abs-center device-wrapper-spinner",children:[T(Tw,{}),"Loading devices..."]}):r.length===0?T("div",{className:"full-height-with-header flex-abs-center",children:"No devices detected"}):T("div",{className:"device-wrapper",children:r.map(f=>T(Lw,{data:f},f.wireless_device_id))})};const Dw=({onLoginSuccess:t})=>{const[e,n]=M.exports.useState(""),[i,r]=M.exports.useState(""),[s,o]=M.exports.useState(!1);return T("div",{className:"full-height-with-header flex-abs-center",children:K("form",{className:"form-wrapper",onSubmit:async a=>{a.preventDefault(),o(!0);try{ty(e);const u=await br.post(Cr.login,{username:e,password:i});ey(u.data),t()}catch{Rp.error("User or password incorrect")}finally{o(!1)}},children:[K("label",{children:["Username",T("input",{name:"username",type:"text",value:e,onChange:a=>n(a.target.value)})]}),K("label",{children:["Password",T("input",{name:"password",type:"password",value:i,onChange:a=>r(a.target.value)})]}),T("button",{type:"submit",disabled:s,children:"Login"})]})})};function zw(){const[t,e]=M.exports.useState(!1),[n,i]=M.exports.useState(!0),r=()=>{e(!0)};return M.exports.useEffect(()=>{localStorage.getItem(Bo)&&e(!0),i(!1)},[]),M.exports.useEffect(()=>{localStorage.getItem(ba)&&setTimeout(()=>{ze.error("Unauthorize error"),localStorage.removeItem(ba)},0)},[]),n?T(El,{}):K("div",{className:"App",children:[T(G1,{}),t?T(Ow,{}):T(Dw,{onLoginSuccess:r})]})}Pl.createRoot(document.getElementById("root")).render(K(ja.StrictMode,{children:[T(zw,{}),T(K1,{})]}));
+`):t}function D2(t,e){const{element:n,datasetIndex:i,index:r}=e,s=t.getDatasetMeta(i).controller,{label:o,value:l}=s.getLabelAndValue(r);return{chart:t,label:o,parsed:s.getParsed(r),raw:t.data.datasets[i].data[r],formattedValue:l,dataset:s.getDataset(),dataIndex:r,datasetIndex:i,element:n}}function Jf(t,e){const n=t.chart.ctx,{body:i,footer:r,title:s}=t,{boxWidth:o,boxHeight:l}=e,a=ge(e.bodyFont),u=ge(e.titleFont),c=ge(e.footerFont),f=s.length,d=r.length,h=i.length,m=Me(e.padding);let y=m.height,x=0,p=i.reduce((_,w)=>_+w.before.length+w.lines.length+w.after.length,0);if(p+=t.beforeBody.length+t.afterBody.length,f&&(y+=f*u.lineHeight+(f-1)*e.titleSpacing+e.titleMarginBottom),p){const _=e.displayColors?Math.max(l,a.lineHeight):a.lineHeight;y+=h*_+(p-h)*a.lineHeight+(p-1)*e.bodySpacing}d&&(y+=e.footerMarginTop+d*c.lineHeight+(d-1)*e.footerSpacing);let g=0;const v=function(_){x=Math.max(x,n.measureText(_).width+g)};return n.save(),n.font=u.string,$(t.title,v),n.font=a.string,$(t.beforeBody.concat(t.afterBody),v),g=e.displayColors?o+2+e.boxPadding:0,$(i,_=>{$(_.before,v),$(_.lines,v),$(_.after,v)}),g=0,n.font=c.string,$(t.footer,v),n.restore(),x+=m.width,{width:x,height:y}}function z2(t,e){const{y:n,height:i}=e;return n<i/2?"top":n>t.height-i/2?"bottom":"center"}function N2(t,e,n,i){const{x:r,width:s}=i,o=n.caretSize+n.caretPadding;if(t==="left"&&r+s+o>e.width||t==="right"&&r-s-o<0)return!0}function I2(t,e,n,i){const{x:r,width:s}=n,{width:o,chartArea:{left:l,right:a}}=t;let u="center";return i==="center"?u=r<=(l+a)/2?"left":"right":r<=s/2?u="left":r>=o-s/2&&(u="right"),N2(u,t,e,n)&&(u="center"),u}function ed(t,e,n){const i=n.yAlign||e.yAlign||z2(t,n);return{xAlign:n.xAlign||e.xAlign||I2(t,e,n,i),yAlign:i}}function R2(t,e){let{x:n,width:i}=t;return e==="right"?n-=i:e==="center"&&(n-=i/2),n}function F2(t,e,n){let{y:i,height:r}=t;return e==="top"?i+=n:e==="bottom"?i-=r+n:i-=r/2,i}function td(t,e,n,i){const{caretSize:r,caretPadding:s,cornerRadius:o}=t,{xAlign:l,yAlign:a}=n,u=r+s,{topLeft:c,topRight:f,bottomLeft:d,bottomRight:h}=li(o);let m=R2(e,l);const y=F2(e,a,u);return a==="center"?l==="left"?m+=u:l==="right"&&(m-=u):l==="left"?m-=Math.max(c,d)+r:l==="right"&&(m+=Math.max(f,h)+r),{x:Je(m,0,i.width-e.width),y:Je(y,0,i.height-e.height)}}function ms(t,e,n){const i=Me(n.padding);return e==="center"?t.x+t.width/2:e==="right"?t.x+t.width-i.right:t.x+i.left}function nd(t){return gt([],Ct(t))}function A2(t,e,n){return gn(t,{tooltip:e,tooltipItems:n,type:"tooltip"})}function id(t,e){const n=e&&e.dataset&&e.dataset.tooltip&&e.dataset.tooltip.callbacks;return n?t.override(n):t}const Sg={beforeTitle:St,title(t){if(t.length>0){const e=t[0],n=e.chart.data.labels,i=n?n.length:0;if(this&&this.options&&this.options.mode==="dataset")return e.dataset.label||"";if(e.label)return e.label;if(i>0&&e.dataIndex<i)return n[e.dataIndex]}return""},afterTitle:St,beforeBody:St,beforeLabel:St,label(t){if(this&&this.options&&this.options.mode==="dataset")return t.label+": "+t.formattedValue||t.formattedValue;let e=t.dataset.label||"";e&&(e+=": ");const n=t.formattedValue;return X(n)||(e+=n),e},labelColor(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{borderColor:n.borderColor,backgroundColor:n.backgroundColor,borderWidth:n.borderWidth,borderDash:n.borderDash,borderDashOffset:n.borderDashOffset,borderRadius:0}},labelTextColor(){return this.options.bodyColor},labelPointStyle(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{pointStyle:n.pointStyle,rotation:n.rotation}},afterLabel:St,afterBody:St,beforeFooter:St,footer:St,afterFooter:St};function Le(t,e,n,i){const r=t[e].call(n,i);return typeof r>"u"?Sg[e].call(n,i):r}class Oa extends cn{constructor(e){super(),this.opacity=0,this._active=[],this._eventPosition=void 0,this._size=void 0,this._cachedAnimations=void 0,this._tooltipItems=[],this.$animations=void 0,this.$context=void 0,this.chart=e.chart,this.options=e.options,this.dataPoints=void 0,this.title=void 0,this.beforeBody=void 0,this.body=void 0,this.afterBody=void 0,this.footer=void 0,this.xAlign=void 0,this.yAlign=void 0,this.x=void 0,this.y=void 0,this.height=void 0,this.width=void 0,this.caretX=void 0,this.caretY=void 0,this.labelColors=void 0,this.labelPointStyles=void 0,this.labelTextColors=void 0}initialize(e){this.options=e,this._cachedAnimations=void 0,this.$context=void 0}_resolveAnimations(){const e=this._cachedAnimations;if(e)return e;const n=this.chart,i=this.options.setContext(this.getContext()),r=i.enabled&&n.options.animation&&i.animations,s=new ug(this.chart,r);return r._cacheable&&(this._cachedAnimations=Object.freeze(s)),s}getContext(){return this.$context||(this.$context=A2(this.chart.getContext(),this,this._tooltipItems))}getTitle(e,n){const{callbacks:i}=n,r=Le(i,"beforeTitle",this,e),s=Le(i,"title",this,e),o=Le(i,"afterTitle",this,e);let l=[];return l=gt(l,Ct(r)),l=gt(l,Ct(s)),l=gt(l,Ct(o)),l}getBeforeBody(e,n){return nd(Le(n.callbacks,"beforeBody",this,e))}getBody(e,n){const{callbacks:i}=n,r=[];return $(e,s=>{const o={before:[],lines:[],after:[]},l=id(i,s);gt(o.before,Ct(Le(l,"beforeLabel",this,s))),gt(o.lines,Le(l,"label",this,s)),gt(o.after,Ct(Le(l,"afterLabel",this,s))),r.push(o)}),r}getAfterBody(e,n){return nd(Le(n.callbacks,"afterBody",this,e))}getFooter(e,n){const{callbacks:i}=n,r=Le(i,"beforeFooter",this,e),s=Le(i,"footer",this,e),o=Le(i,"afterFooter",this,e);let l=[];return l=gt(l,Ct(r)),l=gt(l,Ct(s)),l=gt(l,Ct(o)),l}_createItems(e){const n=this._active,i=this.chart.data,r=[],s=[],o=[];let l=[],a,u;for(a=0,u=n.length;a<u;++a)l.push(D2(this.chart,n[a]));return e.filter&&(l=l.filter((c,f,d)=>e.filter(c,f,d,i))),e.itemSort&&(l=l.sort((c,f)=>e.itemSort(c,f,i))),$(l,c=>{const f=id(e.callbacks,c);r.push(Le(f,"labelColor",this,c)),s.push(Le(f,"labelPointStyle",this,c)),o.push(Le(f,"labelTextColor",this,c))}),this.labelColors=r,this.labelPointStyles=s,this.labelTextColors=o,this.dataPoints=l,l}update(e,n){const i=this.options.setContext(this.getContext()),r=this._active;let s,o=[];if(!r.length)this.opacity!==0&&(s={opacity:0});else{const l=Ui[i.position].call(this,r,this._eventPosition);o=this._createItems(i),this.title=this.getTitle(o,i),this.beforeBody=this.getBeforeBody(o,i),this.body=this.getBody(o,i),this.afterBody=this.getAfterBody(o,i),this.footer=this.getFooter(o,i);const a=this._size=Jf(this,i),u=Object.assign({},l,a),c=ed(this.chart,i,u),f=td(i,u,c,this.chart);this.xAlign=c.xAlign,this.yAlign=c.yAlign,s={opacity:1,x:f.x,y:f.y,width:a.width,height:a.height,caretX:l.x,caretY:l.y}}this._tooltipItems=o,this.$context=void 0,s&&this._resolveAnimations().update(this,s),e&&i.external&&i.external.call(this,{chart:this.chart,tooltip:this,replay:n})}drawCaret(e,n,i,r){const s=this.getCaretPosition(e,i,r);n.lineTo(s.x1,s.y1),n.lineTo(s.x2,s.y2),n.lineTo(s.x3,s.y3)}getCaretPosition(e,n,i){const{xAlign:r,yAlign:s}=this,{caretSize:o,cornerRadius:l}=i,{topLeft:a,topRight:u,bottomLeft:c,bottomRight:f}=li(l),{x:d,y:h}=e,{width:m,height:y}=n;let x,p,g,v,_,w;return s==="center"?(_=h+y/2,r==="left"?(x=d,p=x-o,v=_+o,w=_-o):(x=d+m,p=x+o,v=_-o,w=_+o),g=x):(r==="left"?p=d+Math.max(a,c)+o:r==="right"?p=d+m-Math.max(u,f)-o:p=this.caretX,s==="top"?(v=h,_=v-o,x=p-o,g=p+o):(v=h+y,_=v+o,x=p+o,g=p-o),w=v),{x1:x,x2:p,x3:g,y1:v,y2:_,y3:w}}drawTitle(e,n,i){const r=this.title,s=r.length;let o,l,a;if(s){const u=ai(i.rtl,this.x,this.width);for(e.x=ms(this,i.titleAlign,i),n.textAlign=u.textAlign(i.titleAlign),n.textBaseline="middle",o=ge(i.titleFont),l=i.titleSpacing,n.fillStyle=i.titleColor,n.font=o.string,a=0;a<s;++a)n.fillText(r[a],u.x(e.x),e.y+o.lineHeight/2),e.y+=o.lineHeight+l,a+1===s&&(e.y+=i.titleMarginBottom-l)}}_drawColorBox(e,n,i,r,s){const o=this.labelColors[i],l=this.labelPointStyles[i],{boxHeight:a,boxWidth:u,boxPadding:c}=s,f=ge(s.bodyFont),d=ms(this,"left",s),h=r.x(d),m=a<f.lineHeight?(f.lineHeight-a)/2:0,y=n.y+m;if(s.usePointStyle){const x={radius:Math.min(u,a)/2,pointStyle:l.pointStyle,rotation:l.rotation,borderWidth:1},p=r.leftForLtr(h,u)+u/2,g=y+a/2;e.strokeStyle=s.multiKeyBackground,e.fillStyle=s.multiKeyBackground,Pa(e,x,p,g),e.strokeStyle=o.borderColor,e.fillStyle=o.backgroundColor,Pa(e,x,p,g)}else{e.lineWidth=B(o.borderWidth)?Math.max(...Object.values(o.borderWidth)):o.borderWidth||1,e.strokeStyle=o.borderColor,e.setLineDash(o.borderDash||[]),e.lineDashOffset=o.borderDashOffset||0;const x=r.leftForLtr(h,u-c),p=r.leftForLtr(r.xPlus(h,1),u-c-2),g=li(o.borderRadius);Object.values(g).some(v=>v!==0)?(e.beginPath(),e.fillStyle=s.multiKeyBackground,mo(e,{x,y,w:u,h:a,radius:g}),e.fill(),e.stroke(),e.fillStyle=o.backgroundColor,e.beginPath(),mo(e,{x:p,y:y+1,w:u-2,h:a-2,radius:g}),e.fill()):(e.fillStyle=s.multiKeyBackground,e.fillRect(x,y,u,a),e.strokeRect(x,y,u,a),e.fillStyle=o.backgroundColor,e.fillRect(p,y+1,u-2,a-2))}e.fillStyle=this.labelTextColors[i]}drawBody(e,n,i){const{body:r}=this,{bodySpacing:s,bodyAlign:o,displayColors:l,boxHeight:a,boxWidth:u,boxPadding:c}=i,f=ge(i.bodyFont);let d=f.lineHeight,h=0;const m=ai(i.rtl,this.x,this.width),y=function(b){n.fillText(b,m.x(e.x+h),e.y+d/2),e.y+=d+s},x=m.textAlign(o);let p,g,v,_,w,k,S;for(n.textAlign=o,n.textBaseline="middle",n.font=f.string,e.x=ms(this,x,i),n.fillStyle=i.bodyColor,$(this.beforeBody,y),h=l&&x!=="right"?o==="center"?u/2+c:u+2+c:0,_=0,k=r.length;_<k;++_){for(p=r[_],g=this.labelTextColors[_],n.fillStyle=g,$(p.before,y),v=p.lines,l&&v.length&&(this._drawColorBox(n,e,_,m,i),d=Math.max(f.lineHeight,a)),w=0,S=v.length;w<S;++w)y(v[w]),d=f.lineHeight;$(p.after,y)}h=0,d=f.lineHeight,$(this.afterBody,y),e.y-=s}drawFooter(e,n,i){const r=this.footer,s=r.length;let o,l;if(s){const a=ai(i.rtl,this.x,this.width);for(e.x=ms(this,i.footerAlign,i),e.y+=i.footerMarginTop,n.textAlign=a.textAlign(i.footerAlign),n.textBaseline="middle",o=ge(i.footerFont),n.fillStyle=i.footerColor,n.font=o.string,l=0;l<s;++l)n.fillText(r[l],a.x(e.x),e.y+o.lineHeight/2),e.y+=o.lineHeight+i.footerSpacing}}drawBackground(e,n,i,r){const{xAlign:s,yAlign:o}=this,{x:l,y:a}=e,{width:u,height:c}=i,{topLeft:f,topRight:d,bottomLeft:h,bottomRight:m}=li(r.cornerRadius);n.fillStyle=r.backgroundColor,n.strokeStyle=r.borderColor,n.lineWidth=r.borderWidth,n.beginPath(),n.moveTo(l+f,a),o==="top"&&this.drawCaret(e,n,i,r),n.lineTo(l+u-d,a),n.quadraticCurveTo(l+u,a,l+u,a+d),o==="center"&&s==="right"&&this.drawCaret(e,n,i,r),n.lineTo(l+u,a+c-m),n.quadraticCurveTo(l+u,a+c,l+u-m,a+c),o==="bottom"&&this.drawCaret(e,n,i,r),n.lineTo(l+h,a+c),n.quadraticCurveTo(l,a+c,l,a+c-h),o==="center"&&s==="left"&&this.drawCaret(e,n,i,r),n.lineTo(l,a+f),n.quadraticCurveTo(l,a,l+f,a),n.closePath(),n.fill(),r.borderWidth>0&&n.stroke()}_updateAnimationTarget(e){const n=this.chart,i=this.$animations,r=i&&i.x,s=i&&i.y;if(r||s){const o=Ui[e.position].call(this,this._active,this._eventPosition);if(!o)return;const l=this._size=Jf(this,e),a=Object.assign({},o,this._size),u=ed(n,e,a),c=td(e,a,u,n);(r._to!==c.x||s._to!==c.y)&&(this.xAlign=u.xAlign,this.yAlign=u.yAlign,this.width=l.width,this.height=l.height,this.caretX=o.x,this.caretY=o.y,this._resolveAnimations().update(this,c))}}_willRender(){return!!this.opacity}draw(e){const n=this.options.setContext(this.getContext());let i=this.opacity;if(!i)return;this._updateAnimationTarget(n);const r={width:this.width,height:this.height},s={x:this.x,y:this.y};i=Math.abs(i)<.001?0:i;const o=Me(n.padding),l=this.title.length||this.beforeBody.length||this.body.length||this.afterBody.length||this.footer.length;n.enabled&&l&&(e.save(),e.globalAlpha=i,this.drawBackground(s,e,r,n),og(e,n.textDirection),s.y+=o.top,this.drawTitle(s,e,n),this.drawBody(s,e,n),this.drawFooter(s,e,n),lg(e,n.textDirection),e.restore())}getActiveElements(){return this._active||[]}setActiveElements(e,n){const i=this._active,r=e.map(({datasetIndex:l,index:a})=>{const u=this.chart.getDatasetMeta(l);if(!u)throw new Error("Cannot find a dataset at index "+l);return{datasetIndex:l,element:u.data[a],index:a}}),s=!co(i,r),o=this._positionChanged(r,n);(s||o)&&(this._active=r,this._eventPosition=n,this._ignoreReplayEvents=!0,this.update(!0))}handleEvent(e,n,i=!0){if(n&&this._ignoreReplayEvents)return!1;this._ignoreReplayEvents=!1;const r=this.options,s=this._active||[],o=this._getActiveElements(e,s,n,i),l=this._positionChanged(o,e),a=n||!co(o,s)||l;return a&&(this._active=o,(r.enabled||r.external)&&(this._eventPosition={x:e.x,y:e.y},this.update(!0,n))),a}_getActiveElements(e,n,i,r){const s=this.options;if(e.type==="mouseout")return[];if(!r)return n;const o=this.chart.getElementsAtEventForMode(e,s.mode,s,i);return s.reverse&&o.reverse(),o}_positionChanged(e,n){const{caretX:i,caretY:r,options:s}=this,o=Ui[s.position].call(this,e,n);return o!==!1&&(i!==o.x||r!==o.y)}}I(Oa,"positioners",Ui);var j2={id:"tooltip",_element:Oa,positioners:Ui,afterInit(t,e,n){n&&(t.tooltip=new Oa({chart:t,options:n}))},beforeUpdate(t,e,n){t.tooltip&&t.tooltip.initialize(n)},reset(t,e,n){t.tooltip&&t.tooltip.initialize(n)},afterDraw(t){const e=t.tooltip;if(e&&e._willRender()){const n={tooltip:e};if(t.notifyPlugins("beforeTooltipDraw",{...n,cancelable:!0})===!1)return;e.draw(t.ctx),t.notifyPlugins("afterTooltipDraw",n)}},afterEvent(t,e){if(t.tooltip){const n=e.replay;t.tooltip.handleEvent(e.event,n,e.inChartArea)&&(e.changed=!0)}},defaults:{enabled:!0,external:null,position:"average",backgroundColor:"rgba(0,0,0,0.8)",titleColor:"#fff",titleFont:{weight:"bold"},titleSpacing:2,titleMarginBottom:6,titleAlign:"left",bodyColor:"#fff",bodySpacing:2,bodyFont:{},bodyAlign:"left",footerColor:"#fff",footerSpacing:2,footerMarginTop:6,footerFont:{weight:"bold"},footerAlign:"left",padding:6,caretPadding:2,caretSize:5,cornerRadius:6,boxHeight:(t,e)=>e.bodyFont.size,boxWidth:(t,e)=>e.bodyFont.size,multiKeyBackground:"#fff",displayColors:!0,boxPadding:0,borderColor:"rgba(0,0,0,0)",borderWidth:0,animation:{duration:400,easing:"easeOutQuart"},animations:{numbers:{type:"number",properties:["x","y","width","height","caretX","caretY"]},opacity:{easing:"linear",duration:200}},callbacks:Sg},defaultRoutes:{bodyFont:"font",footerFont:"font",titleFont:"font"},descriptors:{_scriptable:t=>t!=="filter"&&t!=="itemSort"&&t!=="external",_indexable:!1,callbacks:{_scriptable:!1,_indexable:!1},animation:{_fallback:!1},animations:{_fallback:"animation"}},additionalOptionScopes:["interaction"]};const B2=(t,e,n,i)=>(typeof e=="string"?(n=t.push(e)-1,i.unshift({index:n,label:e})):isNaN(e)&&(n=null),n);function $2(t,e,n,i){const r=t.indexOf(e);if(r===-1)return B2(t,e,n,i);const s=t.lastIndexOf(e);return r!==s?n:r}const H2=(t,e)=>t===null?null:Je(Math.round(t),0,e);function rd(t){const e=this.getLabels();return t>=0&&t<e.length?e[t]:t}class Da extends Bn{constructor(e){super(e),this._startValue=void 0,this._valueRange=0,this._addedLabels=[]}init(e){const n=this._addedLabels;if(n.length){const i=this.getLabels();for(const{index:r,label:s}of n)i[r]===s&&i.splice(r,1);this._addedLabels=[]}super.init(e)}parse(e,n){if(X(e))return null;const i=this.getLabels();return n=isFinite(n)&&i[n]===e?n:$2(i,e,F(n,e),this._addedLabels),H2(n,i.length-1)}determineDataLimits(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let{min:i,max:r}=this.getMinMax(!0);this.options.bounds==="ticks"&&(e||(i=0),n||(r=this.getLabels().length-1)),this.min=i,this.max=r}buildTicks(){const e=this.min,n=this.max,i=this.options.offset,r=[];let s=this.getLabels();s=e===0&&n===s.length-1?s:s.slice(e,n+1),this._valueRange=Math.max(s.length-(i?0:1),1),this._startValue=this.min-(i?.5:0);for(let o=e;o<=n;o++)r.push({value:o});return r}getLabelForValue(e){return rd.call(this,e)}configure(){super.configure(),this.isHorizontal()||(this._reversePixels=!this._reversePixels)}getPixelForValue(e){return typeof e!="number"&&(e=this.parse(e)),e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getPixelForTick(e){const n=this.ticks;return e<0||e>n.length-1?null:this.getPixelForValue(n[e].value)}getValueForPixel(e){return Math.round(this._startValue+this.getDecimalForPixel(e)*this._valueRange)}getBasePixel(){return this.bottom}}I(Da,"id","category"),I(Da,"defaults",{ticks:{callback:rd}});function W2(t,e){const n=[],{bounds:r,step:s,min:o,max:l,precision:a,count:u,maxTicks:c,maxDigits:f,includeBounds:d}=t,h=s||1,m=c-1,{min:y,max:x}=e,p=!X(o),g=!X(l),v=!X(u),_=(x-y)/(f+1);let w=df((x-y)/m/h)*h,k,S,b,O;if(w<1e-14&&!p&&!g)return[{value:y},{value:x}];O=Math.ceil(x/w)-Math.floor(y/w),O>m&&(w=df(O*w/m/h)*h),X(a)||(k=Math.pow(10,a),w=Math.ceil(w*k)/k),r==="ticks"?(S=Math.floor(y/w)*w,b=Math.ceil(x/w)*w):(S=y,b=x),p&&g&&s&&Ny((l-o)/s,w/1e3)?(O=Math.round(Math.min((l-o)/w,c)),w=(l-o)/O,S=o,b=l):v?(S=p?o:S,b=g?l:b,O=u-1,w=(b-S)/O):(O=(b-S)/w,nr(O,Math.round(O),w/1e3)?O=Math.round(O):O=Math.ceil(O));const P=Math.max(hf(w),hf(S));k=Math.pow(10,X(a)?P:a),S=Math.round(S*k)/k,b=Math.round(b*k)/k;let D=0;for(p&&(d&&S!==o?(n.push({value:o}),S<o&&D++,nr(Math.round((S+D*w)*k)/k,o,sd(o,_,t))&&D++):S<o&&D++);D<O;++D)n.push({value:Math.round((S+D*w)*k)/k});return g&&d&&b!==l?n.length&&nr(n[n.length-1].value,l,sd(l,_,t))?n[n.length-1].value=l:n.push({value:l}):(!g||b===l)&&n.push({value:b}),n}function sd(t,e,{horizontal:n,minRotation:i}){const r=Xt(i),s=(n?Math.sin(r):Math.cos(r))||.001,o=.75*e*(""+t).length;return Math.min(e/s,o)}class _o extends Bn{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._endValue=void 0,this._valueRange=0}parse(e,n){return X(e)||(typeof e=="number"||e instanceof Number)&&!isFinite(+e)?null:+e}handleTickRangeOptions(){const{beginAtZero:e}=this.options,{minDefined:n,maxDefined:i}=this.getUserBounds();let{min:r,max:s}=this;const o=a=>r=n?r:a,l=a=>s=i?s:a;if(e){const a=mi(r),u=mi(s);a<0&&u<0?l(0):a>0&&u>0&&o(0)}if(r===s){let a=s===0?1:Math.abs(s*.05);l(s+a),e||o(r-a)}this.min=r,this.max=s}getTickLimit(){const e=this.options.ticks;let{maxTicksLimit:n,stepSize:i}=e,r;return i?(r=Math.ceil(this.max/i)-Math.floor(this.min/i)+1,r>1e3&&(console.warn(`scales.${this.id}.ticks.stepSize: ${i} would result generating up to ${r} ticks. Limiting to 1000.`),r=1e3)):(r=this.computeTickLimit(),n=n||11),n&&(r=Math.min(n,r)),r}computeTickLimit(){return Number.POSITIVE_INFINITY}buildTicks(){const e=this.options,n=e.ticks;let i=this.getTickLimit();i=Math.max(2,i);const r={maxTicks:i,bounds:e.bounds,min:e.min,max:e.max,precision:n.precision,step:n.stepSize,count:n.count,maxDigits:this._maxDigits(),horizontal:this.isHorizontal(),minRotation:n.minRotation||0,includeBounds:n.includeBounds!==!1},s=this._range||this,o=W2(r,s);return e.bounds==="ticks"&&Vp(o,this,"value"),e.reverse?(o.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),o}configure(){const e=this.ticks;let n=this.min,i=this.max;if(super.configure(),this.options.offset&&e.length){const r=(i-n)/Math.max(e.length-1,1)/2;n-=r,i+=r}this._startValue=n,this._endValue=i,this._valueRange=i-n}getLabelForValue(e){return Au(e,this.chart.options.locale,this.options.ticks.format)}}class za extends _o{determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=de(e)?e:0,this.max=de(n)?n:1,this.handleTickRangeOptions()}computeTickLimit(){const e=this.isHorizontal(),n=e?this.width:this.height,i=Xt(this.options.ticks.minRotation),r=(e?Math.sin(i):Math.cos(i))||.001,s=this._resolveTickFontOptions(0);return Math.ceil(n/Math.min(40,s.lineHeight/r))}getPixelForValue(e){return e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getValueForPixel(e){return this._startValue+this.getDecimalForPixel(e)*this._valueRange}}I(za,"id","linear"),I(za,"defaults",{ticks:{callback:$o.formatters.numeric}});const Or=t=>Math.floor(Kt(t)),xn=(t,e)=>Math.pow(10,Or(t)+e);function od(t){return t/Math.pow(10,Or(t))===1}function ld(t,e,n){const i=Math.pow(10,n),r=Math.floor(t/i);return Math.ceil(e/i)-r}function V2(t,e){const n=e-t;let i=Or(n);for(;ld(t,e,i)>10;)i++;for(;ld(t,e,i)<10;)i--;return Math.min(i,Or(t))}function U2(t,{min:e,max:n}){e=He(t.min,e);const i=[],r=Or(e);let s=V2(e,n),o=s<0?Math.pow(10,Math.abs(s)):1;const l=Math.pow(10,s),a=r>s?Math.pow(10,r):0,u=Math.round((e-a)*o)/o,c=Math.floor((e-a)/l/10)*l*10;let f=Math.floor((u-c)/Math.pow(10,s)),d=He(t.min,Math.round((a+c+f*Math.pow(10,s))*o)/o);for(;d<n;)i.push({value:d,major:od(d),significand:f}),f>=10?f=f<15?15:20:f++,f>=20&&(s++,f=2,o=s>=0?1:o),d=Math.round((a+c+f*Math.pow(10,s))*o)/o;const h=He(t.max,d);return i.push({value:h,major:od(h),significand:f}),i}class ad extends Bn{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._valueRange=0}parse(e,n){const i=_o.prototype.parse.apply(this,[e,n]);if(i===0){this._zero=!0;return}return de(i)&&i>0?i:null}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=de(e)?Math.max(0,e):null,this.max=de(n)?Math.max(0,n):null,this.options.beginAtZero&&(this._zero=!0),this._zero&&this.min!==this._suggestedMin&&!de(this._userMin)&&(this.min=e===xn(this.min,0)?xn(this.min,-1):xn(this.min,0)),this.handleTickRangeOptions()}handleTickRangeOptions(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let i=this.min,r=this.max;const s=l=>i=e?i:l,o=l=>r=n?r:l;i===r&&(i<=0?(s(1),o(10)):(s(xn(i,-1)),o(xn(r,1)))),i<=0&&s(xn(r,-1)),r<=0&&o(xn(i,1)),this.min=i,this.max=r}buildTicks(){const e=this.options,n={min:this._userMin,max:this._userMax},i=U2(n,this);return e.bounds==="ticks"&&Vp(i,this,"value"),e.reverse?(i.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),i}getLabelForValue(e){return e===void 0?"0":Au(e,this.chart.options.locale,this.options.ticks.format)}configure(){const e=this.min;super.configure(),this._startValue=Kt(e),this._valueRange=Kt(this.max)-Kt(e)}getPixelForValue(e){return(e===void 0||e===0)&&(e=this.min),e===null||isNaN(e)?NaN:this.getPixelForDecimal(e===this.min?0:(Kt(e)-this._startValue)/this._valueRange)}getValueForPixel(e){const n=this.getDecimalForPixel(e);return Math.pow(10,this._startValue+n*this._valueRange)}}I(ad,"id","logarithmic"),I(ad,"defaults",{ticks:{callback:$o.formatters.logarithmic,major:{enabled:!0}}});function Na(t){const e=t.ticks;if(e.display&&t.display){const n=Me(e.backdropPadding);return F(e.font&&e.font.size,oe.font.size)+n.height}return 0}function Y2(t,e,n){return n=ie(n)?n:[n],{w:tv(t,e.string,n),h:n.length*e.lineHeight}}function ud(t,e,n,i,r){return t===i||t===r?{start:e-n/2,end:e+n/2}:t<i||t>r?{start:e-n,end:e}:{start:e,end:e+n}}function Q2(t){const e={l:t.left+t._padding.left,r:t.right-t._padding.right,t:t.top+t._padding.top,b:t.bottom-t._padding.bottom},n=Object.assign({},e),i=[],r=[],s=t._pointLabels.length,o=t.options.pointLabels,l=o.centerPointLabels?ve/s:0;for(let a=0;a<s;a++){const u=o.setContext(t.getPointLabelContext(a));r[a]=u.padding;const c=t.getPointPosition(a,t.drawingArea+r[a],l),f=ge(u.font),d=Y2(t.ctx,f,t._pointLabels[a]);i[a]=d;const h=lt(t.getIndexAngle(a)+l),m=Math.round(Ru(h)),y=ud(m,c.x,d.w,0,180),x=ud(m,c.y,d.h,90,270);K2(n,e,h,y,x)}t.setCenterPoint(e.l-n.l,n.r-e.r,e.t-n.t,n.b-e.b),t._pointLabelItems=X2(t,i,r)}function K2(t,e,n,i,r){const s=Math.abs(Math.sin(n)),o=Math.abs(Math.cos(n));let l=0,a=0;i.start<e.l?(l=(e.l-i.start)/s,t.l=Math.min(t.l,e.l-l)):i.end>e.r&&(l=(i.end-e.r)/s,t.r=Math.max(t.r,e.r+l)),r.start<e.t?(a=(e.t-r.start)/o,t.t=Math.min(t.t,e.t-a)):r.end>e.b&&(a=(r.end-e.b)/o,t.b=Math.max(t.b,e.b+a))}function X2(t,e,n){const i=[],r=t._pointLabels.length,s=t.options,o=Na(s)/2,l=t.drawingArea,a=s.pointLabels.centerPointLabels?ve/r:0;for(let u=0;u<r;u++){const c=t.getPointPosition(u,l+o+n[u],a),f=Math.round(Ru(lt(c.angle+Ne))),d=e[u],h=q2(c.y,d.h,f),m=G2(f),y=Z2(c.x,d.w,m);i.push({x:c.x,y:h,textAlign:m,left:y,top:h,right:y+d.w,bottom:h+d.h})}return i}function G2(t){return t===0||t===180?"center":t<180?"left":"right"}function Z2(t,e,n){return n==="right"?t-=e:n==="center"&&(t-=e/2),t}function q2(t,e,n){return n===90||n===270?t-=e/2:(n>270||n<90)&&(t-=e),t}function J2(t,e){const{ctx:n,options:{pointLabels:i}}=t;for(let r=e-1;r>=0;r--){const s=i.setContext(t.getPointLabelContext(r)),o=ge(s.font),{x:l,y:a,textAlign:u,left:c,top:f,right:d,bottom:h}=t._pointLabelItems[r],{backdropColor:m}=s;if(!X(m)){const y=li(s.borderRadius),x=Me(s.backdropPadding);n.fillStyle=m;const p=c-x.left,g=f-x.top,v=d-c+x.width,_=h-f+x.height;Object.values(y).some(w=>w!==0)?(n.beginPath(),mo(n,{x:p,y:g,w:v,h:_,radius:y}),n.fill()):n.fillRect(p,g,v,_)}yi(n,t._pointLabels[r],l,a+o.lineHeight/2,o,{color:s.color,textAlign:u,textBaseline:"middle"})}}function bg(t,e,n,i){const{ctx:r}=t;if(n)r.arc(t.xCenter,t.yCenter,e,0,tt);else{let s=t.getPointPosition(0,e);r.moveTo(s.x,s.y);for(let o=1;o<i;o++)s=t.getPointPosition(o,e),r.lineTo(s.x,s.y)}}function e_(t,e,n,i,r){const s=t.ctx,o=e.circular,{color:l,lineWidth:a}=e;!o&&!i||!l||!a||n<0||(s.save(),s.strokeStyle=l,s.lineWidth=a,s.setLineDash(r.dash),s.lineDashOffset=r.dashOffset,s.beginPath(),bg(t,n,o,i),s.closePath(),s.stroke(),s.restore())}function t_(t,e,n){return gn(t,{label:n,index:e,type:"pointLabel"})}class ys extends _o{constructor(e){super(e),this.xCenter=void 0,this.yCenter=void 0,this.drawingArea=void 0,this._pointLabels=[],this._pointLabelItems=[]}setDimensions(){const e=this._padding=Me(Na(this.options)/2),n=this.width=this.maxWidth-e.width,i=this.height=this.maxHeight-e.height;this.xCenter=Math.floor(this.left+n/2+e.left),this.yCenter=Math.floor(this.top+i/2+e.top),this.drawingArea=Math.floor(Math.min(n,i)/2)}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!1);this.min=de(e)&&!isNaN(e)?e:0,this.max=de(n)&&!isNaN(n)?n:0,this.handleTickRangeOptions()}computeTickLimit(){return Math.ceil(this.drawingArea/Na(this.options))}generateTickLabels(e){_o.prototype.generateTickLabels.call(this,e),this._pointLabels=this.getLabels().map((n,i)=>{const r=V(this.options.pointLabels.callback,[n,i],this);return r||r===0?r:""}).filter((n,i)=>this.chart.getDataVisibility(i))}fit(){const e=this.options;e.display&&e.pointLabels.display?Q2(this):this.setCenterPoint(0,0,0,0)}setCenterPoint(e,n,i,r){this.xCenter+=Math.floor((e-n)/2),this.yCenter+=Math.floor((i-r)/2),this.drawingArea-=Math.min(this.drawingArea/2,Math.max(e,n,i,r))}getIndexAngle(e){const n=tt/(this._pointLabels.length||1),i=this.options.startAngle||0;return lt(e*n+Xt(i))}getDistanceFromCenterForValue(e){if(X(e))return NaN;const n=this.drawingArea/(this.max-this.min);return this.options.reverse?(this.max-e)*n:(e-this.min)*n}getValueForDistanceFromCenter(e){if(X(e))return NaN;const n=e/(this.drawingArea/(this.max-this.min));return this.options.reverse?this.max-n:this.min+n}getPointLabelContext(e){const n=this._pointLabels||[];if(e>=0&&e<n.length){const i=n[e];return t_(this.getContext(),e,i)}}getPointPosition(e,n,i=0){const r=this.getIndexAngle(e)-Ne+i;return{x:Math.cos(r)*n+this.xCenter,y:Math.sin(r)*n+this.yCenter,angle:r}}getPointPositionForValue(e,n){return this.getPointPosition(e,this.getDistanceFromCenterForValue(n))}getBasePosition(e){return this.getPointPositionForValue(e||0,this.getBaseValue())}getPointLabelPosition(e){const{left:n,top:i,right:r,bottom:s}=this._pointLabelItems[e];return{left:n,top:i,right:r,bottom:s}}drawBackground(){const{backgroundColor:e,grid:{circular:n}}=this.options;if(e){const i=this.ctx;i.save(),i.beginPath(),bg(this,this.getDistanceFromCenterForValue(this._endValue),n,this._pointLabels.length),i.closePath(),i.fillStyle=e,i.fill(),i.restore()}}drawGrid(){const e=this.ctx,n=this.options,{angleLines:i,grid:r,border:s}=n,o=this._pointLabels.length;let l,a,u;if(n.pointLabels.display&&J2(this,o),r.display&&this.ticks.forEach((c,f)=>{if(f!==0){a=this.getDistanceFromCenterForValue(c.value);const d=this.getContext(f),h=r.setContext(d),m=s.setContext(d);e_(this,h,a,o,m)}}),i.display){for(e.save(),l=o-1;l>=0;l--){const c=i.setContext(this.getPointLabelContext(l)),{color:f,lineWidth:d}=c;!d||!f||(e.lineWidth=d,e.strokeStyle=f,e.setLineDash(c.borderDash),e.lineDashOffset=c.borderDashOffset,a=this.getDistanceFromCenterForValue(n.ticks.reverse?this.min:this.max),u=this.getPointPosition(l,a),e.beginPath(),e.moveTo(this.xCenter,this.yCenter),e.lineTo(u.x,u.y),e.stroke())}e.restore()}}drawBorder(){}drawLabels(){const e=this.ctx,n=this.options,i=n.ticks;if(!i.display)return;const r=this.getIndexAngle(0);let s,o;e.save(),e.translate(this.xCenter,this.yCenter),e.rotate(r),e.textAlign="center",e.textBaseline="middle",this.ticks.forEach((l,a)=>{if(a===0&&!n.reverse)return;const u=i.setContext(this.getContext(a)),c=ge(u.font);if(s=this.getDistanceFromCenterForValue(this.ticks[a].value),u.showLabelBackdrop){e.font=c.string,o=e.measureText(l.label).width,e.fillStyle=u.backdropColor;const f=Me(u.backdropPadding);e.fillRect(-o/2-f.left,-s-c.size/2-f.top,o+f.width,c.size+f.height)}yi(e,l.label,0,-s,c,{color:u.color})}),e.restore()}drawTitle(){}}I(ys,"id","radialLinear"),I(ys,"defaults",{display:!0,animate:!0,position:"chartArea",angleLines:{display:!0,lineWidth:1,borderDash:[],borderDashOffset:0},grid:{circular:!1},startAngle:0,ticks:{showLabelBackdrop:!0,callback:$o.formatters.numeric},pointLabels:{backdropColor:void 0,backdropPadding:2,display:!0,font:{size:10},callback(e){return e},padding:5,centerPointLabels:!1}}),I(ys,"defaultRoutes",{"angleLines.color":"borderColor","pointLabels.color":"color","ticks.color":"color"}),I(ys,"descriptors",{angleLines:{_fallback:"grid"}});const Vo={millisecond:{common:!0,size:1,steps:1e3},second:{common:!0,size:1e3,steps:60},minute:{common:!0,size:6e4,steps:60},hour:{common:!0,size:36e5,steps:24},day:{common:!0,size:864e5,steps:30},week:{common:!1,size:6048e5,steps:4},month:{common:!0,size:2628e6,steps:12},quarter:{common:!1,size:7884e6,steps:4},year:{common:!0,size:3154e7}},Oe=Object.keys(Vo);function n_(t,e){return t-e}function cd(t,e){if(X(e))return null;const n=t._adapter,{parser:i,round:r,isoWeekday:s}=t._parseOpts;let o=e;return typeof i=="function"&&(o=i(o)),de(o)||(o=typeof i=="string"?n.parse(o,i):n.parse(o)),o===null?null:(r&&(o=r==="week"&&(Pr(s)||s===!0)?n.startOf(o,"isoWeek",s):n.startOf(o,r)),+o)}function fd(t,e,n,i){const r=Oe.length;for(let s=Oe.indexOf(t);s<r-1;++s){const o=Vo[Oe[s]],l=o.steps?o.steps:Number.MAX_SAFE_INTEGER;if(o.common&&Math.ceil((n-e)/(l*o.size))<=i)return Oe[s]}return Oe[r-1]}function i_(t,e,n,i,r){for(let s=Oe.length-1;s>=Oe.indexOf(n);s--){const o=Oe[s];if(Vo[o].common&&t._adapter.diff(r,i,o)>=e-1)return o}return Oe[n?Oe.indexOf(n):0]}function r_(t){for(let e=Oe.indexOf(t)+1,n=Oe.length;e<n;++e)if(Vo[Oe[e]].common)return Oe[e]}function dd(t,e,n){if(!n)t[e]=!0;else if(n.length){const{lo:i,hi:r}=Fu(n,e),s=n[i]>=e?n[i]:n[r];t[s]=!0}}function s_(t,e,n,i){const r=t._adapter,s=+r.startOf(e[0].value,i),o=e[e.length-1].value;let l,a;for(l=s;l<=o;l=+r.add(l,1,i))a=n[l],a>=0&&(e[a].major=!0);return e}function hd(t,e,n){const i=[],r={},s=e.length;let o,l;for(o=0;o<s;++o)l=e[o],r[l]=o,i.push({value:l,major:!1});return s===0||!n?i:s_(t,i,r,n)}class wo extends Bn{constructor(e){super(e),this._cache={data:[],labels:[],all:[]},this._unit="day",this._majorUnit=void 0,this._offsets={},this._normalized=!1,this._parseOpts=void 0}init(e,n={}){const i=e.time||(e.time={}),r=this._adapter=new ax._date(e.adapters.date);r.init(n),tr(i.displayFormats,r.formats()),this._parseOpts={parser:i.parser,round:i.round,isoWeekday:i.isoWeekday},super.init(e),this._normalized=n.normalized}parse(e,n){return e===void 0?null:cd(this,e)}beforeLayout(){super.beforeLayout(),this._cache={data:[],labels:[],all:[]}}determineDataLimits(){const e=this.options,n=this._adapter,i=e.time.unit||"day";let{min:r,max:s,minDefined:o,maxDefined:l}=this.getUserBounds();function a(u){!o&&!isNaN(u.min)&&(r=Math.min(r,u.min)),!l&&!isNaN(u.max)&&(s=Math.max(s,u.max))}(!o||!l)&&(a(this._getLabelBounds()),(e.bounds!=="ticks"||e.ticks.source!=="labels")&&a(this.getMinMax(!1))),r=de(r)&&!isNaN(r)?r:+n.startOf(Date.now(),i),s=de(s)&&!isNaN(s)?s:+n.endOf(Date.now(),i)+1,this.min=Math.min(r,s-1),this.max=Math.max(r+1,s)}_getLabelBounds(){const e=this.getLabelTimestamps();let n=Number.POSITIVE_INFINITY,i=Number.NEGATIVE_INFINITY;return e.length&&(n=e[0],i=e[e.length-1]),{min:n,max:i}}buildTicks(){const e=this.options,n=e.time,i=e.ticks,r=i.source==="labels"?this.getLabelTimestamps():this._generate();e.bounds==="ticks"&&r.length&&(this.min=this._userMin||r[0],this.max=this._userMax||r[r.length-1]);const s=this.min,o=this.max,l=jy(r,s,o);return this._unit=n.unit||(i.autoSkip?fd(n.minUnit,this.min,this.max,this._getLabelCapacity(s)):i_(this,l.length,n.minUnit,this.min,this.max)),this._majorUnit=!i.major.enabled||this._unit==="year"?void 0:r_(this._unit),this.initOffsets(r),e.reverse&&l.reverse(),hd(this,l,this._majorUnit)}afterAutoSkip(){this.options.offsetAfterAutoskip&&this.initOffsets(this.ticks.map(e=>+e.value))}initOffsets(e=[]){let n=0,i=0,r,s;this.options.offset&&e.length&&(r=this.getDecimalForValue(e[0]),e.length===1?n=1-r:n=(this.getDecimalForValue(e[1])-r)/2,s=this.getDecimalForValue(e[e.length-1]),e.length===1?i=s:i=(s-this.getDecimalForValue(e[e.length-2]))/2);const o=e.length<3?.5:.25;n=Je(n,0,o),i=Je(i,0,o),this._offsets={start:n,end:i,factor:1/(n+1+i)}}_generate(){const e=this._adapter,n=this.min,i=this.max,r=this.options,s=r.time,o=s.unit||fd(s.minUnit,n,i,this._getLabelCapacity(n)),l=F(r.ticks.stepSize,1),a=o==="week"?s.isoWeekday:!1,u=Pr(a)||a===!0,c={};let f=n,d,h;if(u&&(f=+e.startOf(f,"isoWeek",a)),f=+e.startOf(f,u?"day":o),e.diff(i,n,o)>1e5*l)throw new Error(n+" and "+i+" are too far apart with stepSize of "+l+" "+o);const m=r.ticks.source==="data"&&this.getDataTimestamps();for(d=f,h=0;d<i;d=+e.add(d,l,o),h++)dd(c,d,m);return(d===i||r.bounds==="ticks"||h===1)&&dd(c,d,m),Object.keys(c).sort((y,x)=>y-x).map(y=>+y)}getLabelForValue(e){const n=this._adapter,i=this.options.time;return i.tooltipFormat?n.format(e,i.tooltipFormat):n.format(e,i.displayFormats.datetime)}_tickFormatFunction(e,n,i,r){const s=this.options,o=s.ticks.callback;if(o)return V(o,[e,n,i],this);const l=s.time.displayFormats,a=this._unit,u=this._majorUnit,c=a&&l[a],f=u&&l[u],d=i[n],h=u&&f&&d&&d.major;return this._adapter.format(e,r||(h?f:c))}generateTickLabels(e){let n,i,r;for(n=0,i=e.length;n<i;++n)r=e[n],r.label=this._tickFormatFunction(r.value,n,e)}getDecimalForValue(e){return e===null?NaN:(e-this.min)/(this.max-this.min)}getPixelForValue(e){const n=this._offsets,i=this.getDecimalForValue(e);return this.getPixelForDecimal((n.start+i)*n.factor)}getValueForPixel(e){const n=this._offsets,i=this.getDecimalForPixel(e)/n.factor-n.end;return this.min+i*(this.max-this.min)}_getLabelSize(e){const n=this.options.ticks,i=this.ctx.measureText(e).width,r=Xt(this.isHorizontal()?n.maxRotation:n.minRotation),s=Math.cos(r),o=Math.sin(r),l=this._resolveTickFontOptions(0).size;return{w:i*s+l*o,h:i*o+l*s}}_getLabelCapacity(e){const n=this.options.time,i=n.displayFormats,r=i[n.unit]||i.millisecond,s=this._tickFormatFunction(e,0,hd(this,[e],this._majorUnit),r),o=this._getLabelSize(s),l=Math.floor(this.isHorizontal()?this.width/o.w:this.height/o.h)-1;return l>0?l:1}getDataTimestamps(){let e=this._cache.data||[],n,i;if(e.length)return e;const r=this.getMatchingVisibleMetas();if(this._normalized&&r.length)return this._cache.data=r[0].controller.getAllParsedValues(this);for(n=0,i=r.length;n<i;++n)e=e.concat(r[n].controller.getAllParsedValues(this));return this._cache.data=this.normalize(e)}getLabelTimestamps(){const e=this._cache.labels||[];let n,i;if(e.length)return e;const r=this.getLabels();for(n=0,i=r.length;n<i;++n)e.push(cd(this,r[n]));return this._cache.labels=this._normalized?e:this.normalize(e)}normalize(e){return $y(e.sort(n_))}}I(wo,"id","time"),I(wo,"defaults",{bounds:"data",adapters:{},time:{parser:!1,unit:!1,round:!1,isoWeekday:!1,minUnit:"millisecond",displayFormats:{}},ticks:{source:"auto",callback:!1,major:{enabled:!1}}});function vs(t,e,n){let i=0,r=t.length-1,s,o,l,a;n?(e>=t[i].pos&&e<=t[r].pos&&({lo:i,hi:r}=En(t,"pos",e)),{pos:s,time:l}=t[i],{pos:o,time:a}=t[r]):(e>=t[i].time&&e<=t[r].time&&({lo:i,hi:r}=En(t,"time",e)),{time:s,pos:l}=t[i],{time:o,pos:a}=t[r]);const u=o-s;return u?l+(a-l)*(e-s)/u:l}class pd extends wo{constructor(e){super(e),this._table=[],this._minPos=void 0,this._tableRange=void 0}initOffsets(){const e=this._getTimestampsForTable(),n=this._table=this.buildLookupTable(e);this._minPos=vs(n,this.min),this._tableRange=vs(n,this.max)-this._minPos,super.initOffsets(e)}buildLookupTable(e){const{min:n,max:i}=this,r=[],s=[];let o,l,a,u,c;for(o=0,l=e.length;o<l;++o)u=e[o],u>=n&&u<=i&&r.push(u);if(r.length<2)return[{time:n,pos:0},{time:i,pos:1}];for(o=0,l=r.length;o<l;++o)c=r[o+1],a=r[o-1],u=r[o],Math.round((c+a)/2)!==u&&s.push({time:u,pos:o/(l-1)});return s}_getTimestampsForTable(){let e=this._cache.all||[];if(e.length)return e;const n=this.getDataTimestamps(),i=this.getLabelTimestamps();return n.length&&i.length?e=this.normalize(n.concat(i)):e=n.length?n:i,e=this._cache.all=e,e}getDecimalForValue(e){return(vs(this._table,e)-this._minPos)/this._tableRange}getValueForPixel(e){const n=this._offsets,i=this.getDecimalForPixel(e)/n.factor-n.end;return vs(this._table,i*this._tableRange+this._minPos,!0)}}I(pd,"id","timeseries"),I(pd,"defaults",wo.defaults);const Cg="label";function gd(t,e){typeof t=="function"?t(e):t&&(t.current=e)}function o_(t,e){const n=t.options;n&&e&&Object.assign(n,e)}function Mg(t,e){t.labels=e}function Eg(t,e){let n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:Cg;const i=[];t.datasets=e.map(r=>{const s=t.datasets.find(o=>o[n]===r[n]);return!s||!r.data||i.includes(s)?{...r}:(i.push(s),Object.assign(s,r),s)})}function l_(t){let e=arguments.length>1&&arguments[1]!==void 0?arguments[1]:Cg;const n={labels:[],datasets:[]};return Mg(n,t.labels),Eg(n,t.datasets,e),n}function a_(t,e){const{height:n=150,width:i=300,redraw:r=!1,datasetIdKey:s,type:o,data:l,options:a,plugins:u=[],fallbackContent:c,updateMode:f,...d}=t,h=M.exports.useRef(null),m=M.exports.useRef(),y=()=>{h.current&&(m.current=new Wo(h.current,{type:o,data:l_(l,s),options:a&&{...a},plugins:u}),gd(e,m.current))},x=()=>{gd(e,null),m.current&&(m.current.destroy(),m.current=null)};return M.exports.useEffect(()=>{!r&&m.current&&a&&o_(m.current,a)},[r,a]),M.exports.useEffect(()=>{!r&&m.current&&Mg(m.current.config.data,l.labels)},[r,l.labels]),M.exports.useEffect(()=>{!r&&m.current&&l.datasets&&Eg(m.current.config.data,l.datasets,s)},[r,l.datasets]),M.exports.useEffect(()=>{m.current&&(r?(x(),setTimeout(y)):m.current.update(f))},[r,a,l.labels,l.datasets,f]),M.exports.useEffect(()=>{m.current&&(x(),setTimeout(y))},[o]),M.exports.useEffect(()=>(y(),()=>x()),[]),ja.createElement("canvas",Object.assign({ref:h,role:"img",height:n,width:i},d),c)}const u_=M.exports.forwardRef(a_);function c_(t,e){return Wo.register(e),M.exports.forwardRef((n,i)=>ja.createElement(u_,Object.assign({},n,{ref:i,type:t})))}const f_=c_("line",Ns);function d_(t){var e=typeof t;return t!=null&&(e=="object"||e=="function")}var Pg=d_,h_=typeof{}=="object"&&{}&&{}.Object===Object&&{},p_=h_,g_=p_,m_=typeof self=="object"&&self&&self.Object===Object&&self,y_=g_||m_||Function("return this")(),Lg=y_,v_=Lg,x_=function(){return v_.Date.now()},__=x_,w_=/\s/;function k_(t){for(var e=t.length;e--&&w_.test(t.charAt(e)););return e}var S_=k_,b_=S_,C_=/^\s+/;function M_(t){return t&&t.slice(0,b_(t)+1).replace(C_,"")}var E_=M_,P_=Lg,L_=P_.Symbol,Tg=L_,md=Tg,Og=Object.prototype,T_=Og.hasOwnProperty,O_=Og.toString,Ri=md?md.toStringTag:void 0;function D_(t){var e=T_.call(t,Ri),n=t[Ri];try{t[Ri]=void 0;var i=!0}catch{}var r=O_.call(t);return i&&(e?t[Ri]=n:delete t[Ri]),r}var z_=D_,N_=Object.prototype,I_=N_.toString;function R_(t){return I_.call(t)}var F_=R_,yd=Tg,A_=z_,j_=F_,B_="[object Null]",$_="[object Undefined]",vd=yd?yd.toStringTag:void 0;function H_(t){return t==null?t===void 0?$_:B_:vd&&vd in Object(t)?A_(t):j_(t)}var W_=H_;function V_(t){return t!=null&&typeof t=="object"}var U_=V_,Y_=W_,Q_=U_,K_="[object Symbol]";function X_(t){return typeof t=="symbol"||Q_(t)&&Y_(t)==K_}var G_=X_,Z_=E_,xd=Pg,q_=G_,_d=0/0,J_=/^[-+]0x[0-9a-f]+$/i,ew=/^0b[01]+$/i,tw=/^0o[0-7]+$/i,nw=parseInt;function iw(t){if(typeof t=="number")return t;if(q_(t))return _d;if(xd(t)){var e=typeof t.valueOf=="function"?t.valueOf():t;t=xd(e)?e+"":e}if(typeof t!="string")return t===0?t:+t;t=Z_(t);var n=ew.test(t);return n||tw.test(t)?nw(t.slice(2),n?2:8):J_.test(t)?_d:+t}var rw=iw,sw=Pg,Ml=__,wd=rw,ow="Expected a function",lw=Math.max,aw=Math.min;function uw(t,e,n){var i,r,s,o,l,a,u=0,c=!1,f=!1,d=!0;if(typeof t!="function")throw new TypeError(ow);e=wd(e)||0,sw(n)&&(c=!!n.leading,f="maxWait"in n,s=f?lw(wd(n.maxWait)||0,e):s,d="trailing"in n?!!n.trailing:d);function h(k){var S=i,b=r;return i=r=void 0,u=k,o=t.apply(b,S),o}function m(k){return u=k,l=setTimeout(p,e),c?h(k):o}function y(k){var S=k-a,b=k-u,O=e-S;return f?aw(O,s-b):O}function x(k){var S=k-a,b=k-u;return a===void 0||S>=e||S<0||f&&b>=s}function p(){var k=Ml();if(x(k))return g(k);l=setTimeout(p,y(k))}function g(k){return l=void 0,d&&i?h(k):(i=r=void 0,o)}function v(){l!==void 0&&clearTimeout(l),u=0,i=a=r=l=void 0}function _(){return l===void 0?o:g(Ml())}function w(){var k=Ml(),S=x(k);if(i=arguments,r=this,a=k,S){if(l===void 0)return m(a);if(f)return clearTimeout(l),l=setTimeout(p,e),h(a)}return l===void 0&&(l=setTimeout(p,e)),o}return w.cancel=v,w.flush=_,w}var cw=uw;const fw=()=>{const[t,e]=M.exports.useState(!1);return M.exports.useLayoutEffect(()=>{const n=()=>{e(window.innerWidth<768)};return window.addEventListener("resize",cw(n,250)),n(),()=>window.removeEventListener("resize",n)},[]),t},dw=t=>({labels:t.map(e=>new Date(e.time).toLocaleTimeString()),datasets:[{data:t.map(e=>e.value),backgroundColor:Fp.gray,type:"line",tension:.1}]}),pM=(t,e,n,i)=>{const r=Math.min(e.length>0?e[0].time:1/0,i!==void 0?i+1:1/0);return t.filter(s=>s.time>=n&&s.time<r).concat(e)};Wo.register(za,Da,Vi,Fs,j2,O2);const hw=({deviceId:t,sensorUnit:e,isSensorOn:n})=>{const[i,r]=M.exports.useState({datasets:[{data:[],backgroundColor:Fp.gray}]}),[s,o]=M.exports.useState(!1),[l,a]=M.exports.useState(!0),[u,c]=M.exports.useState(!1),f=!fw(),d=.5,h=M.exports.useRef(0),g=M.exports.useRef([]),m=async()=>{try{const p=Date.now(),v=p-Tu.measurements.window,b=g.current[g.current.length-1],w=b?Math.max(b.time-Tu.sinceOverlap,v):void 0,k=await br.get(Ap(Cr.measurementRange,{id:t,start:String(v),end:String(p)}),{params:{bucket:Tu.measurements.bucket,agg:Tu.measurements.agg,...w!==void 0?{since:w}:{}}});c(!1),jp.log("Measurement",t,{response:k.data}),g.current=pM(g.current,k.data,v,w),r(dw(g.current))}catch(p){Ou(p.status),jp.log("error fetching measurements"),g.current=[],c(!0)}},y=async()=>{o(!0),await m(),o(!1)};M.exports.useEffect(()=>{n&&l&&!s&&y()},[n]),M.exports.useEffect(()=>{if(!l)return h.current=window.setInterval(m,Tu.intervals.measurement),()=>clearInterval(h.current)},[l,n]),M.exports.useEffect(()=>{a(u),u&&clearInterval(h.current)},[u]);const x={plugins:{legend:{display:!1},tooltip:{callbacks:{label:p=>`${Number(p.raw).toFixed(1)}${rf[e]}`}}},scales:{y:{ticks:{callback:function(p){return`${Number(p).toFixed(1)}${rf[e]}`}},min:f?Math.min(...i.datasets[0].data)-d:void 0,max:f?Math.max(...i.datasets[0].data)+d:void 0}}};return u?K("div",{className:"flex-abs-center chart-section",children:["Error loading measurements,"," ",T("div",{role:"button",className:"chart-wrapper-link",onClick:y,children:"try again"})]}):s?T("div",{className:"flex-abs-center chart-section",children:"Loading measurements..."}):n?i.datasets[0].data.length===0?T("div",{className:"flex-abs-center chart-section",children:"No data to display"}):T("div",{className:"flex-abs-center chart-section",children:T(f_,{datasetIdKey:"line-chart",options:x,data:i})}):T("div",{className:"flex-abs-center chart-section",children:"Sensor unavailable"})};var Dg={exports:{}};(function(t){(function(){var e={}.hasOwnProperty;function n(){for(var i=[],r=0;r<arguments.length;r++){var s=arguments[r];if(s){var o=typeof s;if(o==="string"||o==="number")i.push(s);else if(Array.isArray(s)){if(s.length){var l=n.apply(null,s);l&&i.push(l)}}else if(o==="object"){if(s.toString!==Object.prototype.toString&&!s.toString.toString().includes("[native code]")){i.push(s.toString());continue}for(var a in s)e.call(s,a)&&s[a]&&i.push(a)}}}return i.join(" ")}t.exports?(n.default=n,t.exports=n):window.classNames=n})()})(Dg);const or=Dg.exports,pw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M192 128c70.7 0 128 57.3 128 128s-57.3 128-128 128s-128-57.3-128-128s57.3-128 128-128zm0 320H384c106 0 192-86 192-192s-86-192-192-192H192C86 64 0 150 0 256S86 448 192 448zm143.1-64c30.4-34 48.9-78.8 48.9-128s-18.5-94-48.9-128H384c70.7 0 128 57.3 128 128s-57.3 128-128 128H335.1z"})),gw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M384 64C490 64 576 149.1 576 256C576 362 490 448 384 448H192C85.96 448 0 362 0 256C0 149.1 85.96 64 192 64H384zM384 400C463.5 400 528 335.5 528 256C528 176.5 463.5 112 384 112C304.5 112 240 176.5 240 256C240 335.5 304.5 400 384 400z"}));const mw=({serialNumber:t,initialState:e,ledId:n,deviceId:i,isOffline:r})=>{const[s,o]=M.exports.useState(!1),[l,a]=M.exports.useState(!1),u=async(f,d,h)=>{let m=!1,y=!1;const p=setTimeout(()=>{y=!0},5e3);for(;m===!1&&y===!1;){const g=await br.get(Ap(Cr.device,{id:f}));m=h===yl.ON?g.data.led_on.includes(d):!g.data.led_on.includes(d)}return clearTimeout(p),m},c=async()=>{a(!0);const f=s?yl.OFF:yl.ON;try{const d=await br.post(Cr.led,{command:"DEMO_APP_ACTION_REQ",deviceId:i,ledId:n,action:f});await u(i,n,f)&&o(m=>!m)}catch(d){Ou(d.status),Rp("Error notifying led, try again later")}finally{a(!1)}};return M.exports.useEffect(()=>{l||o(e)},[e]),K("div",{className:"flex-abs-center led-section",children:[s?T("span",{className:or("led-section-indicator-on"),children:"On"}):T("span",{className:or("led-section-indicator-off"),children:"Off"}),T("button",{className:"flex-abs-center led-section-toggle-button",onClick:c,disabled:r||l,children:s?T(gw,{fill:"green",width:25,height:25}):T(pw,{width:25,height:25})}),K("span",{className:"mt-1 no-selection",children:["LED ",t]})]})};const yw=t=>M.exports.createElement("svg",{width:"100%",height:"100%",viewBox:"0 0 640 448",xmlns:"http://www.w3.org/2000/svg",xmlnsXlink:"http://www.w3.org/1999/xlink",...t},M.exports.createElement("title",null,"Combined Shape"),M.exports.createElement("g",{id:"Page-1",stroke:"none",strokeWidth:1,fill:"none",fillRule:"evenodd",fillOpacity:.54},M.exports.createElement("path",{d:"M272,0 C331.5,0 384.1,29.55 416,74.8 C430.5,67.87 446.8,64 464,64 C525.9,64 576,114.1 576,176 C576,186.7 574.5,196.1 571.7,206.8 C612.3,228.2 640,270.9 640,320 C640,390.7 582.7,448 512,448 L144,448 C64.47,448 0,383.5 0,304 C0,241.2 40.15,187.9 96.17,168.1 C100.3,74.6 177.4,0 272,0 Z M272,32 C194.6,32 131.5,93 128.1,169.5 C127.6,182.6 119.1,193.1 106.8,198.3 C63.18,213.7 32,255.2 32,304 C32,365.9 82.14,416 144,416 L512,416 C565,416 608,373 608,320 C608,283.2 587.3,251.2 556.8,235.1 C543.4,227.1 536.8,212.5 540.9,197.1 C542.9,191 544,183.7 544,176 C544,131.8 508.2,96 464,96 C451.7,96 440.1,98.8 429.7,103.7 C415.7,110.4 398.8,105.9 389.8,93.2 C363.7,56.12 320.7,32 272,32 Z M360.125,92 C365.453125,92 369.8125,96.3327344 369.8125,101.6875 L369.8125,101.6875 L369.8125,130.75 L379.5,130.75 C400.90332,130.75 418.25,148.09668 418.25,169.5 L418.25,169.5 L418.25,179.1875 L447.3125,179.1875 C452.667266,179.1875 457,183.546875 457,188.875 C457,194.203125 452.640625,198.5625 447.3125,198.5625 L447.3125,198.5625 L418.25,198.5625 L418.25,237.3125 L447.3125,237.3125 C452.667266,237.3125 457,241.671875 457,247 C457,252.328125 452.640625,256.6875 447.3125,256.6875 L447.3125,256.6875 L418.25,256.6875 L418.25,295.4375 L447.3125,295.4375 C452.667266,295.4375 457,299.770234 457,305.125 C457,310.479766 452.667266,314.8125 447.3125,314.8125 L447.3125,314.8125 L418.25,314.8125 L418.25,324.5 C418.25,345.90332 400.90332,363.25 379.5,363.25 L379.5,363.25 L369.8125,363.25 L369.8125,392.3125 C369.8125,397.667266 365.479766,402 360.125,402 C354.770234,402 350.4375,397.667266 350.4375,392.3125 L350.4375,392.3125 L350.4375,363.25 L311.6875,363.25 L311.6875,392.3125 C311.6875,397.667266 307.354766,402 302,402 C296.645234,402 292.3125,397.667266 292.3125,392.3125 L292.3125,392.3125 L292.3125,363.25 L253.5625,363.25 L253.5625,392.3125 C253.5625,397.667266 249.203125,402 243.875,402 C238.546875,402 234.1875,397.640625 234.1875,392.3125 L234.1875,392.3125 L234.1875,363.25 L224.5,363.25 C203.09668,363.25 185.75,345.90332 185.75,324.5 L185.75,324.5 L185.75,314.8125 L156.6875,314.8125 C151.332734,314.8125 147,310.453125 147,305.125 C147,299.796875 151.332734,295.4375 156.6875,295.4375 L156.6875,295.4375 L185.75,295.4375 L185.75,256.6875 L156.6875,256.6875 C151.332734,256.6875 147,252.328125 147,247 C147,241.671875 151.332734,237.3125 156.6875,237.3125 L156.6875,237.3125 L185.75,237.3125 L185.75,198.5625 L156.6875,198.5625 C151.332734,198.5625 147,194.203125 147,188.875 C147,183.546875 151.332734,179.1875 156.6875,179.1875 L156.6875,179.1875 L185.75,179.1875 L185.75,169.5 C185.75,148.09668 203.09668,130.75 224.5,130.75 L224.5,130.75 L234.1875,130.75 L234.1875,101.6875 C234.1875,96.3327344 238.546875,92 243.875,92 C249.203125,92 253.5625,96.3327344 253.5625,101.6875 L253.5625,101.6875 L253.5625,130.75 L292.3125,130.75 L292.3125,101.6875 C292.3125,96.3327344 296.671875,92 302,92 C307.328125,92 311.6875,96.3327344 311.6875,101.6875 L311.6875,101.6875 L311.6875,130.75 L350.4375,130.75 L350.4375,101.6875 C350.4375,96.3327344 354.796875,92 360.125,92 Z M379.5,150.125 L224.5,150.125 C213.819531,150.125 205.125,158.819531 205.125,169.5 L205.125,169.5 L205.125,324.5 C205.125,335.180469 213.819531,343.875 224.5,343.875 L224.5,343.875 L379.5,343.875 C390.180469,343.875 398.875,335.180469 398.875,324.5 L398.875,324.5 L398.875,169.5 C398.875,158.819531 390.180469,150.125 379.5,150.125 L379.5,150.125 Z M360.125,169.5 C370.841797,169.5 379.5,178.158203 379.5,188.875 L379.5,188.875 L379.5,305.125 C379.5,315.823633 370.823633,324.5 360.125,324.5 L360.125,324.5 L243.875,324.5 C233.176367,324.5 224.5,315.823633 224.5,305.125 L224.5,305.125 L224.5,188.875 C224.5,178.158203 233.158203,169.5 243.875,169.5 L243.875,169.5 Z M360.125,188.875 L243.875,188.875 L243.875,305.125 L360.125,305.125 L360.125,188.875 Z",id:"Combined-Shape",fill:"#000000",fillRule:"nonzero"}))),vw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512",...t},M.exports.createElement("path",{d:"M256 512c141.4 0 256-114.6 256-256S397.4 0 256 0S0 114.6 0 256S114.6 512 256 512z"})),xw=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M160 256C160 185.3 217.3 128 288 128C358.7 128 416 185.3 416 256C416 326.7 358.7 384 288 384C217.3 384 160 326.7 160 256zM288 336C332.2 336 368 300.2 368 256C368 211.8 332.2 176 288 176C287.3 176 286.7 176 285.1 176C287.3 181.1 288 186.5 288 192C288 227.3 259.3 256 224 256C218.5 256 213.1 255.3 208 253.1C208 254.7 208 255.3 208 255.1C208 300.2 243.8 336 288 336L288 336zM95.42 112.6C142.5 68.84 207.2 32 288 32C368.8 32 433.5 68.84 480.6 112.6C527.4 156 558.7 207.1 573.5 243.7C576.8 251.6 576.8 260.4 573.5 268.3C558.7 304 527.4 355.1 480.6 399.4C433.5 443.2 368.8 480 288 480C207.2 480 142.5 443.2 95.42 399.4C48.62 355.1 17.34 304 2.461 268.3C-.8205 260.4-.8205 251.6 2.461 243.7C17.34 207.1 48.62 156 95.42 112.6V112.6zM288 80C222.8 80 169.2 109.6 128.1 147.7C89.6 183.5 63.02 225.1 49.44 256C63.02 286 89.6 328.5 128.1 364.3C169.2 402.4 222.8 432 288 432C353.2 432 406.8 402.4 447.9 364.3C486.4 328.5 512.1 286 526.6 256C512.1 225.1 486.4 183.5 447.9 147.7C406.8 109.6 353.2 80 288 80V80z"})),_w=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512",...t},M.exports.createElement("path",{d:"M108.2 71c13.8 11.1 16 31.2 5 45C82.4 154.4 64 203 64 256s18.4 101.6 49.1 140c11.1 13.8 8.8 33.9-5 45s-33.9 8.8-45-5C23.7 386.7 0 324.1 0 256S23.7 125.3 63.2 76c11.1-13.8 31.2-16 45-5zm359.7 0c13.8-11.1 33.9-8.8 45 5C552.3 125.3 576 187.9 576 256s-23.7 130.7-63.2 180c-11.1 13.8-31.2 16-45 5s-16-31.2-5-45c30.7-38.4 49.1-87 49.1-140s-18.4-101.6-49.1-140c-11.1-13.8-8.8-33.9 5-45zM344 256c0 30.9-25.1 56-56 56s-56-25.1-56-56s25.1-56 56-56s56 25.1 56 56zM204.5 181.3c-17.8 19.8-28.5 46-28.5 74.7s10.8 54.8 28.5 74.7c11.8 13.2 10.7 33.4-2.5 45.2s-33.4 10.7-45.2-2.5C129 342.2 112 301.1 112 256s17-86.2 44.8-117.3c11.8-13.2 32-14.3 45.2-2.5s14.3 32 2.5 45.2zm214.7-42.7C447 169.8 464 210.9 464 256s-17 86.2-44.8 117.3c-11.8 13.2-32 14.3-45.2 2.5s-14.3-32-2.5-45.2c17.8-19.8 28.5-46 28.5-74.7s-10.8-54.8-28.5-74.7c-11.8-13.2-10.7-33.4 2.5-45.2s33.4-10.7 45.2 2.5z"})),ww={day:86400,hour:3600,minute:60,second:1},kw=t=>(Date.now()-t)/1e3,Sw=t=>{for(const[e,n]of Object.entries(ww))if(t>=n||e==="second")return{value:Math.floor(t/n)*-1,unit:e}},bw={second:"s",minute:"m",hour:"h",day:"d",week:"w"},Cw=t=>{const e=kw(t),{value:n,unit:i}=Sw(e);return`${Math.abs(n)}${bw[i]} ago`},Mw=({date:t})=>{const[e,n]=M.exports.useState("");return M.exports.useEffect(()=>{const i=setInterval(()=>{n(Cw(t))},1e3);return()=>clearInterval(i)},[t]),T("div",{children:e})};const kd=({name:t,lastUplink:e,isOffline:n,linkType:i})=>K("div",{className:"status-section",children:[T("div",{className:"status-section-icon-wrapper",children:T(yw,{width:75,height:60})}),K("div",{className:"status-section-right-column-wrapper",children:[T("h2",{className:"title-h2",children:t}),K("div",{className:"status-section-device-info",children:[K("div",{className:"flex-abs-center status-section-status",children:[T(vw,{width:10,height:18,fill:n?"black":"green"}),T("span",{className:"status-section-info-text",children:n?"Offline":"Online"})]}),K("div",{className:"flex-abs-center status-section-last-beat",children:[T(xw,{width:15,height:18}),T("span",{className:"status-section-info-text",children:T(Mw,{date:e})})]}),!n&&K("div",{className:"flex-abs-center status-section-signal",children:[T(_w,{width:15,height:18}),T("span",{className:"status-section-info-text",children:i})]})]})]})]}),Ew=t=>M.exports.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512",...t},M.exports.createElement("path",{d:"M288 32V0H224V32 256v32h64V256 32zM80 256c0-54.4 24.7-103.1 63.5-135.4L102.6 71.4C49.7 115.4 16 181.8 16 256c0 132.5 107.5 240 240 240s240-107.5 240-240c0-74.2-33.8-140.6-86.6-184.6l-40.9 49.2c38.9 32.3 63.5 81 63.5 135.4c0 97.2-78.8 176-176 176s-176-78.8-176-176z"}));const Pw=({serialNumber:t,initialState:e})=>{const[n,i]=M.exports.useState(!1);return M.exports.useEffect(()=>{i(e)},[e]),T("div",{className:"engage-button-section",children:K("button",{className:or("stats-power-button","flex-abs-center",n&&"on"),children:[T("span",{className:or("no-selection","mr-2",n?"green":"black"),children:t}),K("div",{className:"flex-abs-center",children:[T(Ew,{width:25,height:25,fill:n?"green":"black"}),T("span",{className:or("no-selection","engaged-text",n?"green":"black"),children:n?"Engaged":"Disengaged"})]})]})})},Lw=({data:t})=>{const[e,n]=M.exports.useState(!1);return M.exports.useEffect(()=>{const r=setInterval(()=>{const l=Date.now()-t.last_uplink*1e3>6e4;n(l)},Tu.intervals.online);return()=>clearInterval(r)},[t.last_uplink]),t.led.length===0&&t.button.length===0&&!t.sensor?K("div",{className:"full-height-with-header container-offline",children:[T("section",{className:"title",children:T(kd,{name:t.wireless_device_id,lastUplink:t.last_uplink*1e3,linkType:t.link_type,isOffline:e})}),T("section",{className:"offline offline-text flex-abs-center",children:K("p",{children:["No device capabilities info. ",T("br",{}),"Please restart your device."]})})]}):K("div",{className:"container",children:[T("section",{className:"title",children:T(kd,{name:t.wireless_device_id,lastUplink:t.last_uplink*1e3,linkType:t.link_type,isOffline:e})}),K(El,{children:[T("section",{className:"led",children:t.led.length>0&&T("div",{className:"led-wrapper",children:t.led.map(r=>{const s=t.led.length===1,o=t.led_on.includes(r);return T(mw,{initialState:o,serialNumber:s?void 0:r+1,deviceId:t.wireless_device_id,ledId:r,isOffline:e},r)})})}),T("section",{className:"chart",children:T(hw,{deviceId:t.wireless_device_id,sensorUnit:t.sensor_unit,isSensorOn:t.sensor})}),T("section",{className:"ebuttons",children:t.button.length>0&&K(El,{children:[T("div",{className:"ebuttons-section-title flex-abs-center",children:"Push button on device"}),T("div",{className:"ebuttons-wrapper",children:t.button.map(r=>{const s=t.button.length===1,o=t.button_pressed.includes(r);return T(Pw,{initialState:o,serialNumber:s?void 0:r+1},r)})})]})})]})]})};const Tw=()=>T("div",{className:"loadingio-spinner-cube-43if4zhoecl",children:K("div",{className:"ldio-3ubwwbm9rn2",children:[T("div",{}),T("div",{}),T("div",{}),T("div",{})]})});const pD=(t,e)=>{const n=new Map(e.map(r=>[r.wireless_device_id,r])),i=Date.now()/1e3;return t.map(r=>n.get(r.wireless_device_id)??r).concat(e.filter(r=>!t.some(s=>s.wireless_device_id===r.wireless_device_id))).filter(r=>!r.time_to_live||r.time_to_live>i)},pL=t=>t.reduce((e,n)=>Math.max(e,n.last_uplink??0),0);const Ow=()=>{const[t,e]=M.exports.useState(!0),[n,i]=M.exports.useState(!1),[r,s]=M.exports.useState([]),[o,l]=M.exports.useState(!1),a=M.exports.useRef(0),g=M.exports.useRef([]),h=M.exports.useRef(""),u=async()=>{try{const f=pL(g.current),d=f?Math.max(f-Tu.sinceOverlap/1e3,0):void 0,p=await br.get(Cr.devices,{params:d!==void 0?{since:d}:{},headers:h.current?{"If-None-Match":h.current}:{},validateStatus:m=>m===304||m>=200&&m<300});l(!1);const y=p.status===304?[]:p.data;h.current=p.headers.get("ETag")??h.current,g.current=pD(g.current,y),s(g.current),jp.log("Devices",{response:y})}catch(f){Ou(f.status),jp.log("error fetching devices:",f),g.current=[],h.current="",l(!0)}},c=async()=>{i(!0),await u(),i(!1)};return M.exports.useEffect(()=>{t&&!n&&c()},[]),M.exports.useEffect(()=>{if(!t)return a.current=window.setInterval(u,Tu.intervals.devices),()=>clearInterval(a.current)},[t]),M.exports.useEffect(()=>{e(o),o&&clearInterval(a.current)},[o]),o?K("div",{className:"full-height-with-header flex-abs-center",children:["Error loading devices information,"," ",T("div",{role:"button",className:"device-wrapper-link",onClick:c,children:"try again"})]}):n?K("div",{className:"full-height-with-header flex-abs-center device-wrapper-spinner",children:[T(Tw,{}),"Loading devices..."]}):r.length===0?T("div",{className:"full-height-with-header flex-abs-center",children:"No devices detected"}):T("div",{className:"device-wrapper",children:r.map(f=>T(Lw,{data:f},f.wireless_device_id))})};const Dw=({onLoginSuccess:t})=>{const[e,n]=M.exports.useState(""),[i,r]=M.exports.useState(""),[s,o]=M.exports.useState(!1);return T("div",{className:"full-height-with-header flex-abs-center",children:K("form",{className:"form-wrapper",onSubmit:async a=>{a.preventDefault(),o(!0);try{ty(e);const u=await br.post(Cr.login,{username:e,password:i});ey(u.data),t()}catch{Rp.error("User or password incorrect")}finally{o(!1)}},children:[K("label",{children:["Username",T("input",{name:"username",type:"text",value:e,onChange:a=>n(a.target.value)})]}),K("label",{children:["Password",T("input",{name:"password",type:"password",value:i,onChange:a=>r(a.target.value)})]}),T("button",{type:"submit",disabled:s,children:"Login"})]})})};function zw(){const[t,e]=M.exports.useState(!1),[n,i]=M.exports.useState(!0),r=()=>{e(!0)};return M.exports.useEffect(()=>{localStorage.getItem(Bo)&&e(!0),i(!1)},[]),M.exports.useEffect(()=>{localStorage.getItem(ba)&&setTimeout(()=>{ze.error("Unauthorize error"),localStorage.removeItem(ba)},0)},[]),n?T(El,{}):K("div",{className:"App",children:[T(G1,{}),t?T(Ow,{}):T(Dw,{onLoginSuccess:r})]})}Pl.createRoot(document.getElementById("root")).render(K(ja.StrictMode,{children:[T(zw,{}),T(K1,{})]}));
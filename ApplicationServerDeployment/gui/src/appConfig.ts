@@ -7,4 +7,14 @@ export const APP_CONFIG = {
     devices: 5 * 1000,
     online: 1 * 1000,
   },
+  // incremental polls (since) re-fetch this much before the last change, so that records written late,
+  // committed out of order or shifted by the server (timestamp collisions) are not missed
+  sinceOverlap: 5 * 60 * 1000,
+  measurements: {
+    // time window displayed on the chart (measurements expire after 1 hour)
+    window: 60 * 60 * 1000,
+    // measurements are downsampled by the API to one point per bucket
+    bucket: "60s",
+    agg: "avg",
+  },
 };
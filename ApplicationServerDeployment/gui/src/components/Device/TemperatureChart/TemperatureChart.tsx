@@ -19,7 +19,7 @@ import { COLORS, SENSOR_UNIT } from "../../../constants";
 import { ENDPOINTS, interpolateParams } from "../../../endpoints";
 import useIsMobile from "../../../hooks/useIsMobile";
 import { IMeasurement } from "../../../types";
-import { mapMeasurementsToChartData } from "./utils";
+import { mapMeasurementsToChartData, mergeMeasurements } from "./utils";
 import "./styles.css";
 import { logger } from "../../../utils/logger";
 import { apiClient } from "../../../apiClient";
@@ -59,20 +59,46 @@ export const TemperatureChart = ({
   const isDesktop = !useIsMobile();
   const SCALE_OFFSET = 0.5;
   const intervalMeasurementsId = useRef(0);
+  const measurementsRef = useRef([] as IMeasurement[]);
 
+  // after the first load, only measurements newer than the last point (minus an overlap) are fetched and merged
   const fetchMeasurements = async () => {
     try {
+      const end = Date.now();
+      const start = end - APP_CONFIG.measurements.window;
+      const last = measurementsRef.current[measurementsRef.current.length - 1];
+      const since = last
+        ? Math.max(last.time - APP_CONFIG.sinceOverlap, start)
+        : undefined;
       const response = await apiClient.get<IMeasurement[]>(
-        interpolateParams(ENDPOINTS.measurement, { id: deviceId })
+        interpolateParams(ENDPOINTS.measurementRange, {
+          id: deviceId,
+          start: String(start),
+          end: String(end),
+        }),
+        {
+          params: {
+            bucket: APP_CONFIG.measurements.bucket,
+            agg: APP_CONFIG.measurements.agg,
+            ...(since !== undefined ? { since } : {}),
+          },
+        }
       );
 
       setHasError(false);
       logger.log("Measurement", deviceId, { response: response.data });
-      setValues(mapMeasurementsToChartData(response.data));
+      measurementsRef.current = mergeMeasurements(
+        measurementsRef.current,
+        response.data,
+        start,
+        since
+      );
+      setValues(mapMeasurementsToChartData(measurementsRef.current));
     } catch (error) {
       // @ts-ignore
       verifyAuth(error.status);
       logger.log("error fetching measurements");
+      measurementsRef.current = [];
       setHasError(true);
     }
   };
@@ -20,3 +20,23 @@ export const mapMeasurementsToChartData = (arr: IMeasurement[]) => {
     ],
   } as ChartData<"line">;
 };
+
+// Measurements returned with "since" replace the ones newer than since, or from their first point on
+// if it is earlier (the downsampled bucket containing since is returned again complete).
+export const mergeMeasurements = (
+  current: IMeasurement[],
+  delta: IMeasurement[],
+  windowStart: number,
+  since?: number
+) => {
+  const deltaStart = Math.min(
+    delta.length > 0 ? delta[0].time : Infinity,
+    since !== undefined ? since + 1 : Infinity
+  );
+  return current
+    .filter(
+      (measurement) =>
+        measurement.time >= windowStart && measurement.time < deltaStart
+    )
+    .concat(delta);
+};
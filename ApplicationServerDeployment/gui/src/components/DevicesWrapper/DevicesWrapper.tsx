@@ -10,6 +10,7 @@ import { verifyAuth } from "../../utils";
 import { logger } from "../../utils/logger";
 import { Device } from "../Device/Device";
 import { Spinner } from "../Spinner/Spinner";
+import { getLastChange, mergeDevices } from "./utils";
 import "./styles.css";
 
 export const DevicesWrapper = () => {
@@ -18,17 +19,35 @@ export const DevicesWrapper = () => {
   const [devicesData, setDevicesData] = useState([] as IDevice[]);
   const [hasError, setHasError] = useState(false);
   const intervalDevicesFetchId = useRef(0);
+  const devicesRef = useRef([] as IDevice[]);
+  const etagRef = useRef("");
 
+  // after the first load, only devices changed since the last change (minus an overlap) are fetched
+  // and merged by id, unchanged response is not sent again (304 Not Modified)
   const fetchDevices = async () => {
     try {
-      const response = await apiClient.get<IDevice[]>(ENDPOINTS.devices);
+      const lastChange = getLastChange(devicesRef.current);
+      const since = lastChange
+        ? Math.max(lastChange - APP_CONFIG.sinceOverlap / 1000, 0)
+        : undefined;
+      const response = await apiClient.get<IDevice[]>(ENDPOINTS.devices, {
+        params: since !== undefined ? { since } : {},
+        headers: etagRef.current ? { "If-None-Match": etagRef.current } : {},
+        validateStatus: (status: number) =>
+          status === 304 || (status >= 200 && status < 300),
+      });
       setHasError(false);
-      setDevicesData(response.data);
-      logger.log("Devices", { response: response.data });
+      const delta = response.status === 304 ? [] : response.data;
+      etagRef.current = response.headers.get("ETag") ?? etagRef.current;
+      devicesRef.current = mergeDevices(devicesRef.current, delta);
+      setDevicesData(devicesRef.current);
+      logger.log("Devices", { response: delta });
     } catch (error) {
       // @ts-ignore
       verifyAuth(error.status);
       logger.log("error fetching devices:", error);
+      devicesRef.current = [];
+      etagRef.current = "";
       setHasError(true);
     }
   };
@@ -0,0 +1,28 @@
+// Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+// SPDX-License-Identifier: MIT-0
+
+import { IDevice } from "../../types";
+
+// Devices returned with "since" replace the current ones with the same id,
+// devices which expired (time_to_live) are removed.
+export const mergeDevices = (current: IDevice[], delta: IDevice[]) => {
+  const changed = new Map(
+    delta.map((device) => [device.wireless_device_id, device])
+  );
+  const now = Date.now() / 1000;
+  return current
+    .map((device) => changed.get(device.wireless_device_id) ?? device)
+    .concat(
+      delta.filter(
+        (device) =>
+          !current.some(
+            (currentDevice) =>
+              currentDevice.wireless_device_id === device.wireless_device_id
+          )
+      )
+    )
+    .filter((device) => !device.time_to_live || device.time_to_live > now);
+};
+
+export const getLastChange = (devices: IDevice[]) =>
+  devices.reduce((last, device) => Math.max(last, device.last_uplink ?? 0), 0);
@@ -5,6 +5,7 @@ export const ENDPOINTS = {
   devices: "/devices",
   device: "/devices/:id",
   measurement: "/measurements/:id",
+  measurementRange: "/measurements/:id/:start/:end",
   led: "",
   login: "/auth"
 };
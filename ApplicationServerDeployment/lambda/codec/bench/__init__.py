@@ -0,0 +1,11 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Performance benchmarks for the Sidewalk Sensor Monitoring Demo Application codec.
+Run from the lambda/codec directory, e.g.: python -m bench.decoder
+
+Regression check (CI):
+    python -m bench.suite --output results.json
+    python -m bench.compare bench/baseline.json results.json --threshold 0.2
+"""
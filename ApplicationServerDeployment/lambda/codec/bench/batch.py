@@ -0,0 +1,58 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measures throughput (messages/sec) of the batch decoder (Command.decode_many/iter_decode)
+against decoding PayloadData strings one by one, the way uplink lambda does it.
+
+Usage (from the lambda/codec directory):
+    python -m bench.batch [--messages N]
+"""
+import argparse
+import base64
+import itertools
+import time
+
+from bench.decoder import PAYLOADS
+from command import Command
+
+
+def decode_single_str(payloads: [str]):
+    for payload in payloads:
+        Command().decode(base64.b64decode(payload.encode('ascii')).decode('ascii'))
+
+
+def decode_single_bytes(payloads: [str]):
+    for payload in payloads:
+        Command().decode_bytes(bytes.fromhex(base64.b64decode(payload.encode('ascii')).decode('ascii')))
+
+
+def decode_many(payloads: [str]):
+    Command.decode_many(payloads)
+
+
+def iter_decode(payloads: [str]):
+    for _ in Command.iter_decode(payloads):
+        pass
+
+
+def bench(messages: int):
+    """
+    Decodes given number of messages with every method and prints the throughput.
+
+    :param messages:    Number of messages to be decoded.
+    """
+    samples = [base64.b64encode(payload.encode('ascii')).decode() for payload in PAYLOADS.values()]
+    payloads = list(itertools.islice(itertools.cycle(samples), messages))
+    print(f'{"method":<24}{"msg/s":>12}')
+    for fn in (decode_single_str, decode_single_bytes, decode_many, iter_decode):
+        start = time.perf_counter()
+        fn(payloads)
+        elapsed = time.perf_counter() - start
+        print(f'{fn.__name__:<24}{messages / elapsed:>12.0f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Batch decoder benchmark')
+    parser.add_argument('--messages', type=int, default=200000, help='number of messages to be decoded')
+    bench(parser.parse_args().messages)
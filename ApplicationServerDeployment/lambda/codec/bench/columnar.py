@@ -0,0 +1,50 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measures throughput (messages/sec) of the vectorized sensor notifications decoder
+against the batch decoder (Command.decode_many). Requires numpy.
+
+Usage (from the lambda/codec directory):
+    python -m bench.columnar [--messages N]
+"""
+import argparse
+import base64
+import random
+import time
+
+from columnar import decode_sensor_notifications
+from command import Command
+
+
+def sensor_notification(temperature: int, gps_time: int, link_type: int) -> str:
+    payload = f'4106{temperature:02X}87{gps_time:08X}0C{link_type:02X}'
+    return base64.b64encode(payload.encode('ascii')).decode()
+
+
+def bench(messages: int):
+    """
+    Decodes given number of sensor notifications (with 1% of button presses) and prints the throughput.
+
+    :param messages:    Number of messages to be decoded.
+    """
+    rnd = random.Random(0)
+    button_press = base64.b64encode(b'41850102030487000003E80C04').decode()
+    payloads = [
+        button_press if rnd.random() < 0.01 else
+        sensor_notification(rnd.randrange(256), 1_370_000_000 + i, rnd.choice((1, 2, 4)))
+        for i in range(messages)
+    ]
+    print(f'{"method":<32}{"msg/s":>12}')
+    for name, fn in (('Command.decode_many', Command.decode_many),
+                     ('decode_sensor_notifications', decode_sensor_notifications)):
+        start = time.perf_counter()
+        fn(payloads)
+        elapsed = time.perf_counter() - start
+        print(f'{name:<32}{messages / elapsed:>12.0f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Vectorized decoder benchmark')
+    parser.add_argument('--messages', type=int, default=500000, help='number of messages to be decoded')
+    bench(parser.parse_args().messages)
@@ -0,0 +1,67 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compares bench.suite results against a stored baseline, exits with status 1 on regression.
+Intended to be run by CI after: python -m bench.suite --output results.json
+
+Usage (from the lambda/codec directory):
+    python -m bench.compare bench/baseline.json results.json [--threshold 0.2] [--time-threshold 0.5]
+
+Timings are compared as relative_time (ns/op divided by ns/op of the reference operation timed in the same run,
+see: bench.suite.reference), so the baseline does not depend on the speed of the machine it was recorded on.
+Absolute ns_per_op is reported for local comparisons only. Relative timings are still noisier than
+the deterministic memory metrics, so --time-threshold may be set looser than --threshold. All the metrics
+depend on the Python version, the baseline should be recorded with the version the comparison runs on.
+"""
+import argparse
+import json
+import sys
+
+"""
+Metrics, which are compared (lower is better).
+"""
+METRICS = ('relative_time', 'allocs_per_op', 'peak_bytes')
+
+
+def compare(baseline: dict, current: dict, threshold: float, time_threshold: float = None) -> [str]:
+    """
+    Finds metrics, which got worse than baseline by more than the threshold.
+
+    :param baseline:        Baseline report (see: bench.suite.run).
+    :param current:         Current report.
+    :param threshold:       Allowed relative increase (e.g. 0.2 for 20%).
+    :param time_threshold:  Allowed relative increase of relative_time (threshold is used if not given).
+    :return:                List of regression descriptions, empty if there is none.
+    """
+    regressions = []
+    for case, base_metrics in baseline['results'].items():
+        metrics = current['results'].get(case)
+        if metrics is None:
+            regressions.append(f'{case}: missing in current results')
+            continue
+        for metric in METRICS:
+            base, value = base_metrics[metric], metrics[metric]
+            allowed = time_threshold if metric == 'relative_time' and time_threshold is not None else threshold
+            if value > base * (1 + allowed):
+                regressions.append(f'{case}: {metric} {base} -> {value}')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compares codec benchmark results against baseline')
+    parser.add_argument('baseline', help='path of the baseline JSON file')
+    parser.add_argument('current', help='path of the current results JSON file')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative regression (default: 0.2)')
+    parser.add_argument('--time-threshold', type=float, help='allowed relative regression of relative_time')
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline_report = json.load(f)
+    with open(args.current) as f:
+        current_report = json.load(f)
+    found = compare(baseline_report, current_report, args.threshold, args.time_threshold)
+    for regression in found:
+        print(regression)
+    print(f'{len(found)} regression(s) found')
+    sys.exit(1 if found else 0)
@@ -0,0 +1,43 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compares binary string decoder (Command.decode) with bytes decoder (Command.decode_bytes).
+
+Usage (from the lambda/codec directory):
+    python -m bench.decoder [--number N]
+"""
+import argparse
+import timeit
+
+from command import Command
+
+"""
+Uplink payloads (hexadecimal) used for the benchmark.
+"""
+PAYLOADS = {
+    'CAP_DISCOVERY_NOTIFICATION': '40C1050102030405C2060102030405060B000C04',
+    'ACTION_RESP': '61C90301020387000003E888000000640C04',
+    'ACTION_NOTIFICATION_BUTTON': '41850102030487000003E80C04',
+    'ACTION_NOTIFICATION_SENSOR': '41C60301020387000000010C01'
+}
+
+
+def bench(number: int):
+    """
+    Times both decoders for every payload and prints the results.
+
+    :param number:  Number of decodes per measurement.
+    """
+    print(f'{"payload":<30}{"str [us/op]":>14}{"bytes [us/op]":>16}{"speedup":>10}')
+    for name, payload in PAYLOADS.items():
+        raw = bytes.fromhex(payload)
+        t_str = min(timeit.repeat(lambda: Command().decode(payload), number=number, repeat=5)) / number
+        t_bytes = min(timeit.repeat(lambda: Command().decode_bytes(raw), number=number, repeat=5)) / number
+        print(f'{name:<30}{t_str * 1e6:>14.2f}{t_bytes * 1e6:>16.2f}{t_str / t_bytes:>9.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Command decoder benchmark')
+    parser.add_argument('--number', type=int, default=20000, help='number of decodes per measurement')
+    bench(parser.parse_args().number)
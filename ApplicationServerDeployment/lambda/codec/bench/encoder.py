@@ -0,0 +1,69 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compares binary string encoder (Tag/Command.encode + hex_repr + base64) with bytes encoder (Command.encode_base64)
+for the DEMO_APP_ACTION_REQ downlink (LED_ON/LED_OFF + CURRENT_GPS_TIME_IN_SECS).
+
+Usage (from the lambda/codec directory):
+    python -m bench.encoder [--number N]
+"""
+import argparse
+import base64
+import timeit
+
+from command import Command
+from protocol import *
+from tag import Tag
+
+GPS_TIME = 1_370_000_000
+
+
+def encode_str(tag_type: TagType, leds: [int]) -> str:
+    """
+    Encodes DEMO_APP_ACTION_REQ the way downlink lambda used to do it.
+    """
+    tags = [Tag().encode(tag) for tag in [{tag_type: leds}, {TagType.CURRENT_GPS_TIME_IN_SECS: GPS_TIME}]]
+    cmd = Command().encode(
+        status_hdr_ind=False,
+        op_code=OpCode.MSG_TYPE_WRITE,
+        cls=Class.DEMO_APP_CLASS,
+        id=Id.DEMO_APP_ACTION_REQ,
+        payload=tags
+    )
+    return base64.b64encode(bytes.fromhex(cmd.hex_repr())).decode()
+
+
+def encode_bytes(tag_type: TagType, leds: [int]) -> str:
+    """
+    Encodes DEMO_APP_ACTION_REQ with the bytes encoder.
+    """
+    return Command.encode_base64(
+        status_hdr_ind=False,
+        op_code=OpCode.MSG_TYPE_WRITE,
+        cls=Class.DEMO_APP_CLASS,
+        id=Id.DEMO_APP_ACTION_REQ,
+        payload=[{tag_type: leds}, {TagType.CURRENT_GPS_TIME_IN_SECS: GPS_TIME}]
+    )
+
+
+def bench(number: int):
+    """
+    Times both encoders and prints the results.
+
+    :param number:  Number of encodes per measurement.
+    """
+    print(f'{"payload":<30}{"str [us/op]":>14}{"bytes [us/op]":>16}{"speedup":>10}')
+    for tag_type in (TagType.LED_ON, TagType.LED_OFF):
+        for leds in ([1], [1, 2], [1, 2, 3], [1, 2, 3, 4]):
+            assert encode_str(tag_type, leds) == encode_bytes(tag_type, leds)
+            t_str = min(timeit.repeat(lambda: encode_str(tag_type, leds), number=number, repeat=5)) / number
+            t_bytes = min(timeit.repeat(lambda: encode_bytes(tag_type, leds), number=number, repeat=5)) / number
+            name = f'{tag_type.name} {leds}'
+            print(f'{name:<30}{t_str * 1e6:>14.2f}{t_bytes * 1e6:>16.2f}{t_str / t_bytes:>9.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Command encoder benchmark')
+    parser.add_argument('--number', type=int, default=20000, help='number of encodes per measurement')
+    bench(parser.parse_args().number)
@@ -0,0 +1,93 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compares header and tag header parsing by string slicing (as done by the original binary string decoder)
+with single index into HEADER_TABLE and Tag.TAG_BYTE_TABLE.
+
+Lambda CPU share is proportional to its memory (one vCPU at 1769 MB), so the timings are also projected
+for the MemorySize configured in SidewalkSampleApplicationStack.yaml. Projected columns are a linear
+extrapolation of the local timings (assuming one full core locally), not measurements.
+
+Usage (from the lambda/codec directory):
+    python -m bench.lookup [--number N] [--memory-size MB]
+"""
+import argparse
+import os
+import re
+import timeit
+
+from bench.decoder import PAYLOADS
+from command import Command
+from protocol import *
+
+FULL_VCPU_MEMORY_SIZE = 1769
+TEMPLATE = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'template', 'SidewalkSampleApplicationStack.yaml')
+
+
+def parse_str(hex_cmd: str):
+    """
+    Parses header and tag headers by slicing binary string.
+    """
+    bin_cmd = bin(int(hex_cmd, 16))[2:].zfill(len(hex_cmd) * 4)
+    op_code = bin_cmd[1:3]
+    cmd_id = bin((int(bin_cmd[5:8], 2) << 2) | int(op_code, 2))[2:].zfill(3)
+    header = (OpCode(op_code), Class(bin_cmd[3:5]), Id(cmd_id), bin_cmd[0] == '1')
+    idx = 16 if header[3] else 8
+    tags = []
+    while idx < len(bin_cmd):
+        tlv_format = bin_cmd[idx:idx + 2]
+        tag_type = TagType(bin_cmd[idx + 2:idx + 8])
+        length = TLV_FORMAT_LENGTH_TABLE[int(tlv_format, 2)]
+        if length is None:
+            length = int(bin_cmd[idx + 8:idx + 16], 2)
+            idx += 8
+        tags.append((tag_type, idx + 8, idx + 8 + length * 8))
+        idx += 8 + length * 8
+    return header, tags
+
+
+def parse_table(raw: bytes):
+    """
+    Parses header and tag headers with lookup tables.
+    """
+    return HEADER_TABLE[raw[0]], Command.validate_bytes(raw)
+
+
+def memory_size() -> int:
+    """
+    Reads MemorySize of the lambdas from the CloudFormation template.
+    :return:    Memory size in MB (128 if the template is not available).
+    """
+    try:
+        with open(TEMPLATE) as f:
+            return int(re.search(r'MemorySize:\s*(\d+)', f.read()).group(1))
+    except (OSError, AttributeError):
+        return 128
+
+
+def bench(number: int, memory: int):
+    """
+    Times both parsers for every payload and prints the results.
+
+    :param number:  Number of parses per measurement.
+    :param memory:  Lambda memory size (MB), used for projection.
+    """
+    scale = FULL_VCPU_MEMORY_SIZE / memory
+    print(f'Projected for MemorySize={memory} MB: local timings x{scale:.1f} (linear extrapolation, not measured)')
+    print(f'{"payload":<30}{"str [us/op]":>14}{"table [us/op]":>16}{"speedup":>10}'
+          f'{"str projected":>16}{"table projected":>18}')
+    for name, payload in PAYLOADS.items():
+        raw = bytes.fromhex(payload)
+        t_str = min(timeit.repeat(lambda: parse_str(payload), number=number, repeat=5)) / number
+        t_table = min(timeit.repeat(lambda: parse_table(raw), number=number, repeat=5)) / number
+        print(f'{name:<30}{t_str * 1e6:>14.2f}{t_table * 1e6:>16.2f}{t_str / t_table:>9.1f}x'
+              f'{t_str * scale * 1e6:>16.2f}{t_table * scale * 1e6:>18.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Header and tag header lookup benchmark')
+    parser.add_argument('--number', type=int, default=20000, help='number of parses per measurement')
+    parser.add_argument('--memory-size', type=int, default=memory_size(), help='lambda memory size (MB)')
+    args = parser.parse_args()
+    bench(args.number, args.memory_size)
@@ -0,0 +1,57 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measures memory (tracemalloc) retained and allocated at peak per decoded message.
+
+Usage (from the lambda/codec directory):
+    python -m bench.memory [--messages N]
+"""
+import argparse
+import tracemalloc
+
+from bench.decoder import PAYLOADS
+from command import Command
+
+
+def measure(fn, messages: int) -> (float, float):
+    """
+    Calls fn given number of times, keeping all the results alive.
+
+    :param fn:          Function, which decodes single message.
+    :param messages:    Number of messages.
+    :return:            Retained and peak bytes per message.
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    results = [fn() for _ in range(messages)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return (current - base) / messages, (peak - base) / messages
+
+
+def bench(messages: int):
+    """
+    Prints memory usage per decoded message for every payload and decoder.
+
+    :param messages:    Number of messages per measurement.
+    """
+    print(f'{"payload":<30}{"decoder":<20}{"retained [B/msg]":>18}{"peak [B/msg]":>14}')
+    for name, payload in PAYLOADS.items():
+        raw = bytes.fromhex(payload)
+        decoders = {
+            'decode': lambda: Command().decode(payload),
+            'decode_bytes': lambda: Command().decode_bytes(raw),
+            'decoded_cmd only': lambda: Command().decode_bytes(raw).decoded_cmd
+        }
+        for decoder, fn in decoders.items():
+            retained, peak = measure(fn, messages)
+            print(f'{name:<30}{decoder:<20}{retained:>18.0f}{peak:>14.0f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Decoder memory benchmark')
+    parser.add_argument('--messages', type=int, default=10000, help='number of messages per measurement')
+    bench(parser.parse_args().messages)
@@ -0,0 +1,162 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Codec benchmark suite: times decode and encode of every command Id at payload sizes
+from a single 1-byte tag up to a max-length (255 bytes) STANDARD tag.
+For each case reports ns/op, allocations/op and peak memory, and optionally writes the results to JSON,
+which can be compared against a stored baseline with bench.compare.
+ns/op depends on the speed of the machine, so each case also reports its time relative to the reference
+operation timed in the same run (relative_time), which is what bench.compare checks.
+
+Usage (from the lambda/codec directory):
+    python -m bench.suite [--number N] [--output results.json]
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+
+from command import Command
+from protocol import *
+
+"""
+Number of values carried by the single repeated tag of the benchmark payload.
+1 is encoded as SIZE_OPTIMIZED_1B tag, 255 is the longest STANDARD tag.
+"""
+PAYLOAD_SIZES = (1, 2, 4, 16, 64, 255)
+
+"""
+Repeated, 1-byte wide tag used to build payloads of the given size.
+"""
+PAYLOAD_TAG = TagType.BUTTON_PRESS
+
+"""
+Input of the reference operation, see: reference.
+"""
+REFERENCE_DATA = bytes(range(64))
+
+
+def cases():
+    """
+    Yields benchmark cases for every command Id and payload size.
+
+    :return:    Generator of (case name, encode arguments dict, encoded bytes).
+    """
+    for id_idx, cmd_id in enumerate(ID_TABLE):
+        if cmd_id is None:
+            continue
+        op_code = OpCode(TWO_BITS_TABLE[id_idx & 0x03])
+        for size in PAYLOAD_SIZES:
+            args = {
+                'status_hdr_ind': op_code == OpCode.MSG_TYPE_RESP,
+                'op_code': op_code,
+                'cls': Class.DEMO_APP_CLASS,
+                'id': cmd_id,
+                'status_code': 0,
+                'payload': [{PAYLOAD_TAG: [value % 4 + 1 for value in range(size)]}]
+            }
+            yield f'{cmd_id.name}/{size}', args, Command.encode_bytes(**args)
+
+
+def reference() -> dict:
+    """
+    Reference operation, which does codec-like work (byte indexing, bit operations, building a dict)
+    without calling the codec, so that its timing follows the machine, but not the codec changes.
+
+    :return:    Dict of (format id, type id) pairs indexed by the byte position.
+    """
+    return {index: (value >> 6, value & 0x3F) for index, value in enumerate(REFERENCE_DATA)}
+
+
+def time_op(fn, number: int) -> float:
+    """
+    Times single operation, the fastest of 5 timings is taken, as the slower ones are disturbed by other processes.
+
+    :param fn:      Function performing single operation.
+    :param number:  Number of operations per timing.
+    :return:        Time of single operation in nanoseconds.
+    """
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+
+def measure(fn, number: int) -> dict:
+    """
+    Measures single operation.
+    CPython does not expose allocation counter, so allocations/op is the number of memory blocks
+    (tracemalloc) still held by the results of the operation, peak is the highest traced memory
+    during a single call.
+
+    :param fn:      Function performing single operation.
+    :param number:  Number of operations per timing.
+    :return:        Dict with ns_per_op, allocs_per_op and peak_bytes.
+    """
+    ns_per_op = time_op(fn, number)
+
+    tracemalloc.start()
+    base = _traced_blocks()
+    results = [fn() for _ in range(1000)]
+    allocs_per_op = (_traced_blocks() - base) / len(results)
+    del results
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'ns_per_op': round(ns_per_op, 1),
+        'allocs_per_op': round(allocs_per_op, 2),
+        'peak_bytes': peak - current
+    }
+
+
+def run(number: int) -> dict:
+    """
+    Runs all the benchmark cases.
+
+    :param number:  Number of operations per timing.
+    :return:        Dict of the following structure: {'meta': {...}, 'results': {case: metrics}}.
+    """
+    # the reference is timed before and after the cases, so that a slowdown of the machine during the run
+    # does not skew all the relative times alike
+    reference_ns = time_op(reference, number)
+    results = {}
+    for name, args, raw in cases():
+        results[f'decode/{name}'] = measure(lambda: Command().decode_bytes(raw).decoded_cmd, number)
+        results[f'encode/{name}'] = measure(lambda: Command.encode_bytes(**args), number)
+    reference_ns = min(reference_ns, time_op(reference, number))
+    for metrics in results.values():
+        metrics['relative_time'] = round(metrics['ns_per_op'] / reference_ns, 3)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'number': number,
+            'reference_ns_per_op': round(reference_ns, 1)
+        },
+        'results': results
+    }
+
+
+def _traced_blocks() -> int:
+    return sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Codec benchmark suite')
+    parser.add_argument('--number', type=int, default=10000, help='number of operations per timing')
+    parser.add_argument('--output', help='path of the JSON file the results are written to')
+    args = parser.parse_args()
+
+    report = run(args.number)
+    print(f'{"case":<50}{"ns/op":>12}{"relative":>12}{"allocs/op":>12}{"peak [B]":>12}')
+    for case, metrics in report['results'].items():
+        print(f'{case:<50}{metrics["ns_per_op"]:>12.1f}{metrics["relative_time"]:>12.3f}'
+              f'{metrics["allocs_per_op"]:>12.2f}{metrics["peak_bytes"]:>12}')
+    print(f'reference: {report["meta"]["reference_ns_per_op"]:.1f} ns/op')
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Results written to {args.output}', file=sys.stderr)
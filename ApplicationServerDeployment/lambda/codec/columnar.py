@@ -0,0 +1,204 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Vectorized (NumPy) decoder for DEMO_APP_ACTION_NOTIFICATION messages carrying sensor data.
+Intended for analytics and backfill jobs, requires numpy (not shipped with the lambdas).
+"""
+import numpy as np
+
+from command import Command, PAYLOAD_TO_BYTES
+from protocol import *
+
+"""
+Tags, which are extracted by the vectorized decoder, mapped to the names of the columns.
+"""
+_COLUMNS = {
+    TagType.TEMP_SENSOR_DATA: 'sensor_data',
+    TagType.CURRENT_GPS_TIME_IN_SECS: 'gps_time',
+    TagType.LINK_TYPE: 'link_type'
+}
+_ACTION_NOTIFICATION_HDR = (CMD_ID_BITS[Id.DEMO_APP_ACTION_NOTIFICATION]
+                            | (OP_CODE_BITS[OpCode.MSG_TYPE_NOTIFY] << 5)
+                            | (CLASS_BITS[Class.DEMO_APP_CLASS] << 3))
+
+
+class SensorNotifications:
+    """
+    Columnar representation of decoded DEMO_APP_ACTION_NOTIFICATION sensor messages.
+
+    Attributes
+    ----------
+        index: np.ndarray
+            Positions (in the input iterable) of the messages decoded by the vectorized path.
+        sensor_data: np.ndarray
+            Temperature readings (uint64).
+        gps_time: np.ndarray
+            GPS time of the readings in seconds (uint64).
+        link_type: np.ndarray
+            Raw link type bytes (uint8), see: link_type_names.
+        fallback: [(int, dict)]
+            Positions and decoded_cmd dicts of the messages, which do not match the sensor layout
+            (decoded one by one; dict is None if message could not be decoded).
+    """
+
+    def __init__(self, index, sensor_data, gps_time, link_type, fallback):
+        self.index = index
+        self.sensor_data = sensor_data
+        self.gps_time = gps_time
+        self.link_type = link_type
+        self.fallback = fallback
+
+    def link_type_names(self) -> np.ndarray:
+        """
+        Returns names of the link types.
+        :return:    Array of LinkType names.
+        """
+        return np.array(LINK_TYPE_NAME_TABLE, dtype=object)[self.link_type]
+
+    def __len__(self):
+        return len(self.index) + len(self.fallback)
+
+
+def decode_sensor_notifications(payloads, encoding: str = 'base64') -> SensorNotifications:
+    """
+    Decodes sensor notifications in a columnar fashion.
+    Payloads are grouped by length and layout signature (header byte, tag headers and lengths),
+    each group is packed into uint8 matrix and sensor_data, gps_time and link_type are extracted as whole columns.
+    Payloads, which do not match the sensor notification layout, fall back to Command.iter_decode.
+
+    :param payloads:    Iterable of payloads.
+    :param encoding:    Encoding of the payloads, see: Command.iter_decode.
+    :return:            SensorNotifications object.
+    """
+    to_bytes = PAYLOAD_TO_BYTES.get(encoding)
+    if to_bytes is None:
+        raise ValueError(f'Unsupported payload encoding: {encoding}')
+
+    groups = {}
+    fallback_idx = []
+    fallback_raw = []
+    for idx, payload in enumerate(payloads):
+        try:
+            raw = to_bytes(payload)
+        except ValueError:
+            raw = b''
+        if not raw:
+            fallback_idx.append(idx)
+            fallback_raw.append(raw)
+            continue
+        groups.setdefault(len(raw), ([], []))
+        groups[len(raw)][0].append(idx)
+        groups[len(raw)][1].append(raw)
+
+    columns = {'index': [], 'sensor_data': [], 'gps_time': [], 'link_type': []}
+    for length, (indices, raws) in groups.items():
+        indices = np.array(indices, dtype=np.int64)
+        matrix = np.frombuffer(b''.join(raws), dtype=np.uint8).reshape(-1, length)
+        pending = np.ones(len(indices), dtype=bool)
+        while pending.any():
+            template = int(np.argmax(pending))
+            layout = _parse_layout(raws[template])
+            if layout is None:
+                # not a sensor notification, decode all rows with the same signature one by one
+                signature = _signature_positions(raws[template])
+            else:
+                signature = layout['signature']
+            matches = pending & (matrix[:, signature] == matrix[template, signature]).all(axis=1)
+            pending &= ~matches
+            if layout is None:
+                rows = np.flatnonzero(matches)
+                fallback_idx.extend(indices[rows].tolist())
+                fallback_raw.extend(raws[row] for row in rows)
+                continue
+
+            link_type = matrix[matches, layout['link_type']]
+            valid = np.isin(link_type, [i for i, name in enumerate(LINK_TYPE_NAME_TABLE) if name is not None])
+            rows = np.flatnonzero(matches)
+            for row in rows[~valid]:
+                fallback_idx.append(int(indices[row]))
+                fallback_raw.append(raws[row])
+            rows = rows[valid]
+            columns['index'].append(indices[rows])
+            columns['link_type'].append(link_type[valid])
+            for name in ('sensor_data', 'gps_time'):
+                start, end = layout[name]
+                columns[name].append(_to_uint(matrix[rows, start:end]))
+
+    fallback = list(zip(fallback_idx, Command.iter_decode(fallback_raw, encoding='raw', skip_invalid=True)))
+    return SensorNotifications(
+        index=_concat(columns['index'], np.int64),
+        sensor_data=_concat(columns['sensor_data'], np.uint64),
+        gps_time=_concat(columns['gps_time'], np.uint64),
+        link_type=_concat(columns['link_type'], np.uint8),
+        fallback=fallback
+    )
+
+
+def _parse_layout(raw: bytes):
+    """
+    Walks the tags of the template payload and checks if it is a sensor notification.
+
+    :param raw:     Raw payload.
+    :return:        Dict with signature positions and value offsets, None if payload is not a sensor notification.
+    """
+    if not raw or raw[0] != _ACTION_NOTIFICATION_HDR:
+        return None
+    layout = {}
+    signature = [0]
+    try:
+        for type_id, format_id, val_start, val_end in Command.iter_tags(raw, 1):
+            if TLV_FORMAT_LENGTH_TABLE[format_id] is None:
+                signature.extend((val_start - 2, val_start - 1))
+            else:
+                signature.append(val_start - 1)
+            name = _COLUMNS.get(TAG_TYPE_TABLE[type_id])
+            if name is None or name in layout or not 0 < val_end - val_start <= 8:
+                return None
+            layout[name] = (val_start, val_end)
+    except ValueError:
+        return None
+    if len(layout) != len(_COLUMNS) or layout['link_type'][1] - layout['link_type'][0] != 1:
+        return None
+    layout['link_type'] = layout['link_type'][0]
+    layout['signature'] = signature
+    return layout
+
+
+def _signature_positions(raw: bytes) -> [int]:
+    """
+    Returns positions of header and tag header bytes of the payload, as far as they can be determined.
+
+    :param raw:     Raw payload.
+    :return:        List of positions.
+    """
+    signature = [0] if raw else []
+    idx = 2 if raw and raw[0] & 0x80 else 1
+    while idx < len(raw):
+        signature.append(idx)
+        length = TLV_FORMAT_LENGTH_TABLE[raw[idx] >> 6]
+        if length is None:
+            if idx + 1 >= len(raw):
+                break
+            signature.append(idx + 1)
+            length = raw[idx + 1]
+            idx += 1
+        idx += 1 + length
+    return signature
+
+
+def _to_uint(columns: np.ndarray) -> np.ndarray:
+    """
+    Interprets rows of the uint8 matrix as big-endian unsigned integers.
+
+    :param columns:     Matrix of shape (rows, value length).
+    :return:            Array of uint64 values.
+    """
+    values = np.zeros(len(columns), dtype=np.uint64)
+    for col in range(columns.shape[1]):
+        values = (values << np.uint64(8)) | columns[:, col].astype(np.uint64)
+    return values
+
+
+def _concat(arrays: [np.ndarray], dtype) -> np.ndarray:
+    return np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.zeros(0, dtype=dtype)
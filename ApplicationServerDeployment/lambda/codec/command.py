@@ -4,11 +4,22 @@
 """
 Class for encoding/decoding Sidewalk Sensor Monitoring Demo Application commands.
 """
+import base64
+import binascii
 import json
 
 from protocol import *
 from tag import Tag
 
+"""
+Converts payloads of the supported encodings into raw bytes, see: Command.iter_decode.
+"""
+PAYLOAD_TO_BYTES = {
+    'base64': lambda payload: binascii.a2b_hex(binascii.a2b_base64(payload)),
+    'hex': binascii.a2b_hex,
+    'raw': bytes
+}
+
 
 class Command:
     """
@@ -33,7 +44,11 @@ class Command:
             Binary string representing raw_payload (not interpreted sequence of TLVs).
         payload: [Tag]
             List of Tag objects.
+        decoded_cmd: dict
+            Human-readable dict combining id and all the tags (computed on first access for encoded commands).
     """
+    __slots__ = ('status_hdr_ind', 'op_code', 'cls', 'id', 'status_code', 'raw_payload', 'payload', '_decoded_cmd')
+
     def __init__(self):
         self.status_hdr_ind = ''
         self.op_code = ''
@@ -44,6 +59,18 @@ class Command:
         self.payload = []
         self.decoded_cmd = {}
 
+    @property
+    def decoded_cmd(self) -> dict:
+        if self._decoded_cmd is None:
+            decoded_cmd = self.combine_tags(self.payload)
+            decoded_cmd['id'] = ID_NAME_TABLE[int(self.id, 2)]
+            self._decoded_cmd = decoded_cmd
+        return self._decoded_cmd
+
+    @decoded_cmd.setter
+    def decoded_cmd(self, decoded_cmd: dict):
+        self._decoded_cmd = decoded_cmd
+
     def decode(self, byte_stream):
         """
         Decodes byte_stream into human-readable representation of the command.
@@ -51,34 +78,90 @@ class Command:
         :param byte_stream:     Hexadecimal byte stream.
         :return:                Command object.
         """
-        raw_cmd = Command.hex_to_bin(byte_stream)
-
-        # decode binary stream
-        status_hdr_ind_bool = True if raw_cmd[0] == '1' else False
-        self.status_hdr_ind = raw_cmd[0]
-        self.op_code = raw_cmd[1:2 + 1]
-        self.cls = raw_cmd[3:4 + 1]
-        self.id = bin((int(raw_cmd[5:7 + 1], 2) << 2) | int(self.op_code, 2))[2:]
-        padding = 3 - len(self.id)
-        if padding:
-            self.id = padding * '0' + self.id
-        self.status_code = raw_cmd[8:16] if status_hdr_ind_bool else ''
-        self.raw_payload = raw_cmd[16:] if status_hdr_ind_bool else raw_cmd[8:]
-        self.payload = []
-        try:
-            if len(self.raw_payload) > 0:
-                extract = Command.extract_tags(self.raw_payload)
-                while True:
-                    self.payload.append((next(extract)))
-        except StopIteration:
-            pass
+        raw_cmd = binascii.a2b_hex(byte_stream)
+        tags = Command.validate_bytes(raw_cmd)
+
+        # decode header, see: HEADER_TABLE
+        header = HEADER_TABLE[raw_cmd[0]]
+        self.status_hdr_ind = '1' if header.has_status else '0'
+        self.op_code = header.op_code.value
+        self.cls = header.cls.value
+        self.id = header.id.value
+        self.status_code = BYTE_BITS_TABLE[raw_cmd[1]] if header.has_status else ''
+        self.raw_payload = Command._bytes_to_bin(raw_cmd[2 if header.has_status else 1:])
+        # tag values are decoded from raw bytes, binary strings are only kept for the Tag attributes
+        self.payload = [
+            Tag().decode(tag.type.value, tag.format.value, Command._bytes_to_bin(raw_cmd[val_start:val_end]),
+                         BYTE_BITS_TABLE[val_end - val_start] if tag.value_length is None else '',
+                         raw_val=raw_cmd[val_start:val_end])
+            for tag, val_start, val_end in tags
+        ]
 
         # create human-readable dict
         self.decoded_cmd = self.combine_tags(self.payload)
-        self.decoded_cmd['id'] = Id(self.id).name
+        self.decoded_cmd['id'] = header.id.name
+
+        return self
+
+    def decode_bytes(self, byte_stream):
+        """
+        Decodes raw bytes into human-readable representation of the command.
+        Bytes-native counterpart of decode(): header and tags are parsed with bit masks and int.from_bytes,
+        no binary strings are built. Tag objects are not created, so payload is left empty.
+
+        :param byte_stream:     Raw command (bytes, bytearray or memoryview).
+        :return:                Command object.
+        """
+        data = memoryview(byte_stream)
+        self.decoded_cmd = Command._decode_raw(data)
 
+        # header has already been validated by _decode_raw
+        header = HEADER_TABLE[data[0]]
+        self.status_hdr_ind = '1' if header.has_status else '0'
+        self.op_code = header.op_code.value
+        self.cls = header.cls.value
+        self.id = header.id.value
+        self.status_code = BYTE_BITS_TABLE[data[1]] if header.has_status else ''
+        self.raw_payload = ''
+        self.payload = []
         return self
 
+    @staticmethod
+    def iter_decode(payloads, encoding: str = 'base64', skip_invalid: bool = False):
+        """
+        Generator, which decodes given payloads one by one, so that memory usage stays flat.
+        Setup is done once for the whole iterable and no Command objects are created.
+
+        :param payloads:        Iterable of payloads.
+        :param encoding:        Encoding of the payloads:
+                                 - 'base64' - PayloadData as received from Sidewalk (base64 encoded hexadecimal string)
+                                 - 'hex' - hexadecimal string
+                                 - 'raw' - bytes
+        :param skip_invalid:    If set, None is produced for payloads, which cannot be decoded, instead of raising.
+        :return:                Generator, which produces decoded_cmd dicts.
+        """
+        to_bytes = PAYLOAD_TO_BYTES.get(encoding)
+        if to_bytes is None:
+            raise ValueError(f'Unsupported payload encoding: {encoding}')
+        decode_raw = Command._decode_raw
+        for payload in payloads:
+            try:
+                yield decode_raw(to_bytes(payload))
+            except ValueError:
+                if not skip_invalid:
+                    raise
+                yield None
+
+    @staticmethod
+    def decode_many(payloads, encoding: str = 'base64', skip_invalid: bool = False) -> [dict]:
+        """
+        Decodes given payloads into list of human-readable dicts.
+        See: iter_decode.
+
+        :return:                List of decoded_cmd dicts.
+        """
+        return list(Command.iter_decode(payloads, encoding, skip_invalid))
+
     def encode(self, status_hdr_ind: bool, op_code: OpCode, cls: Class, id: Id, status_code: str = '', payload: [Tag] = None):
         """
         Encodes arguments into byte_stream.
@@ -99,11 +182,49 @@ class Command:
         payload = payload or []
         self.payload = payload
         self.raw_payload = ''.join([tag.bin_repr() for tag in payload])
-        self.decoded_cmd = self.combine_tags(self.payload)
-        self.decoded_cmd['id'] = Id(self.id).name
+        self._decoded_cmd = None
 
         return self
 
+    @staticmethod
+    def encode_bytes(status_hdr_ind: bool, op_code: OpCode, cls: Class, id: Id, status_code: int = 0,
+                     payload: [dict] = None) -> bytes:
+        """
+        Encodes arguments straight into bytes, without building binary or hexadecimal strings.
+
+        :param status_hdr_ind:  Is status header included (bool).
+        :param op_code:         OpCode enum.
+        :param cls:             Class enum.
+        :param id:              Id enum.
+        :param status_code:     Status code (int, used only if status_hdr_ind is set).
+        :param payload:         List of dicts of the following structure: {TagType: value}.
+        :return:                Encoded command (bytes).
+        """
+        try:
+            hdr = (OP_CODE_BITS[op_code] << 5) | (CLASS_BITS[cls] << 3) | CMD_ID_BITS[id]
+        except (KeyError, TypeError):
+            raise ValueError(f'Invalid command header: {op_code}, {cls}, {id}')
+        buf = bytearray()
+        if status_hdr_ind:
+            buf.append(0x80 | hdr)
+            buf.append(status_code)
+        else:
+            buf.append(hdr)
+        for tag in payload or []:
+            Tag.encode_bytes(tag, buf)
+        return bytes(buf)
+
+    @staticmethod
+    def encode_base64(status_hdr_ind: bool, op_code: OpCode, cls: Class, id: Id, status_code: int = 0,
+                      payload: [dict] = None) -> str:
+        """
+        Encodes arguments into base64 string, ready to be sent as PayloadData.
+        See: encode_bytes.
+
+        :return:                Encoded command (base64 string).
+        """
+        return base64.b64encode(Command.encode_bytes(status_hdr_ind, op_code, cls, id, status_code, payload)).decode()
+
     def bin_repr(self, separate_bytes=False):
         """
         Returns binary representation of the command.
@@ -143,7 +264,7 @@ class Command:
             'status_hdr_indicator': True if self.status_hdr_ind == '1' else False,
             'op-code': OpCode(self.op_code).name,
             'class': Class(self.cls).name,
-            'id': Id(self.id).name,
+            'id': ID_NAME_TABLE[int(self.id, 2)],
             'status_code': self.status_code,
             'payload': payload,
             'decoded': self.decoded_cmd
@@ -157,9 +278,7 @@ class Command:
         :param hex_str:     Hexadecimal string.
         :return:            Binary string.
         """
-        bin_str = bin(int(hex_str, 16))[2:]
-        padding = (4 - (len(bin_str) % 4)) % 4
-        return '0' * padding + bin_str
+        return format(int(hex_str, 16), f'0{len(hex_str) * 4}b')
 
     @staticmethod
     def bin_to_hex(bin_str: str) -> str:
@@ -174,39 +293,104 @@ class Command:
     def extract_tags(bin_payload: str) -> Tag:
         """
         Generator, which extracts tags from the given binary string, one by one.
+        Tags are walked by iter_tags, so malformed or truncated payloads raise ValueError.
         :param bin_payload:     Binary string, which represents payload.
         :return:                Generator, which produces Tag objects.
         """
-        exhausted = False
-        while not exhausted:
-            format = bin_payload[0:1 + 1]
-            type = bin_payload[2:7 + 1]
-            frmt = TlvFormat(format)
+        if len(bin_payload) % 8:
+            raise ValueError(f'Truncated payload: {len(bin_payload)} bits are not whole bytes')
+        data = int(bin_payload, 2).to_bytes(len(bin_payload) // 8, 'big') if bin_payload else b''
+        for type_id, format_id, val_start, val_end in Command.iter_tags(data):
+            val_len = BYTE_BITS_TABLE[val_end - val_start] if TLV_FORMAT_LENGTH_TABLE[format_id] is None else ''
+            tag = Tag()
+            tag.decode(format(type_id, '06b'), format(format_id, '02b'), bin_payload[val_start * 8:val_end * 8],
+                       val_len, raw_val=data[val_start:val_end])
+            yield tag
 
-            if frmt == TlvFormat.STANDARD:
+    @staticmethod
+    def iter_tags(data, start: int = 0):
+        """
+        Generator, which walks tags of the raw payload without copying it or creating Tag objects.
+        Offsets are validated, so malformed or truncated payloads raise ValueError.
+
+        :param data:    Raw command (bytes or memoryview).
+        :param start:   Offset of the first tag.
+        :return:        Generator, which produces (type_id, format_id, val_start, val_end) tuples,
+                        tag value is data[val_start:val_end].
+        """
+        end = len(data)
+        idx = start
+        while idx < end:
+            tag_hdr = data[idx]
+            format_id = tag_hdr >> 6
+            length = TLV_FORMAT_LENGTH_TABLE[format_id]
+            if length is None:
                 # 11 (STANDARD) | 6b key | 1B len | val
-                val_len = bin_payload[8:15 + 1]
-                length = int(val_len, 2)
-                val_start_idx = 16
+                if idx + 1 >= end:
+                    raise ValueError(f'Truncated STANDARD tag at byte {idx}: length is missing')
+                length = data[idx + 1]
+                val_start = idx + 2
             else:
                 # __ (SIZE_OPTIMIZED) | 6b key | val
-                val_len = ''
-                if frmt == TlvFormat.SIZE_OPTIMIZED_4B:
-                    length = 4
-                else:
-                    length = int(frmt.value, 2) + 1
-                val_start_idx = 8
+                val_start = idx + 1
+            val_end = val_start + length
+            if val_end > end:
+                raise ValueError(f'Truncated tag at byte {idx}: {length} bytes expected, {end - val_start} available')
+            yield tag_hdr & 0x3F, format_id, val_start, val_end
+            idx = val_end
+
+    @staticmethod
+    def validate_bytes(data) -> [(TagHeader, int, int)]:
+        """
+        Validates length and structure of the raw command before any tag value is decoded.
+        Frame length and header byte are checked in constant time, then tag headers are walked with iter_tags
+        (values are skipped) to check that every tag fits into the frame and is known.
+        Header and tag header bytes are looked up in HEADER_TABLE and Tag.TAG_BYTE_TABLE.
 
-            val_end_idx = val_start_idx + length * 8
-            val = bin_payload[val_start_idx:val_end_idx]
-            bin_payload = bin_payload[val_end_idx:]
+        :param data:    Raw command (bytes or memoryview).
+        :return:        List of (TagHeader, val_start, val_end) tuples, tag value is data[val_start:val_end].
+        """
+        end = len(data)
+        if not end:
+            raise ValueError('Empty byte stream')
+        if end > MAX_COMMAND_LENGTH:
+            raise ValueError(f'Command too long: {end} bytes, at most {MAX_COMMAND_LENGTH} expected')
+        header = HEADER_TABLE[data[0]]
+        if header is None:
+            raise ValueError(f'{data[0]:#04x} is not a valid command header')
+        if header.has_status and end < 2:
+            raise ValueError('Status code is missing')
 
-            if not bin_payload:
-                exhausted = True
+        tags = []
+        tag_byte_table = Tag.TAG_BYTE_TABLE
+        for type_id, format_id, val_start, val_end in Command.iter_tags(data, 2 if header.has_status else 1):
+            tag = tag_byte_table[(format_id << 6) | type_id]
+            if tag is None:
+                raise ValueError(f'{type_id} is not a valid TagType')
+            tags.append((tag, val_start, val_end))
+        return tags
 
-            tag = Tag()
-            tag.decode(type, format, val, val_len)
-            yield tag
+    @staticmethod
+    def _decode_raw(data) -> dict:
+        """
+        Decodes raw command into human-readable dict, without building binary strings.
+        :param data:    Raw command (bytes or memoryview).
+        :return:        Dict combining id and all the decoded tags.
+        """
+        decoded_cmd = {}
+        for tag, val_start, val_end in Command.validate_bytes(data):
+            decoded_cmd.update(tag.decoder(data[val_start:val_end]))
+        decoded_cmd['id'] = HEADER_TABLE[data[0]].id.name
+        return decoded_cmd
+
+    @staticmethod
+    def _bytes_to_bin(data) -> str:
+        """
+        Coverts raw bytes into binary string.
+        :param data:    Raw bytes.
+        :return:        Binary string.
+        """
+        return ''.join([BYTE_BITS_TABLE[byte] for byte in data])
 
     @staticmethod
     def combine_tags(payload: [Tag]) -> str:
@@ -0,0 +1,49 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Bounded LRU cache of decoded commands, keyed by raw payload bytes.
+Devices resend identical payloads (capability discovery after every reboot, repeated button presses),
+so these are decoded once per warm lambda container.
+
+Cache lives at module scope, so it survives across warm lambda invocations.
+Its size is read from the DECODE_CACHE_SIZE environment variable (0 disables caching).
+"""
+import os
+from functools import lru_cache
+
+from lazy_command import LazyCommand
+
+DECODE_CACHE_SIZE = int(os.environ.get('DECODE_CACHE_SIZE', 256))
+
+
+def decode(byte_stream):
+    """
+    Decodes raw bytes into human-readable representation of the command, see: LazyCommand.
+    Result is shared between the calls, so it is read-only mapping with lists turned into tuples.
+    Tag values are decoded on first access and stay decoded in the cached entry.
+
+    :param byte_stream:     Raw command (bytes, bytearray or memoryview).
+    :return:                LazyCommand object.
+    """
+    return _decode(bytes(byte_stream))
+
+
+def cache_info():
+    """
+    Returns cache statistics.
+    :return:    Named tuple with hits, misses, maxsize and currsize fields.
+    """
+    return _decode.cache_info()
+
+
+def cache_clear():
+    """
+    Removes all entries from the cache and resets statistics.
+    """
+    _decode.cache_clear()
+
+
+@lru_cache(maxsize=DECODE_CACHE_SIZE)
+def _decode(byte_stream: bytes):
+    return LazyCommand(byte_stream)
@@ -0,0 +1,144 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Offline fuzzing harness for the codec.
+ - round trip: random commands built from TAG_SCHEMA are encoded and decoded back
+ - random bytes: arbitrary byte streams must either decode or be rejected with ValueError,
+   binary string and bytes decoders must agree
+
+Usage (from the lambda/codec directory):
+    python -m fuzz [--iterations N] [--seed S]
+"""
+import argparse
+import random
+
+from command import Command
+from protocol import *
+from tag import Tag
+
+
+def random_value(rng: random.Random, spec: TagSpec):
+    """
+    Generates random value of the tag described by spec.
+
+    :param rng:     Random number generator.
+    :param spec:    TagSpec object.
+    :return:        Value accepted by the tag encoder.
+    """
+    if spec.kind == ValueKind.ENUM:
+        return rng.choice([name for name in spec.names if name is not None])
+    if spec.kind == ValueKind.FLAGS:
+        return {
+            key: rng.choice([True, False] if names is None else names)
+            for key, names in zip(spec.key, spec.names)
+        }
+    if spec.repeated:
+        return [rng.getrandbits(spec.width * 8) for _ in range(rng.randint(1, 255 // spec.width))]
+    return rng.getrandbits((spec.width or rng.randint(1, 8)) * 8)
+
+
+def random_command(rng: random.Random) -> (dict, dict):
+    """
+    Generates random command with distinct tags, which fits into MAX_COMMAND_LENGTH.
+
+    :param rng:     Random number generator.
+    :return:        Arguments of Command.encode_bytes and expected decoded_cmd.
+    """
+    id_idx = rng.choice([idx for idx, cmd_id in enumerate(ID_TABLE) if cmd_id is not None])
+    args = {
+        'status_hdr_ind': rng.random() < 0.5,
+        'op_code': OpCode(TWO_BITS_TABLE[id_idx & 0x03]),
+        'cls': Class.DEMO_APP_CLASS,
+        'id': ID_TABLE[id_idx],
+        'status_code': rng.getrandbits(8),
+        'payload': []
+    }
+    expected = {}
+    length = 2
+    for spec in rng.sample(TAG_SCHEMA, rng.randint(0, len(TAG_SCHEMA))):
+        value = random_value(rng, spec)
+        tag_length = 2 + len(Tag.BYTES_ENCODERS_MAP[spec.tag_type](value))
+        if length + tag_length > MAX_COMMAND_LENGTH:
+            break
+        length += tag_length
+        args['payload'].append({spec.tag_type: value})
+        if spec.decoded:
+            expected.update(value if spec.kind == ValueKind.FLAGS else {spec.key: value})
+    expected['id'] = args['id'].name
+    return args, expected
+
+
+def random_bytes(rng: random.Random) -> bytes:
+    """
+    Generates random byte stream: either noise or a valid command with random corruption.
+
+    :param rng:     Random number generator.
+    :return:        Byte stream.
+    """
+    if rng.random() < 0.5:
+        return bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 32)))
+    data = bytearray(Command.encode_bytes(**random_command(rng)[0]))
+    for _ in range(rng.randint(1, 3)):
+        idx = rng.randrange(len(data))
+        mutation = rng.randrange(3)
+        if mutation == 0:
+            data[idx] = rng.getrandbits(8)
+        elif mutation == 1:
+            del data[idx:]
+        else:
+            data.insert(idx, rng.getrandbits(8))
+        if not data:
+            break
+    return bytes(data)
+
+
+def check_round_trip(args: dict, expected: dict):
+    """
+    Checks that encoded command decodes back into expected dict with both decoders.
+    """
+    raw = Command.encode_bytes(**args)
+    decoded_cmd = Command().decode_bytes(raw).decoded_cmd
+    if decoded_cmd != expected:
+        raise AssertionError(f'{raw.hex()}: decoded into {decoded_cmd}, expected {expected}')
+    decoded_cmd = Command().decode(raw.hex()).decoded_cmd
+    if decoded_cmd != expected:
+        raise AssertionError(f'{raw.hex()}: string decoder returned {decoded_cmd}, expected {expected}')
+
+
+def check_random_bytes(data: bytes):
+    """
+    Checks that decoders either agree on the byte stream or both reject it with ValueError.
+    """
+    try:
+        decoded_cmd = Command().decode_bytes(data).decoded_cmd
+    except ValueError:
+        decoded_cmd = None
+    try:
+        decoded_str = Command().decode(data.hex()).decoded_cmd
+    except ValueError:
+        decoded_str = None
+    if decoded_cmd != decoded_str:
+        raise AssertionError(f'{data.hex()}: bytes decoder returned {decoded_cmd}, string decoder {decoded_str}')
+
+
+def run(iterations: int, seed: int = 0):
+    """
+    Runs both checks given number of times.
+
+    :param iterations:  Number of iterations.
+    :param seed:        Seed of the random number generator, failures are reproducible with the same seed.
+    """
+    rng = random.Random(seed)
+    for _ in range(iterations):
+        check_round_trip(*random_command(rng))
+        check_random_bytes(random_bytes(rng))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Codec fuzzing harness')
+    parser.add_argument('--iterations', type=int, default=100000, help='number of iterations')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random number generator')
+    args = parser.parse_args()
+    run(args.iterations, args.seed)
+    print(f'{args.iterations} iterations passed')
@@ -0,0 +1,71 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Read-only, lazily decoded representation of Sidewalk Sensor Monitoring Demo Application command.
+"""
+from collections.abc import Mapping
+
+from command import Command
+from protocol import *
+
+"""
+TagType indexed by the key of the decoded value, see: TAG_SCHEMA.
+"""
+_KEY_TO_TAG_TYPE = {
+    key: spec.tag_type
+    for spec in TAG_SCHEMA if spec.decoded for key in (spec.key if isinstance(spec.key, tuple) else (spec.key,))
+}
+
+
+class LazyCommand(Mapping):
+    """
+    Mapping with the same keys and values as Command.decoded_cmd (lists are returned as tuples).
+    Header and tag layout are validated on creation (see: Command.validate_bytes), so malformed
+    payloads are rejected up front, but tag values are decoded only on first access
+    (value, which cannot be decoded, raises ValueError on access).
+    Checking key presence ('in') and iterating over keys do not decode any values.
+
+    Attributes
+    ----------
+        id: str
+            Name of the command Id.
+    """
+    __slots__ = ('id', '_data', '_spans', '_values')
+
+    def __init__(self, byte_stream):
+        """
+        :param byte_stream:     Raw command (bytes, bytearray or memoryview).
+        """
+        data = bytes(byte_stream)
+        spans = {tag.type: (tag.decoder, val_start, val_end) for tag, val_start, val_end in Command.validate_bytes(data)}
+        self.id = HEADER_TABLE[data[0]].id.name
+        self._data = data
+        self._spans = spans
+        self._values = {'id': self.id}
+
+    def __getitem__(self, key):
+        values = self._values
+        if key not in values:
+            span = self._spans.get(_KEY_TO_TAG_TYPE.get(key))
+            if span is None:
+                raise KeyError(key)
+            decoder, val_start, val_end = span
+            for decoded_key, val in decoder(self._data[val_start:val_end]).items():
+                values[decoded_key] = tuple(val) if isinstance(val, list) else val
+        return values[key]
+
+    def __contains__(self, key):
+        return key == 'id' or _KEY_TO_TAG_TYPE.get(key) in self._spans
+
+    def __iter__(self):
+        for key, tag_type in _KEY_TO_TAG_TYPE.items():
+            if tag_type in self._spans:
+                yield key
+        yield 'id'
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f'LazyCommand({self._data.hex()}, id={self.id})'
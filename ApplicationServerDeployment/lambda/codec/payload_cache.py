@@ -0,0 +1,95 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Precomputed and memoized downlink payloads (base64 encoded PayloadData, see: Command.encode_base64).
+ - DEMO_APP_CAP_DISCOVERY_RESP is constant, so it is encoded once at import time
+ - DEMO_APP_ACTION_RESP is cached by the set of pressed buttons
+ - DEMO_APP_ACTION_REQ is cached as a template by the LED action and LED set, only GPS time is patched per call
+
+Caches live at module scope, so they survive across warm lambda invocations.
+Their size is read from the PAYLOAD_CACHE_SIZE environment variable.
+"""
+import binascii
+import os
+from functools import lru_cache
+
+from command import Command
+from protocol import *
+
+PAYLOAD_CACHE_SIZE = int(os.environ.get('PAYLOAD_CACHE_SIZE', 256))
+
+DEMO_APP_CAP_DISCOVERY_RESP = Command.encode_base64(
+    status_hdr_ind=True,
+    op_code=OpCode.MSG_TYPE_RESP,
+    cls=Class.DEMO_APP_CLASS,
+    id=Id.DEMO_APP_CAP_DISCOVERY_RESP,
+    status_code=0
+)
+
+
+def action_resp(button_press) -> str:
+    """
+    Returns DEMO_APP_ACTION_RESP payload acknowledging pressed buttons.
+
+    :param button_press:    List of indices of the buttons being pressed.
+    :return:                Base64 encoded command.
+    """
+    return _action_resp(None if button_press is None else tuple(button_press))
+
+
+def action_req(tag_type: TagType, leds, gps_time: int) -> str:
+    """
+    Returns DEMO_APP_ACTION_REQ payload switching given LEDs on or off.
+
+    :param tag_type:    TagType.LED_ON or TagType.LED_OFF.
+    :param leds:        List of indices of the LEDs.
+    :param gps_time:    Current GPS time in seconds.
+    :return:            Base64 encoded command.
+    """
+    template, gps_start = _action_req_template(tag_type, tuple(leds))
+    # lambda handles one request at a time, so the cached template is patched in place
+    template[gps_start:gps_start + 4] = int(gps_time).to_bytes(4, 'big')
+    return binascii.b2a_base64(template, newline=False).decode()
+
+
+def cache_info() -> dict:
+    """
+    Returns cache statistics.
+    :return:    Dict of the following structure: {cache name: named tuple with hits, misses, maxsize and currsize}.
+    """
+    return {'action_resp': _action_resp.cache_info(), 'action_req': _action_req_template.cache_info()}
+
+
+def cache_clear():
+    """
+    Removes all entries from the caches and resets statistics.
+    """
+    _action_resp.cache_clear()
+    _action_req_template.cache_clear()
+
+
+@lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def _action_resp(button_press: tuple) -> str:
+    return Command.encode_base64(
+        status_hdr_ind=True,
+        op_code=OpCode.MSG_TYPE_RESP,
+        cls=Class.DEMO_APP_CLASS,
+        id=Id.DEMO_APP_ACTION_RESP,
+        status_code=0,
+        payload=[{TagType.BUTTON_PRESSED_RESP: None if button_press is None else list(button_press)}]
+    )
+
+
+@lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def _action_req_template(tag_type: TagType, leds: tuple) -> (bytearray, int):
+    template = bytearray(Command.encode_bytes(
+        status_hdr_ind=False,
+        op_code=OpCode.MSG_TYPE_WRITE,
+        cls=Class.DEMO_APP_CLASS,
+        id=Id.DEMO_APP_ACTION_REQ,
+        payload=[{tag_type: list(leds)}, {TagType.CURRENT_GPS_TIME_IN_SECS: 0}]
+    ))
+    gps_start = next(val_start for tag, val_start, _ in Command.validate_bytes(template)
+                     if tag.type == TagType.CURRENT_GPS_TIME_IN_SECS)
+    return template, gps_start
@@ -6,6 +6,7 @@ Sidewalk Sensor Monitoring Application - protocol constants.
 """
 
 from enum import Enum
+from typing import NamedTuple
 
 
 class OpCode(Enum):
@@ -73,6 +74,15 @@ class TlvFormat(Enum):
     STANDARD = '11'
 
 
+class ValueKind(Enum):
+    """
+    Represents semantic types of the tag values.
+    """
+    UINT = 'uint'       # big-endian unsigned integer (or list of them, if repeated)
+    ENUM = 'enum'       # single byte mapped to the name
+    FLAGS = 'flags'     # bits of the last byte mapped to separate keys
+
+
 class LinkType(Enum):
     """
     Represents Link Type values.
@@ -100,3 +110,197 @@ IdToCmdIdValueMap = {
     Id.DEMO_APP_ACTION_RESP: ClassCmdId.DEMO_APP_CLASS_CMD_ACTION.value,
     Id.DEMO_APP_ACTION_NOTIFICATION: ClassCmdId.DEMO_APP_CLASS_CMD_ACTION.value
 }
+
+
+# ------------------------------------------------------------------
+# Flat lookup tables generated once at import time.
+# Used by the codec on the hot path instead of Enum value lookups,
+# the Enums above remain the public API.
+# ------------------------------------------------------------------
+def _index_table(enum, size: int, value=None) -> tuple:
+    """
+    Builds a tuple indexed by integer value of the enum members.
+
+    :param enum:    Enum class with binary string values.
+    :param size:    Size of the table.
+    :param value:   Function, which maps enum member to table entry (member itself by default).
+    :return:        Tuple with entries for all enum members, None elsewhere.
+    """
+    table = [None] * size
+    for member in enum:
+        table[int(member.value, 2)] = member if value is None else value(member)
+    return tuple(table)
+
+
+def tag_type_table(mapping: dict, default=None) -> tuple:
+    """
+    Expands {TagType: value} dict into a 64-entry tuple indexed by tag type id.
+
+    :param mapping: Dict of the following structure: {TagType: value}.
+    :param default: Entry for TagTypes, which are not present in mapping.
+    :return:        Tuple with entries for all TagTypes, None for unknown tag type ids.
+    """
+    return _index_table(TagType, 64, lambda tag_type: mapping.get(tag_type, default))
+
+
+"""
+TagType indexed by 6-bit tag type id.
+"""
+TAG_TYPE_TABLE = _index_table(TagType, 64)
+
+"""
+Value length (in bytes) indexed by 2-bit TLV format id, None for STANDARD format (length is given explicitly).
+"""
+TLV_FORMAT_LENGTH_TABLE = _index_table(TlvFormat, 4, {
+    TlvFormat.SIZE_OPTIMIZED_1B: 1,
+    TlvFormat.SIZE_OPTIMIZED_2B: 2,
+    TlvFormat.SIZE_OPTIMIZED_4B: 4,
+    TlvFormat.STANDARD: None
+}.get)
+
+"""
+Upper bound of the command length (in bytes). Sidewalk frames are much shorter,
+longer byte streams are rejected before any tag is looked at.
+"""
+MAX_COMMAND_LENGTH = 512
+
+"""
+Id and Id name indexed by the combined 5-bit command id: (class command id << 2) | op code.
+"""
+ID_TABLE = _index_table(Id, 32)
+ID_NAME_TABLE = _index_table(Id, 32, lambda cmd_id: cmd_id.name)
+
+"""
+OpCode, Class and TlvFormat indexed by their 2-bit ids.
+"""
+OP_CODE_TABLE = _index_table(OpCode, 4)
+CLASS_TABLE = _index_table(Class, 4)
+TLV_FORMAT_TABLE = _index_table(TlvFormat, 4)
+
+
+class Header(NamedTuple):
+    """
+    Decomposed command header byte, see: HEADER_TABLE.
+    """
+    op_code: OpCode
+    cls: Class
+    id: Id
+    has_status: bool
+
+
+def _header(hdr: int):
+    cmd_id = ID_TABLE[((hdr & 0x07) << 2) | ((hdr >> 5) & 0x03)]
+    cls = CLASS_TABLE[(hdr >> 3) & 0x03]
+    if cmd_id is None or cls is None:
+        return None
+    return Header(OP_CODE_TABLE[(hdr >> 5) & 0x03], cls, cmd_id, bool(hdr & 0x80))
+
+
+"""
+Header indexed by the command header byte, None for bytes with unknown class or command id.
+"""
+HEADER_TABLE = tuple(_header(hdr) for hdr in range(256))
+
+
+class TagHeader(NamedTuple):
+    """
+    Decomposed tag header byte, see: tag_byte_table.
+    """
+    format: TlvFormat
+    type: TagType
+    value_length: int
+    decoder: object
+
+
+def tag_byte_table(decoders: tuple) -> tuple:
+    """
+    Builds a 256-entry tuple indexed by tag header byte (2b TLV format | 6b tag type id).
+
+    :param decoders:    64-entry tuple of tag value decoders indexed by tag type id, see: tag_type_table.
+    :return:            Tuple of TagHeader objects, None for bytes with unknown tag type id.
+    """
+    return tuple(
+        TagHeader(TLV_FORMAT_TABLE[tag_hdr >> 6], TAG_TYPE_TABLE[tag_hdr & 0x3F],
+                  TLV_FORMAT_LENGTH_TABLE[tag_hdr >> 6], decoders[tag_hdr & 0x3F])
+        if TAG_TYPE_TABLE[tag_hdr & 0x3F] is not None else None
+        for tag_hdr in range(256)
+    )
+
+
+"""
+LinkType name indexed by the link type byte.
+"""
+LINK_TYPE_NAME_TABLE = _index_table(LinkType, 256, lambda link_type: link_type.name)
+
+"""
+SensorUnits name indexed by the sensor units bit.
+"""
+SENSOR_UNITS_NAME_TABLE = _index_table(SensorUnits, 2, lambda sensor_units: sensor_units.name)
+
+"""
+Binary string values indexed by integer, used to fill binary string attributes without formatting.
+"""
+TWO_BITS_TABLE = tuple(format(i, '02b') for i in range(4))
+BYTE_BITS_TABLE = tuple(format(i, '08b') for i in range(256))
+
+"""
+Integer values of the enums, used by the encoders.
+"""
+OP_CODE_BITS = {op_code: int(op_code.value, 2) for op_code in OpCode}
+CLASS_BITS = {cls: int(cls.value, 2) for cls in Class}
+CMD_ID_BITS = {cmd_id: int(cmd_id_value, 2) for cmd_id, cmd_id_value in IdToCmdIdValueMap.items()}
+TAG_TYPE_BITS = {tag_type: int(tag_type.value, 2) for tag_type in TagType}
+
+
+# ------------------------------------------------------------------
+# Tag schema.
+# Tag value decoders and encoders are generated from it at import
+# time (see: tag.py), new tags need only to be described here.
+# ------------------------------------------------------------------
+class TagSpec(NamedTuple):
+    """
+    Describes value of a single tag type.
+
+    Attributes
+    ----------
+        tag_type: TagType
+            Tag type.
+        key: str | tuple
+            Key of the decoded value (for FLAGS: tuple of keys, one per bit, starting from the least significant one).
+        kind: ValueKind
+            Semantic type of the value.
+        width: int
+            Size of the value (or of single element, if repeated) in bytes, None if the size is not fixed.
+        repeated: bool
+            True if value is a list of elements.
+        names: tuple
+            For ENUM: names indexed by the value byte.
+            For FLAGS: names table per bit (None for boolean bits).
+        decoded: bool
+            False for downlink-only tags, which are encoded, but ignored when decoding.
+    """
+    tag_type: TagType
+    key: object
+    kind: ValueKind = ValueKind.UINT
+    width: int = None
+    repeated: bool = False
+    names: tuple = None
+    decoded: bool = True
+
+
+TAG_SCHEMA = (
+    TagSpec(TagType.NUMBER_OF_BUTTONS, 'buttons', width=1, repeated=True),
+    TagSpec(TagType.NUMBER_OF_LEDS, 'leds', width=1, repeated=True),
+    TagSpec(TagType.LED_ON, 'led_on', width=1, repeated=True, decoded=False),
+    TagSpec(TagType.LED_OFF, 'led_off', width=1, repeated=True, decoded=False),
+    TagSpec(TagType.BUTTON_PRESS, 'button_press', width=1, repeated=True),
+    TagSpec(TagType.TEMP_SENSOR_DATA, 'sensor_data'),
+    TagSpec(TagType.CURRENT_GPS_TIME_IN_SECS, 'gps_time', width=4),
+    TagSpec(TagType.DL_LATENCY_IN_SECS, 'dl_latency', width=4),
+    TagSpec(TagType.LED_ON_RESP, 'led_on_resp', width=1, repeated=True),
+    TagSpec(TagType.LED_OFF_RESP, 'led_off_resp', width=1, repeated=True),
+    TagSpec(TagType.TEMP_SENSOR_AVAILABLE_AND_UNIT_REPRESENTATION, ('sensor', 'sensor_units'), ValueKind.FLAGS,
+            width=1, names=(None, SENSOR_UNITS_NAME_TABLE)),
+    TagSpec(TagType.LINK_TYPE, 'link_type', ValueKind.ENUM, width=1, names=LINK_TYPE_NAME_TABLE),
+    TagSpec(TagType.BUTTON_PRESSED_RESP, 'button_pressed_resp', width=1, repeated=True, decoded=False)
+)
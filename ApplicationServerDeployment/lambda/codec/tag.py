@@ -5,7 +5,127 @@
 Class for encoding/decoding Sidewalk Sensor Monitoring Demo Application payload tags.
 """
 from protocol import *
-from textwrap import wrap
+
+
+# ---------------------------------------------------------------------
+# Generators of the tag value decoders/encoders, see: TAG_SCHEMA
+# ---------------------------------------------------------------------
+def _generate_bytes_decoder(spec: TagSpec):
+    """
+    Generates function, which decodes tag value (bytes) into a human-readable dict.
+
+    :param spec:    TagSpec object.
+    :return:        Decoder function.
+    """
+    key = spec.key
+    width = spec.width
+    names = spec.names
+    if spec.kind == ValueKind.ENUM:
+        def decode(val):
+            name = names[val[0]] if len(val) == 1 else None
+            if name is None:
+                raise ValueError(f'{bytes(val).hex()} is not a valid {key} value')
+            return {key: name}
+    elif spec.kind == ValueKind.FLAGS:
+        bits = tuple(enumerate(zip(key, names)))
+
+        def decode(val):
+            if not len(val):
+                raise ValueError(f'Empty value of the {spec.tag_type.name} tag')
+            last = val[-1]
+            return {
+                bit_key: bool((last >> bit) & 0x01) if bit_names is None else bit_names[(last >> bit) & 0x01]
+                for bit, (bit_key, bit_names) in bits
+            }
+    elif spec.repeated and width == 1:
+        def decode(val):
+            return {key: list(val)}
+    elif spec.repeated:
+        def decode(val):
+            if len(val) % width:
+                raise ValueError(f'Length of the {spec.tag_type.name} tag is not a multiple of {width}')
+            return {key: [int.from_bytes(val[i:i + width], 'big') for i in range(0, len(val), width)]}
+    else:
+        def decode(val):
+            if not len(val):
+                raise ValueError(f'Empty value of the {spec.tag_type.name} tag')
+            return {key: int.from_bytes(val, 'big')}
+    return decode
+
+
+def _generate_bytes_encoder(spec: TagSpec):
+    """
+    Generates function, which encodes tag value into bytes.
+
+    :param spec:    TagSpec object.
+    :return:        Encoder function.
+    """
+    width = spec.width
+    names = spec.names
+    if spec.kind == ValueKind.ENUM:
+        codes = {name: code for code, name in enumerate(names) if name is not None}
+
+        def encode(value):
+            if value not in codes:
+                raise ValueError(f'{value} is not a valid {spec.key} value')
+            return bytes((codes[value],))
+    elif spec.kind == ValueKind.FLAGS:
+        bits = tuple(enumerate(zip(spec.key, names)))
+
+        def encode(value):
+            byte = 0
+            for bit, (bit_key, bit_names) in bits:
+                bit_value = value.get(bit_key)
+                byte |= (bool(bit_value) if bit_names is None else bit_names.index(bit_value)) << bit
+            return bytes((byte,))
+    elif spec.repeated and width == 1:
+        def encode(value):
+            return bytes(value)
+    elif spec.repeated:
+        def encode(value):
+            return b''.join(int.to_bytes(element, width, 'big') for element in value)
+    elif width is not None:
+        def encode(value):
+            return int.to_bytes(value, width, 'big')
+    else:
+        def encode(value):
+            return int.to_bytes(value, max(1, (int.bit_length(value) + 7) // 8), 'big')
+    return encode
+
+
+def _str_decoder(fn):
+    """
+    Adapts bytes decoder to Tag object, which holds binary string value.
+    :param fn:      Bytes decoder.
+    :return:        Decoder function, which takes Tag object.
+    """
+    return lambda tag: fn(_bits_to_bytes(tag.val))
+
+
+def _str_encoder(tag_type: TagType, fn):
+    """
+    Adapts bytes encoder to Tag object, which holds binary string value.
+    :param tag_type:    TagType enum.
+    :param fn:          Bytes encoder.
+    :return:            Encoder function, which takes Tag object and returns binary string.
+    """
+    return lambda tag: _bytes_to_bits(fn(tag.json[tag_type]))
+
+
+def _decode_unsupported(val):
+    """
+    Used for TagTypes, which are not described by TAG_SCHEMA.
+    :return:    Empty dict.
+    """
+    return {}
+
+
+def _bits_to_bytes(bits: str) -> bytes:
+    return int(bits, 2).to_bytes(len(bits) // 8, 'big') if bits else b''
+
+
+def _bytes_to_bits(val: bytes) -> str:
+    return format(int.from_bytes(val, 'big'), f'0{len(val) * 8}b') if val else ''
 
 
 class Tag:
@@ -26,6 +146,7 @@ class Tag:
         json: dict
             Dictionary, which presents above-mentioned attributes in human-readable format.
     """
+    __slots__ = ('type', 'format', 'val', 'val_len', 'json')
 
     def __init__(self):
         self.type = ''
@@ -34,7 +155,7 @@ class Tag:
         self.val_len = ''
         self.json = {}
 
-    def decode(self, type: str, format: str, val: str, val_len: str = ''):
+    def decode(self, type: str, format: str, val: str, val_len: str = '', raw_val=None):
         """
         Decodes Tag object based on input parameters.
 
@@ -42,6 +163,8 @@ class Tag:
         :param format:      TLV format (binary string).
         :param val:         Payload value (binary string).
         :param val_len:     Payload length (if TLV format is STANDARD, binary string).
+        :param raw_val:     Payload value (bytes or memoryview), if given it is decoded instead of val,
+                            so that val does not have to be converted back to bytes.
         :return:            Tag object.
 
         """
@@ -49,9 +172,23 @@ class Tag:
         self.format = format
         self.val = val
         self.val_len = val_len
-        self._decode_tag()
+        self._decode_tag(raw_val)
         return self
 
+    @staticmethod
+    def decode_bytes(type_id: int, val) -> dict:
+        """
+        Decodes raw tag value into human readable json, without building binary strings.
+
+        :param type_id:     TagType (integer).
+        :param val:         Payload value (bytes or memoryview).
+        :return:            Dict representing tag value, empty if there is no decoder for the given TagType.
+        """
+        fn = Tag.BYTES_DECODERS_TABLE[type_id]
+        if fn is None:
+            raise ValueError(f'{type_id} is not a valid TagType')
+        return fn(val)
+
     def encode(self, json: dict):
         """
         Encodes Tag object based on input dictionary.
@@ -63,6 +200,38 @@ class Tag:
         self._encode_tag()
         return self
 
+    @staticmethod
+    def encode_bytes(json: dict, buf: bytearray = None) -> bytearray:
+        """
+        Encodes tag described by input dictionary straight into the bytearray, without building binary strings.
+
+        :param json:        Dict of the following structure: {TagType: value}.
+        :param buf:         Bytearray to which encoded tag is appended (new one is created if not given).
+        :return:            Bytearray containing encoded tag.
+        """
+        buf = bytearray() if buf is None else buf
+        tag_type = next(iter(json))
+        tag_id = TAG_TYPE_BITS.get(tag_type)
+        if tag_id is None:
+            raise ValueError(f'{tag_type} is not a valid TagType')
+        fn = Tag.BYTES_ENCODERS_MAP.get(tag_type)
+        try:
+            val = fn(json[tag_type])
+        except TypeError:
+            return buf
+        val_len = len(val)
+        if val_len == 1:
+            buf.append(tag_id)
+        elif val_len == 2:
+            buf.append(0x40 | tag_id)
+        elif val_len == 4:
+            buf.append(0x80 | tag_id)
+        else:
+            buf.append(0xC0 | tag_id)
+            buf.append(val_len)
+        buf += val
+        return buf
+
     def dict_repr(self):
         """
         Returns dict representation of the Tag object.
@@ -83,13 +252,23 @@ class Tag:
         """
         return self.format + self.type + self.val_len + self.val
 
-    def _decode_tag(self):
+    def _decode_tag(self, raw_val=None):
         """
         Decodes tag value into human readable json and stores it in json attribute.
-        """
-        fn = Tag.DECODERS_MAP.get(TagType(self.type))
+
+        :param raw_val:     Payload value (bytes or memoryview), val is decoded if not given.
+        """
+        type_id = int(self.type, 2)
+        if raw_val is None:
+            fn = Tag.DECODERS_TABLE[type_id]
+            val = self
+        else:
+            fn = Tag.BYTES_DECODERS_TABLE[type_id]
+            val = raw_val
+        if fn is None:
+            raise ValueError(f'{self.type} is not a valid TagType')
         try:
-            self.json = fn(self)
+            self.json = fn(val)
         except TypeError:
             self.json = {}
 
@@ -122,149 +301,13 @@ class Tag:
             self.val_len = ''
             self.val = ''
 
-    # -------------
-    # Tag decoders
-    # -------------
-    def _decode_button_press(self):
-        """
-        Decodes BUTTON_PRESS tag and turns it into a human-readable dict.
-        :return:    Dict representing received "button pressed" event.
-        """
-        return {
-            'button_press': [int(id, 2) for id in wrap(self.val, 8)]
-        }
-
-    def _decode_current_gps_time_in_secs(self):
-        """
-        Decodes CURRENT_GPS_TIME_IN_SECS tag and turns it into a human-readable dict.
-        :return:    Dict representing current gps time.
-        """
-        return {
-            'gps_time': int(self.val, 2)
-        }
-
-    def _decode_downlink_latency_in_secs(self):
-        """
-        Decodes DL_LATENCY_IN_SECS tag and turns it into a human-readable dict.
-        :return:    Dict representing downlink latency.
-        """
-        return {
-            'dl_latency': int(self.val, 2)
-        }
-
-    def _decode_led_on_resp(self):
-        """
-        Decodes TAG_LED_ON_RESP tag and turns it into a human-readable dict.
-        :return:    Dict representing received "LEDs on" response.
-        """
-        return {
-            'led_on_resp': [int(id, 2) for id in wrap(self.val, 8)]
-        }
-
-    def _decode_led_off_resp(self):
-        """
-        Decodes TAG_LED_OFF_RESP tag and turns it into a human-readable dict.
-        :return:    Dict representing received "LEDs off" response.
-        """
-        return {
-            'led_off_resp': [int(id, 2) for id in wrap(self.val, 8)]
-        }
-
-    def _decode_link_type(self):
-        """
-        Decodes LINK_TYPE tag and turns it into a human-readable dict.
-        :return:    Dict representing link type.
-        """
-        return {'link_type': LinkType(self.val).name}
-
-    def _decode_number_of_buttons(self):
-        """
-        Decodes NUMBER_OF_BUTTONS tag and turns it into a human-readable dict.
-        :return:    Dict representing number of available buttons.
-        """
-        return {
-            'buttons': [int(id, 2) for id in wrap(self.val, 8)]
-        }
-
-    def _decode_number_of_leds(self):
-        """
-        Decodes NUMBER_OF_LEDS tag and turns it into a human-readable dict.
-        :return:    Dict representing number of available LEDs.
-        """
-        return {
-            'leds': [int(id, 2) for id in wrap(self.val, 8)]
-        }
-
-    def _decode_temp_sensor_available_and_unit_representation(self):
-        """
-        Decodes TEMP_SENSOR_AVAILABLE_AND_UNIT_REPRESENTATION tag and turns it into a human-readable dict.
-        :return:    Dict representing temp sensor metadata.
-        """
-        return {
-            'sensor': True if self.val[-1] == '1' else False,
-            'sensor_units': SensorUnits(self.val[-2]).name
-        }
-
-    def _decode_temp_sensor_data(self):
-        """
-        Decodes TEMP_SENSOR_DATA tag and turns it into a human-readable dict.
-        :return:    Dict representing temp sensor data.
-        """
-        return {
-            'sensor_data': int(self.val, 2)
-        }
-
-    DECODERS_MAP = {
-        TagType.BUTTON_PRESS: _decode_button_press,
-        TagType.CURRENT_GPS_TIME_IN_SECS: _decode_current_gps_time_in_secs,
-        TagType.DL_LATENCY_IN_SECS: _decode_downlink_latency_in_secs,
-        TagType.LED_ON_RESP: _decode_led_on_resp,
-        TagType.LED_OFF_RESP: _decode_led_off_resp,
-        TagType.LINK_TYPE: _decode_link_type,
-        TagType.NUMBER_OF_BUTTONS: _decode_number_of_buttons,
-        TagType.NUMBER_OF_LEDS: _decode_number_of_leds,
-        TagType.TEMP_SENSOR_AVAILABLE_AND_UNIT_REPRESENTATION: _decode_temp_sensor_available_and_unit_representation,
-        TagType.TEMP_SENSOR_DATA: _decode_temp_sensor_data
-    }
-
-    # -------------
-    # Tag encoders
-    # -------------
-    def _encode_button_pressed_resp(self):
-        """
-        Encodes BUTTON_PRESSED_RESP tag value based on json dict.
-        :return:    Tag value (binary string).
-        """
-        indices = self.json[TagType.BUTTON_PRESSED_RESP]
-        return ''.join([format(idx, '08b') for idx in indices])
-
-    def _encode_led_on(self):
-        """
-        Encodes LED_ON tag value based on json dict.
-        :return:    Tag value (binary string).
-        """
-        indices = self.json[TagType.LED_ON]
-        return ''.join([format(idx, '08b') for idx in indices])
-
-    def _encode_led_off(self):
-        """
-        Encodes LED_OFF tag value based on json dict.
-        :return:    Tag value (binary string).
-        """
-        indices = self.json[TagType.LED_OFF]
-        return ''.join([format(idx, '08b') for idx in indices])
-
-    def _encode_current_gps_time_in_secs(self):
-        """
-        Encodes CURRENT_GPS_TIME_IN_SECS tag value based on json dict.
-        :return:    Tag value (binary string).
-        """
-        current_gps_time = self.json[TagType.CURRENT_GPS_TIME_IN_SECS]
-        return format(current_gps_time, '032b')
-
-    ENCODERS_MAP = {
-        TagType.BUTTON_PRESSED_RESP: _encode_button_pressed_resp,
-        TagType.LED_ON: _encode_led_on,
-        TagType.LED_OFF: _encode_led_off,
-        TagType.CURRENT_GPS_TIME_IN_SECS: _encode_current_gps_time_in_secs
-    }
+    # ---------------------------------------------
+    # Tag decoders/encoders generated from schema
+    # ---------------------------------------------
+    BYTES_DECODERS_MAP = {spec.tag_type: _generate_bytes_decoder(spec) for spec in TAG_SCHEMA if spec.decoded}
+    BYTES_DECODERS_TABLE = tag_type_table(BYTES_DECODERS_MAP, _decode_unsupported)
+    TAG_BYTE_TABLE = tag_byte_table(BYTES_DECODERS_TABLE)
+    BYTES_ENCODERS_MAP = {spec.tag_type: _generate_bytes_encoder(spec) for spec in TAG_SCHEMA}
+    DECODERS_MAP = {tag_type: _str_decoder(fn) for tag_type, fn in BYTES_DECODERS_MAP.items()}
+    DECODERS_TABLE = tag_type_table(DECODERS_MAP, _decode_unsupported)
+    ENCODERS_MAP = {tag_type: _str_encoder(tag_type, fn) for tag_type, fn in BYTES_ENCODERS_MAP.items()}
@@ -0,0 +1,63 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for batch command decoder.
+"""
+import base64
+import types
+import unittest
+
+from command import Command
+
+PAYLOADS_HEX = [
+    '4001014201020B030C01',
+    '61C90301020387000003E888000000640C04',
+    '41850102030487000003E80C04',
+    '41C60301020387000000010C01'
+]
+
+
+def to_base64(payload_hex: str) -> str:
+    return base64.b64encode(payload_hex.encode('ascii')).decode()
+
+
+class TestBatchDecoder(unittest.TestCase):
+
+    def test_decodeMany_base64_sameAsDecode(self):
+        decoded = Command.decode_many([to_base64(payload) for payload in PAYLOADS_HEX])
+        self.assertEqual(decoded, [Command().decode(payload).decoded_cmd for payload in PAYLOADS_HEX])
+
+    def test_decodeMany_hex_sameAsDecode(self):
+        decoded = Command.decode_many(PAYLOADS_HEX, encoding='hex')
+        self.assertEqual(decoded, [Command().decode(payload).decoded_cmd for payload in PAYLOADS_HEX])
+
+    def test_decodeMany_raw_sameAsDecode(self):
+        decoded = Command.decode_many([bytes.fromhex(payload) for payload in PAYLOADS_HEX], encoding='raw')
+        self.assertEqual(decoded, [Command().decode(payload).decoded_cmd for payload in PAYLOADS_HEX])
+
+    def test_iterDecode_isLazy(self):
+        def payloads():
+            yield PAYLOADS_HEX[0]
+            raise AssertionError('Generator consumed too eagerly')
+
+        decoded = Command.iter_decode(payloads(), encoding='hex')
+        self.assertIsInstance(decoded, types.GeneratorType)
+        self.assertEqual(next(decoded)['id'], 'DEMO_APP_CAP_DISCOVERY_NOTIFICATION')
+
+    def test_decodeMany_invalidPayload_shouldRaise(self):
+        with self.assertRaises(ValueError):
+            Command.decode_many(PAYLOADS_HEX + ['4Z'], encoding='hex')
+
+    def test_decodeMany_invalidPayload_skipInvalid(self):
+        decoded = Command.decode_many(['4Z', '', 'E1', '41C6'] + PAYLOADS_HEX[:1], encoding='hex', skip_invalid=True)
+        self.assertEqual(decoded[:4], [None, None, None, None])
+        self.assertEqual(decoded[4]['buttons'], [1])
+
+    def test_decodeMany_unsupportedEncoding(self):
+        with self.assertRaises(ValueError):
+            Command.decode_many(PAYLOADS_HEX, encoding='utf-16')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the codec benchmark suite.
+"""
+import unittest
+from unittest import mock
+
+from bench import compare, suite
+from command import Command
+from protocol import *
+
+
+class TestBench(unittest.TestCase):
+
+    def test_cases_coverAllIdsAndSizes(self):
+        cases = list(suite.cases())
+        self.assertEqual({args['id'] for _, args, _ in cases}, set(Id))
+        self.assertEqual(len(cases), len(Id) * len(suite.PAYLOAD_SIZES))
+        for name, args, raw in cases:
+            with self.subTest(case=name):
+                decoded_cmd = Command().decode_bytes(raw).decoded_cmd
+                self.assertEqual(decoded_cmd['id'], args['id'].name)
+                self.assertEqual(decoded_cmd['button_press'], args['payload'][0][suite.PAYLOAD_TAG])
+
+    def test_cases_maxLengthStandardTag(self):
+        raw = max((raw for _, _, raw in suite.cases()), key=len)
+        self.assertEqual(raw[-257] >> 6, int(TlvFormat.STANDARD.value, 2))
+        self.assertEqual(raw[-256], 255)
+
+    def test_compare_detectsRegression(self):
+        baseline = {'results': {'decode/A': {'ns_per_op': 100, 'relative_time': 0.5, 'allocs_per_op': 4,
+                                             'peak_bytes': 1000}}}
+        current = {'results': {'decode/A': {'ns_per_op': 130, 'relative_time': 0.65, 'allocs_per_op': 4,
+                                            'peak_bytes': 1050}}}
+        self.assertEqual(compare.compare(baseline, current, 0.2), ['decode/A: relative_time 0.5 -> 0.65'])
+        self.assertEqual(compare.compare(baseline, current, 0.2, time_threshold=0.5), [])
+        self.assertEqual(compare.compare(baseline, {'results': {}}, 0.2), ['decode/A: missing in current results'])
+
+    def test_compare_slowerMachine_noRegression(self):
+        # the same run on a machine twice as slow: ns_per_op doubles, relative_time does not change
+        baseline = {'results': {'decode/A': {'ns_per_op': 100, 'relative_time': 0.5, 'allocs_per_op': 4,
+                                             'peak_bytes': 1000}}}
+        current = {'results': {'decode/A': {'ns_per_op': 200, 'relative_time': 0.5, 'allocs_per_op': 4,
+                                            'peak_bytes': 1000}}}
+        self.assertEqual(compare.compare(baseline, current, 0.2), [])
+
+    def test_run_timesRelativeToReference(self):
+        metrics = {'ns_per_op': 500, 'allocs_per_op': 1, 'peak_bytes': 100}
+        with mock.patch.object(suite, 'measure', side_effect=lambda fn, number: dict(metrics)), \
+                mock.patch.object(suite, 'time_op', side_effect=[2500, 2000]):
+            report = suite.run(1)
+
+        self.assertEqual(report['meta']['reference_ns_per_op'], 2000)
+        self.assertEqual({metrics['relative_time'] for metrics in report['results'].values()}, {0.25})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for bytes-native command decoder.
+"""
+import unittest
+from unittest import mock
+
+import test_decoder
+from command import Command
+
+
+class _BytesCommand(Command):
+    """
+    Command, which routes hexadecimal input through the bytes decoder.
+    """
+    def decode(self, byte_stream):
+        return self.decode_bytes(bytes.fromhex(byte_stream))
+
+
+class TestBytesDecoder(test_decoder.TestDecoder):
+    """
+    Runs all the decoder test cases against Command.decode_bytes.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(test_decoder, 'Command', _BytesCommand)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # -----------------------------------------------
+    # Compare with binary string decoder
+    # -----------------------------------------------
+    def test_decodeBytes_sameAsDecode(self):
+        payloads = [
+            '4001014201020B030C01',
+            '40C1050102030405C2060102030405060B000C04',
+            '61C90301020387000003E88800000064' + '0C04',
+            '618A010203048700002710880000' + '03E80C01',
+            '41850102030487000003E80C04',
+            '41C60301020387000000010C01',
+            'E1000D01'
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                expected = Command().decode(payload)
+                cmd = Command().decode_bytes(bytes.fromhex(payload))
+                self.assertEqual(cmd.decoded_cmd, expected.decoded_cmd)
+                self.assertEqual(cmd.status_hdr_ind, expected.status_hdr_ind)
+                self.assertEqual(cmd.op_code, expected.op_code)
+                self.assertEqual(cmd.cls, expected.cls)
+                self.assertEqual(cmd.id, expected.id)
+                self.assertEqual(cmd.status_code, expected.status_code)
+
+    def test_decodeBytes_acceptsMemoryview(self):
+        cmd = Command().decode_bytes(memoryview(bytes.fromhex('41060187000000010C01')))
+        self.assertEqual(cmd.decoded_cmd['sensor_data'], 1)
+        self.assertEqual(cmd.decoded_cmd['link_type'], 'BLE')
+
+    def test_decodeBytes_unknownTagType(self):
+        with self.assertRaises(ValueError):
+            Command().decode_bytes(bytes.fromhex('41FF01'))
+
+    def test_decodeBytes_emptyInput(self):
+        with self.assertRaises(ValueError):
+            Command().decode_bytes(b'')
+
+    # -----------------------------------------------
+    # Tags iterator
+    # -----------------------------------------------
+    def test_iterTags_shouldSucceed(self):
+        data = memoryview(bytes.fromhex('40C1050102030405C2060102030405060B000C04'))
+        tags = list(Command.iter_tags(data, 1))
+        self.assertEqual(tags, [(1, 3, 3, 8), (2, 3, 10, 16), (11, 0, 17, 18), (12, 0, 19, 20)])
+        self.assertEqual(list(data[3:8]), [1, 2, 3, 4, 5])
+
+    def test_iterTags_truncatedValue(self):
+        with self.assertRaisesRegex(ValueError, 'Truncated tag at byte 1: 4 bytes expected, 2 available'):
+            list(Command.iter_tags(bytes.fromhex('4187000A'), 1))
+
+    def test_iterTags_truncatedStandardLength(self):
+        with self.assertRaisesRegex(ValueError, 'length is missing'):
+            list(Command.iter_tags(bytes.fromhex('41C6'), 1))
+
+    def test_validateBytesAndExtractTags_walkTagsWithIterTags(self):
+        data = bytes.fromhex('40C1050102030405C2060102030405060B000C04')
+        spans = [(val_start, val_end) for _, _, val_start, val_end in Command.iter_tags(data, 1)]
+        self.assertEqual([(val_start, val_end) for _, val_start, val_end in Command.validate_bytes(data)], spans)
+
+        bin_payload = Command._bytes_to_bin(data[1:])
+        tags = list(Command.extract_tags(bin_payload))
+        self.assertEqual([tag.val for tag in tags],
+                         [bin_payload[(val_start - 1) * 8:(val_end - 1) * 8] for val_start, val_end in spans])
+        decoded_cmd = Command().decode_bytes(data).decoded_cmd
+        self.assertEqual({**Command.combine_tags(tags), 'id': decoded_cmd['id']}, decoded_cmd)
+
+    def test_extractTags_truncatedPayload(self):
+        for bin_payload in ('1100011000000101', '110001', '000000'):
+            with self.subTest(bin_payload=bin_payload):
+                with self.assertRaises(ValueError):
+                    list(Command.extract_tags(bin_payload))
+
+    def test_decode_truncatedPayload(self):
+        for payload in ('41C60501020387000000010C01', '41050187000000'):
+            with self.subTest(payload=payload):
+                with self.assertRaises(ValueError):
+                    Command().decode(payload)
+                with self.assertRaises(ValueError):
+                    Command().decode_bytes(bytes.fromhex(payload))
+
+
+if __name__ == '__main__':
+    unittest.main()
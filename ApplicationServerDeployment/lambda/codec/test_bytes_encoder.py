@@ -0,0 +1,138 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for bytes-native command encoder.
+"""
+import base64
+import unittest
+
+from command import Command
+from protocol import *
+from tag import Tag
+
+
+class TestBytesEncoder(unittest.TestCase):
+
+    # -----------------------------------------------
+    # Invalid params
+    # -----------------------------------------------
+    def test_encodeBytesHeader_invalidHeader(self):
+        with self.assertRaises(ValueError):
+            Command.encode_bytes(
+                status_hdr_ind=True,
+                op_code=OpCode.MSG_TYPE_RESP,
+                cls=True,
+                id=Id.DEMO_APP_ACTION_RESP
+            )
+
+    def test_encodeBytesHeader_invalidPayload(self):
+        with self.assertRaises(ValueError):
+            Tag.encode_bytes({'NonExistentTag': '1'})
+
+    def test_encodeBytesTag_invalidIndex(self):
+        with self.assertRaises(ValueError):
+            Tag.encode_bytes({TagType.LED_ON: [256]})
+
+    # ----------------------------------------
+    # Encode DEMO_APP_CAP_DISCOVERY_RESP  msg
+    # ----------------------------------------
+    def test_encodeBytesDemoAppCapDiscoveryResp_shouldSucceed(self):
+        payload = Command.encode_bytes(
+            status_hdr_ind=True,
+            op_code=OpCode.MSG_TYPE_RESP,
+            cls=Class.DEMO_APP_CLASS,
+            id=Id.DEMO_APP_CAP_DISCOVERY_RESP,
+            status_code=0
+        )
+        self.assertEqual(payload, bytes.fromhex('E000'))
+
+    # --------------------------------
+    # Encode DEMO_APP_ACTION_RESP msg
+    # --------------------------------
+    def test_encodeBytesButtonPressedResp_shouldSucceed(self):
+        cases = [
+            ([1], 'E1000D01'),
+            ([2, 4], 'E1004D0204'),
+            ([1, 2, 4], 'E100CD03010204')
+        ]
+        for buttons, expected in cases:
+            with self.subTest(buttons=buttons):
+                payload = Command.encode_bytes(
+                    status_hdr_ind=True,
+                    op_code=OpCode.MSG_TYPE_RESP,
+                    cls=Class.DEMO_APP_CLASS,
+                    id=Id.DEMO_APP_ACTION_RESP,
+                    status_code=0,
+                    payload=[{TagType.BUTTON_PRESSED_RESP: buttons}]
+                )
+                self.assertEqual(payload, bytes.fromhex(expected))
+
+    # -------------------------------
+    # Encode DEMO_APP_ACTION_REQ msg
+    # -------------------------------
+    def test_encodeBytesLed_gpsTime1000_shouldSucceed(self):
+        cases = [
+            (TagType.LED_ON, [1], '21030187000003E8'),
+            (TagType.LED_ON, [1, 2], '2143010287000003E8'),
+            (TagType.LED_ON, [1, 2, 3], '21C30301020387000003E8'),
+            (TagType.LED_ON, [1, 2, 3, 4], '21830102030487000003E8'),
+            (TagType.LED_OFF, [1], '21040187000003E8'),
+            (TagType.LED_OFF, [1, 2], '2144010287000003E8'),
+            (TagType.LED_OFF, [1, 2, 3], '21C40301020387000003E8'),
+            (TagType.LED_OFF, [1, 2, 3, 4], '21840102030487000003E8')
+        ]
+        for tag_type, leds, expected in cases:
+            with self.subTest(tag_type=tag_type, leds=leds):
+                payload = Command.encode_bytes(
+                    status_hdr_ind=False,
+                    op_code=OpCode.MSG_TYPE_WRITE,
+                    cls=Class.DEMO_APP_CLASS,
+                    id=Id.DEMO_APP_ACTION_REQ,
+                    payload=[{tag_type: leds}, {TagType.CURRENT_GPS_TIME_IN_SECS: 1000}]
+                )
+                self.assertEqual(payload, bytes.fromhex(expected))
+
+    # -----------------------------------------------
+    # Compare with binary string encoder
+    # -----------------------------------------------
+    def test_encodeBase64_sameAsHexRepr(self):
+        tags_json = [{TagType.LED_ON: [1, 2, 3]}, {TagType.CURRENT_GPS_TIME_IN_SECS: 1234567}]
+        cmd = Command().encode(
+            status_hdr_ind=False,
+            op_code=OpCode.MSG_TYPE_WRITE,
+            cls=Class.DEMO_APP_CLASS,
+            id=Id.DEMO_APP_ACTION_REQ,
+            payload=[Tag().encode(tag) for tag in tags_json]
+        )
+        payload = Command.encode_base64(
+            status_hdr_ind=False,
+            op_code=OpCode.MSG_TYPE_WRITE,
+            cls=Class.DEMO_APP_CLASS,
+            id=Id.DEMO_APP_ACTION_REQ,
+            payload=tags_json
+        )
+        self.assertEqual(payload, base64.b64encode(bytes.fromhex(cmd.hex_repr())).decode())
+
+    # -----------------------------------------------
+    # Compact representation
+    # -----------------------------------------------
+    def test_encode_decodedCmdComputedOnAccess(self):
+        cmd = Command().encode(
+            status_hdr_ind=True,
+            op_code=OpCode.MSG_TYPE_RESP,
+            cls=Class.DEMO_APP_CLASS,
+            id=Id.DEMO_APP_ACTION_RESP,
+            status_code='00000000',
+            payload=[Tag().encode({TagType.BUTTON_PRESSED_RESP: [1, 2]})]
+        )
+        self.assertIsNone(cmd._decoded_cmd)
+        self.assertEqual(cmd.decoded_cmd, {TagType.BUTTON_PRESSED_RESP: [1, 2], 'id': 'DEMO_APP_ACTION_RESP'})
+
+    def test_commandAndTag_haveNoInstanceDict(self):
+        self.assertFalse(hasattr(Command(), '__dict__'))
+        self.assertFalse(hasattr(Tag(), '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for vectorized sensor notifications decoder.
+"""
+import base64
+import unittest
+
+from command import Command
+
+try:
+    import numpy as np
+    from columnar import decode_sensor_notifications
+except ImportError:
+    np = None
+
+PAYLOADS_HEX = [
+    '41060187000000010C01',
+    '4146010287000000010C01',
+    '41C60301020387000000010C01',
+    '41860102030487000000010C01',
+    '41850102030487000003E80C04',
+    '41860102030487000000020C02',
+    '4001014201020B030C01',
+    '41060187000000010C07',
+    '41060187000000010C01'
+]
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestColumnarDecoder(unittest.TestCase):
+
+    def test_decodeSensorNotifications_sameAsDecode(self):
+        payloads = [base64.b64encode(payload.encode('ascii')).decode() for payload in PAYLOADS_HEX]
+        result = decode_sensor_notifications(payloads)
+        self.assertEqual(len(result), len(PAYLOADS_HEX))
+        self.assertEqual(sorted(result.index.tolist()), [0, 1, 2, 3, 5, 8])
+        names = result.link_type_names()
+        for row, idx in enumerate(result.index.tolist()):
+            expected = Command().decode(PAYLOADS_HEX[idx]).decoded_cmd
+            self.assertEqual(int(result.sensor_data[row]), expected['sensor_data'])
+            self.assertEqual(int(result.gps_time[row]), expected['gps_time'])
+            self.assertEqual(names[row], expected['link_type'])
+
+    def test_decodeSensorNotifications_fallback(self):
+        result = decode_sensor_notifications(PAYLOADS_HEX + ['4Z'], encoding='hex')
+        fallback = dict(result.fallback)
+        self.assertEqual(sorted(fallback), [4, 6, 7, 9])
+        self.assertEqual(fallback[4], Command().decode(PAYLOADS_HEX[4]).decoded_cmd)
+        self.assertEqual(fallback[6], Command().decode(PAYLOADS_HEX[6]).decoded_cmd)
+        self.assertIsNone(fallback[7])
+        self.assertIsNone(fallback[9])
+
+    def test_decodeSensorNotifications_empty(self):
+        result = decode_sensor_notifications([], encoding='hex')
+        self.assertEqual(len(result), 0)
+        self.assertEqual(result.sensor_data.dtype, np.uint64)
+
+
+if __name__ == '__main__':
+    unittest.main()
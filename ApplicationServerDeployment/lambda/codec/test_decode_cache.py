@@ -0,0 +1,47 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for decode cache.
+"""
+import unittest
+
+import decode_cache
+from command import Command
+
+
+class TestDecodeCache(unittest.TestCase):
+
+    def setUp(self):
+        decode_cache.cache_clear()
+
+    def test_decode_sameAsDecodeBytes(self):
+        payload = bytes.fromhex('40C1050102030405C2060102030405060B000C04')
+        decoded = decode_cache.decode(payload)
+        expected = Command().decode_bytes(payload).decoded_cmd
+        self.assertEqual({key: list(val) if isinstance(val, tuple) else val for key, val in decoded.items()}, expected)
+
+    def test_decode_countsHitsAndMisses(self):
+        payload = bytes.fromhex('41050187000000010C01')
+        first = decode_cache.decode(payload)
+        second = decode_cache.decode(bytearray(payload))
+        self.assertIs(first, second)
+        info = decode_cache.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+
+    def test_decode_resultIsImmutable(self):
+        decoded = decode_cache.decode(bytes.fromhex('41050187000000010C01'))
+        with self.assertRaises(TypeError):
+            decoded['id'] = 'DEMO_APP_ACTION_RESP'
+        with self.assertRaises(AttributeError):
+            decoded['button_press'].append(2)
+
+    def test_decode_invalidPayload_notCached(self):
+        with self.assertRaises(ValueError):
+            decode_cache.decode(b'')
+        self.assertEqual(decode_cache.cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
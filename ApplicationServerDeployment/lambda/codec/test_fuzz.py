@@ -0,0 +1,99 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Fuzz and property tests of the codec, together with up-front payload validation.
+"""
+import random
+import unittest
+from unittest import mock
+
+import fuzz
+from command import Command
+from protocol import *
+from tag import Tag
+
+try:
+    from hypothesis import given, strategies
+except ImportError:
+    given = None
+
+
+def patch_tag_decoders(decode_tag: mock.Mock):
+    """
+    Patches Tag.TAG_BYTE_TABLE, so that decode_tag is called before every tag value decoder.
+    :param decode_tag:  Mock object.
+    :return:            Patcher (context manager).
+    """
+    def counted(decoder):
+        return lambda val: decode_tag(val) and decoder(val)
+
+    table = tuple(tag and tag._replace(decoder=counted(tag.decoder)) for tag in Tag.TAG_BYTE_TABLE)
+    return mock.patch.object(Tag, 'TAG_BYTE_TABLE', table)
+
+
+class TestFuzz(unittest.TestCase):
+
+    # -----------------------------------------------
+    # Seeded fuzzing
+    # -----------------------------------------------
+    def test_fuzz_roundTripAndRandomBytes(self):
+        fuzz.run(iterations=500, seed=2023)
+
+    def test_fuzz_truncatedCommands(self):
+        rng = random.Random(7)
+        for _ in range(100):
+            raw = Command.encode_bytes(**fuzz.random_command(rng)[0])
+            for end in range(len(raw)):
+                fuzz.check_random_bytes(raw[:end])
+
+    # -----------------------------------------------
+    # Up-front validation
+    # -----------------------------------------------
+    def test_validateBytes_shouldSucceed(self):
+        tags = Command.validate_bytes(bytes.fromhex('41C60301020387000000010C01'))
+        self.assertEqual([(tag.type, val_start, val_end) for tag, val_start, val_end in tags], [
+            (TagType.TEMP_SENSOR_DATA, 3, 6),
+            (TagType.CURRENT_GPS_TIME_IN_SECS, 7, 11),
+            (TagType.LINK_TYPE, 12, 13)
+        ])
+
+    def test_validateBytes_rejectsBeforeTagDecoding(self):
+        payloads = [
+            '',                                         # empty
+            '41' + '00' * MAX_COMMAND_LENGTH,           # too long
+            '0001',                                     # unknown id
+            'E1',                                       # missing status code
+            '41C605010203',                             # truncated STANDARD tag
+            '41860102030487000003E83F01',               # unknown tag type after valid tags
+        ]
+        decode_tag = mock.Mock()
+        with patch_tag_decoders(decode_tag):
+            for payload in payloads:
+                with self.subTest(payload=payload):
+                    with self.assertRaises(ValueError):
+                        Command().decode_bytes(bytes.fromhex(payload))
+                    with self.assertRaises(ValueError):
+                        Command().decode(payload)
+            decode_tag.assert_not_called()
+
+    def test_hexToBin_keepsLeadingZeroNibbles(self):
+        self.assertEqual(Command.hex_to_bin('0C01'), '0000110000000001')
+        self.assertEqual(Command.hex_to_bin('000C'), '0000000000001100')
+
+
+@unittest.skipIf(given is None, 'hypothesis is not installed')
+class TestProperties(unittest.TestCase):
+
+    if given is not None:
+        @given(strategies.randoms(use_true_random=False))
+        def test_roundTrip(self, rng):
+            fuzz.check_round_trip(*fuzz.random_command(rng))
+
+        @given(strategies.binary(max_size=64))
+        def test_randomBytes(self, data):
+            fuzz.check_random_bytes(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
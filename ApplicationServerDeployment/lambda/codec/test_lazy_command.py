@@ -0,0 +1,71 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for lazily decoded command.
+"""
+import unittest
+from unittest import mock
+
+from command import Command
+from lazy_command import LazyCommand
+from test_fuzz import patch_tag_decoders
+
+
+class TestLazyCommand(unittest.TestCase):
+
+    def test_lazyCommand_sameAsDecodeBytes(self):
+        payloads = [
+            '40C1050102030405C2060102030405060B000C04',
+            '61C90301020387000003E88800000064' + '0C04',
+            '41850102030487000003E80C04',
+            '41C60301020387000000010C01',
+            'E1000D01'
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                raw = bytes.fromhex(payload)
+                lazy = LazyCommand(raw)
+                expected = Command().decode_bytes(raw).decoded_cmd
+                self.assertEqual(dict(lazy), {key: tuple(val) if isinstance(val, list) else val
+                                              for key, val in expected.items()})
+                self.assertEqual(lazy.id, expected['id'])
+
+    def test_lazyCommand_routingDoesNotDecodeTags(self):
+        decode_tag = mock.Mock()
+        with patch_tag_decoders(decode_tag):
+            lazy = LazyCommand(bytes.fromhex('41850102030487000003E80C04'))
+            self.assertEqual(lazy['id'], 'DEMO_APP_ACTION_NOTIFICATION')
+            self.assertIn('button_press', lazy)
+            self.assertNotIn('sensor_data', lazy)
+            self.assertEqual(set(lazy), {'button_press', 'gps_time', 'link_type', 'id'})
+            decode_tag.assert_not_called()
+
+            self.assertEqual(lazy.get('button_press'), (1, 2, 3, 4))
+            self.assertEqual(lazy.get('button_press'), (1, 2, 3, 4))
+            self.assertIsNone(lazy.get('sensor_data'))
+            decode_tag.assert_called_once()
+
+    def test_lazyCommand_flagsTagDecodedOnce(self):
+        decode_tag = mock.Mock()
+        with patch_tag_decoders(decode_tag):
+            lazy = LazyCommand(bytes.fromhex('400B03'))
+            self.assertTrue(lazy['sensor'])
+            self.assertEqual(lazy['sensor_units'], 'FAHRENHEIT')
+            decode_tag.assert_called_once()
+
+    def test_lazyCommand_invalidPayload(self):
+        for payload in ('', '41C605010203', '413F01'):
+            with self.subTest(payload=payload):
+                with self.assertRaises(ValueError):
+                    LazyCommand(bytes.fromhex(payload))
+
+    def test_lazyCommand_invalidValueRaisesOnAccess(self):
+        lazy = LazyCommand(bytes.fromhex('410C03'))
+        self.assertEqual(lazy.id, 'DEMO_APP_ACTION_NOTIFICATION')
+        with self.assertRaises(ValueError):
+            lazy.get('link_type')
+
+
+if __name__ == '__main__':
+    unittest.main()
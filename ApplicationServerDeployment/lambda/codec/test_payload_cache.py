@@ -0,0 +1,69 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for downlink payload cache.
+"""
+import unittest
+
+import payload_cache
+from command import Command
+from protocol import *
+
+
+class TestPayloadCache(unittest.TestCase):
+
+    def setUp(self):
+        payload_cache.cache_clear()
+
+    def test_capDiscoveryResp_sameAsEncoder(self):
+        self.assertEqual(payload_cache.DEMO_APP_CAP_DISCOVERY_RESP, Command.encode_base64(
+            status_hdr_ind=True,
+            op_code=OpCode.MSG_TYPE_RESP,
+            cls=Class.DEMO_APP_CLASS,
+            id=Id.DEMO_APP_CAP_DISCOVERY_RESP,
+            status_code=0
+        ))
+
+    def test_actionResp_sameAsEncoder(self):
+        for buttons in ([1], [2, 4], [1, 2, 4], [1], None):
+            with self.subTest(buttons=buttons):
+                self.assertEqual(payload_cache.action_resp(buttons), Command.encode_base64(
+                    status_hdr_ind=True,
+                    op_code=OpCode.MSG_TYPE_RESP,
+                    cls=Class.DEMO_APP_CLASS,
+                    id=Id.DEMO_APP_ACTION_RESP,
+                    status_code=0,
+                    payload=[{TagType.BUTTON_PRESSED_RESP: buttons}]
+                ))
+        info = payload_cache.cache_info()['action_resp']
+        self.assertEqual((info.hits, info.misses), (1, 4))
+
+    def test_actionReq_patchesGpsTime(self):
+        cases = [
+            (TagType.LED_ON, [1], 1000),
+            (TagType.LED_ON, [1], 1370000000),
+            (TagType.LED_OFF, [1, 2, 3], 1000),
+            (TagType.LED_OFF, [1, 2, 3], 0xFFFFFFFF),
+            (TagType.LED_ON, [1, 2, 3, 4], 1000)
+        ]
+        for tag_type, leds, gps_time in cases:
+            with self.subTest(tag_type=tag_type, leds=leds, gps_time=gps_time):
+                self.assertEqual(payload_cache.action_req(tag_type, leds, gps_time), Command.encode_base64(
+                    status_hdr_ind=False,
+                    op_code=OpCode.MSG_TYPE_WRITE,
+                    cls=Class.DEMO_APP_CLASS,
+                    id=Id.DEMO_APP_ACTION_REQ,
+                    payload=[{tag_type: leds}, {TagType.CURRENT_GPS_TIME_IN_SECS: gps_time}]
+                ))
+        info = payload_cache.cache_info()['action_req']
+        self.assertEqual((info.hits, info.misses), (2, 3))
+
+    def test_actionReq_invalidLed_notCached(self):
+        with self.assertRaises(ValueError):
+            payload_cache.action_req(TagType.LED_ON, [256], 1000)
+        self.assertEqual(payload_cache.cache_info()['action_req'].currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
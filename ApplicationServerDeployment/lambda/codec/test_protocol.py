@@ -0,0 +1,75 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for protocol lookup tables.
+"""
+import unittest
+
+from protocol import *
+from tag import Tag
+
+
+class TestProtocolTables(unittest.TestCase):
+
+    def test_tagTypeTable_matchesEnum(self):
+        self.assertEqual(len(TAG_TYPE_TABLE), 64)
+        for tag_id, tag_type in enumerate(TAG_TYPE_TABLE):
+            if tag_type is None:
+                with self.assertRaises(ValueError):
+                    TagType(format(tag_id, '06b'))
+            else:
+                self.assertEqual(tag_type, TagType(format(tag_id, '06b')))
+
+    def test_tlvFormatLengthTable_matchesEnum(self):
+        self.assertEqual(TLV_FORMAT_LENGTH_TABLE, (1, 2, 4, None))
+
+    def test_idTables_matchEnum(self):
+        self.assertEqual((len(ID_TABLE), len(ID_NAME_TABLE)), (32, 32))
+        for cmd_id in Id:
+            self.assertEqual(ID_TABLE[int(cmd_id.value, 2)], cmd_id)
+            self.assertEqual(ID_NAME_TABLE[int(cmd_id.value, 2)], cmd_id.name)
+        self.assertEqual(sum(cmd_id is not None for cmd_id in ID_TABLE), len(Id))
+        self.assertEqual(sum(name is not None for name in ID_NAME_TABLE), len(Id))
+
+    def test_headerTable_matchesBitFields(self):
+        self.assertEqual(len(HEADER_TABLE), 256)
+        for hdr, header in enumerate(HEADER_TABLE):
+            bits = format(hdr, '08b')
+            if header is None:
+                continue
+            self.assertEqual(header.has_status, bits[0] == '1')
+            self.assertEqual(header.op_code, OpCode(bits[1:3]))
+            self.assertEqual(header.cls, Class(bits[3:5]))
+            self.assertEqual(header.id, ID_TABLE[(int(bits[5:8], 2) << 2) | int(bits[1:3], 2)])
+        self.assertEqual(sum(header is not None for header in HEADER_TABLE), len(Id) * len(Class) * 2)
+
+    def test_tagByteTable_matchesBitFields(self):
+        self.assertEqual(len(Tag.TAG_BYTE_TABLE), 256)
+        for tag_hdr, tag in enumerate(Tag.TAG_BYTE_TABLE):
+            if TAG_TYPE_TABLE[tag_hdr & 0x3F] is None:
+                self.assertIsNone(tag)
+                continue
+            self.assertEqual(tag.format, TlvFormat(format(tag_hdr >> 6, '02b')))
+            self.assertEqual(tag.type, TagType(format(tag_hdr & 0x3F, '06b')))
+            self.assertEqual(tag.value_length, TLV_FORMAT_LENGTH_TABLE[tag_hdr >> 6])
+            self.assertIs(tag.decoder, Tag.BYTES_DECODERS_TABLE[tag_hdr & 0x3F])
+
+    def test_linkTypeNameTable_matchesEnum(self):
+        for value in range(256):
+            try:
+                expected = LinkType(format(value, '08b')).name
+            except ValueError:
+                expected = None
+            self.assertEqual(LINK_TYPE_NAME_TABLE[value], expected)
+
+    def test_tagDecodersTables_coverAllTagTypes(self):
+        for tag_type in TagType:
+            tag_id = int(tag_type.value, 2)
+            self.assertIsNotNone(Tag.DECODERS_TABLE[tag_id])
+            self.assertIsNotNone(Tag.BYTES_DECODERS_TABLE[tag_id])
+        self.assertEqual(sum(fn is not None for fn in Tag.BYTES_DECODERS_TABLE), len(TagType))
+
+
+if __name__ == '__main__':
+    unittest.main()
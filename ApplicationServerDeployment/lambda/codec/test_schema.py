@@ -0,0 +1,96 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for tag codecs generated from TAG_SCHEMA.
+"""
+import unittest
+
+from protocol import *
+from command import Command
+from tag import Tag, _generate_bytes_decoder, _generate_bytes_encoder
+
+"""
+Sample values of the tags described by TAG_SCHEMA.
+"""
+_SAMPLES = {
+    TagType.NUMBER_OF_BUTTONS: [1, 2, 3, 4],
+    TagType.NUMBER_OF_LEDS: [1, 2],
+    TagType.LED_ON: [1, 2, 3],
+    TagType.LED_OFF: [4],
+    TagType.BUTTON_PRESS: [2, 3],
+    TagType.TEMP_SENSOR_DATA: 300,
+    TagType.CURRENT_GPS_TIME_IN_SECS: 1000,
+    TagType.DL_LATENCY_IN_SECS: 65536,
+    TagType.LED_ON_RESP: [1],
+    TagType.LED_OFF_RESP: [1, 2, 3, 4],
+    TagType.TEMP_SENSOR_AVAILABLE_AND_UNIT_REPRESENTATION: {'sensor': True, 'sensor_units': 'FAHRENHEIT'},
+    TagType.LINK_TYPE: 'LORA',
+    TagType.BUTTON_PRESSED_RESP: [1, 4]
+}
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_schema_coversAllTagTypes(self):
+        self.assertEqual({spec.tag_type for spec in TAG_SCHEMA}, set(TagType))
+        self.assertEqual(set(_SAMPLES), set(TagType))
+
+    def test_generatedCodecs_roundTrip(self):
+        for spec in TAG_SCHEMA:
+            with self.subTest(tag_type=spec.tag_type):
+                value = _SAMPLES[spec.tag_type]
+                val = Tag.BYTES_ENCODERS_MAP[spec.tag_type](value)
+                if spec.width is not None and not spec.repeated:
+                    self.assertEqual(len(val), spec.width)
+                if not spec.decoded:
+                    continue
+                decoded = Tag.decode_bytes(int(spec.tag_type.value, 2), val)
+                expected = value if spec.kind == ValueKind.FLAGS else {spec.key: value}
+                self.assertEqual(decoded, expected)
+
+    def test_downlinkOnlyTags_areNotDecoded(self):
+        downlink_only = {TagType.LED_ON, TagType.LED_OFF, TagType.BUTTON_PRESSED_RESP}
+        self.assertEqual({spec.tag_type for spec in TAG_SCHEMA if not spec.decoded}, downlink_only)
+        for tag_type in downlink_only:
+            with self.subTest(tag_type=tag_type):
+                val = Tag.BYTES_ENCODERS_MAP[tag_type](_SAMPLES[tag_type])
+                self.assertEqual(Tag.decode_bytes(int(tag_type.value, 2), val), {})
+
+    def test_decodedCmd_keepsBaselineKeys(self):
+        raw = Command.encode_bytes(False, OpCode.MSG_TYPE_WRITE, Class.DEMO_APP_CLASS, Id.DEMO_APP_ACTION_REQ,
+                                   payload=[{tag_type: _SAMPLES[tag_type]} for tag_type in TagType])
+        expected_keys = {'id', 'buttons', 'leds', 'button_press', 'sensor_data', 'gps_time', 'dl_latency',
+                         'led_on_resp', 'led_off_resp', 'sensor', 'sensor_units', 'link_type'}
+        self.assertEqual(set(Command().decode_bytes(raw).decoded_cmd), expected_keys)
+        self.assertEqual(set(Command().decode(raw.hex()).decoded_cmd), expected_keys)
+
+    def test_generatedCodecs_bytesAndStringAgree(self):
+        for spec in TAG_SCHEMA:
+            with self.subTest(tag_type=spec.tag_type):
+                json = {spec.tag_type: _SAMPLES[spec.tag_type]}
+                tag = Tag().encode(json)
+                raw = bytes(Tag.encode_bytes(json))
+                self.assertEqual(tag.bin_repr(), format(int.from_bytes(raw, 'big'), f'0{len(raw) * 8}b'))
+                self.assertEqual(Tag().decode(tag.type, tag.format, tag.val, tag.val_len).json,
+                                 Tag.decode_bytes(int(tag.type, 2), raw[-len(tag.val) // 8:]))
+
+    def test_generatedDecoder_repeatedWidth(self):
+        decode = _generate_bytes_decoder(TagSpec(TagType.DL_LATENCY_IN_SECS, 'latencies', width=2, repeated=True))
+        encode = _generate_bytes_encoder(TagSpec(TagType.DL_LATENCY_IN_SECS, 'latencies', width=2, repeated=True))
+        self.assertEqual(encode([1, 258]), bytes.fromhex('00010102'))
+        self.assertEqual(decode(bytes.fromhex('00010102')), {'latencies': [1, 258]})
+        with self.assertRaises(ValueError):
+            decode(bytes.fromhex('000101'))
+
+    def test_generatedCodecs_invalidValues(self):
+        with self.assertRaises(ValueError):
+            Tag.decode_bytes(int(TagType.LINK_TYPE.value, 2), b'\x03')
+        with self.assertRaises(ValueError):
+            Tag.encode_bytes({TagType.LINK_TYPE: 'WIFI'})
+        with self.assertRaises(ValueError):
+            Tag.decode_bytes(int(TagType.CURRENT_GPS_TIME_IN_SECS.value, 2), b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
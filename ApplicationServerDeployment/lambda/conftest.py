@@ -0,0 +1,12 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Makes modules of the common directories importable by tests of every lambda, the same way as they are
+in the deployed lambda package (see: common_dirs in deploy_stack.py).
+"""
+import os
+import sys
+
+for common_dir in ('codec', 'database', 'utils'):
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), common_dir))
@@ -32,6 +32,7 @@ class Device(object):
                     state: int
                         Button state (1 - engaged, 0 - disengaged)
                 }
+            Stored in the table as a map keyed by button index, see: button_pressed_to_map.
         _link_type: LinkType
             Enum that describes link type.
         _sensor: bool
@@ -59,12 +60,23 @@ class Device(object):
         self._last_uplink = last_uplink
         self._time_to_live = time_to_live
 
-        self._button_pressed = {} if button_pressed is None else button_pressed
+        if button_pressed is None:
+            button_pressed = []
+        elif isinstance(button_pressed, dict):
+            button_pressed = [{'id': int(button_id), 'seqN': button['seqN'], 'state': button['state']}
+                              for button_id, button in sorted(button_pressed.items(), key=lambda b: int(b[0]))]
+        self._button_pressed = button_pressed
         self._led_on = [] if led_on is None else led_on
 
     def set_led_on(self, led_on: [int]):
         self._led_on = led_on
 
+    def set_button_pressed(self, button_pressed: [dict]):
+        self._button_pressed = button_pressed
+
+    def set_link_type(self, link_type: LinkType):
+        self._link_type = link_type
+
     def get_wireless_device_id(self) -> str:
         return self._wireless_device_id
 
@@ -77,9 +89,12 @@ class Device(object):
     def get_button(self) -> [int]:
         return [int(x) for x in self._button]
 
-    def get_button_pressed(self) -> dict:
+    def get_button_pressed(self) -> [dict]:
         return self._button_pressed
 
+    def get_button_pressed_map(self) -> dict:
+        return self.button_pressed_to_map(self._button_pressed)
+
     def get_enabled_button_pressed_state(self) -> [int]:
         button_pressed = []
         for button in self.get_button_pressed():
@@ -102,6 +117,17 @@ class Device(object):
     def get_time_to_live(self) -> int:
         return int(self._time_to_live)
 
+    @staticmethod
+    def button_pressed_to_map(button_pressed: [dict]) -> dict:
+        """
+        Converts list of button states into the map stored in the table, which allows to update single button
+        with an update expression (see: SidewalkDevicesHandler.toggle_buttons).
+
+        :param button_pressed:  List of dicts indicating buttons state.
+        :return:                Dict of the following structure: {str(button index): {'seqN': int, 'state': int}}.
+        """
+        return {str(int(button['id'])): {'seqN': button['seqN'], 'state': button['state']} for button in button_pressed}
+
     def to_dict(self) -> dict:
         """
         Returns dict representation of the Device object.
@@ -0,0 +1,162 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import boto3
+import logging
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+from functools import lru_cache
+
+from device import Device
+from link_type import LinkType
+from measurement import Measurement
+from measurements_handler import MeasurementsHandler
+from sidewalk_devices_handler import SidewalkDevicesHandler
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceUnitOfWork:
+    """
+    A class that accumulates changes of the SidewalkDevices record of a single device (and measurements coming
+    from it) made while handling one event, and flushes them with a single write on commit:
+     - put_item, if the record is replaced (see: put_device)
+     - update_item of the changed fields only, otherwise
+     - TransactWriteItems of the above and the measurement inserts, if commit is transactional,
+       otherwise measurements are buffered (see: MeasurementsHandler.buffer_measurement) and written
+       when the caller flushes the MeasurementsHandler
+    Button toggles are written afterwards, one conditional write per pressed button (see: toggle_buttons).
+
+    The record is read only if the caller needs it (see: get_device), and at most once.
+    """
+
+    MAX_TRANSACT_ITEMS = 100
+
+    def __init__(self, wireless_device_id: str, devices_handler: SidewalkDevicesHandler,
+                 measurements_handler: MeasurementsHandler):
+        self._wireless_device_id = wireless_device_id
+        self._devices_handler = devices_handler
+        self._measurements_handler = measurements_handler
+        self._device = None
+        self._replaced = False
+        self._fields = {}
+        self._measurements = []
+        self._toggles = []
+
+    def get_device(self) -> Device:
+        """
+        Returns the device with pending changes applied. Record is read on first call, unless it was replaced.
+
+        :return:    Device object (None if the record does not exist).
+        """
+        if self._device is None:
+            self._device = self._devices_handler.get_device(self._wireless_device_id)
+            if self._device is not None:
+                self._apply_fields()
+        return self._device
+
+    def put_device(self, device: Device):
+        """
+        Replaces the record with given device, changes made so far are discarded.
+
+        :param device:  Device object.
+        """
+        self._device = device
+        self._replaced = True
+        self._fields = {}
+
+    def set_led_on(self, led_on: [int]):
+        self._set_field('led_on', led_on)
+
+    def set_button_pressed(self, button_pressed: [dict]):
+        self._set_field('button_pressed', button_pressed)
+
+    def set_link_type(self, link_type: LinkType):
+        self._set_field('link_type', link_type)
+
+    def add_measurement(self, measurement: Measurement):
+        self._measurements.append(measurement)
+
+    def toggle_buttons(self, button_ids: [int], seq_n: int):
+        """
+        Toggles given buttons on commit, see: SidewalkDevicesHandler.toggle_buttons.
+        State of the buttons returned by get_device is not affected.
+
+        :param button_ids:  List of indices of the pressed buttons.
+        :param seq_n:       Sequence number of the uplink reporting the press.
+        """
+        self._toggles.append((button_ids, seq_n))
+
+    def commit(self, transactional: bool = False):
+        """
+        Writes accumulated changes and clears them.
+
+        :param transactional:   If True, the record and the measurements are written with single TransactWriteItems
+                                (unless it would exceed MAX_TRANSACT_ITEMS actions), otherwise measurements
+                                are buffered.
+        """
+        try:
+            changed = self._replaced or bool(self._fields)
+            if transactional and changed and self._measurements \
+                    and len(self._measurements) < self.MAX_TRANSACT_ITEMS:
+                self._transact_write()
+            else:
+                if self._replaced:
+                    self._devices_handler.add_device(self._device)
+                elif self._fields:
+                    self._devices_handler.update_fields_and_last_uplink(self._wireless_device_id, **self._fields)
+                for measurement in self._measurements:
+                    self._measurements_handler.buffer_measurement(measurement)
+            for button_ids, seq_n in self._toggles:
+                self._devices_handler.toggle_buttons(self._wireless_device_id, button_ids, seq_n)
+        finally:
+            self._replaced = False
+            self._fields = {}
+            self._measurements = []
+            self._toggles = []
+
+    # -----------------
+    # For internal use
+    # -----------------
+    def _set_field(self, name: str, value):
+        self._fields[name] = value
+        if self._device is not None:
+            self._apply_fields()
+
+    def _apply_fields(self):
+        for name, value in self._fields.items():
+            getattr(self._device, f'set_{name}')(value)
+
+    def _transact_write(self):
+        devices_table = self._devices_handler.TABLE_NAME
+        if self._replaced:
+            items = [{'Put': {'TableName': devices_table, 'Item': self._devices_handler.build_put_item(self._device)}}]
+        else:
+            items = [{'Update': {'TableName': devices_table,
+                                 **self._devices_handler.build_update(self._wireless_device_id, **self._fields)}}]
+        items.extend({'Put': {'TableName': self._measurements_handler.TABLE_NAME,
+                              'Item': self._measurements_handler.build_put_item(measurement)}}
+                     for measurement in self._measurements)
+        try:
+            _client().transact_write_items(TransactItems=[_serialize(item) for item in items])
+        except ClientError as err:
+            logger.error(f'Error while calling commit for wireless_device_id: {self._wireless_device_id}: {err}')
+            raise
+
+
+def _serialize(item: dict) -> dict:
+    """
+    Converts values of the TransactWriteItems action into DynamoDB attribute values.
+    """
+    (action, request), = item.items()
+    serializer = TypeSerializer()
+    serialized = dict(request)
+    for key in ('Key', 'Item', 'ExpressionAttributeValues'):
+        if key in request:
+            serialized[key] = {name: serializer.serialize(value) for name, value in request[key].items()}
+    return {action: serialized}
+
+
+@lru_cache(maxsize=None)
+def _client():
+    return boto3.client('dynamodb')
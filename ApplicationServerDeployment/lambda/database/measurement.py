@@ -16,7 +16,7 @@ class Measurement(object):
         _value: int
             Measured value.
         _time: int
-            UTC time in seconds.
+            UTC time in milliseconds.
     """
 
     def __init__(self, wireless_device_id, temperature: int = None, timestamp: int = None, time_to_live: int = None):
@@ -2,11 +2,12 @@
 # SPDX-License-Identifier: MIT-0
 import boto3
 import logging
+import random
 import time
 
 from botocore.exceptions import ClientError
 from decimal import Decimal
-from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.conditions import Attr, Key
 
 from measurement import Measurement
 
@@ -19,34 +20,60 @@ class MeasurementsHandler:
     """
 
     TABLE_NAME = 'SidewalkMeasurements'
+    DEVICE_INDEX_NAME = 'wireless_device_id'
+    BATCH_SIZE = 25
+    MAX_BATCH_WRITE_RETRIES = 5
+    BATCH_WRITE_RETRY_DELAY = 0.05
 
     def __init__(self):
         self._table = boto3.resource('dynamodb').Table(self.TABLE_NAME)
+        self._buffer = []
+        self._buffered_timestamps = set()
 
     # ----------------
     # Read operations
     # ----------------
 
-    def get_measurements_for_device(self, wireless_device_id: str) -> [Measurement]:
+    def get_measurements_for_device(self, wireless_device_id: str, start: int = None, end: int = None,
+                                    limit: int = None, scan_index_forward: bool = True) -> [Measurement]:
         """
         Queries Measurements table for the records coming from given device withing a given time span.
+        Only the device partition of the wireless_device_id index (sorted by timestamp) is read,
+        expired records, which were not removed by TTL yet, are filtered out.
 
         :param wireless_device_id:  Id of the wireless device.
+        :param start:               Start of the time span (UTC time in milliseconds, inclusive), unbounded if None.
+        :param end:                 End of the time span (UTC time in milliseconds, inclusive), unbounded if None.
+        :param limit:               Maximum number of returned records, unlimited if None.
+        :param scan_index_forward:  If True, records are ordered from the oldest, otherwise from the newest.
         :return:                    List of Measurement objects.
         """
+        key_condition = Key('wireless_device_id').eq(wireless_device_id)
+        if start is not None and end is not None:
+            key_condition &= Key('timestamp').between(start, end)
+        elif start is not None:
+            key_condition &= Key('timestamp').gte(start)
+        elif end is not None:
+            key_condition &= Key('timestamp').lte(end)
+        query = {
+            'IndexName': self.DEVICE_INDEX_NAME,
+            'KeyConditionExpression': key_condition,
+            'FilterExpression': Attr('time_to_live').gte(int(time.time())),
+            'ScanIndexForward': scan_index_forward
+        }
         items = []
         try:
-            t_now = int(time.time())
-            filter_expression = Attr('wireless_device_id').eq(wireless_device_id) & Attr('time_to_live').gte(t_now)
-            response = self._table.scan(IndexName='wireless_device_id', FilterExpression=filter_expression)
-            items.extend(response.get('Items', []))
-            while "NextToken" in response:
-                response = self._table.scan(IndexName='wireless_device_id',
-                                            FilterExpression=filter_expression,
-                                            NextToken=response["NextToken"])
+            while True:
+                if limit is not None:
+                    query['Limit'] = limit - len(items)
+                response = self._table.query(**query)
                 items.extend(response.get('Items', []))
+                if 'LastEvaluatedKey' not in response or (limit is not None and len(items) >= limit):
+                    break
+                query['ExclusiveStartKey'] = response['LastEvaluatedKey']
         except ClientError as err:
-            logger.error(f'Error while calling get_all_devices: {err}')
+            logger.error(f'Error while calling get_measurements_for_device for wireless_device_id: '
+                         f'{wireless_device_id}: {err}')
             raise
         else:
             measurements = []
@@ -63,35 +90,126 @@ class MeasurementsHandler:
         Adds measurement object to the SidewalkMeasurement table.
 
         _time_to_live attribute is ignored.
-        time_to_live field is set to the current_time + 24 hours.
+        time_to_live field is set to the measurement time + 1 hour.
 
         :param measurement:  Measurement object.
         :return:             Updated Measurement object.
         """
         try:
-            timestamp = int(time.time_ns() / 1000000)
-            ttl = self._get_dynamodb_item_time_to_live(int(time.time()))
-            self._table.put_item(
-                Item={
-                    'timestamp': timestamp,
-                    'wireless_device_id': measurement.get_wireless_device_id(),
-                    'temperature': Decimal(measurement.get_value()),
-                    'time_to_live': ttl
-                },
-                ReturnValues="ALL_OLD"
-            )
+            item = self.build_put_item(measurement)
+            self._table.put_item(Item=item)
         except ClientError as err:
             logger.error(
                 f'Error while calling add_measurement for wireless_device_id: {measurement.get_wireless_device_id()}: {err}'
             )
             raise
         else:
-            measurement._time_to_live = ttl
+            measurement._time_to_live = item['time_to_live']
             return measurement
 
+    def buffer_measurement(self, measurement: Measurement):
+        """
+        Adds measurement object to the write buffer, which is written with BatchWriteItem in groups of BATCH_SIZE.
+        Only full groups are written here, flush has to be called to write the rest (e.g. at the end of invocation).
+        Groups, which cannot be written here, are kept in the buffer and written (or reported) by flush.
+
+        timestamp is the table key, so timestamps colliding with other measurements buffered since the last flush
+        are moved by 1 ms to keep all the measurements.
+
+        :param measurement:  Measurement object.
+        """
+        item = self.build_put_item(measurement)
+        while item['timestamp'] in self._buffered_timestamps:
+            item['timestamp'] += 1
+        self._buffered_timestamps.add(item['timestamp'])
+        self._buffer.append(item)
+        if len(self._buffer) >= self.BATCH_SIZE:
+            try:
+                self._write_buffer(full_batches_only=True)
+            except (ClientError, RuntimeError) as err:
+                logger.warning(f'{len(self._buffer)} buffered measurements will be retried on flush: {err}')
+
+    def flush(self):
+        """
+        Writes all buffered measurements.
+        Unprocessed items are retried with exponential backoff. If they are still unprocessed after
+        MAX_BATCH_WRITE_RETRIES (or the request fails), RuntimeError (ClientError) is raised and all the measurements,
+        which were not written, are kept in the buffer, so that the caller can find them (see: get_buffered_items)
+        and discard them (see: discard_buffered_items).
+        """
+        self._write_buffer(full_batches_only=False)
+        self._buffered_timestamps.clear()
+
+    def get_buffered_items(self) -> [dict]:
+        """
+        Returns items, which are buffered and not written yet.
+
+        :return:    List of SidewalkMeasurements items, see: build_put_item.
+        """
+        return list(self._buffer)
+
+    def discard_buffered_items(self, wireless_device_id: str = None):
+        """
+        Removes items from the buffer without writing them.
+
+        :param wireless_device_id:  If given, only items of this device are removed.
+        """
+        if wireless_device_id is None:
+            self._buffer = []
+        else:
+            self._buffer = [item for item in self._buffer if item['wireless_device_id'] != wireless_device_id]
+        self._buffered_timestamps = {item['timestamp'] for item in self._buffer}
+
+    # ------------------------------------------------
+    # Request builders (shared with DeviceUnitOfWork)
+    # ------------------------------------------------
+    def build_put_item(self, measurement: Measurement) -> dict:
+        """
+        Builds SidewalkMeasurements item from the Measurement object.
+
+        :param measurement:  Measurement object.
+        :return:             Item dict.
+        """
+        if measurement._time is None:
+            timestamp = int(time.time_ns() / 1000000)
+        else:
+            timestamp = measurement.get_time()
+        return {
+            'timestamp': timestamp,
+            'wireless_device_id': measurement.get_wireless_device_id(),
+            'temperature': Decimal(measurement.get_value()),
+            'time_to_live': self._get_dynamodb_item_time_to_live(timestamp // 1000)
+        }
+
     # -----------------
     # For internal use
     # -----------------
+    def _write_buffer(self, full_batches_only: bool):
+        # items are removed from the buffer only once they are written
+        while len(self._buffer) >= self.BATCH_SIZE or (self._buffer and not full_batches_only):
+            batch = self._buffer[:self.BATCH_SIZE]
+            unprocessed = self._batch_write(batch)
+            self._buffer = unprocessed + self._buffer[len(batch):]
+            if unprocessed:
+                logger.error(f'{len(unprocessed)} measurements were not written after '
+                             f'{self.MAX_BATCH_WRITE_RETRIES} retries: {unprocessed}')
+                raise RuntimeError(f'{len(unprocessed)} measurements were not written')
+
+    def _batch_write(self, items: [dict]) -> [dict]:
+        request_items = {self.TABLE_NAME: [{'PutRequest': {'Item': item}} for item in items]}
+        for attempt in range(self.MAX_BATCH_WRITE_RETRIES + 1):
+            if attempt:
+                time.sleep(random.uniform(0, self.BATCH_WRITE_RETRY_DELAY * 2 ** attempt))
+            try:
+                response = self._table.meta.client.batch_write_item(RequestItems=request_items)
+            except ClientError as err:
+                logger.error(f'Error while calling batch_write_item for {len(items)} measurements: {err}')
+                raise
+            request_items = response.get('UnprocessedItems')
+            if not request_items:
+                return []
+        return [request['PutRequest']['Item'] for request in request_items[self.TABLE_NAME]]
+
     @staticmethod
     def _get_dynamodb_item_time_to_live(timestamp: int) -> int:
         return timestamp + 3600
@@ -3,8 +3,12 @@
 
 import boto3
 import logging
+import os
 import time
+from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator
 
 from device import Device
 from link_type import LinkType
@@ -13,6 +17,11 @@ from unit import Unit
 
 logger = logging.getLogger(__name__)
 
+"""
+Number of segments scanned in parallel by get_all_devices (1 means sequential scan).
+"""
+DEVICES_SCAN_SEGMENTS = int(os.environ.get('DEVICES_SCAN_SEGMENTS', 1))
+
 
 class SidewalkDevicesHandler:
     """
@@ -43,28 +52,46 @@ class SidewalkDevicesHandler:
             if 'Item' in response:
                 return Device(**response['Item'])
 
-    def get_all_devices(self) -> [Device]:
+    def get_all_devices(self, since: int = None, total_segments: int = None) -> [Device]:
         """
         Gets all available records from the SidewalkDevices table.
 
-        :return:    List of Device objects.
+        :param since:           If given, only records changed at or after this time (UTC time in seconds,
+                                see: last_uplink) are returned.
+        :param total_segments:  Number of segments scanned in parallel (DEVICES_SCAN_SEGMENTS if not given).
+        :return:                List of Device objects.
+        """
+        return list(self.iter_all_devices(since=since, total_segments=total_segments))
+
+    def iter_all_devices(self, since: int = None, total_segments: int = None) -> Iterator[Device]:
+        """
+        Gets all available records from the SidewalkDevices table page by page, so that devices are yielded
+        as soon as their page is read, without building the full list.
+        If total_segments is greater than 1, the table is divided into segments scanned in parallel
+        (each on its own thread) and devices are yielded in the order the pages arrive.
+        since is applied as a scan filter, so it reduces the number of returned devices, but not the number
+        of items read (and read capacity consumed).
+
+        :param since:           If given, only records changed at or after this time (UTC time in seconds,
+                                see: last_uplink) are returned.
+        :param total_segments:  Number of segments scanned in parallel (DEVICES_SCAN_SEGMENTS if not given).
+        :return:                Iterator of Device objects.
         """
-        items = []
+        scan = {'TableName': self.TABLE_NAME}
+        if since is not None:
+            scan['FilterExpression'] = Attr('last_uplink').gte(since)
+        total_segments = total_segments or DEVICES_SCAN_SEGMENTS
         try:
-            response = self._table.scan()
-            items.extend(response.get('Items', []))
-            while "NextToken" in response:
-                response = self._table.scan(NextToken=response["NextToken"])
-                items.extend(response.get('Items', []))
+            if total_segments > 1:
+                pages = self._scan_segments(scan, total_segments)
+            else:
+                pages = self._scan_pages(scan)
+            for items in pages:
+                for item in items:
+                    yield Device(**item)
         except ClientError as err:
             logger.error(f'Error while calling get_all_devices: {err}')
             raise
-        else:
-            devices = []
-            for item in items:
-                device = Device(**item)
-                devices.append(device)
-            return devices
 
     # -----------------
     # Write operations
@@ -81,33 +108,19 @@ class SidewalkDevicesHandler:
         :return:        Updated Device object.
         """
         try:
-            ttl = self._get_dynamodb_item_time_to_live()
-            self._table.put_item(
-                Item={
-                    'wireless_device_id': device.get_wireless_device_id(),
-                    'led': device.get_led(),
-                    'led_on': device.get_led_on(),
-                    'button': device.get_button(),
-                    'button_pressed': device.get_button_pressed(),
-                    'link_type': device.get_link_type().value,
-                    'sensor': device.is_sensor(),
-                    'sensor_unit': device.get_sensor_unit().value,
-                    'last_uplink': int(time.time()),
-                    'time_to_live': ttl
-                },
-                ReturnValues="ALL_OLD"
-            )
+            item = self.build_put_item(device)
+            self._table.put_item(Item=item)
         except ClientError as err:
             logger.error(
                 f'Error while calling add_device for wireless_device_id: {device.get_wireless_device_id()}: {err}'
             )
             raise
         else:
-            device._time_to_live = ttl
+            device._time_to_live = item['time_to_live']
             return device
 
     def update_device(self, wireless_device_id: str, led_on: [int], button_pressed: dict,
-                      link_type: LinkType, is_sensor: bool, sensor_unit: Unit) -> Device:
+                      link_type: LinkType, is_sensor: bool, sensor_unit: Unit, read_back: bool = False) -> Device:
         """
         Updates record in the SidewalkDevices table based on provided parameters.
 
@@ -117,140 +130,264 @@ class SidewalkDevicesHandler:
         :param link_type:           LinkType object.
         :param is_sensor:           True if sensor is available on the board, False otherwise.
         :param sensor_unit:         Enum that describes sensor units.
-        :return:                    Updated Device object.
+        :param read_back:           If True, updated record is returned.
+        :return:                    Updated Device object (None if read_back is False).
         """
-        try:
-            ttl = self._get_dynamodb_item_time_to_live()
-            response = self._table.update_item(
-                Key={'wireless_device_id': wireless_device_id},
-                UpdateExpression="set "
-                                 "led_on=:led_on, "
-                                 "button_pressed=:button_pressed, "
-                                 "link_type=:link_type, "
-                                 "sensor=:sensor, "
-                                 "sensor_unit=:sensor_unit, "
-                                 "last_uplink=:last_uplink, "
-                                 "time_to_live=:TTL",
-                ExpressionAttributeValues={
-                    ':led_on': led_on,
-                    ':button_pressed': button_pressed,
-                    ':link_type': link_type.name,
-                    ':sensor': is_sensor,
-                    ':sensor_unit': sensor_unit.value,
-                    ':last_uplink': int(time.time()),
-                    ':TTL': ttl
-                },
-                ReturnValues="ALL_NEW")
-        except ClientError as err:
-            logger.error(f'Error while calling update_device for wireless_device_id: {wireless_device_id}: {err}')
-            raise
-        else:
-            return Device(**response['Attributes'])
+        update = self.build_update(wireless_device_id, led_on=led_on, button_pressed=button_pressed,
+                                   link_type=link_type, sensor=is_sensor, sensor_unit=sensor_unit.value)
+        return self._update_item('update_device', update, read_back)
+
+    def update_fields_and_last_uplink(self, wireless_device_id: str, led_on: [int] = None, button_pressed: dict = None,
+                                      link_type: LinkType = None, read_back: bool = False) -> Device:
+        """
+        Updates given fields together with last_uplink and time_to_live fields of the record stored
+        in SidewalkDevices table with single request. Fields set to None are left unchanged.
+
+        :param wireless_device_id:  Wireless device ID.
+        :param led_on:              List of indices of the LEDs, which are turned on.
+        :param button_pressed:      List of dicts indicating buttons state, see: Device class.
+        :param link_type:           LinkType object.
+        :param read_back:           If True, updated record is returned.
+        :return:                    Updated Device object (None if read_back is False).
+        """
+        update = self.build_update(wireless_device_id, led_on=led_on, button_pressed=button_pressed,
+                                   link_type=link_type)
+        return self._update_item('update_fields_and_last_uplink', update, read_back)
 
-    def update_link_type_and_last_uplink(self, wireless_device_id: str, link_type: LinkType) -> Device:
+    def update_link_type_and_last_uplink(self, wireless_device_id: str, link_type: LinkType,
+                                         read_back: bool = False) -> Device:
         """
         Updates link_type, last_uplink and time_to_live fields of the record stored in SidewalkDevices table.
 
         :param wireless_device_id:  Wireless device ID.
         :param link_type:           LinkType object.
-        :return:                    Updated Device object.
+        :param read_back:           If True, updated record is returned.
+        :return:                    Updated Device object (None if read_back is False).
         """
-        try:
-            ttl = self._get_dynamodb_item_time_to_live()
-            response = self._table.update_item(
-                Key={'wireless_device_id': wireless_device_id},
-                UpdateExpression="set last_uplink=:last_uplink, time_to_live=:TTL, link_type=:link_type",
-                ExpressionAttributeValues={
-                    ':last_uplink': int(time.time()),
-                    ':link_type': link_type.name,
-                    ':TTL': ttl
-                },
-                ReturnValues="ALL_NEW")
-        except ClientError as err:
-            logger.error(f'Error while calling update_link_type_and_last_uplink for wireless_device_id: '
-                         f'{wireless_device_id}: {err}')
-            raise
-        else:
-            return Device(**response['Attributes'])
+        update = self.build_update(wireless_device_id, link_type=link_type)
+        return self._update_item('update_link_type_and_last_uplink', update, read_back)
 
-    def update_last_uplink(self, wireless_device_id: str) -> Device:
+    def update_last_uplink(self, wireless_device_id: str, read_back: bool = False) -> Device:
         """
         Updates last_uplink and time_to_live fields of the record stored in SidewalkDevices table.
 
         :param wireless_device_id:  Wireless device ID.
-        :return:                    Updated Device object.
+        :param read_back:           If True, updated record is returned.
+        :return:                    Updated Device object (None if read_back is False).
         """
-        try:
-            ttl = self._get_dynamodb_item_time_to_live()
-            response = self._table.update_item(
-                Key={'wireless_device_id': wireless_device_id},
-                UpdateExpression="set last_uplink=:last_uplink, time_to_live=:TTL",
-                ExpressionAttributeValues={
-                    ':last_uplink': int(time.time()),
-                    ':TTL': ttl
-                },
-                ReturnValues="ALL_NEW")
-        except ClientError as err:
-            logger.error(f'Error while calling update_last_uplink for wireless_device_id: {wireless_device_id}: {err}')
-            raise
-        else:
-            return Device(**response['Attributes'])
+        update = self.build_update(wireless_device_id)
+        return self._update_item('update_last_uplink', update, read_back)
 
-    def update_button_and_last_uplink(self, wireless_device_id: str, button_pressed: dict) -> Device:
+    def update_button_and_last_uplink(self, wireless_device_id: str, button_pressed: dict,
+                                      read_back: bool = False) -> Device:
         """
         Updates button_pressed, last_uplink and time_to_live fields of the record stored in SidewalkDevices table.
 
         :param wireless_device_id:  Wireless device ID.
         :param button_pressed:      List of dicts indicating buttons state, see: Device class.
-        :return:                    Updated Device object.
+        :param read_back:           If True, updated record is returned.
+        :return:                    Updated Device object (None if read_back is False).
+        """
+        update = self.build_update(wireless_device_id, button_pressed=button_pressed)
+        return self._update_item('update_button_and_last_uplink', update, read_back)
+
+    def update_led_and_last_uplink(self, wireless_device_id: str, led_on: [int], read_back: bool = False) -> Device:
+        """
+        Updates led_on, last_uplink and time_to_live fields of the record stored in SidewalkDevices table.
+
+        :param wireless_device_id:  Wireless device ID.
+        :param led_on:              List of indices of the LEDs, which are turned on.
+        :param read_back:           If True, updated record is returned.
+        :return:                    Updated Device object (None if read_back is False).
+        """
+        update = self.build_update(wireless_device_id, led_on=led_on)
+        return self._update_item('update_led_and_last_uplink', update, read_back)
+
+    def toggle_buttons(self, wireless_device_id: str, button_ids: [int], seq_n: int) -> bool:
         """
+        Toggles state of each of the given buttons and sets its seqN to seq_n (together with last_uplink and
+        time_to_live fields) with one conditional write per button, the record is read only if the write is rejected.
+        Button is toggled only if seq_n is greater than its own seqN, so that duplicated and out of order uplinks
+        are ignored, also when handled concurrently. Presses of buttons missing in the record are ignored.
+        Records storing button_pressed as a list (written before it was stored as a map) are migrated on first toggle.
+
+        :param wireless_device_id:  Wireless device ID.
+        :param button_ids:          List of indices of the pressed buttons.
+        :param seq_n:               Sequence number of the uplink reporting the press.
+        :return:                    True if any of the buttons was toggled, False if the uplink was ignored.
+        """
+        toggled = False
+        for button_id in sorted(set(button_ids)):
+            toggled |= self._toggle_button(wireless_device_id, button_id, seq_n)
+        return toggled
+
+    # ------------------------------------------------
+    # Request builders (shared with DeviceUnitOfWork)
+    # ------------------------------------------------
+    def build_put_item(self, device: Device) -> dict:
+        """
+        Builds SidewalkDevices item from the Device object.
+        last_uplink field is set to the current time.
+        time_to_live field is set to the current_time + 24 hours.
+
+        :param device:  Device object.
+        :return:        Item dict.
+        """
+        return {
+            'wireless_device_id': device.get_wireless_device_id(),
+            'led': device.get_led(),
+            'led_on': device.get_led_on(),
+            'button': device.get_button(),
+            'button_pressed': device.get_button_pressed_map(),
+            'link_type': device.get_link_type().value,
+            'sensor': device.is_sensor(),
+            'sensor_unit': device.get_sensor_unit().value,
+            'last_uplink': int(time.time()),
+            'time_to_live': self._get_dynamodb_item_time_to_live()
+        }
+
+    def build_update(self, wireless_device_id: str, **fields) -> dict:
+        """
+        Builds update_item arguments setting given fields together with last_uplink and time_to_live fields.
+        Fields set to None are left unchanged, LinkType is stored by its name and button_pressed as a map
+        (see: Device.button_pressed_to_map).
+
+        :param wireless_device_id:  Wireless device ID.
+        :param fields:              Fields to be set, e.g. led_on=[1], link_type=LinkType.BLE.
+        :return:                    Dict with Key, UpdateExpression and ExpressionAttributeValues.
+        """
+        values = {
+            ':last_uplink': int(time.time()),
+            ':TTL': self._get_dynamodb_item_time_to_live()
+        }
+        update_expression = "set last_uplink=:last_uplink, time_to_live=:TTL"
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if isinstance(value, LinkType):
+                value = value.name
+            elif name == 'button_pressed':
+                value = Device.button_pressed_to_map(value)
+            update_expression += f", {name}=:{name}"
+            values[f':{name}'] = value
+        return {
+            'Key': {'wireless_device_id': wireless_device_id},
+            'UpdateExpression': update_expression,
+            'ExpressionAttributeValues': values
+        }
+
+    # -----------------
+    # For internal use
+    # -----------------
+    def _update_item(self, operation: str, update: dict, read_back: bool) -> Device:
         try:
-            ttl = self._get_dynamodb_item_time_to_live()
-            response = self._table.update_item(
-                Key={'wireless_device_id': wireless_device_id},
-                UpdateExpression="set last_uplink=:last_uplink, button_pressed=:button_pressed, time_to_live=:TTL",
-                ExpressionAttributeValues={
-                    ':last_uplink': int(time.time()),
-                    ':button_pressed': button_pressed,
-                    ':TTL': ttl
-                },
-                ReturnValues="ALL_NEW")
+            if read_back:
+                response = self._table.update_item(**update, ReturnValues="ALL_NEW")
+            else:
+                self._table.update_item(**update)
         except ClientError as err:
-            logger.error(f'Error while calling update_button_and_last_uplink for wireless_device_id: '
-                         f'{wireless_device_id}: {err}')
+            logger.error(f'Error while calling {operation} for wireless_device_id: '
+                         f'{update["Key"]["wireless_device_id"]}: {err}')
+            raise
+        else:
+            if read_back:
+                return Device(**response['Attributes'])
+
+    def _scan_pages(self, scan: dict) -> Iterator[list]:
+        # client is used, as opposed to the table resource, since it is thread-safe (see: _scan_segments)
+        client = self._table.meta.client
+        while True:
+            response = client.scan(**scan)
+            yield response.get('Items', [])
+            if 'LastEvaluatedKey' not in response:
+                return
+            scan = {**scan, 'ExclusiveStartKey': response['LastEvaluatedKey']}
+
+    def _scan_segments(self, scan: dict, total_segments: int) -> Iterator[list]:
+        client = self._table.meta.client
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            pending = {executor.submit(client.scan, **scan, Segment=segment, TotalSegments=total_segments): segment
+                       for segment in range(total_segments)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    segment = pending.pop(future)
+                    response = future.result()
+                    if 'LastEvaluatedKey' in response:
+                        next_page = executor.submit(client.scan, **scan, Segment=segment, TotalSegments=total_segments,
+                                                    ExclusiveStartKey=response['LastEvaluatedKey'])
+                        pending[next_page] = segment
+                    yield response.get('Items', [])
+
+    def _toggle_button(self, wireless_device_id: str, button_id: int, seq_n: int, migrate: bool = True) -> bool:
+        update = self.build_update(wireless_device_id)
+        update['UpdateExpression'] += ", button_pressed.#b.#state=:one-button_pressed.#b.#state, " \
+                                      "button_pressed.#b.seqN=:seq_n"
+        update['ExpressionAttributeValues'].update({':one': 1, ':seq_n': seq_n, ':map': 'M'})
+        try:
+            self._table.update_item(**update,
+                                    ConditionExpression='attribute_type(button_pressed, :map) AND '
+                                                        'button_pressed.#b.seqN < :seq_n',
+                                    ExpressionAttributeNames={'#b': str(int(button_id)), '#state': 'state'})
+        except ClientError as err:
+            if err.response['Error']['Code'] not in ('ConditionalCheckFailedException', 'ValidationException'):
+                logger.error(f'Error while calling toggle_buttons for wireless_device_id: {wireless_device_id}: {err}')
+                raise
+            # the write is rejected alike for outdated presses, unknown buttons and records storing button_pressed
+            # as a list (written before it was stored as a map), the stored record tells them apart
+            button_pressed = self._get_button_pressed(wireless_device_id)
+            if isinstance(button_pressed, list):
+                if migrate and self._migrate_button_pressed(wireless_device_id, button_pressed):
+                    return self._toggle_button(wireless_device_id, button_id, seq_n, migrate=False)
+                logger.warning(f'Button press {button_id} (seqN {seq_n}) of {wireless_device_id} cannot be applied, '
+                               f'button_pressed is not migrated')
+            elif isinstance(button_pressed, dict) and str(int(button_id)) in button_pressed:
+                logger.info(f'Button press {button_id} (seqN {seq_n}) of {wireless_device_id} is outdated, ignored')
+            else:
+                # buttons are stored in the record on capability discovery
+                logger.warning(f'Button press {button_id} (seqN {seq_n}) of {wireless_device_id} is ignored, '
+                               f'button is unknown')
+            return False
+        else:
+            return True
+
+    def _get_button_pressed(self, wireless_device_id: str):
+        try:
+            response = self._table.get_item(Key={'wireless_device_id': wireless_device_id},
+                                            ProjectionExpression='button_pressed', ConsistentRead=True)
+        except ClientError as err:
+            logger.error(f'Error while calling toggle_buttons for wireless_device_id: {wireless_device_id}: {err}')
             raise
         else:
-            return Device(**response['Attributes'])
+            return response.get('Item', {}).get('button_pressed')
 
-    def update_led_and_last_uplink(self, wireless_device_id: str, led_on: [int]) -> Device:
+    def _migrate_button_pressed(self, wireless_device_id: str, button_pressed: [dict]) -> bool:
         """
-        Updates led_on, last_uplink and time_to_live fields of the record stored in SidewalkDevices table.
+        Converts button_pressed stored as a list into the map (see: Device.button_pressed_to_map).
+        Conversion is conditional, so that concurrent migration or toggle is not overwritten.
 
         :param wireless_device_id:  Wireless device ID.
-        :param led_on:              List of indices of the LEDs, which are turned on.
-        :return:                    Updated Device object.
+        :param button_pressed:      button_pressed list read from the record.
+        :return:                    True if button_pressed is stored as a map now.
         """
         try:
-            ttl = self._get_dynamodb_item_time_to_live()
-            response = self._table.update_item(
-                Key={'wireless_device_id': wireless_device_id},
-                UpdateExpression="set last_uplink=:last_uplink, led_on=:led_on, time_to_live=:TTL",
-                ExpressionAttributeValues={
-                    ':last_uplink': int(time.time()),
-                    ':led_on': led_on,
-                    ':TTL': ttl
-                },
-                ReturnValues="ALL_NEW")
+            self._table.update_item(Key={'wireless_device_id': wireless_device_id},
+                                    UpdateExpression='set button_pressed=:button_pressed',
+                                    ConditionExpression='attribute_type(button_pressed, :list)',
+                                    ExpressionAttributeValues={
+                                        ':button_pressed': Device.button_pressed_to_map(button_pressed),
+                                        ':list': 'L'
+                                    })
         except ClientError as err:
-            logger.error(f'Error while calling update_led_and_last_uplink for wireless_device_id: '
+            if err.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return True  # migrated concurrently
+            logger.error(f'Error while calling migrate_button_pressed for wireless_device_id: '
                          f'{wireless_device_id}: {err}')
             raise
         else:
-            return Device(**response['Attributes'])
+            logger.info(f'button_pressed of {wireless_device_id} migrated to map')
+            return True
 
-    # -----------------
-    # For internal use
-    # -----------------
     @staticmethod
     def _get_dynamodb_item_time_to_live() -> int:
         return int(time.time() + 24 * 3600)
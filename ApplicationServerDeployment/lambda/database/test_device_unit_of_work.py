@@ -0,0 +1,158 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for per-device unit of work.
+"""
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from device import Device
+from device_unit_of_work import DeviceUnitOfWork
+from link_type import LinkType
+from measurement import Measurement
+from measurements_handler import MeasurementsHandler
+from sidewalk_devices_handler import SidewalkDevicesHandler
+
+WIRELESS_DEVICE_ID = 'device-1'
+
+
+def _device(led_on=None) -> Device:
+    return Device(wireless_device_id=WIRELESS_DEVICE_ID, led=[1, 2], led_on=led_on or [], button=[1, 2],
+                  button_pressed=[{'id': 1, 'seqN': 0, 'state': 0}, {'id': 2, 'seqN': 0, 'state': 0}],
+                  link_type='BLE', sensor=True, sensor_unit='CELSIUS')
+
+
+def _measurement(timestamp: int, temperature: int = 20) -> Measurement:
+    return Measurement(wireless_device_id=WIRELESS_DEVICE_ID, temperature=temperature, timestamp=timestamp)
+
+
+class TestDeviceUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        # handlers are created with mocked tables, so that requests they issue can be inspected
+        with mock.patch('boto3.resource'):
+            self.devices_handler = SidewalkDevicesHandler()
+            self.measurements_handler = MeasurementsHandler()
+        self.devices_table = self.devices_handler._table
+        self.devices_table.get_item.return_value = {'Item': self.devices_handler.build_put_item(_device())}
+        self.measurements_handler.buffer_measurement = mock.Mock()
+        client_patcher = mock.patch('device_unit_of_work._client')
+        self.client = client_patcher.start()().transact_write_items
+        self.addCleanup(client_patcher.stop)
+        self.unit_of_work = DeviceUnitOfWork(WIRELESS_DEVICE_ID, self.devices_handler, self.measurements_handler)
+
+    def test_commit_nonTransactional_updatesFieldsAndBuffersMeasurements(self):
+        self.unit_of_work.set_link_type(LinkType.LORA)
+        self.unit_of_work.add_measurement(_measurement(1000))
+        self.unit_of_work.add_measurement(_measurement(2000))
+        self.unit_of_work.commit(transactional=False)
+
+        self.devices_table.update_item.assert_called_once()
+        update = self.devices_table.update_item.call_args.kwargs
+        self.assertEqual(update['Key'], {'wireless_device_id': WIRELESS_DEVICE_ID})
+        self.assertEqual(update['ExpressionAttributeValues'][':link_type'], 'LORA')
+        self.assertEqual([call.args[0].get_time() for call in self.measurements_handler.buffer_measurement.mock_calls],
+                         [1000, 2000])
+        self.client.assert_not_called()
+
+    def test_commit_transactional_writesRecordAndMeasurementsTogether(self):
+        self.unit_of_work.set_link_type(LinkType.LORA)
+        self.unit_of_work.add_measurement(_measurement(1000, 21))
+        self.unit_of_work.add_measurement(_measurement(2000, 22))
+        self.unit_of_work.commit(transactional=True)
+
+        self.client.assert_called_once()
+        items = self.client.call_args.kwargs['TransactItems']
+        self.assertEqual([next(iter(item)) for item in items], ['Update', 'Put', 'Put'])
+        self.assertEqual(items[0]['Update']['TableName'], SidewalkDevicesHandler.TABLE_NAME)
+        self.assertEqual(items[0]['Update']['Key'], {'wireless_device_id': {'S': WIRELESS_DEVICE_ID}})
+        self.assertEqual(items[0]['Update']['ExpressionAttributeValues'][':link_type'], {'S': 'LORA'})
+        self.assertEqual([item['Put']['TableName'] for item in items[1:]], [MeasurementsHandler.TABLE_NAME] * 2)
+        self.assertEqual([item['Put']['Item']['timestamp'] for item in items[1:]], [{'N': '1000'}, {'N': '2000'}])
+        self.devices_table.update_item.assert_not_called()
+        self.measurements_handler.buffer_measurement.assert_not_called()
+
+    def test_commit_transactionalWithoutMeasurements_updatesOnly(self):
+        self.unit_of_work.set_led_on([1])
+        self.unit_of_work.commit(transactional=True)
+
+        self.devices_table.update_item.assert_called_once()
+        self.client.assert_not_called()
+
+    def test_commit_transactionalTooManyItems_fallsBackToBuffer(self):
+        self.unit_of_work.set_led_on([1])
+        for idx in range(DeviceUnitOfWork.MAX_TRANSACT_ITEMS):
+            self.unit_of_work.add_measurement(_measurement(1000 + idx))
+        self.unit_of_work.commit(transactional=True)
+
+        self.client.assert_not_called()
+        self.devices_table.update_item.assert_called_once()
+        self.assertEqual(self.measurements_handler.buffer_measurement.call_count, DeviceUnitOfWork.MAX_TRANSACT_ITEMS)
+
+    def test_putDevice_laterChangesApplied_earlierChangesDiscarded(self):
+        self.unit_of_work.set_link_type(LinkType.LORA)
+        self.unit_of_work.put_device(_device())
+        self.unit_of_work.set_led_on([2])
+        self.unit_of_work.add_measurement(_measurement(1000))
+        self.unit_of_work.commit(transactional=True)
+
+        self.devices_table.get_item.assert_not_called()
+        items = self.client.call_args.kwargs['TransactItems']
+        self.assertEqual([next(iter(item)) for item in items], ['Put', 'Put'])
+        device_item = items[0]['Put']['Item']
+        self.assertEqual(device_item['led_on'], {'L': [{'N': '2'}]})
+        self.assertEqual(device_item['link_type'], {'S': 'BLE'})
+
+    def test_putDevice_nonTransactional_replacesRecord(self):
+        self.unit_of_work.put_device(_device(led_on=[1]))
+        self.unit_of_work.commit()
+
+        self.devices_table.put_item.assert_called_once()
+        self.assertEqual(self.devices_table.put_item.call_args.kwargs['Item']['led_on'], [1])
+        self.devices_table.update_item.assert_not_called()
+
+    def test_getDevice_readsRecordOnceWithPendingChanges(self):
+        self.unit_of_work.set_led_on([2])
+        self.assertEqual(self.unit_of_work.get_device().get_led_on(), [2])
+        self.unit_of_work.set_link_type(LinkType.FSK)
+        self.assertEqual(self.unit_of_work.get_device().get_link_type(), LinkType.FSK)
+        self.devices_table.get_item.assert_called_once()
+
+    def test_commit_togglesAppliedAfterWriteInOrder(self):
+        manager = mock.Mock()
+        self.devices_handler.update_fields_and_last_uplink = manager.update
+        self.devices_handler.toggle_buttons = manager.toggle
+        self.unit_of_work.toggle_buttons([1], 5)
+        self.unit_of_work.set_led_on([1])
+        self.unit_of_work.toggle_buttons([2], 6)
+        self.unit_of_work.commit()
+
+        self.assertEqual([call[0] for call in manager.mock_calls], ['update', 'toggle', 'toggle'])
+        self.assertEqual(manager.mock_calls[1], mock.call.toggle(WIRELESS_DEVICE_ID, [1], 5))
+        self.assertEqual(manager.mock_calls[2], mock.call.toggle(WIRELESS_DEVICE_ID, [2], 6))
+
+    def test_commit_failedTransaction_nothingElseWrittenAndChangesCleared(self):
+        self.client.side_effect = ClientError({'Error': {'Code': 'TransactionCanceledException', 'Message': ''}},
+                                              'TransactWriteItems')
+        self.unit_of_work.set_led_on([1])
+        self.unit_of_work.add_measurement(_measurement(1000))
+        self.unit_of_work.toggle_buttons([1], 5)
+
+        with self.assertRaises(ClientError):
+            self.unit_of_work.commit(transactional=True)
+
+        self.devices_table.update_item.assert_not_called()
+        self.measurements_handler.buffer_measurement.assert_not_called()
+
+        self.client.reset_mock()
+        self.unit_of_work.commit(transactional=True)
+        self.client.assert_not_called()
+        self.devices_table.update_item.assert_not_called()
+        self.devices_table.put_item.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for measurement queries and buffered measurement writes.
+"""
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from measurement import Measurement
+from measurements_handler import MeasurementsHandler
+
+
+def _measurement(wireless_device_id: str, timestamp: int) -> Measurement:
+    return Measurement(wireless_device_id=wireless_device_id, temperature=20, timestamp=timestamp)
+
+
+def _page(timestamps: [int], last_evaluated_key: dict = None) -> dict:
+    page = {'Items': [{'wireless_device_id': 'a', 'temperature': 20, 'timestamp': timestamp}
+                      for timestamp in timestamps]}
+    if last_evaluated_key is not None:
+        page['LastEvaluatedKey'] = last_evaluated_key
+    return page
+
+
+class TestGetMeasurementsForDevice(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch('boto3.resource'):
+            self.handler = MeasurementsHandler()
+        self.query = self.handler._table.query
+
+    def _queried(self, key: str) -> list:
+        return [call.kwargs.get(key) for call in self.query.call_args_list]
+
+    def test_getMeasurementsForDevice_allPagesRead(self):
+        self.query.side_effect = [_page([1, 2], {'timestamp': 2}), _page([], {'timestamp': 3}), _page([4])]
+
+        measurements = self.handler.get_measurements_for_device('a', start=1)
+
+        self.assertEqual([measurement.get_time() for measurement in measurements], [1, 2, 4])
+        self.assertEqual(self._queried('ExclusiveStartKey'), [None, {'timestamp': 2}, {'timestamp': 3}])
+        self.assertEqual(self._queried('Limit'), [None, None, None])
+
+    def test_getMeasurementsForDevice_limitReachedMidPage_nextPageNotRead(self):
+        # Limit caps the items evaluated per page, filtered out (expired) items may leave a page short
+        self.query.side_effect = [_page([1, 2], {'timestamp': 3}), _page([4], {'timestamp': 4}), _page([5])]
+
+        measurements = self.handler.get_measurements_for_device('a', limit=3)
+
+        self.assertEqual([measurement.get_time() for measurement in measurements], [1, 2, 4])
+        self.assertEqual(self._queried('Limit'), [3, 1])
+        self.assertEqual(self._queried('ExclusiveStartKey'), [None, {'timestamp': 3}])
+
+    def test_getMeasurementsForDevice_lastPageShorterThanLimit_returned(self):
+        self.query.side_effect = [_page([1, 2])]
+
+        measurements = self.handler.get_measurements_for_device('a', limit=5, scan_index_forward=False)
+
+        self.assertEqual([measurement.get_time() for measurement in measurements], [1, 2])
+        self.assertEqual(self.query.call_count, 1)
+        self.assertFalse(self.query.call_args.kwargs['ScanIndexForward'])
+
+    def test_getMeasurementsForDevice_failedPage_raised(self):
+        self.query.side_effect = [_page([1], {'timestamp': 1}),
+                                  ClientError({'Error': {'Code': 'InternalServerError', 'Message': ''}}, 'Query')]
+
+        with self.assertRaises(ClientError):
+            self.handler.get_measurements_for_device('a')
+
+
+class TestMeasurementsBuffer(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch('boto3.resource'):
+            self.handler = MeasurementsHandler()
+        self.batch_write_item = self.handler._table.meta.client.batch_write_item
+        self.batch_write_item.return_value = {}
+        sleep_patcher = mock.patch('time.sleep')
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def _written_timestamps(self) -> [int]:
+        return [request['PutRequest']['Item']['timestamp']
+                for call in self.batch_write_item.call_args_list
+                for request in call.kwargs['RequestItems'][MeasurementsHandler.TABLE_NAME]]
+
+    def test_bufferMeasurement_writesFullBatchesOnly(self):
+        for timestamp in range(MeasurementsHandler.BATCH_SIZE + 3):
+            self.handler.buffer_measurement(_measurement('a', timestamp))
+
+        self.assertEqual(self.batch_write_item.call_count, 1)
+        self.assertEqual(len(self.handler.get_buffered_items()), 3)
+        self.handler.flush()
+        self.assertEqual(self._written_timestamps(), list(range(MeasurementsHandler.BATCH_SIZE + 3)))
+        self.assertEqual(self.handler.get_buffered_items(), [])
+
+    def test_bufferMeasurement_collidingTimestampsShifted(self):
+        self.handler.buffer_measurement(_measurement('a', 1000))
+        self.handler.buffer_measurement(_measurement('b', 1000))
+        self.handler.flush()
+        self.assertEqual(self._written_timestamps(), [1000, 1001])
+
+    def test_flush_failedRequest_unwrittenItemsKept(self):
+        self.batch_write_item.side_effect = [{}, ClientError({'Error': {'Code': 'InternalServerError'}},
+                                                             'BatchWriteItem')]
+        for timestamp in range(MeasurementsHandler.BATCH_SIZE + 2):
+            self.handler.buffer_measurement(_measurement('a' if timestamp < MeasurementsHandler.BATCH_SIZE else 'b',
+                                                         timestamp))
+
+        with self.assertRaises(ClientError):
+            self.handler.flush()
+        self.assertEqual([item['wireless_device_id'] for item in self.handler.get_buffered_items()], ['b', 'b'])
+
+    def test_flush_unprocessedAfterRetries_keptAndReported(self):
+        def batch_write_item(RequestItems):
+            requests = RequestItems[MeasurementsHandler.TABLE_NAME]
+            return {'UnprocessedItems': {MeasurementsHandler.TABLE_NAME: requests[:1]}}
+        self.batch_write_item.side_effect = batch_write_item
+        self.handler.buffer_measurement(_measurement('a', 1))
+        self.handler.buffer_measurement(_measurement('b', 2))
+
+        with self.assertRaises(RuntimeError):
+            self.handler.flush()
+        self.assertEqual(self.batch_write_item.call_count, MeasurementsHandler.MAX_BATCH_WRITE_RETRIES + 1)
+        self.assertEqual([item['timestamp'] for item in self.handler.get_buffered_items()], [1])
+
+    def test_bufferMeasurement_failedEagerWrite_retriedOnFlush(self):
+        self.batch_write_item.side_effect = [ClientError({'Error': {'Code': 'InternalServerError'}}, 'BatchWriteItem'),
+                                             {}]
+        for timestamp in range(MeasurementsHandler.BATCH_SIZE):
+            self.handler.buffer_measurement(_measurement('a', timestamp))
+        self.assertEqual(len(self.handler.get_buffered_items()), MeasurementsHandler.BATCH_SIZE)
+
+        self.handler.flush()
+        self.assertEqual(self.handler.get_buffered_items(), [])
+
+    def test_discardBufferedItems_byDevice(self):
+        self.handler.buffer_measurement(_measurement('a', 1))
+        self.handler.buffer_measurement(_measurement('b', 1))
+        self.handler.discard_buffered_items('a')
+        self.assertEqual([(item['wireless_device_id'], item['timestamp']) for item in self.handler.get_buffered_items()],
+                         [('b', 2)])
+        self.handler.discard_buffered_items()
+        self.assertEqual(self.handler.get_buffered_items(), [])
+        self.handler.flush()
+        self.batch_write_item.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for scans and button toggles of the SidewalkDevices table handler.
+"""
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from device import Device
+from sidewalk_devices_handler import SidewalkDevicesHandler
+
+WIRELESS_DEVICE_ID = 'device-1'
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': ''}}, 'UpdateItem')
+
+
+def _device_items(*wireless_device_ids: str) -> [dict]:
+    return [{'wireless_device_id': wireless_device_id, 'link_type': 'BLE', 'sensor_unit': 'CELSIUS'}
+            for wireless_device_id in wireless_device_ids]
+
+
+class TestIterAllDevices(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch('boto3.resource'):
+            self.handler = SidewalkDevicesHandler()
+        self.scan = self.handler._table.meta.client.scan
+
+    def _scanned(self, key: str) -> list:
+        return [call.kwargs.get(key) for call in self.scan.call_args_list]
+
+    @staticmethod
+    def _ids(devices: [Device]) -> [str]:
+        return [device.get_wireless_device_id() for device in devices]
+
+    def test_getAllDevices_singleSegment_allPagesRead(self):
+        self.scan.side_effect = [{'Items': _device_items('a', 'b'), 'LastEvaluatedKey': {'wireless_device_id': 'b'}},
+                                 {'Items': [], 'LastEvaluatedKey': {'wireless_device_id': 'c'}},
+                                 {'Items': _device_items('d')}]
+
+        devices = self.handler.get_all_devices(since=100, total_segments=1)
+
+        self.assertEqual(self._ids(devices), ['a', 'b', 'd'])
+        self.assertEqual(self._scanned('ExclusiveStartKey'), [None, {'wireless_device_id': 'b'},
+                                                              {'wireless_device_id': 'c'}])
+        self.assertEqual(self._scanned('Segment'), [None, None, None])
+        self.assertTrue(all(call.kwargs['FilterExpression'] is not None for call in self.scan.call_args_list))
+
+    def test_getAllDevices_parallelSegments_allPagesOfAllSegmentsMerged(self):
+        pages = {
+            (0, None): {'Items': _device_items('a'), 'LastEvaluatedKey': {'wireless_device_id': 'a'}},
+            (0, 'a'): {'Items': _device_items('b')},
+            (1, None): {'Items': _device_items('c'), 'LastEvaluatedKey': {'wireless_device_id': 'c'}},
+            (1, 'c'): {'Items': [], 'LastEvaluatedKey': {'wireless_device_id': 'd'}},
+            (1, 'd'): {'Items': _device_items('e', 'f')},
+            (2, None): {'Items': []}
+        }
+
+        def scan(Segment, TotalSegments, ExclusiveStartKey=None, **kwargs):
+            self.assertEqual(TotalSegments, 3)
+            return pages[(Segment, ExclusiveStartKey and ExclusiveStartKey['wireless_device_id'])]
+        self.scan.side_effect = scan
+
+        devices = self.handler.get_all_devices(total_segments=3)
+
+        self.assertEqual(sorted(self._ids(devices)), ['a', 'b', 'c', 'e', 'f'])
+        # every page of every segment is read once, starting from the key its previous page ended at
+        scanned = [(segment, key and key['wireless_device_id'])
+                   for segment, key in zip(self._scanned('Segment'), self._scanned('ExclusiveStartKey'))]
+        self.assertCountEqual(scanned, pages)
+        self.assertTrue(all('FilterExpression' not in call.kwargs for call in self.scan.call_args_list))
+
+    def test_getAllDevices_failedSegmentPage_raised(self):
+        def scan(Segment, **kwargs):
+            if Segment == 1:
+                raise ClientError({'Error': {'Code': 'InternalServerError', 'Message': ''}}, 'Scan')
+            return {'Items': _device_items('a')}
+        self.scan.side_effect = scan
+
+        with self.assertRaises(ClientError):
+            self.handler.get_all_devices(total_segments=2)
+
+
+class TestToggleButtons(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch('boto3.resource'):
+            self.handler = SidewalkDevicesHandler()
+        self.table = self.handler._table
+
+    def _stored_button_pressed(self, button_pressed):
+        self.table.get_item.return_value = {'Item': {'button_pressed': button_pressed}}
+
+    def test_toggleButtons_oneConditionalWritePerButton(self):
+        self.assertTrue(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [2, 1, 2], 7))
+
+        self.assertEqual(self.table.update_item.call_count, 2)
+        for call, button_id in zip(self.table.update_item.call_args_list, ['1', '2']):
+            kwargs = call.kwargs
+            self.assertEqual(kwargs['ExpressionAttributeNames']['#b'], button_id)
+            self.assertEqual(kwargs['ConditionExpression'],
+                             'attribute_type(button_pressed, :map) AND button_pressed.#b.seqN < :seq_n')
+            self.assertEqual(kwargs['ExpressionAttributeValues'][':seq_n'], 7)
+            self.assertIn('button_pressed.#b.#state=:one-button_pressed.#b.#state', kwargs['UpdateExpression'])
+        self.table.get_item.assert_not_called()
+
+    def test_toggleButtons_outdatedButtonIgnored_othersToggled(self):
+        self._stored_button_pressed({'1': {'seqN': 9, 'state': 0}, '2': {'seqN': 3, 'state': 0}})
+        self.table.update_item.side_effect = [_client_error('ConditionalCheckFailedException'), {}]
+        self.assertTrue(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [1, 2], 7))
+
+        self.table.update_item.side_effect = _client_error('ConditionalCheckFailedException')
+        self.assertFalse(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [1], 7))
+        self.assertEqual(self.table.update_item.call_count, 3)
+
+    def test_toggleButtons_listShapedRecord_migratedAndToggled(self):
+        # condition on the map type fails for a list, which DynamoDB reports as ConditionalCheckFailedException
+        self._stored_button_pressed([{'id': 1, 'seqN': 3, 'state': 0}, {'id': 2, 'seqN': 4, 'state': 1}])
+        self.table.update_item.side_effect = [_client_error('ConditionalCheckFailedException'), {}, {}]
+
+        self.assertTrue(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [2], 7))
+
+        toggle, migration, retry = self.table.update_item.call_args_list
+        self.assertEqual(migration.kwargs['ExpressionAttributeValues'][':button_pressed'],
+                         {'1': {'seqN': 3, 'state': 0}, '2': {'seqN': 4, 'state': 1}})
+        self.assertEqual(migration.kwargs['ConditionExpression'], 'attribute_type(button_pressed, :list)')
+        self.assertEqual(retry, toggle)
+        self.assertTrue(self.table.get_item.call_args.kwargs['ConsistentRead'])
+
+    def test_toggleButtons_listShapedRecordInvalidPath_migratedAndToggled(self):
+        self._stored_button_pressed([{'id': 1, 'seqN': 3, 'state': 0}])
+        self.table.update_item.side_effect = [_client_error('ValidationException'), {}, {}]
+
+        self.assertTrue(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [1], 7))
+        self.assertEqual(self.table.update_item.call_count, 3)
+
+    def test_toggleButtons_migratedConcurrently_retriedOnce(self):
+        self._stored_button_pressed([{'id': 1, 'seqN': 3, 'state': 0}])
+        self.table.update_item.side_effect = [_client_error('ConditionalCheckFailedException'),
+                                              _client_error('ConditionalCheckFailedException'),
+                                              _client_error('ConditionalCheckFailedException')]
+
+        self.assertFalse(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [1], 7))
+        self.assertEqual(self.table.update_item.call_count, 3)
+
+    def test_toggleButtons_unknownButton_ignoredWithoutMigration(self):
+        for code in ('ConditionalCheckFailedException', 'ValidationException'):
+            with self.subTest(code=code):
+                self.table.reset_mock()
+                self._stored_button_pressed({'1': {'seqN': 3, 'state': 0}})
+                self.table.update_item.side_effect = _client_error(code)
+
+                self.assertFalse(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [5], 7))
+                self.assertEqual(self.table.update_item.call_count, 1)
+
+    def test_toggleButtons_missingRecord_ignored(self):
+        self.table.get_item.return_value = {}
+        self.table.update_item.side_effect = _client_error('ConditionalCheckFailedException')
+
+        self.assertFalse(self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [1], 7))
+        self.assertEqual(self.table.update_item.call_count, 1)
+
+    def test_toggleButtons_otherErrors_raised(self):
+        self.table.update_item.side_effect = _client_error('ProvisionedThroughputExceededException')
+        with self.assertRaises(ClientError):
+            self.handler.toggle_buttons(WIRELESS_DEVICE_ID, [1], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
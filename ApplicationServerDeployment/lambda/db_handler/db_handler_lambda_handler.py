@@ -5,11 +5,13 @@
 Handles read request to SidewalkDevices and Measurements tables.
 """
 
+import hashlib
 import json
 import traceback
 import cors_utils
 from typing import Final
 
+import measurements_downsampling
 from measurements_handler import MeasurementsHandler
 from sidewalk_devices_handler import SidewalkDevicesHandler
 
@@ -17,17 +19,56 @@ device_handler: Final = SidewalkDevicesHandler()
 measurement_handler: Final = MeasurementsHandler()
 
 
-def get_all_devices():
+def get_all_devices(since: int = None, if_none_match: str = None):
     """
     Get all records from the SidewalkDevices table.
+    Both since and if_none_match reduce the size of the response only, the whole table is scanned either way
+    (since is applied as a scan filter and ETag is computed from the response body).
 
-    :return:    Response with list of records from SidewalkDevices table.
+    :param since:           If given, only records changed at or after this time (UTC time in seconds) are returned.
+    :param if_none_match:   Value of the If-None-Match header, 304 is returned if it matches ETag of the response.
+    :return:                Response with list of records from SidewalkDevices table.
     """
-    devices = device_handler.get_all_devices()
     devices_json = []
-    for device in devices:
+    for device in device_handler.iter_all_devices(since=since):
         devices_json.append(device.to_dict())
-    return _create_response_message(200, devices_json)
+    return _create_conditional_response_message(devices_json, if_none_match)
+
+
+def get_measurements(wireless_device_id: str, time_range: str, query_params: dict):
+    """
+    Get records from the Measurements table for a particular device.
+
+    :param wireless_device_id:  Wireless device ID.
+    :param time_range:          Optional time range in format {start}/{end} or {start} (UTC time in milliseconds).
+    :param query_params:        Query string parameters: optional bucket (e.g. 60s), agg (avg, min or max)
+                                and since (UTC time in milliseconds). If since is given, only measurements newer
+                                than since are returned, if bucket is given as well, the bucket containing since
+                                is returned complete, so that client can replace its last point.
+    :return:                    Response with list of measurements, downsampled if bucket is given.
+    """
+    start, end = _parse_time_range(time_range)
+    bucket = query_params.get("bucket")
+    aggregation = measurements_downsampling.get_aggregation(query_params.get("agg", measurements_downsampling.AVG))
+    bucket_ms = measurements_downsampling.parse_bucket(bucket) if bucket else None
+    since = _parse_since(query_params)
+
+    if since is not None:
+        newer_than_since = since + 1
+        if bucket_ms is not None:
+            newer_than_since -= newer_than_since % bucket_ms
+        start = newer_than_since if start is None else max(start, newer_than_since)
+        if end is not None and end < start:
+            return _create_response_message(200, [])
+
+    measurements = measurement_handler.get_measurements_for_device(wireless_device_id=wireless_device_id,
+                                                                   start=start, end=end)
+    if bucket_ms is not None:
+        return _create_response_message(200, measurements_downsampling.downsample(measurements, bucket_ms, aggregation))
+    measurements_json = []
+    for measurement in measurements:
+        measurements_json.append(measurement.to_dict())
+    return _create_response_message(200, measurements_json)
 
 
 def lambda_handler(event, context):
@@ -45,7 +86,7 @@ def lambda_handler(event, context):
             if path.startswith("/devices/"):
                 split_path = path.split("/devices/", 1)
                 if len(split_path) == 1:  # if no device id is specified we get all devices
-                    return get_all_devices()
+                    return _get_all_devices_for_event(event)
 
                 wireless_device_id = split_path[1]
                 device = device_handler.get_device(wireless_device_id)
@@ -53,23 +94,26 @@ def lambda_handler(event, context):
                     return _create_response_message(404, "No device found with id {}".format(wireless_device_id))
                 return _create_response_message(200, device.to_dict())
 
-            elif path == "/devices":
-                return get_all_devices()
+            elif path == "/devices":  # you can also optionally specify ?since={lastUplink} and If-None-Match header
+                try:
+                    return _get_all_devices_for_event(event)
+                except ValueError as e:
+                    return _create_response_message(400, "Invalid request. {}".format(e))
 
-            elif path.startswith("/measurements/"):  # get device request format devices/{deviceId}
-                # you can also optionally specify range: devices/{deviceId}/dateStart/dateEnd
+            elif path.startswith("/measurements/"):  # get measurements request format measurements/{deviceId}
+                # you can also optionally specify range: measurements/{deviceId}/dateStart/dateEnd
+                # and downsampling: ?bucket=60s&agg=avg|min|max, to get only new measurements: ?since={time}
                 split_path = path.split("/measurements/", 1)
                 if len(split_path) == 1:
                     return _create_response_message(400, "Invalid path. Device id needs to be specified. Example of correct "
                                                          "path /measurements/{wirelessDeviceId}")
                 remaining_path = split_path[1].split("/", 1)
                 wireless_device_id = remaining_path[0]
-
-                measurements = measurement_handler.get_measurements_for_device(wireless_device_id=wireless_device_id)
-                measurements_json = []
-                for measurement in measurements:
-                    measurements_json.append(measurement.to_dict())
-                return _create_response_message(200, measurements_json)
+                time_range = remaining_path[1] if len(remaining_path) > 1 else None
+                try:
+                    return get_measurements(wireless_device_id, time_range, event.get("queryStringParameters") or {})
+                except ValueError as e:
+                    return _create_response_message(400, "Invalid request. {}".format(e))
 
             elif path == "/measurements":
                 return _create_response_message(400, "Invalid path. Correct path format /measurements/{wirelessDeviceId}")
@@ -83,6 +127,52 @@ def lambda_handler(event, context):
         return _create_response_message(400, "Unexpected exception thrown {}".format(e))
 
 
+def _get_all_devices_for_event(event) -> dict:
+    return get_all_devices(since=_parse_since(event.get("queryStringParameters") or {}),
+                           if_none_match=_get_header(event, "If-None-Match"))
+
+
+def _get_header(event, name: str) -> str:
+    # header names are case-insensitive, API Gateway passes them as sent by the client
+    for header, value in (event.get("headers") or {}).items():
+        if header.lower() == name.lower():
+            return value
+
+
+def _parse_since(query_params: dict) -> int:
+    since = query_params.get("since")
+    if since is None:
+        return None
+    if not since.isdigit():
+        raise ValueError(f"{since} is not a valid since parameter, expected UTC time")
+    return int(since)
+
+
+def _parse_time_range(time_range: str) -> (int, int):
+    if not time_range:
+        return None, None
+    bounds = time_range.strip("/").split("/")
+    if len(bounds) > 2 or not all(bound.isdigit() for bound in bounds):
+        raise ValueError(f"{time_range} is not a valid time range, expected {{start}}/{{end}} in milliseconds")
+    start = int(bounds[0])
+    end = int(bounds[1]) if len(bounds) == 2 else None
+    if end is not None and end < start:
+        raise ValueError(f"End of the time range ({end}) precedes its start ({start})")
+    return start, end
+
+
+def _create_conditional_response_message(body, if_none_match: str) -> dict:
+    # ETag is a hash of the response body, so unchanged data is not sent again (304 Not Modified),
+    # it saves bandwidth only, the body is read from the table before it can be compared
+    response = _create_response_message(200, body)
+    etag = '"{}"'.format(hashlib.md5(response['body'].encode()).hexdigest())
+    if if_none_match and etag in (tag.strip().replace('W/', '', 1) for tag in if_none_match.split(",")):
+        response['statusCode'] = 304
+        response['body'] = ''
+    response['headers']['ETag'] = etag
+    return response
+
+
 def _create_response_message(status_code: int, body) -> dict:
     return {
         'statusCode': status_code,
@@ -90,6 +180,8 @@ def _create_response_message(status_code: int, body) -> dict:
         "headers": {
             "Access-Control-Allow-Origin": cors_utils.get_gui_bucket_url_for_cors(),
             "Access-Control-Allow-Methods": "GET,POST,OPTIONS,PUT",
-            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token"
+            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,"
+                                            "If-None-Match",
+            "Access-Control-Expose-Headers": "ETag"
         }
     }
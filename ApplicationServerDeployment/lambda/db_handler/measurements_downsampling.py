@@ -0,0 +1,86 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Downsamples measurement series returned by the /measurements API, so that the GUI receives one point per
+time bucket instead of every raw measurement.
+"""
+from itertools import groupby
+from typing import Final
+
+from measurement import Measurement
+
+AVG: Final = 'avg'
+MIN: Final = 'min'
+MAX: Final = 'max'
+
+"""
+Aggregation functions indexed by the agg query parameter.
+"""
+AGGREGATIONS: Final = {
+    AVG: lambda values: sum(values) / len(values),
+    MIN: min,
+    MAX: max
+}
+
+"""
+Bucket size units (suffix of the bucket query parameter) in milliseconds.
+"""
+BUCKET_UNITS: Final = {
+    'ms': 1,
+    's': 1000,
+    'm': 60 * 1000,
+    'h': 3600 * 1000
+}
+
+
+def parse_bucket(bucket: str) -> int:
+    """
+    Parses bucket size given as a number followed by unit, e.g. 500ms, 60s, 5m, 1h (seconds if unit is omitted).
+
+    :param bucket:  Bucket size.
+    :return:        Bucket size in milliseconds.
+    """
+    for unit in sorted(BUCKET_UNITS, key=len, reverse=True):
+        if bucket.endswith(unit):
+            number, multiplier = bucket[:-len(unit)], BUCKET_UNITS[unit]
+            break
+    else:
+        number, multiplier = bucket, BUCKET_UNITS['s']
+    if not number.isdigit() or int(number) == 0:
+        raise ValueError(f'{bucket} is not a valid bucket size, expected e.g. 60s, 5m or 1h')
+    return int(number) * multiplier
+
+
+def get_aggregation(agg: str):
+    """
+    Returns aggregation function for the given agg query parameter.
+
+    :param agg: Aggregation name (avg, min or max).
+    :return:    Function aggregating list of values into single value.
+    """
+    aggregation = AGGREGATIONS.get(agg)
+    if aggregation is None:
+        raise ValueError(f'{agg} is not a valid aggregation, expected one of: {", ".join(AGGREGATIONS)}')
+    return aggregation
+
+
+def downsample(measurements: [Measurement], bucket_ms: int, aggregation) -> [dict]:
+    """
+    Groups measurements into consecutive time buckets and aggregates values within each of them.
+    Empty buckets are skipped.
+
+    :param measurements:    List of Measurement objects ordered by time.
+    :param bucket_ms:       Bucket size in milliseconds.
+    :param aggregation:     Aggregation function, see: get_aggregation.
+    :return:                List of dicts in the Measurement.to_dict format, time is the start of the bucket.
+    """
+    series = []
+    for bucket_start, bucket in groupby(measurements, key=lambda m: m.get_time() - m.get_time() % bucket_ms):
+        bucket = list(bucket)
+        series.append({
+            'wireless_device_id': bucket[0].get_wireless_device_id(),
+            'value': aggregation([measurement.get_value() for measurement in bucket]),
+            'time': bucket_start
+        })
+    return series
@@ -0,0 +1,98 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for time range, downsampling and since parameters of the /measurements API.
+"""
+import json
+import os
+import unittest
+from unittest import mock
+
+from measurement import Measurement
+
+with mock.patch('boto3.resource'):
+    import db_handler_lambda_handler
+
+
+def _event(path: str, query_params: dict = None) -> dict:
+    return {'httpMethod': 'GET', 'path': f'/api{path}', 'queryStringParameters': query_params}
+
+
+class TestMeasurementsApi(unittest.TestCase):
+
+    def setUp(self):
+        env_patcher = mock.patch.dict(os.environ, {'GUI_BUCKET_URL': 'https://gui.example.com/'})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        query_patcher = mock.patch.object(db_handler_lambda_handler.measurement_handler,
+                                          'get_measurements_for_device')
+        self.query = query_patcher.start()
+        self.addCleanup(query_patcher.stop)
+        self.query.return_value = [Measurement(wireless_device_id='device-1', temperature=value, timestamp=timestamp)
+                                   for timestamp, value in [(61000, 20), (62000, 22), (125000, 30)]]
+
+    def _get(self, path: str, query_params: dict = None) -> (int, object):
+        response = db_handler_lambda_handler.lambda_handler(_event(path, query_params), None)
+        return response['statusCode'], json.loads(response['body'])
+
+    def test_measurements_noRange_unboundedQuery(self):
+        status, body = self._get('/measurements/device-1')
+        self.assertEqual(status, 200)
+        self.query.assert_called_once_with(wireless_device_id='device-1', start=None, end=None)
+        self.assertEqual([point['time'] for point in body], [61000, 62000, 125000])
+
+    def test_measurements_range_passedToQuery(self):
+        cases = {
+            '/measurements/device-1/1000/5000': (1000, 5000),
+            '/measurements/device-1/1000': (1000, None),
+            '/measurements/device-1/1000/1000/': (1000, 1000)
+        }
+        for path, (start, end) in cases.items():
+            with self.subTest(path=path):
+                self.query.reset_mock()
+                status, _ = self._get(path)
+                self.assertEqual(status, 200)
+                self.query.assert_called_once_with(wireless_device_id='device-1', start=start, end=end)
+
+    def test_measurements_bucket_downsampled(self):
+        status, body = self._get('/measurements/device-1/60000/180000', {'bucket': '60s', 'agg': 'max'})
+        self.assertEqual(status, 200)
+        self.assertEqual(body, [{'wireless_device_id': 'device-1', 'value': 22.0, 'time': 60000},
+                                {'wireless_device_id': 'device-1', 'value': 30.0, 'time': 120000}])
+        _, body = self._get('/measurements/device-1/60000/180000', {'bucket': '60s'})
+        self.assertEqual([point['value'] for point in body], [21.0, 30.0])
+
+    def test_measurements_invalidParameters_badRequestWithoutQuery(self):
+        cases = [
+            ('/measurements/device-1/abc/5000', None),
+            ('/measurements/device-1/5000/1000', None),
+            ('/measurements/device-1/1/2/3', None),
+            ('/measurements/device-1/-1/5000', None),
+            ('/measurements/device-1/1000/5000', {'bucket': '1d'}),
+            ('/measurements/device-1/1000/5000', {'bucket': '60s', 'agg': 'median'}),
+            ('/measurements/device-1', {'since': 'yesterday'})
+        ]
+        for path, query_params in cases:
+            with self.subTest(path=path, query_params=query_params):
+                status, body = self._get(path, query_params)
+                self.assertEqual(status, 400)
+                self.assertTrue(body.startswith('Invalid request.'))
+        self.query.assert_not_called()
+
+    def test_measurements_since_newerThanSinceAlignedToBucket(self):
+        self._get('/measurements/device-1', {'since': '61000'})
+        self.query.assert_called_with(wireless_device_id='device-1', start=61001, end=None)
+        self._get('/measurements/device-1/0/180000', {'since': '61000', 'bucket': '60s'})
+        self.query.assert_called_with(wireless_device_id='device-1', start=60000, end=180000)
+        self._get('/measurements/device-1/100000/180000', {'since': '61000', 'bucket': '60s'})
+        self.query.assert_called_with(wireless_device_id='device-1', start=100000, end=180000)
+
+    def test_measurements_sinceAfterRange_emptyWithoutQuery(self):
+        status, body = self._get('/measurements/device-1/0/1000', {'since': '5000'})
+        self.assertEqual((status, body), (200, []))
+        self.query.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
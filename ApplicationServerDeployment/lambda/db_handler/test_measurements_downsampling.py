@@ -0,0 +1,69 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for downsampling of the /measurements API.
+"""
+import unittest
+
+from measurement import Measurement
+from measurements_downsampling import *
+
+
+def _series(*points) -> [Measurement]:
+    return [Measurement(wireless_device_id='device-1', temperature=value, timestamp=timestamp)
+            for timestamp, value in points]
+
+
+class TestParseBucket(unittest.TestCase):
+
+    def test_parseBucket_units(self):
+        cases = {'500ms': 500, '60s': 60000, '5m': 300000, '1h': 3600000, '30': 30000}
+        for bucket, bucket_ms in cases.items():
+            with self.subTest(bucket=bucket):
+                self.assertEqual(parse_bucket(bucket), bucket_ms)
+
+    def test_parseBucket_invalid(self):
+        for bucket in ['', 's', '0s', '-5s', '1.5s', '1d', 'xs', 'm5']:
+            with self.subTest(bucket=bucket):
+                with self.assertRaises(ValueError):
+                    parse_bucket(bucket)
+
+
+class TestDownsample(unittest.TestCase):
+
+    def test_getAggregation(self):
+        values = [3.0, 1.0, 2.0]
+        self.assertEqual(get_aggregation(AVG)(values), 2.0)
+        self.assertEqual(get_aggregation(MIN)(values), 1.0)
+        self.assertEqual(get_aggregation(MAX)(values), 3.0)
+        for agg in ['', 'median', 'AVG']:
+            with self.subTest(agg=agg):
+                with self.assertRaises(ValueError):
+                    get_aggregation(agg)
+
+    def test_downsample_aggregatesWithinBuckets(self):
+        series = _series((0, 20), (999, 22), (1000, 30), (1500, 10), (2999, 25))
+        self.assertEqual(downsample(series, 1000, get_aggregation(AVG)), [
+            {'wireless_device_id': 'device-1', 'value': 21.0, 'time': 0},
+            {'wireless_device_id': 'device-1', 'value': 20.0, 'time': 1000},
+            {'wireless_device_id': 'device-1', 'value': 25.0, 'time': 2000}
+        ])
+        self.assertEqual([point['value'] for point in downsample(series, 1000, get_aggregation(MIN))], [20, 10, 25])
+        self.assertEqual([point['value'] for point in downsample(series, 1000, get_aggregation(MAX))], [22, 30, 25])
+
+    def test_downsample_bucketsAlignedToBucketSize(self):
+        # buckets are aligned to multiples of the bucket size, not to the start of the requested range,
+        # so the first and the last bucket of the range may be partial
+        series = _series((61500, 1), (119999, 2), (120000, 3))
+        self.assertEqual([point['time'] for point in downsample(series, 60000, get_aggregation(AVG))],
+                         [60000, 120000])
+
+    def test_downsample_emptyBucketsSkipped(self):
+        series = _series((0, 1), (5000, 2))
+        self.assertEqual([point['time'] for point in downsample(series, 1000, get_aggregation(AVG))], [0, 5000])
+        self.assertEqual(downsample([], 1000, get_aggregation(AVG)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
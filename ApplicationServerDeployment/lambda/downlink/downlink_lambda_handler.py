@@ -5,27 +5,20 @@
 Handles requests to send downlink commands to a wireless device.
 """
 
-import base64
-import boto3
 import json
 import cors_utils
 import traceback
 from botocore.exceptions import ClientError
-from datetime import datetime, timezone
 from typing import Final
 
+import payload_cache
 import time_utils
-from command import Command
+from downlink_service import DEMO_APP_ACTION_REQ, DEMO_APP_ACTION_RESP, DEMO_APP_CAP_DISCOVERY_RESP, \
+    encode_response, send_payload_to_device
 from protocol import *
-from tag import Tag
 
 
 COMMAND_KEY: Final = "command"
-DEMO_APP_CAP_DISCOVERY_RESP: Final = "DEMO_APP_CAP_DISCOVERY_RESP"
-DEMO_APP_ACTION_RESP: Final = "DEMO_APP_ACTION_RESP"
-DEMO_APP_ACTION_REQ: Final = "DEMO_APP_ACTION_REQ"
-session = boto3.Session()
-wireless_client = session.client(service_name='iotwireless')
 headers = {
     "Access-Control-Allow-Origin": cors_utils.get_gui_bucket_url_for_cors(),
     "Access-Control-Allow-Methods": "GET,POST,OPTIONS,PUT",
@@ -33,45 +26,6 @@ headers = {
 }
 
 
-def send_hex_payload_to_device(wireless_device_id: str, cmd: Command, seq_n: int):
-    """
-    Extracts hexadecimal representation of the Command object.
-    Encodes hex into base64 and sends it to the wireless device.
-
-    :param wireless_device_id:  Id of the wireless device.
-    :param cmd:                 Command object.
-    :param seq_n:               Sequence number of the downlink message.
-    :return:                    IoTWireless client response.
-    """
-    wireless_metadata = {}
-    wireless_metadata_sidewalk = {"Seq": seq_n}
-    wireless_metadata["Sidewalk"] = wireless_metadata_sidewalk
-
-    payload_hex = cmd.hex_repr()
-    payload_data = base64.b64encode(bytes.fromhex(payload_hex)).decode()
-
-    return wireless_client.send_data_to_wireless_device(Id=wireless_device_id,
-                                                        TransmitMode=0,
-                                                        PayloadData=payload_data,
-                                                        WirelessMetadata=wireless_metadata)
-
-
-def calculate_seq_from_current_time():
-    """
-    Determines sequence number to be used for downlink message based on the current time.
-    SeqN is calculated in following fashion:
-    First 2 digits are reserved for current seconds
-    Last 2 digits are reserved for first 2 digits of current microseconds
-
-    :return:    Sequence number.
-    """
-    time_now = datetime.now(timezone.utc)
-    seq_n = time_now.strftime("%S%f")[:-4]
-    while seq_n[0] == "0" and len(seq_n) > 1:
-        seq_n = seq_n[1:]
-    return int(seq_n)
-
-
 def format_command_id_as_json(command: str, response):
     """
     Formats information about the sent downlink into a json dict.
@@ -86,10 +40,28 @@ def format_command_id_as_json(command: str, response):
     return dict_format
 
 
+def handle_queued_requests(event, context):
+    """
+    Handles batch of requests received from the downlink queue (see: downlink_dispatcher in the uplink lambda).
+    Requests, which failed with server error, are reported as failed, so that only they are redelivered.
+
+    :return:    Partial batch response: {'batchItemFailures': [{'itemIdentifier': str}]}.
+    """
+    failures = []
+    for record in event['Records']:
+        response = lambda_handler(record['body'], context)
+        if response['statusCode'] >= 500:
+            failures.append({'itemIdentifier': record['messageId']})
+    return {'batchItemFailures': failures}
+
+
 def lambda_handler(event, context):
     """
     Handles requests to send downlink commands to a wireless device.
     """
+    if type(event) == dict and 'Records' in event:
+        return handle_queued_requests(event, context)
+
     device_id = ""
     try:
         # ---------------------------------------------------------------
@@ -125,23 +97,17 @@ def lambda_handler(event, context):
 
         command = json_body.get("command")
         device_id = json_body.get("deviceId")
+        correlation_id = json_body.get("correlationId")
+        if correlation_id is not None:
+            print(f'Correlation id: {correlation_id}')
 
-        seq_n = calculate_seq_from_current_time()
+        seq_n = time_utils.calculate_seq_from_current_time()
 
         # ---------------------------------------------
         # Handle and encode demo app specific commands
         # ---------------------------------------------
         if command == DEMO_APP_CAP_DISCOVERY_RESP:
-            status_code = '00000000'
-            cmd = Command()
-            cmd.encode(
-                status_hdr_ind=True,
-                op_code=OpCode.MSG_TYPE_RESP,
-                cls=Class.DEMO_APP_CLASS,
-                id=Id.DEMO_APP_CAP_DISCOVERY_RESP,
-                status_code=status_code
-            )
-            msg_id = send_hex_payload_to_device(device_id, cmd, seq_n)
+            msg_id = send_payload_to_device(device_id, encode_response(command), seq_n)
 
             return {
                 'statusCode': 200,
@@ -151,17 +117,7 @@ def lambda_handler(event, context):
 
         elif command == DEMO_APP_ACTION_RESP:
             button_press = json_body.get("button_press")
-            tags_json = [{TagType.BUTTON_PRESSED_RESP: button_press}]
-            tags = [Tag().encode(tag) for tag in tags_json]
-            cmd = Command().encode(
-                status_hdr_ind=True,
-                op_code=OpCode.MSG_TYPE_RESP,
-                cls=Class.DEMO_APP_CLASS,
-                id=Id.DEMO_APP_ACTION_RESP,
-                status_code='00000000',
-                payload=tags
-            )
-            msg_id = send_hex_payload_to_device(device_id, cmd, seq_n)
+            msg_id = send_payload_to_device(device_id, encode_response(command, button_press), seq_n)
             return {
                 'statusCode': 200,
                 'body': json.dumps(format_command_id_as_json(DEMO_APP_ACTION_RESP, msg_id)),
@@ -193,19 +149,8 @@ def lambda_handler(event, context):
                                 "Only lists and int are supported".format(type(led_id))),
                         "headers": headers
                     }
-            tags_json = [
-                {tag_type: led_id},
-                {TagType.CURRENT_GPS_TIME_IN_SECS: int(gps_time)}
-            ]
-            tags = [Tag().encode(tag) for tag in tags_json]
-            cmd = Command().encode(
-                status_hdr_ind=False,
-                op_code=OpCode.MSG_TYPE_WRITE,
-                cls=Class.DEMO_APP_CLASS,
-                id=Id.DEMO_APP_ACTION_REQ,
-                payload=tags
-            )
-            msg_id = send_hex_payload_to_device(device_id, cmd, seq_n)
+            payload_data = payload_cache.action_req(tag_type, led_id, gps_time)
+            msg_id = send_payload_to_device(device_id, payload_data, seq_n)
             return {
                 'statusCode': 200,
                 'body': json.dumps(format_command_id_as_json(DEMO_APP_ACTION_REQ, msg_id)),
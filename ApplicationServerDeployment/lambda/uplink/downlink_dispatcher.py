@@ -0,0 +1,142 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Dispatches downlinks determined by the uplink pipeline. Dispatch mode is read from the DOWNLINK_DISPATCH_MODE
+environment variable:
+ - sync: SidewalkDownlinkLambda is invoked and awaited (RequestResponse), its response is returned
+ - event: SidewalkDownlinkLambda is invoked asynchronously (Event), uplink lambda does not wait for it (default)
+ - sqs: request is sent to the queue given by DOWNLINK_QUEUE_URL, which is consumed by SidewalkDownlinkLambda
+ - in_process: payload is encoded and sent to the device directly, without second lambda,
+   see: downlink_service
+
+Batches of uplinks are never dispatched in the sync mode, see: get_mode. Unknown mode falls back to the default one.
+Every request carries a correlation id, which is logged by both lambdas.
+Clients are created once per lambda container and reused across warm invocations.
+"""
+import json
+import os
+import uuid
+from functools import lru_cache
+from typing import Final
+
+import boto3
+
+import downlink_service
+
+SYNC: Final = 'sync'
+EVENT: Final = 'event'
+SQS: Final = 'sqs'
+IN_PROCESS: Final = 'in_process'
+
+DEFAULT_MODE: Final = EVENT
+
+DOWNLINK_LAMBDA_NAME: Final = 'SidewalkDownlinkLambda'
+
+DOWNLINK_DISPATCH_MODE = os.environ.get('DOWNLINK_DISPATCH_MODE', DEFAULT_MODE)
+DOWNLINK_QUEUE_URL = os.environ.get('DOWNLINK_QUEUE_URL', '')
+
+
+def dispatch(command: str, wireless_device_id: str, button_pressed=None, mode: str = None) -> str:
+    """
+    Dispatches downlink command to the wireless device.
+
+    :param command:             Command to be sent (DEMO_APP_CAP_DISCOVERY_RESP or DEMO_APP_ACTION_RESP).
+    :param wireless_device_id:  Id of the wireless device.
+    :param button_pressed:      List of indices of the buttons being pressed.
+    :param mode:                Dispatch mode (DOWNLINK_DISPATCH_MODE if not given, DEFAULT_MODE if unknown).
+    :return:                    Description of the dispatch result.
+    """
+    mode = mode or DOWNLINK_DISPATCH_MODE
+    dispatcher = DISPATCHERS.get(mode)
+    if dispatcher is None:
+        print(f'{mode} is not a valid downlink dispatch mode, {DEFAULT_MODE} is used instead')
+        mode, dispatcher = DEFAULT_MODE, DISPATCHERS[DEFAULT_MODE]
+    correlation_id = uuid.uuid4().hex
+    print(f'Dispatching {command} to {wireless_device_id} (mode: {mode}, correlation id: {correlation_id})')
+    return dispatcher(command, wireless_device_id, button_pressed, correlation_id)
+
+
+def get_mode(batch: bool = False) -> str:
+    """
+    Returns mode used to dispatch downlinks.
+    Downlinks sent in response to the batch of uplinks are dispatched one by one, so the batch would wait for
+    every one of them in the sync mode, event mode is used instead.
+
+    :param batch:   True if downlinks are dispatched in response to the batch of uplinks.
+    :return:        Dispatch mode.
+    """
+    if batch and DOWNLINK_DISPATCH_MODE == SYNC:
+        return EVENT
+    return DOWNLINK_DISPATCH_MODE
+
+
+def build_request(command: str, wireless_device_id: str, button_pressed, correlation_id: str) -> dict:
+    """
+    Builds request accepted by the SidewalkDownlinkLambda.
+
+    :param command:             Command to be sent.
+    :param wireless_device_id:  Id of the wireless device.
+    :param button_pressed:      List of indices of the buttons being pressed.
+    :param correlation_id:      Id used to correlate logs of both lambdas.
+    :return:                    Request dict.
+    """
+    body = {'command': command, 'deviceId': wireless_device_id, 'correlationId': correlation_id}
+    if button_pressed is not None:
+        body['button_press'] = list(button_pressed)
+    return {'body': body, 'httpMethod': 'POST'}
+
+
+# -----------
+# Dispatchers
+# -----------
+def _dispatch_sync(command: str, wireless_device_id: str, button_pressed, correlation_id: str) -> str:
+    response = _client('lambda').invoke(
+        FunctionName=DOWNLINK_LAMBDA_NAME,
+        InvocationType='RequestResponse',
+        Payload=json.dumps(build_request(command, wireless_device_id, button_pressed, correlation_id)).encode()
+    )
+    response_body = response['Payload'].read().decode()
+    print(f'Response from {DOWNLINK_LAMBDA_NAME}: {response_body} (correlation id: {correlation_id})')
+    return response_body
+
+
+def _dispatch_event(command: str, wireless_device_id: str, button_pressed, correlation_id: str) -> str:
+    response = _client('lambda').invoke(
+        FunctionName=DOWNLINK_LAMBDA_NAME,
+        InvocationType='Event',
+        Payload=json.dumps(build_request(command, wireless_device_id, button_pressed, correlation_id)).encode()
+    )
+    return f'{DOWNLINK_LAMBDA_NAME} invoked asynchronously (status: {response["StatusCode"]}, ' \
+           f'correlation id: {correlation_id})'
+
+
+def _dispatch_sqs(command: str, wireless_device_id: str, button_pressed, correlation_id: str) -> str:
+    if not DOWNLINK_QUEUE_URL:
+        raise ValueError('DOWNLINK_QUEUE_URL is not set')
+    response = _client('sqs').send_message(
+        QueueUrl=DOWNLINK_QUEUE_URL,
+        MessageBody=json.dumps(build_request(command, wireless_device_id, button_pressed, correlation_id))
+    )
+    return f'Downlink queued (message id: {response["MessageId"]}, correlation id: {correlation_id})'
+
+
+def _dispatch_in_process(command: str, wireless_device_id: str, button_pressed, correlation_id: str) -> str:
+    response = downlink_service.send_response(command, wireless_device_id, button_pressed)
+    return f'Downlink sent (message id: {response.get("MessageId")}, correlation id: {correlation_id})'
+
+
+"""
+Dispatchers indexed by dispatch mode.
+"""
+DISPATCHERS: Final = {
+    SYNC: _dispatch_sync,
+    EVENT: _dispatch_event,
+    SQS: _dispatch_sqs,
+    IN_PROCESS: _dispatch_in_process
+}
+
+
+@lru_cache(maxsize=None)
+def _client(service_name: str):
+    return boto3.client(service_name)
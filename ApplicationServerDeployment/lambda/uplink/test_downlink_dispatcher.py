@@ -0,0 +1,107 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for downlink dispatch modes.
+"""
+import io
+import json
+import unittest
+from unittest import mock
+
+import downlink_dispatcher
+from downlink_service import DEMO_APP_ACTION_RESP, DEMO_APP_CAP_DISCOVERY_RESP
+
+WIRELESS_DEVICE_ID = 'device-1'
+QUEUE_URL = 'https://sqs.us-east-1.amazonaws.com/123456789012/SidewalkDownlinkQueue'
+
+
+class TestDownlinkDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.clients = {'lambda': mock.Mock(), 'sqs': mock.Mock()}
+        self.clients['lambda'].invoke.return_value = {'StatusCode': 202}
+        self.clients['sqs'].send_message.return_value = {'MessageId': 'message-1'}
+        client_patcher = mock.patch('downlink_dispatcher._client', side_effect=lambda name: self.clients[name])
+        client_patcher.start()
+        self.addCleanup(client_patcher.stop)
+
+    def invoke_request(self) -> dict:
+        return json.loads(self.clients['lambda'].invoke.call_args.kwargs['Payload'])
+
+    def test_dispatch_sync_invokesAndReturnsResponse(self):
+        self.clients['lambda'].invoke.return_value = {'StatusCode': 200, 'Payload': io.BytesIO(b'{"statusCode": 200}')}
+
+        result = downlink_dispatcher.dispatch(DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, (1, 2), mode='sync')
+
+        self.assertEqual(result, '{"statusCode": 200}')
+        kwargs = self.clients['lambda'].invoke.call_args.kwargs
+        self.assertEqual((kwargs['FunctionName'], kwargs['InvocationType']),
+                         (downlink_dispatcher.DOWNLINK_LAMBDA_NAME, 'RequestResponse'))
+        body = self.invoke_request()['body']
+        self.assertEqual((body['command'], body['deviceId'], body['button_press']),
+                         (DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [1, 2]))
+
+    def test_dispatch_event_invokesWithoutWaiting(self):
+        result = downlink_dispatcher.dispatch(DEMO_APP_CAP_DISCOVERY_RESP, WIRELESS_DEVICE_ID, mode='event')
+
+        self.assertEqual(self.clients['lambda'].invoke.call_args.kwargs['InvocationType'], 'Event')
+        self.assertNotIn('button_press', self.invoke_request()['body'])
+        self.assertIn('status: 202', result)
+
+    def test_dispatch_sqs_sendsRequestToQueue(self):
+        with mock.patch('downlink_dispatcher.DOWNLINK_QUEUE_URL', QUEUE_URL):
+            result = downlink_dispatcher.dispatch(DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [3], mode='sqs')
+
+        kwargs = self.clients['sqs'].send_message.call_args.kwargs
+        self.assertEqual(kwargs['QueueUrl'], QUEUE_URL)
+        self.assertEqual(json.loads(kwargs['MessageBody'])['body']['button_press'], [3])
+        self.assertIn('message id: message-1', result)
+        self.clients['lambda'].invoke.assert_not_called()
+
+    def test_dispatch_sqsWithoutQueue_raised(self):
+        with mock.patch('downlink_dispatcher.DOWNLINK_QUEUE_URL', ''):
+            with self.assertRaises(ValueError):
+                downlink_dispatcher.dispatch(DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [3], mode='sqs')
+
+    def test_dispatch_inProcess_sentWithoutDownlinkLambda(self):
+        with mock.patch('downlink_service.send_response', return_value={'MessageId': 'downlink-1'}) as send_response:
+            result = downlink_dispatcher.dispatch(DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [1], mode='in_process')
+
+        send_response.assert_called_once_with(DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [1])
+        self.assertIn('message id: downlink-1', result)
+        self.clients['lambda'].invoke.assert_not_called()
+
+    def test_dispatch_correlationIdPropagated(self):
+        with mock.patch('downlink_dispatcher.DOWNLINK_QUEUE_URL', QUEUE_URL):
+            results = {mode: downlink_dispatcher.dispatch(DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [1], mode=mode)
+                       for mode in ('event', 'sqs')}
+
+        invoked_id = self.invoke_request()['body']['correlationId']
+        queued_id = json.loads(self.clients['sqs'].send_message.call_args.kwargs['MessageBody'])['body']['correlationId']
+        self.assertNotEqual(invoked_id, queued_id)
+        self.assertIn(f'correlation id: {invoked_id}', results['event'])
+        self.assertIn(f'correlation id: {queued_id}', results['sqs'])
+
+    def test_dispatch_unknownMode_fallsBackToDefault(self):
+        with mock.patch('downlink_dispatcher.DOWNLINK_DISPATCH_MODE', 'carrier_pigeon'):
+            downlink_dispatcher.dispatch(DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [1])
+
+        self.assertEqual(downlink_dispatcher.DEFAULT_MODE, 'event')
+        self.assertEqual(self.clients['lambda'].invoke.call_args.kwargs['InvocationType'], 'Event')
+
+    def test_getMode_batchNeverSync(self):
+        cases = {
+            ('sync', False): 'sync',
+            ('sync', True): 'event',
+            ('sqs', True): 'sqs',
+            ('in_process', True): 'in_process'
+        }
+        for (mode, batch), expected in cases.items():
+            with self.subTest(mode=mode, batch=batch):
+                with mock.patch('downlink_dispatcher.DOWNLINK_DISPATCH_MODE', mode):
+                    self.assertEqual(downlink_dispatcher.get_mode(batch=batch), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the uplink processing pipeline.
+"""
+import base64
+import json
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from device import Device
+from measurements_handler import MeasurementsHandler
+from sidewalk_devices_handler import SidewalkDevicesHandler
+
+with mock.patch('boto3.resource'):
+    import uplink_pipeline
+
+CAP_DISCOVERY_NOTIFICATION = '40C1020102C20201020B000C04'
+ACTION_RESP = '61C90301020387000003E888000000640C04'
+BUTTON_PRESS_NOTIFICATION = '41850102030487000003E80C04'
+SENSOR_NOTIFICATION = '41C60301020387000000010C01'
+SENT_TIMESTAMP = 1700000000123
+
+
+def _event(payload: str, wireless_device_id: str = 'device-1', seq_n: int = 5) -> dict:
+    return {
+        'uplink': {
+            'WirelessDeviceId': wireless_device_id,
+            'WirelessMetadata': {'Sidewalk': {'Seq': seq_n}},
+            'PayloadData': base64.b64encode(payload.encode()).decode()
+        }
+    }
+
+
+def _sqs_record(message_id: str, event: dict, sent_timestamp: int = SENT_TIMESTAMP) -> dict:
+    return {'messageId': message_id, 'eventSource': 'aws:sqs', 'body': json.dumps(event),
+            'attributes': {'SentTimestamp': str(sent_timestamp)}}
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': ''}}, 'Operation')
+
+
+class PipelineTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # handlers are created with mocked tables, so that requests they issue can be inspected
+        with mock.patch('boto3.resource'):
+            devices_handler = SidewalkDevicesHandler()
+            measurements_handler = MeasurementsHandler()
+        for name, handler in (('device_handler', devices_handler), ('measurement_handler', measurements_handler)):
+            patcher = mock.patch.object(uplink_pipeline, name, handler)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.devices_table = devices_handler._table
+        self.devices_table.get_item.return_value = {'Item': devices_handler.build_put_item(
+            Device(wireless_device_id='device-1', led=[1, 2, 3], led_on=[3], link_type='BLE', sensor_unit='CELSIUS'))}
+        self.batch_write = measurements_handler._table.meta.client.batch_write_item
+        self.batch_write.return_value = {}
+        self.measurements_handler = measurements_handler
+        client_patcher = mock.patch('device_unit_of_work._client')
+        self.transact_write = client_patcher.start()().transact_write_items
+        self.addCleanup(client_patcher.stop)
+        dispatch_patcher = mock.patch('downlink_dispatcher.dispatch', return_value='dispatched')
+        self.dispatch = dispatch_patcher.start()
+        self.addCleanup(dispatch_patcher.stop)
+
+    def written_measurements(self) -> [dict]:
+        return [request['PutRequest']['Item']
+                for call in self.batch_write.call_args_list
+                for request in call.kwargs['RequestItems'][MeasurementsHandler.TABLE_NAME]]
+
+
+class TestProcess(PipelineTestCase):
+
+    def process(self, payload: str) -> (int, str):
+        response = uplink_pipeline.process(_event(payload))
+        return response['statusCode'], json.loads(response['body'])
+
+    def test_process_capDiscoveryNotification_deviceStoredAndResponseSent(self):
+        status, body = self.process(CAP_DISCOVERY_NOTIFICATION)
+
+        self.assertEqual(status, 200)
+        self.assertTrue(body.startswith('Hello from DEMO_APP_CAP_DISCOVERY_NOTIFICATION!'))
+        item = self.devices_table.put_item.call_args.kwargs['Item']
+        self.assertEqual((item['button'], item['led'], item['link_type']), ([1, 2], [1, 2], 'LORA'))
+        self.assertEqual(item['button_pressed'], {'1': {'seqN': 5, 'state': 0}, '2': {'seqN': 5, 'state': 0}})
+        self.dispatch.assert_called_once_with(uplink_pipeline.DEMO_APP_CAP_DISCOVERY_RESP, 'device-1', None,
+                                              mode=None)
+
+    def test_process_actionResp_ledsUpdated(self):
+        status, body = self.process(ACTION_RESP)
+
+        self.assertEqual((status, body), (200, 'Hello from DEMO_APP_ACTION_RESP!'))
+        update = self.devices_table.update_item.call_args.kwargs
+        self.assertEqual(sorted(update['ExpressionAttributeValues'][':led_on']), [1, 2, 3])
+        self.dispatch.assert_not_called()
+
+    def test_process_sensorNotification_measurementWrittenWithDevice(self):
+        status, _ = self.process(SENSOR_NOTIFICATION)
+
+        self.assertEqual(status, 200)
+        items = self.transact_write.call_args.kwargs['TransactItems']
+        self.assertEqual([next(iter(item)) for item in items], ['Update', 'Put'])
+        self.assertEqual(items[1]['Put']['Item']['temperature'], {'N': '66051'})
+        self.dispatch.assert_not_called()
+
+    def test_process_buttonPressNotification_buttonsToggledAndResponseSent(self):
+        status, _ = self.process(BUTTON_PRESS_NOTIFICATION)
+
+        self.assertEqual(status, 200)
+        toggled = [call.kwargs['ExpressionAttributeNames']['#b'] for call in self.devices_table.update_item.mock_calls
+                   if 'ConditionExpression' in call.kwargs]
+        self.assertEqual(toggled, ['1', '2', '3', '4'])
+        self.dispatch.assert_called_once_with(uplink_pipeline.DEMO_APP_ACTION_RESP, 'device-1', [1, 2, 3, 4],
+                                              mode=None)
+
+    def test_process_malformedPayload_rejected(self):
+        # the invalid link_type value is decoded lazily, when the route handler reads it
+        for payload in ('zz', '41C60301020387000000010C03'):
+            with self.subTest(payload=payload):
+                status, body = self.process(payload)
+                self.assertEqual(status, 400)
+                self.assertTrue(body.startswith('Malformed payload'))
+        self.devices_table.update_item.assert_not_called()
+        self.transact_write.assert_not_called()
+
+    def test_process_unsupportedCommand_rejected(self):
+        status, body = self.process('210C01')
+
+        self.assertEqual(status, 400)
+        self.assertTrue(body.startswith('Command DEMO_APP_ACTION_REQ is not supported'))
+        self.devices_table.update_item.assert_not_called()
+
+    def test_route_programmingError_raised(self):
+        uplink = uplink_pipeline.run(uplink_pipeline.Uplink(_event(SENSOR_NOTIFICATION)),
+                                     stages=uplink_pipeline.STAGES[:2])
+        handler = mock.Mock(side_effect=TypeError('unexpected'))
+        with mock.patch.dict(uplink_pipeline.ROUTES, {uplink_pipeline.Id.DEMO_APP_ACTION_NOTIFICATION: handler}):
+            with self.assertRaises(TypeError):
+                uplink_pipeline.route(uplink)
+        self.assertIsNone(uplink.response)
+
+    def test_process_notification_acknowledged(self):
+        response = uplink_pipeline.process({'notification': {}})
+
+        self.assertEqual(response['statusCode'], 200)
+        self.devices_table.get_item.assert_not_called()
+
+
+class TestProcessBatch(PipelineTestCase):
+
+    def test_processBatch_unreadableAndUnprocessableRecords_reportedAsFailed(self):
+        records = [
+            _sqs_record('sensor', _event(SENSOR_NOTIFICATION)),
+            {'messageId': 'not-json', 'eventSource': 'aws:sqs', 'body': '{'},
+            _sqs_record('no-metadata', {'uplink': {'WirelessDeviceId': 'device-2'}}),
+            _sqs_record('malformed', _event('zz'))
+        ]
+        response = uplink_pipeline.process_batch({'Records': records})
+
+        # malformed payloads are rejected, redelivery would not help
+        self.assertEqual(response, {'batchItemFailures': [{'itemIdentifier': 'not-json'},
+                                                          {'itemIdentifier': 'no-metadata'}]})
+        self.assertEqual([item['wireless_device_id'] for item in self.written_measurements()], ['device-1'])
+
+    def test_processBatch_persistFailure_recordsOfDeviceFailedAndMeasurementsDiscarded(self):
+        def update_item(**kwargs):
+            if kwargs['Key']['wireless_device_id'] == 'device-2':
+                raise _client_error('ProvisionedThroughputExceededException')
+        self.devices_table.update_item.side_effect = update_item
+        records = [
+            _sqs_record('device-1', _event(SENSOR_NOTIFICATION, 'device-1')),
+            _sqs_record('device-2-a', _event(SENSOR_NOTIFICATION, 'device-2', 1)),
+            _sqs_record('device-2-b', _event(SENSOR_NOTIFICATION, 'device-2', 2))
+        ]
+        response = uplink_pipeline.process_batch({'Records': records})
+
+        self.assertEqual(response, {'batchItemFailures': [{'itemIdentifier': 'device-2-a'},
+                                                          {'itemIdentifier': 'device-2-b'}]})
+        self.assertEqual([item['wireless_device_id'] for item in self.written_measurements()], ['device-1'])
+        self.assertEqual(self.dispatch.call_count, 0)
+
+    def test_processBatch_flushFailure_recordsWithMeasurementsFailed(self):
+        self.batch_write.side_effect = _client_error('ProvisionedThroughputExceededException')
+        records = [
+            _sqs_record('sensor', _event(SENSOR_NOTIFICATION, seq_n=1)),
+            _sqs_record('button', _event(BUTTON_PRESS_NOTIFICATION, seq_n=2))
+        ]
+        response = uplink_pipeline.process_batch({'Records': records})
+
+        self.assertEqual(response, {'batchItemFailures': [{'itemIdentifier': 'sensor'}]})
+        self.assertEqual(self.measurements_handler.get_buffered_items(), [])
+        self.dispatch.assert_called_once()
+
+    def test_processBatch_redelivered_measurementsStoredAtSameTime(self):
+        records = [
+            _sqs_record('device-2', _event(SENSOR_NOTIFICATION, 'device-2')),
+            _sqs_record('device-1', _event(SENSOR_NOTIFICATION, 'device-1'))
+        ]
+        uplink_pipeline.process_batch({'Records': records})
+        written = self.written_measurements()
+        self.batch_write.reset_mock()
+        uplink_pipeline.process_batch({'Records': records[::-1]})
+
+        keys = sorted((item['wireless_device_id'], item['timestamp']) for item in written)
+        self.assertEqual(keys, [('device-1', SENT_TIMESTAMP), ('device-2', SENT_TIMESTAMP + 1)])
+        self.assertEqual(sorted((item['wireless_device_id'], item['timestamp'])
+                                for item in self.written_measurements()), keys)
+
+    def test_processBatch_kinesisRecord_storedAtArrivalTime(self):
+        data = base64.b64encode(json.dumps(_event(SENSOR_NOTIFICATION)).encode()).decode()
+        record = {'eventSource': 'aws:kinesis',
+                  'kinesis': {'sequenceNumber': '1', 'data': data, 'approximateArrivalTimestamp': 1700000000.5}}
+        response = uplink_pipeline.process_batch({'Records': [record]})
+
+        self.assertEqual(response, {'batchItemFailures': []})
+        self.assertEqual([item['timestamp'] for item in self.written_measurements()], [1700000000500])
+
+    def test_processBatch_syncMode_downlinksDispatchedWithoutWaiting(self):
+        records = [_sqs_record('button', _event(BUTTON_PRESS_NOTIFICATION))]
+        with mock.patch('downlink_dispatcher.DOWNLINK_DISPATCH_MODE', 'sync'):
+            uplink_pipeline.process_batch({'Records': records})
+
+        self.assertEqual(self.dispatch.call_args.kwargs['mode'], 'event')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,453 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Uplink processing pipeline: parse -> decode -> route -> persist -> respond.
+
+Every stage takes an Uplink object, fills in its part of it and may set the response, which ends the processing.
+Stages are timed separately and can be run one by one, so they are shared by the single message
+and batch entry points.
+"""
+
+import base64
+import binascii
+import json
+import time
+import traceback
+from datetime import datetime, timezone
+from typing import Final
+
+import decode_cache
+import downlink_dispatcher
+import time_utils
+from device import Device
+from device_unit_of_work import DeviceUnitOfWork
+from downlink_service import DEMO_APP_CAP_DISCOVERY_RESP, DEMO_APP_ACTION_RESP
+from measurement import Measurement
+from measurements_handler import MeasurementsHandler
+from protocol import Id
+from sidewalk_devices_handler import SidewalkDevicesHandler
+
+device_handler: Final = SidewalkDevicesHandler()
+measurement_handler: Final = MeasurementsHandler()
+
+
+class Uplink:
+    """
+    State of a single uplink passed between the pipeline stages.
+
+    Attributes
+    ----------
+        event: dict
+            Event received from the IoT rule.
+        wireless_device_id: str
+            Id of the wireless device (set by parse).
+        seq_n: int
+            Sidewalk sequence number of the uplink (set by parse).
+        payload_data: str
+            Base64 encoded payload (set by parse).
+        received_at: datetime
+            UTC time when the uplink was decoded (set by decode).
+        sent_at: datetime
+            UTC time when the uplink was sent to the queue or stream (set by process_batch), it does not change
+            when the record is redelivered.
+        command: LazyCommand
+            Decoded command (set by decode).
+        device: Device
+            Device to be created or replaced (set by route).
+        led_on: [int]
+            Indices of the LEDs reported as turned on (set by route).
+        led_off: [int]
+            Indices of the LEDs reported as turned off (set by route).
+        link_type: str
+            Link type reported together with sensor data (set by route).
+        temperature: int
+            Sensor reading (set by route).
+        buttons_pressed: [int]
+            Indices of the pressed buttons (set by route).
+        downlink: (str, [int])
+            Downlink command to be sent in response and its button_press argument (set by route).
+        message: str
+            Body of the successful response (set by route).
+        response: dict
+            Response of the lambda (set by the stage, which ends the processing).
+        timings: dict
+            Duration of the executed stages in nanoseconds, keyed by stage name.
+    """
+    __slots__ = ('event', 'wireless_device_id', 'seq_n', 'payload_data', 'received_at', 'sent_at', 'command',
+                 'device', 'led_on', 'led_off', 'link_type', 'temperature', 'buttons_pressed', 'downlink', 'message',
+                 'response', 'timings')
+
+    def __init__(self, event: dict):
+        self.event = event
+        self.wireless_device_id = None
+        self.seq_n = None
+        self.payload_data = None
+        self.received_at = None
+        self.sent_at = None
+        self.command = None
+        self.device = None
+        self.led_on = None
+        self.led_off = None
+        self.link_type = None
+        self.temperature = None
+        self.buttons_pressed = None
+        self.downlink = None
+        self.message = None
+        self.response = None
+        self.timings = {}
+
+
+def build_response(status_code: int, body: str) -> dict:
+    """
+    Builds lambda response.
+
+    :param status_code: HTTP status code.
+    :param body:        Message.
+    :return:            Response dict.
+    """
+    return {
+        'statusCode': status_code,
+        'body': json.dumps(body)
+    }
+
+
+# ----------------
+# Pipeline stages
+# ----------------
+def parse(uplink: Uplink):
+    """
+    Reads metadata and payload of the uplink, responds to notifications and unsupported events.
+    """
+    event = uplink.event
+    if event.get("notification") is not None:
+        uplink.response = build_response(200, 'Notification received')
+        return
+
+    data = event.get("uplink")
+    if data is None:
+        print("Unsupported request received {}".format(event))
+        uplink.response = build_response(400, 'Unsupported request received. '
+                                              'Only uplink and notification are supported')
+        return
+
+    uplink.wireless_device_id = data.get("WirelessDeviceId")
+    uplink.seq_n = data.get("WirelessMetadata").get("Sidewalk").get("Seq")
+    uplink.payload_data = data.get("PayloadData")
+
+
+def decode(uplink: Uplink):
+    """
+    Decodes base64 encoded hexadecimal payload, only header is decoded eagerly (see: LazyCommand).
+    Malformed payloads are rejected without traceback.
+    """
+    try:
+        raw = binascii.a2b_hex(binascii.a2b_base64(uplink.payload_data))
+        uplink.command = decode_cache.decode(raw)
+        ul_time = uplink.command.get("gps_time")
+    except (ValueError, TypeError) as e:
+        reject_malformed(uplink, e)
+        return
+
+    uplink.received_at = datetime.now(timezone.utc)
+    ul_latency = 'no latency info'
+    if ul_time is not None:
+        ul_latency = str((uplink.received_at - time_utils.convert_gps_to_utc(ul_time)).total_seconds())
+    print(f'WirelessDeviceId: {uplink.wireless_device_id} DecodedPayload: {uplink.command} '
+          f'Seqn: {uplink.seq_n} Uplink latency: {ul_latency} '
+          f'Decode cache: {decode_cache.cache_info()}')
+
+
+def route(uplink: Uplink):
+    """
+    Dispatches the command to its handler (see: ROUTES), which determines changes to be persisted
+    and downlink to be sent.
+    Tag values are decoded when the handler reads them, values which cannot be decoded are rejected
+    in the same way as malformed payloads in decode.
+    """
+    handler = ROUTES.get(Id[uplink.command.id])
+    if handler is None:
+        uplink.response = build_response(400, f'Command {uplink.command.id} is not supported. '
+                                              f'Payload {uplink.command}')
+        return
+    try:
+        handler(uplink)
+    except ValueError as e:
+        reject_malformed(uplink, e)
+
+
+def reject_malformed(uplink: Uplink, error: Exception):
+    """
+    Responds to the uplink, which payload cannot be decoded, without traceback.
+
+    :param uplink:  Uplink object.
+    :param error:   Decoding error.
+    """
+    print(f'Malformed payload from {uplink.wireless_device_id}: {uplink.payload_data} ({error})')
+    uplink.response = build_response(400, f'Malformed payload: {error}')
+
+
+def persist(uplink: Uplink):
+    """
+    Writes changes determined by route to the database.
+    """
+    try:
+        persist_device(uplink.wireless_device_id, [uplink])
+        measurement_handler.flush()
+    except Exception:
+        # buffer is kept by the warm lambda container, measurements are not written by later invocations
+        measurement_handler.discard_buffered_items()
+        raise
+
+
+def persist_device(wireless_device_id: str, uplinks: [Uplink], transactional: bool = True):
+    """
+    Coalesces changes of the uplinks coming from the same device (see: DeviceUnitOfWork), so that the device record
+    is read at most once and written once together with the measurements, no matter how many uplinks are given.
+    Button presses are applied without reading the record, with one conditional write per pressed button.
+    Uplinks are applied in order of their sequence numbers (uplinks without sequence number are applied last).
+    Measurements are stored at sent_at (if given, see: process_batch) or received_at time.
+
+    :param wireless_device_id:  Id of the wireless device.
+    :param uplinks:             List of routed Uplink objects of the device.
+    :param transactional:       If False, measurements are buffered, so that they are written with BatchWriteItem
+                                once measurement_handler is flushed.
+    """
+    unit_of_work = DeviceUnitOfWork(wireless_device_id, device_handler, measurement_handler)
+    for uplink in sorted(uplinks, key=lambda u: (u.seq_n is None, u.seq_n or 0)):
+        if uplink.device is not None:
+            unit_of_work.put_device(uplink.device)
+
+        if uplink.led_on is not None or uplink.led_off is not None:
+            led_on_set = set(unit_of_work.get_device().get_led_on())
+            led_on_set.update(uplink.led_on or [])
+            led_on_set.difference_update(uplink.led_off or [])
+            unit_of_work.set_led_on(list(led_on_set))
+
+        if uplink.temperature is not None:
+            measured_at = uplink.sent_at or uplink.received_at
+            unit_of_work.set_link_type(Device(wireless_device_id, link_type=uplink.link_type).get_link_type())
+            unit_of_work.add_measurement(Measurement(wireless_device_id=wireless_device_id,
+                                                     temperature=uplink.temperature,
+                                                     timestamp=int(round(measured_at.timestamp() * 1000))))
+
+        if uplink.buttons_pressed is not None:
+            unit_of_work.toggle_buttons(uplink.buttons_pressed, uplink.seq_n)
+
+    unit_of_work.commit(transactional=transactional)
+
+
+def respond(uplink: Uplink, mode: str = None):
+    """
+    Dispatches downlink determined by route (if any) and builds the response, see: downlink_dispatcher.
+
+    :param uplink:  Uplink object.
+    :param mode:    Downlink dispatch mode (downlink_dispatcher.get_mode() if not given).
+    """
+    body = uplink.message
+    if uplink.downlink is not None:
+        command, button_pressed = uplink.downlink
+        response_body = downlink_dispatcher.dispatch(command, uplink.wireless_device_id, button_pressed, mode=mode)
+        body += ' Resp Body: ' + response_body
+    uplink.response = build_response(200, body)
+
+
+STAGES: Final = (
+    ('parse', parse),
+    ('decode', decode),
+    ('route', route),
+    ('persist', persist),
+    ('respond', respond)
+)
+
+
+def run(uplink: Uplink, stages=STAGES) -> Uplink:
+    """
+    Runs given stages until one of them sets the response.
+
+    :param uplink:  Uplink object.
+    :param stages:  Sequence of (stage name, stage function) tuples.
+    :return:        Uplink object.
+    """
+    for name, stage in stages:
+        start = time.perf_counter_ns()
+        stage(uplink)
+        uplink.timings[name] = time.perf_counter_ns() - start
+        if uplink.response is not None:
+            break
+    return uplink
+
+
+def process(event: dict) -> dict:
+    """
+    Processes single uplink event with all the stages.
+
+    :param event:   Event received from the IoT rule.
+    :return:        Lambda response.
+    """
+    uplink = run(Uplink(event))
+    print(f'Stage timings [us]: {format_timings(uplink.timings)}')
+    return uplink.response
+
+
+def process_batch(event: dict) -> dict:
+    """
+    Processes SQS or Kinesis batch of uplink events.
+    All the uplinks are decoded and routed first, then changes are persisted once per device (see: persist_device),
+    measurements of all the devices are written with BatchWriteItem and downlinks are sent without waiting
+    for them (see: downlink_dispatcher.get_mode).
+    Uplinks rejected by parse, decode or route are not retried. Records, which could not be read, processed
+    or persisted, are reported as failed, so that only they are redelivered.
+    Measurements are stored at the time their records were sent, so that redelivered measurements overwrite
+    the ones written before, instead of being duplicated (devices are persisted in order of their ids, so that
+    timestamps colliding within the batch are moved the same way, see: MeasurementsHandler.buffer_measurement).
+
+    :param event:   Event received from the SQS queue or Kinesis stream, see: read_record.
+    :return:        Partial batch response: {'batchItemFailures': [{'itemIdentifier': str}]}.
+    """
+    failures = []
+    devices = {}
+    timings = {name: 0 for name, _ in STAGES[:3]}
+    for record in event['Records']:
+        try:
+            item_id, message, sent_at = read_record(record)
+        except (KeyError, ValueError, TypeError):
+            print(f'Unexpected error occurred while reading record {record}: {traceback.format_exc()}')
+            failures.append(_record_id(record))
+            continue
+        try:
+            uplink = Uplink(message)
+            uplink.sent_at = sent_at
+            run(uplink, stages=STAGES[:3])
+        except Exception:
+            print(f'Unexpected error occurred while processing record {item_id}: {traceback.format_exc()}')
+            failures.append(item_id)
+            continue
+        for name, duration in uplink.timings.items():
+            timings[name] += duration
+        if uplink.response is None:
+            devices.setdefault(uplink.wireless_device_id, []).append((item_id, uplink))
+
+    start = time.perf_counter_ns()
+    routed = []
+    for wireless_device_id, items in sorted(devices.items(), key=lambda device: device[0]):
+        try:
+            persist_device(wireless_device_id, [uplink for _, uplink in items], transactional=False)
+        except Exception:
+            print(f'Unexpected error occurred while persisting {wireless_device_id}: {traceback.format_exc()}')
+            # records are redelivered, so their measurements must not be written
+            measurement_handler.discard_buffered_items(wireless_device_id)
+            failures.extend(item_id for item_id, _ in items)
+        else:
+            routed.extend(items)
+    try:
+        measurement_handler.flush()
+    except Exception:
+        # measurements, which were not written, are kept in the buffer,
+        # records carrying measurements of their devices are redelivered
+        print(f'Unexpected error occurred while writing measurements: {traceback.format_exc()}')
+        unwritten = {item['wireless_device_id'] for item in measurement_handler.get_buffered_items()}
+        measurement_handler.discard_buffered_items()
+        failed = [(item_id, uplink) for item_id, uplink in routed
+                  if uplink.temperature is not None and uplink.wireless_device_id in unwritten]
+        failures.extend(item_id for item_id, _ in failed)
+        routed = [item for item in routed if item not in failed]
+    timings['persist'] = time.perf_counter_ns() - start
+
+    start = time.perf_counter_ns()
+    mode = downlink_dispatcher.get_mode(batch=True)
+    for item_id, uplink in routed:
+        try:
+            respond(uplink, mode=mode)
+        except Exception:
+            # changes are already persisted, so the uplink is not redelivered
+            print(f'Unexpected error occurred while responding to {item_id}: {traceback.format_exc()}')
+    timings['respond'] = time.perf_counter_ns() - start
+
+    print(f'Batch of {len(event["Records"])} records from {len(devices)} devices, {len(failures)} failed. '
+          f'Stage timings [us]: {format_timings(timings)}')
+    return {'batchItemFailures': [{'itemIdentifier': item_id} for item_id in failures]}
+
+
+def read_record(record: dict) -> (str, dict, datetime):
+    """
+    Reads uplink event from the batch record.
+     - SQS record: event is the JSON message body, record is identified by messageId and sent at SentTimestamp
+     - Kinesis record: event is the base64 encoded JSON data, record is identified by sequenceNumber
+       and sent at approximateArrivalTimestamp
+
+    :param record:  Record of the batch.
+    :return:        Tuple of the following structure: (record identifier, event, UTC time when the record was sent
+                    or None if unknown).
+    """
+    if record.get('eventSource') == 'aws:kinesis':
+        kinesis = record['kinesis']
+        return kinesis['sequenceNumber'], json.loads(base64.b64decode(kinesis['data'])), \
+            _utc_time(kinesis.get('approximateArrivalTimestamp'))
+    sent_timestamp = record.get('attributes', {}).get('SentTimestamp')
+    return record['messageId'], json.loads(record['body']), \
+        _utc_time(int(sent_timestamp) / 1000 if sent_timestamp is not None else None)
+
+
+def _utc_time(timestamp: float) -> datetime:
+    if timestamp is not None:
+        return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def _record_id(record: dict) -> str:
+    return record.get('kinesis', {}).get('sequenceNumber') or record.get('messageId')
+
+
+def format_timings(timings: dict) -> str:
+    """
+    Formats stage timings for logging.
+    :param timings:     Dict of the following structure: {stage name: duration in nanoseconds}.
+    :return:            String of the following structure: 'parse=1.0 decode=2.0 ...'.
+    """
+    return ' '.join(f'{name}={duration / 1000:.1f}' for name, duration in timings.items())
+
+
+# --------------
+# Route handlers
+# --------------
+def _route_cap_discovery_notification(uplink: Uplink):
+    command = uplink.command
+    buttons = list(command.get("buttons", []))
+    button_pressed = [{"id": button, "seqN": uplink.seq_n, "state": 0} for button in buttons]
+    uplink.device = Device(wireless_device_id=uplink.wireless_device_id,
+                           led=list(command.get("leds", [])), led_on=[],
+                           button=buttons, button_pressed=button_pressed,
+                           link_type=command.get("link_type"),
+                           sensor=command.get("sensor", False), sensor_unit=command.get("sensor_units"))
+    uplink.downlink = (DEMO_APP_CAP_DISCOVERY_RESP, None)
+    uplink.message = 'Hello from DEMO_APP_CAP_DISCOVERY_NOTIFICATION!'
+
+
+def _route_action_resp(uplink: Uplink):
+    command = uplink.command
+    uplink.led_on = list(command.get("led_on_resp", []))
+    uplink.led_off = list(command.get("led_off_resp", []))
+    dl_latency = command.get("dl_latency", 0)
+    print(f'Downlink latency: {dl_latency if dl_latency < 1000 else 0}')  # 'if' introduced in case of edge device time drift
+    uplink.message = 'Hello from DEMO_APP_ACTION_RESP!'
+
+
+def _route_action_notification(uplink: Uplink):
+    command = uplink.command
+    if "sensor_data" in command:
+        uplink.temperature = command["sensor_data"]
+        uplink.link_type = command["link_type"]
+    if "button_press" in command:
+        uplink.buttons_pressed = list(command["button_press"])
+        uplink.downlink = (DEMO_APP_ACTION_RESP, uplink.buttons_pressed)
+    uplink.message = 'Hello from DEMO_APP_ACTION_NOTIFICATION!'
+
+
+"""
+Route handlers indexed by command Id, commands without handler are rejected.
+"""
+ROUTES: Final = {
+    Id.DEMO_APP_CAP_DISCOVERY_NOTIFICATION: _route_cap_discovery_notification,
+    Id.DEMO_APP_ACTION_RESP: _route_action_resp,
+    Id.DEMO_APP_ACTION_NOTIFICATION: _route_action_notification
+}
@@ -0,0 +1,74 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Encodes demo app downlink commands and sends them to the wireless devices.
+Shared by the SidewalkDownlinkLambda and the SidewalkUplinkLambda, which sends responses to uplinks directly.
+"""
+from functools import lru_cache
+from typing import Final
+
+import boto3
+from botocore.config import Config
+
+import payload_cache
+import time_utils
+
+DEMO_APP_CAP_DISCOVERY_RESP: Final = "DEMO_APP_CAP_DISCOVERY_RESP"
+DEMO_APP_ACTION_RESP: Final = "DEMO_APP_ACTION_RESP"
+DEMO_APP_ACTION_REQ: Final = "DEMO_APP_ACTION_REQ"
+
+
+def encode_response(command: str, button_press=None) -> str:
+    """
+    Encodes response to the uplink.
+
+    :param command:         DEMO_APP_CAP_DISCOVERY_RESP or DEMO_APP_ACTION_RESP.
+    :param button_press:    List of indices of the buttons being pressed (DEMO_APP_ACTION_RESP only).
+    :return:                Base64 encoded command.
+    """
+    if command == DEMO_APP_CAP_DISCOVERY_RESP:
+        return payload_cache.DEMO_APP_CAP_DISCOVERY_RESP
+    if command == DEMO_APP_ACTION_RESP:
+        return payload_cache.action_resp(button_press)
+    raise ValueError(f'Command {command} is not supported')
+
+
+def send_response(command: str, wireless_device_id: str, button_press=None) -> dict:
+    """
+    Encodes response to the uplink and sends it to the wireless device.
+
+    :param command:             DEMO_APP_CAP_DISCOVERY_RESP or DEMO_APP_ACTION_RESP.
+    :param wireless_device_id:  Id of the wireless device.
+    :param button_press:        List of indices of the buttons being pressed (DEMO_APP_ACTION_RESP only).
+    :return:                    IoTWireless client response.
+    """
+    return send_payload_to_device(wireless_device_id, encode_response(command, button_press))
+
+
+def send_payload_to_device(wireless_device_id: str, payload_data: str, seq_n: int = None) -> dict:
+    """
+    Sends base64 encoded command to the wireless device.
+
+    :param wireless_device_id:  Id of the wireless device.
+    :param payload_data:        Base64 encoded command, see: Command.encode_base64.
+    :param seq_n:               Sequence number of the downlink message (calculated from current time if not given).
+    :return:                    IoTWireless client response.
+    """
+    if seq_n is None:
+        seq_n = time_utils.calculate_seq_from_current_time()
+    return wireless_client().send_data_to_wireless_device(Id=wireless_device_id,
+                                                          TransmitMode=0,
+                                                          PayloadData=payload_data,
+                                                          WirelessMetadata={"Sidewalk": {"Seq": seq_n}})
+
+
+@lru_cache(maxsize=None)
+def wireless_client():
+    """
+    Returns IoTWireless client. Client is created on first use and reused across warm invocations,
+    so that its connection pool (kept alive between requests) is reused as well.
+
+    :return:    IoTWireless client.
+    """
+    return boto3.client('iotwireless', config=Config(tcp_keepalive=True))
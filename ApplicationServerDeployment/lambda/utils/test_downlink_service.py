@@ -0,0 +1,64 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for encoding and sending of demo app downlinks.
+"""
+import unittest
+from unittest import mock
+
+import downlink_service
+import payload_cache
+
+WIRELESS_DEVICE_ID = 'device-1'
+WIRELESS_CLIENT = downlink_service.wireless_client
+
+
+class TestDownlinkService(unittest.TestCase):
+
+    def setUp(self):
+        client_patcher = mock.patch('downlink_service.wireless_client')
+        self.send_data = client_patcher.start()().send_data_to_wireless_device
+        self.send_data.return_value = {'MessageId': 'downlink-1'}
+        self.addCleanup(client_patcher.stop)
+
+    def test_encodeResponse_supportedCommands(self):
+        self.assertEqual(downlink_service.encode_response(downlink_service.DEMO_APP_CAP_DISCOVERY_RESP),
+                         payload_cache.DEMO_APP_CAP_DISCOVERY_RESP)
+        self.assertEqual(downlink_service.encode_response(downlink_service.DEMO_APP_ACTION_RESP, [1, 2]),
+                         payload_cache.action_resp([1, 2]))
+
+    def test_encodeResponse_unsupportedCommand_raised(self):
+        with self.assertRaises(ValueError):
+            downlink_service.encode_response(downlink_service.DEMO_APP_ACTION_REQ)
+
+    def test_sendPayloadToDevice_givenSeq(self):
+        response = downlink_service.send_payload_to_device(WIRELESS_DEVICE_ID, 'payload', seq_n=7)
+
+        self.assertEqual(response, {'MessageId': 'downlink-1'})
+        self.send_data.assert_called_once_with(Id=WIRELESS_DEVICE_ID, TransmitMode=0, PayloadData='payload',
+                                               WirelessMetadata={'Sidewalk': {'Seq': 7}})
+
+    def test_sendPayloadToDevice_seqFromCurrentTime(self):
+        with mock.patch('time_utils.calculate_seq_from_current_time', return_value=42):
+            downlink_service.send_payload_to_device(WIRELESS_DEVICE_ID, 'payload')
+
+        self.assertEqual(self.send_data.call_args.kwargs['WirelessMetadata'], {'Sidewalk': {'Seq': 42}})
+
+    def test_sendResponse_encodedResponseSent(self):
+        downlink_service.send_response(downlink_service.DEMO_APP_ACTION_RESP, WIRELESS_DEVICE_ID, [2])
+
+        self.assertEqual(self.send_data.call_args.kwargs['PayloadData'], payload_cache.action_resp([2]))
+
+    def test_wirelessClient_createdOnceWithKeepAlive(self):
+        WIRELESS_CLIENT.cache_clear()
+        self.addCleanup(WIRELESS_CLIENT.cache_clear)
+        with mock.patch('boto3.client') as client:
+            self.assertIs(WIRELESS_CLIENT(), WIRELESS_CLIENT())
+
+        client.assert_called_once()
+        self.assertEqual(client.call_args.args, ('iotwireless',))
+        self.assertTrue(client.call_args.kwargs['config'].tcp_keepalive)
+
+if __name__ == '__main__':
+    unittest.main()
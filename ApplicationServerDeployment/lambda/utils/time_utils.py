@@ -31,3 +31,19 @@ def get_gps_time():
     """
     dt_from_gps_epoch = (datetime.now(timezone.utc).replace(tzinfo=None) - datetime(1980, 1, 6)).total_seconds()
     return dt_from_gps_epoch + LEAP_SECONDS
+
+
+def calculate_seq_from_current_time():
+    """
+    Determines sequence number to be used for downlink message based on the current time.
+    SeqN is calculated in following fashion:
+    First 2 digits are reserved for current seconds
+    Last 2 digits are reserved for first 2 digits of current microseconds
+
+    :return:    Sequence number.
+    """
+    time_now = datetime.now(timezone.utc)
+    seq_n = time_now.strftime("%S%f")[:-4]
+    while seq_n[0] == "0" and len(seq_n) > 1:
+        seq_n = seq_n[1:]
+    return int(seq_n)